@@ -1,7 +1,7 @@
 """Configuration management for the subtitle management system."""
 
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import List, Literal, Optional, Union
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
@@ -127,6 +127,47 @@ class Settings(BaseSettings):
     translation_max_segments_per_chunk: int = Field(
         default=100, env="TRANSLATION_MAX_SEGMENTS_PER_CHUNK"
     )  # Maximum segments per chunk (100-200 recommended for GPT-4o-mini, up to 300-400 if server allows)
+    translation_chunking_mode: Literal["greedy", "balanced"] = Field(
+        default="greedy", env="TRANSLATION_CHUNKING_MODE"
+    )  # "greedy" (fill chunks to the limit) or "balanced" (equal chunks across parallel slots)
+    translation_adaptive_chunking: bool = Field(
+        default=False, env="TRANSLATION_ADAPTIVE_CHUNKING"
+    )  # Split truncated chunks in half and remember the chunk size that fits per model
+    translation_memory_enabled: bool = Field(
+        default=False, env="TRANSLATION_MEMORY_ENABLED"
+    )  # Reuse stored translations of repeated lines (lyrics, credits, short replies)
+    translation_memory_ttl_days: int = Field(
+        default=30, env="TRANSLATION_MEMORY_TTL_DAYS"
+    )  # Translation memory entries expire after this many days without use
+    token_calibration_enabled: bool = Field(
+        default=False, env="TOKEN_CALIBRATION_ENABLED"
+    )  # Learn per-language chars/token from API usage (used when tiktoken is unavailable)
+    token_calibration_min_samples: int = Field(
+        default=3, env="TOKEN_CALIBRATION_MIN_SAMPLES"
+    )  # Requests observed before calibrated ratios replace the defaults
+    translation_streaming: bool = Field(
+        default=False, env="TRANSLATION_STREAMING"
+    )  # Stream completions and hand each [n] segment to the orchestrator as it closes
+    translation_stream_idle_timeout: float = Field(
+        default=30.0, env="TRANSLATION_STREAM_IDLE_TIMEOUT"
+    )  # Abort a streamed completion after this many seconds without a delta
+    translation_progressive_output: bool = Field(
+        default=False, env="TRANSLATION_PROGRESSIVE_OUTPUT"
+    )  # Rewrite a .partial.srt next to the output as the translated prefix grows
+    translation_prefilter_enabled: bool = Field(
+        default=False, env="TRANSLATION_PREFILTER_ENABLED"
+    )  # Keep wordless/URL/speaker-tag segments as-is and send repeated lines once
+    translation_markup_placeholders: bool = Field(
+        default=False, env="TRANSLATION_MARKUP_PLACEHOLDERS"
+    )  # Send {n} placeholders instead of <i>/<font>/{\\an8} tags and restore them after
+    translation_response_format: Literal["numbered", "json"] = Field(
+        default="numbered", env="TRANSLATION_RESPONSE_FORMAT"
+    )  # "numbered" ([n] blocks, streamable) or "json" ({id, text} entries under a strict schema)
+
+    # Subtitle Parsing Configuration
+    subtitle_parse_engine: Literal["regex", "lines"] = Field(
+        default="regex", env="SUBTITLE_PARSE_ENGINE"
+    )  # SRT parse engine: "regex" (whole-buffer fast path) or "lines" (line walker)
 
     # OpenAI Retry Configuration
     openai_max_retries: int = Field(
@@ -141,6 +182,12 @@ class Settings(BaseSettings):
     openai_retry_exponential_base: int = Field(
         default=2, env="OPENAI_RETRY_EXPONENTIAL_BASE"
     )  # Exponential base for backoff (2 = double each time)
+    openai_requests_per_minute: int = Field(
+        default=0, env="OPENAI_REQUESTS_PER_MINUTE"
+    )  # Cluster-wide request limit per model, shared through Redis (0 = disabled)
+    openai_tokens_per_minute: int = Field(
+        default=0, env="OPENAI_TOKENS_PER_MINUTE"
+    )  # Cluster-wide token limit per model, shared through Redis (0 = disabled)
 
     # Translation Parallel Processing Configuration
     translation_parallel_requests: int = Field(
@@ -149,6 +196,18 @@ class Settings(BaseSettings):
     translation_parallel_requests_high_tier: int = Field(
         default=6, env="TRANSLATION_PARALLEL_REQUESTS_HIGH_TIER"
     )  # Number of parallel translation requests for higher tier models (GPT-4o, GPT-4)
+    translation_adaptive_concurrency: bool = Field(
+        default=False, env="TRANSLATION_ADAPTIVE_CONCURRENCY"
+    )  # Adjust parallel requests with AIMD instead of using the fixed count
+    translation_min_parallel_requests: int = Field(
+        default=1, env="TRANSLATION_MIN_PARALLEL_REQUESTS"
+    )  # Lowest parallel request count adaptive concurrency may cut to
+    translation_max_parallel_requests: int = Field(
+        default=16, env="TRANSLATION_MAX_PARALLEL_REQUESTS"
+    )  # Highest parallel request count adaptive concurrency may grow to
+    translation_concurrency_latency_tolerance: float = Field(
+        default=2.0, env="TRANSLATION_CONCURRENCY_LATENCY_TOLERANCE"
+    )  # Cut concurrency when p95 latency exceeds this multiple of the best p95
 
     def get_translation_parallel_requests(self) -> int:
         """
@@ -192,6 +251,23 @@ class Settings(BaseSettings):
     checkpoint_storage_path: Optional[str] = Field(
         default=None, env="CHECKPOINT_STORAGE_PATH"
     )  # Override checkpoint location (defaults to {subtitle_storage_path}/checkpoints)
+    checkpoint_compression: bool = Field(
+        default=False, env="CHECKPOINT_COMPRESSION"
+    )  # Gzip each checkpoint journal record
+
+    # Translation Result Cache Configuration
+    translation_result_cache_enabled: bool = Field(
+        default=False, env="TRANSLATION_RESULT_CACHE_ENABLED"
+    )  # Reuse finished translations of identical subtitle content
+    translation_result_cache_path: Optional[str] = Field(
+        default=None, env="TRANSLATION_RESULT_CACHE_PATH"
+    )  # Override cache location (defaults to {subtitle_storage_path}/translation_cache)
+    translation_result_cache_max_age_days: int = Field(
+        default=30, env="TRANSLATION_RESULT_CACHE_MAX_AGE_DAYS"
+    )  # Cached translations expire after this many days without use
+    translation_result_cache_max_size_mb: int = Field(
+        default=1024, env="TRANSLATION_RESULT_CACHE_MAX_SIZE_MB"
+    )  # Least recently used cached translations are evicted above this size
 
     # Subtitle Language Configuration
     subtitle_desired_language: str = Field(
@@ -474,6 +474,11 @@ class RedisJobClient:
                     job.error_message = metadata["error_message"]
                 if metadata.get("download_url"):
                     job.download_url = metadata["download_url"]
+                # Per-language outputs accumulate as each language completes
+                if metadata.get("translated_paths"):
+                    job.translated_paths.update(metadata["translated_paths"])
+                if metadata.get("download_urls"):
+                    job.download_urls.update(metadata["download_urls"])
 
             # Save updated job
             success = await self.save_job(job)
@@ -36,6 +36,7 @@ class EventType(str, Enum):
     SUBTITLE_TRANSLATE_REQUESTED = "subtitle.translate.requested"
     SUBTITLE_TRANSLATED = "subtitle.translated"
     TRANSLATION_COMPLETED = "translation.completed"
+    TRANSLATION_PROGRESS = "translation.progress"
     JOB_FAILED = "job.failed"
     MEDIA_FILE_DETECTED = "media.file.detected"
     SUBTITLE_REQUESTED = "subtitle.requested"
@@ -94,6 +95,14 @@ class SubtitleResponse(BaseModel):
     download_url: Optional[str] = Field(
         None, description="URL to download processed subtitles"
     )
+    translated_paths: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Translated subtitle file path per target language",
+    )
+    download_urls: Dict[str, str] = Field(
+        default_factory=dict,
+        description="URL to download translated subtitles per target language",
+    )
 
     class Config:
         json_schema_extra = {
@@ -108,6 +117,8 @@ class SubtitleResponse(BaseModel):
                 "updated_at": "2024-01-01T00:00:00Z",
                 "error_message": None,
                 "download_url": None,
+                "translated_paths": {},
+                "download_urls": {},
             }
         }
 
@@ -143,6 +154,13 @@ class TranslationTask(BaseModel):
     )
     source_language: str = Field(..., description="Source language code")
     target_language: str = Field(..., description="Target language code")
+    target_languages: List[str] = Field(
+        default_factory=list,
+        description=(
+            "All target language codes when translating into several languages "
+            "in one pass (target_language is included if missing)"
+        ),
+    )
 
 
 class HealthResponse(BaseModel):
@@ -207,6 +225,16 @@ class TranslationCheckpoint(BaseModel):
         default_factory=list,
         description="List of translated SubtitleSegment objects as dictionaries",
     )
+    translated_positions: Optional[List[int]] = Field(
+        default=None,
+        description=(
+            "Source segment position (0-based) of each translated segment; "
+            "None for checkpoints keyed by completed chunks"
+        ),
+    )
+    source_hash: Optional[str] = Field(
+        default=None, description="Hash of the source segments the checkpoint is for"
+    )
     checkpoint_path: str = Field(..., description="Path to the checkpoint file")
     created_at: datetime = Field(
         default_factory=DateTimeUtils.get_current_utc_datetime,
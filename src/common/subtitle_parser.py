@@ -1,9 +1,25 @@
 """SRT subtitle parser and formatter for translation workflows."""
 
+import io
 import logging
+import math
 import re
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from itertools import islice
+from operator import attrgetter
+from typing import (
+    IO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +47,7 @@ class TranslationCountMismatchError(ValueError):
         total_chunks: int = None,
         parsed_segment_numbers: List[int] = None,
         response_sample: str = None,
+        translations: List[str] = None,
     ):
         """
         Initialize the error with detailed context.
@@ -42,6 +59,8 @@ class TranslationCountMismatchError(ValueError):
             total_chunks: Total number of chunks (if available)
             parsed_segment_numbers: List of segment numbers that were successfully parsed
             response_sample: Sample of the API response for debugging
+            translations: Translations that were parsed, in the same order as
+                parsed_segment_numbers (lets callers re-request only the rest)
         """
         self.expected_count = expected_count
         self.actual_count = actual_count
@@ -49,6 +68,7 @@ class TranslationCountMismatchError(ValueError):
         self.total_chunks = total_chunks
         self.parsed_segment_numbers = parsed_segment_numbers or []
         self.response_sample = response_sample
+        self.translations = translations or []
 
         # Build detailed error message
         message = (
@@ -71,24 +91,208 @@ class TranslationCountMismatchError(ValueError):
 
         super().__init__(message)
 
+    @property
+    def missing_segment_numbers(self) -> List[int]:
+        """Segment numbers (1-based) with no parsed translation, in order."""
+        parsed = set(self.parsed_segment_numbers)
+        return [
+            number
+            for number in range(1, self.expected_count + 1)
+            if number not in parsed
+        ]
+
 
 # Maximum number of subtitle segments to process in a single batch
 # This limit helps prevent API timeouts and memory issues with large subtitle files
 DEFAULT_MAX_SEGMENTS_PER_CHUNK = 50
 
+# Number of segments whose token counts are requested in one batch
+TOKEN_COUNT_BATCH_SIZE = 512
+
+# Chunking modes for split_subtitle_content
+CHUNKING_MODE_GREEDY = "greedy"
+CHUNKING_MODE_BALANCED = "balanced"
+CHUNKING_MODES = (CHUNKING_MODE_GREEDY, CHUNKING_MODE_BALANCED)
+
+# Estimated response tokens per segment beyond its text ("[n]" marker and spacing)
+SEGMENT_MARKER_TOKENS = 4
+
+# Balanced chunks are not made smaller than this fraction of the token limit
+# just to fill parallel slots (each request also pays for the prompt)
+BALANCED_MIN_CHUNK_FRACTION = 0.25
+
+# Balanced boundaries may move this fraction of the average chunk size away
+# from the ideal split point to land on a longer timestamp gap
+BALANCED_BOUNDARY_TOLERANCE = 0.1
+
+# Single SRT timestamp: HH:MM:SS,mmm
+SINGLE_TIMESTAMP_PATTERN = re.compile(r"(\d{2,}):(\d{2}):(\d{2}),(\d{3})")
+
+# Reasons a segment is kept as-is instead of being translated
+PASSTHROUGH_NO_WORDS = "no_words"  # music notes, numbers, punctuation
+PASSTHROUGH_URL = "url"
+PASSTHROUGH_SPEAKER_TAG = "speaker_tag"
+
+# HTML-style and ASS override tags, ignored when classifying a segment
+MARKUP_PATTERN = re.compile(r"<[^>]*>|\{\\[^}]*\}")
 
-@dataclass
+# A line that is only a URL or an email address
+URL_LINE_PATTERN = re.compile(
+    r"^(?:(?:https?://|www\.)\S+|[\w.+-]+@[\w-]+(?:\.[\w-]+)+)$", re.IGNORECASE
+)
+
+# A line that is only an upper-case speaker label such as "JOHN:" or "- DR. WHO:"
+SPEAKER_TAG_LINE_PATTERN = re.compile(r"^-?\s*[A-Z][A-Z0-9 .'&-]*:$")
+
+
+def parse_srt_timestamp(timestamp: str) -> int:
+    """
+    Convert an SRT timestamp to integer milliseconds.
+
+    Args:
+        timestamp: Timestamp in HH:MM:SS,mmm format
+
+    Returns:
+        Offset in milliseconds
+
+    Raises:
+        ValueError: If timestamp is not in HH:MM:SS,mmm format
+    """
+    match = SINGLE_TIMESTAMP_PATTERN.fullmatch(timestamp.strip())
+    if not match:
+        raise ValueError(f"Invalid SRT timestamp: {timestamp!r}")
+
+    hours, minutes, seconds, millis = match.groups()
+    return ((int(hours) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + int(millis)
+
+
+def format_srt_timestamp(milliseconds: int) -> str:
+    """
+    Format integer milliseconds as an SRT timestamp.
+
+    Args:
+        milliseconds: Offset in milliseconds
+
+    Returns:
+        Timestamp in HH:MM:SS,mmm format
+    """
+    hours, remainder = divmod(milliseconds, 3_600_000)
+    minutes, remainder = divmod(remainder, 60_000)
+    seconds, millis = divmod(remainder, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{millis:03d}"
+
+
+@dataclass(slots=True, init=False)
 class SubtitleSegment:
-    """Represents a single subtitle segment with timing and text."""
+    """
+    Represents a single subtitle segment with timing and text.
+
+    Timestamps are stored as integer milliseconds (start_ms/end_ms) in a slotted
+    object; SRT timestamp strings are only produced when formatting through the
+    start_time/end_time properties or str().
+    """
 
     index: int
-    start_time: str
-    end_time: str
+    start_ms: int
+    end_ms: int
     text: str
 
+    def __init__(
+        self,
+        index: int,
+        start_time: Union[str, int],
+        end_time: Union[str, int],
+        text: str,
+    ):
+        """
+        Initialize a segment.
+
+        Args:
+            index: Segment number
+            start_time: Start as an SRT timestamp string or integer milliseconds
+            end_time: End as an SRT timestamp string or integer milliseconds
+            text: Subtitle text
+
+        Raises:
+            ValueError: If a timestamp string is malformed
+        """
+        self.index = index
+        self.start_ms = (
+            start_time
+            if isinstance(start_time, int)
+            else parse_srt_timestamp(start_time)
+        )
+        self.end_ms = (
+            end_time if isinstance(end_time, int) else parse_srt_timestamp(end_time)
+        )
+        self.text = text
+
+    @property
+    def start_time(self) -> str:
+        """Start timestamp formatted as HH:MM:SS,mmm."""
+        return format_srt_timestamp(self.start_ms)
+
+    @property
+    def end_time(self) -> str:
+        """End timestamp formatted as HH:MM:SS,mmm."""
+        return format_srt_timestamp(self.end_ms)
+
+    def with_text(self, text: str) -> "SubtitleSegment":
+        """
+        Return a copy of this segment with different text.
+
+        Args:
+            text: Replacement text
+
+        Returns:
+            New SubtitleSegment sharing index and timing
+        """
+        return SubtitleSegment(self.index, self.start_ms, self.end_ms, text)
+
+    def with_index(self, index: int) -> "SubtitleSegment":
+        """
+        Return a copy of this segment with a different index.
+
+        Args:
+            index: Replacement segment number
+
+        Returns:
+            New SubtitleSegment sharing timing and text
+        """
+        return SubtitleSegment(index, self.start_ms, self.end_ms, self.text)
+
     def __str__(self) -> str:
         """Format segment as SRT entry."""
-        return f"{self.index}\n{self.start_time} --> {self.end_time}\n{self.text}\n"
+        return (
+            f"{self.index}\n{format_srt_timestamp(self.start_ms)} --> "
+            f"{format_srt_timestamp(self.end_ms)}\n{self.text}\n"
+        )
+
+
+def _timestamp_groups_to_milliseconds(groups: Sequence[str]) -> Tuple[int, int]:
+    """
+    Convert the eight timing groups of a TIMESTAMP_PATTERN or BLOCK_PATTERN
+    match to (start_ms, end_ms).
+
+    Args:
+        groups: HH, MM, SS, mmm strings of the start and then the end timestamp
+
+    Returns:
+        Tuple of start and end offsets in milliseconds
+    """
+    h1, m1, s1, ms1, h2, m2, s2, ms2 = groups
+    # Both patterns fix the field widths, so HHMMSSmmm parses as one integer
+    # that is split into milliseconds (two int() calls per cue instead of eight)
+    start = int(h1 + m1 + s1 + ms1)
+    end = int(h2 + m2 + s2 + ms2)
+    return (
+        (start // 10_000_000) * 3_600_000
+        + (start // 100_000 % 100) * 60_000
+        + start % 100_000,
+        (end // 10_000_000) * 3_600_000
+        + (end // 100_000 % 100) * 60_000
+        + end % 100_000,
+    )
 
 
 class SRTParser:
@@ -99,80 +303,244 @@ class SRTParser:
         r"(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}),(\d{3})"
     )
 
+    # Whole cue block for the regex engine: index line, timing line, then every
+    # following non-blank line as text. [^\S\n] is whitespace that never spans lines.
+    BLOCK_PATTERN = re.compile(
+        r"^[^\S\n]*(\d+)[^\S\n]*\n"
+        r"(\d{2}):(\d{2}):(\d{2}),(\d{3})[^\S\n]*-->[^\S\n]*"
+        r"(\d{2}):(\d{2}):(\d{2}),(\d{3})[^\n]*\n"
+        r"((?:[^\S\n]*\S[^\n]*(?:\n|\Z))*)",
+        re.MULTILINE,
+    )
+
+    # Whitespace around an inner line break (including CRLF endings)
+    _LINE_PADDING_PATTERN = re.compile(r"\s\n|\n\s")
+
+    # Parse engines selectable through parse(engine=...)
+    ENGINE_REGEX = "regex"
+    ENGINE_LINES = "lines"
+    ENGINES = (ENGINE_REGEX, ENGINE_LINES)
+
     @staticmethod
-    def parse(content: str) -> List[SubtitleSegment]:
+    def parse(content: str, engine: str = ENGINE_REGEX) -> List[SubtitleSegment]:
         """
         Parse SRT content into subtitle segments.
 
+        Two engines produce identical output, for well-formed files and for the
+        malformed cases pinned by the conformance tests:
+        - "regex" (default): one compiled multiline finditer over the whole
+          buffer, falling back to the line walker only for regions it cannot match
+        - "lines": the tolerant line-by-line walker
+
         Args:
             content: Raw SRT file content
+            engine: Parse engine name ("regex" or "lines")
 
         Returns:
             List of SubtitleSegment objects
+
+        Raises:
+            ValueError: If engine is not a known parse engine
         """
         # Remove BOM (Byte Order Mark) if present (common in UTF-8 files)
         if content.startswith("\ufeff"):
             content = content[1:]
+        content = content.strip()
 
-        segments = []
-        lines = content.strip().split("\n")
+        if engine == SRTParser.ENGINE_REGEX:
+            segments = list(SRTParser._parse_blocks(content))
+        elif engine == SRTParser.ENGINE_LINES:
+            segments = list(SRTParser._parse_lines(io.StringIO(content)))
+        else:
+            raise ValueError(
+                f"Unknown SRT parse engine {engine!r}, expected one of {SRTParser.ENGINES}"
+            )
 
-        i = 0
-        while i < len(lines):
-            # Skip empty lines
-            if not lines[i].strip():
-                i += 1
+        logger.info(f"Parsed {len(segments)} subtitle segments")
+        return segments
+
+    @staticmethod
+    def _parse_blocks(content: str) -> Iterator[SubtitleSegment]:
+        """
+        Yield segments using a single regex pass over the whole buffer.
+
+        Text between matched blocks that contains anything but whitespace is a
+        malformed region and is handed to the tolerant line walker.
+
+        Args:
+            content: SRT content with BOM and surrounding whitespace removed
+
+        Yields:
+            SubtitleSegment objects in file order
+        """
+        position = 0
+        for match in SRTParser.BLOCK_PATTERN.finditer(content):
+            if match.start() > position:
+                gap = content[position : match.start()]
+                if not gap.isspace():
+                    yield from SRTParser._parse_lines(io.StringIO(gap))
+            position = match.end()
+
+            groups = match.groups()
+            text = groups[9]
+            if not text:
                 continue
 
-            try:
-                # Parse index
-                index = int(lines[i].strip())
-                i += 1
+            # Most cues are a single clean line; only multi-line text needs
+            # per-line stripping to match the line walker
+            text = text.strip()
+            if "\n" in text and SRTParser._LINE_PADDING_PATTERN.search(text):
+                text = "\n".join(line.strip() for line in text.split("\n"))
+
+            start_ms, end_ms = _timestamp_groups_to_milliseconds(groups[1:9])
+            yield SubtitleSegment(int(groups[0]), start_ms, end_ms, text)
 
-                if i >= len(lines):
-                    break
+        if position < len(content):
+            tail = content[position:]
+            if not tail.isspace():
+                yield from SRTParser._parse_lines(io.StringIO(tail))
 
+    @staticmethod
+    def iter_parse(fileobj: IO) -> Iterator[SubtitleSegment]:
+        """
+        Stream subtitle segments from an open SRT file in one forward pass.
+
+        The stream is read line by line, so the decoded file is never held in
+        memory as a whole and each segment is yielded as soon as its cue ends.
+        Binary streams are decoded as UTF-8 (a leading BOM is dropped); text
+        streams are consumed as-is. The stream is left open for the caller.
+
+        Args:
+            fileobj: Buffered binary or text stream positioned at the start of the file
+
+        Yields:
+            SubtitleSegment objects in file order
+        """
+        if isinstance(fileobj, io.TextIOBase):
+            yield from SRTParser._parse_lines(fileobj)
+            return
+
+        text_stream = io.TextIOWrapper(fileobj, encoding="utf-8-sig")
+        try:
+            yield from SRTParser._parse_lines(text_stream)
+        finally:
+            # Detach so the wrapper doesn't close the caller's stream
+            text_stream.detach()
+
+    @staticmethod
+    def _parse_lines(lines: Iterable[str]) -> Iterator[SubtitleSegment]:
+        """
+        Walk SRT lines and yield segments, skipping malformed entries.
+
+        Args:
+            lines: Iterable of SRT lines (trailing newlines are tolerated)
+
+        Yields:
+            SubtitleSegment objects in file order
+        """
+        index: Optional[int] = None
+        start_ms = end_ms = 0
+        text_lines: List[str] = []
+        expecting_timestamp = False
+        segment_count = 0
+
+        for line_number, line in enumerate(lines):
+            # Remove BOM (Byte Order Mark) if present (common in UTF-8 files)
+            if line_number == 0 and line.startswith("\ufeff"):
+                line = line[1:]
+
+            stripped = line.strip()
+
+            if expecting_timestamp:
+                expecting_timestamp = False
                 # Parse timestamps
-                timestamp_match = SRTParser.TIMESTAMP_PATTERN.match(lines[i])
+                timestamp_match = SRTParser.TIMESTAMP_PATTERN.match(line)
+                if not timestamp_match and stripped.isdigit():
+                    # Repeated or stray index line: the last number before the
+                    # timing line is the index, as in the regex engine
+                    index = int(stripped)
+                    expecting_timestamp = True
+                    continue
                 if not timestamp_match:
-                    logger.warning(f"Invalid timestamp format at line {i}: {lines[i]}")
-                    i += 1
+                    logger.warning(
+                        f"Invalid timestamp format at line {line_number}: {line.rstrip()}"
+                    )
+                    index = None
                     continue
 
-                start_time = (
-                    f"{timestamp_match.group(1)}:{timestamp_match.group(2)}:"
-                    f"{timestamp_match.group(3)},{timestamp_match.group(4)}"
-                )
-                end_time = (
-                    f"{timestamp_match.group(5)}:{timestamp_match.group(6)}:"
-                    f"{timestamp_match.group(7)},{timestamp_match.group(8)}"
+                start_ms, end_ms = _timestamp_groups_to_milliseconds(
+                    timestamp_match.groups()
                 )
-                i += 1
+                continue
 
-                # Parse text (may be multiple lines)
-                text_lines = []
-                while i < len(lines) and lines[i].strip():
-                    text_lines.append(lines[i].strip())
-                    i += 1
+            if index is not None:
+                # Parse text (may be multiple lines, terminated by a blank line)
+                if stripped:
+                    text_lines.append(stripped)
+                    continue
 
                 if text_lines:
-                    text = "\n".join(text_lines)
-                    segments.append(
-                        SubtitleSegment(
-                            index=index,
-                            start_time=start_time,
-                            end_time=end_time,
-                            text=text,
-                        )
+                    segment_count += 1
+                    yield SubtitleSegment(
+                        index=index,
+                        start_time=start_ms,
+                        end_time=end_ms,
+                        text="\n".join(text_lines),
                     )
+                index = None
+                text_lines = []
+                continue
 
-            except (ValueError, IndexError) as e:
-                logger.error(f"Error parsing segment at line {i}: {e}")
-                i += 1
+            # Skip empty lines
+            if not stripped:
                 continue
 
-        logger.info(f"Parsed {len(segments)} subtitle segments")
-        return segments
+            # Parse index
+            try:
+                index = int(stripped)
+                expecting_timestamp = True
+            except ValueError as e:
+                logger.error(f"Error parsing segment at line {line_number}: {e}")
+
+        if index is not None and text_lines:
+            segment_count += 1
+            yield SubtitleSegment(
+                index=index,
+                start_time=start_ms,
+                end_time=end_ms,
+                text="\n".join(text_lines),
+            )
+
+        logger.debug(f"Streamed {segment_count} subtitle segments")
+
+    @staticmethod
+    def write(segments: Iterable[SubtitleSegment], stream: IO[str]) -> int:
+        """
+        Serialize subtitle segments incrementally into a text stream.
+
+        Produces exactly the same output as format(), one entry at a time, so
+        arbitrarily long segment iterables can be written with constant memory.
+
+        Args:
+            segments: Iterable of SubtitleSegment objects
+            stream: Writable text stream (left open)
+
+        Returns:
+            Number of segments written
+        """
+        segment_count = 0
+        for segment in segments:
+            # Separate entries with one blank line; the first has no prefix
+            if segment_count:
+                stream.write("\n\n")
+            stream.write(str(segment).rstrip())
+            segment_count += 1
+
+        # Add final newline (but not double newline)
+        if segment_count:
+            stream.write("\n")
+
+        return segment_count
 
     @staticmethod
     def format(segments: List[SubtitleSegment]) -> str:
@@ -190,16 +558,9 @@ class SRTParser:
         Returns:
             Formatted SRT content string
         """
-        if not segments:
-            return ""
-
-        # Join segments with double newline for proper spacing
-        # Each segment's __str__ ends with a newline, so joining with \n\n
-        # gives us: segment1\n\nsegment2\n\nsegment3
-        formatted = "\n\n".join(str(segment).rstrip() for segment in segments)
-
-        # Add final newline (but not double newline)
-        return formatted + "\n"
+        buffer = io.StringIO()
+        SRTParser.write(segments, buffer)
+        return buffer.getvalue()
 
 
 def extract_text_for_translation(segments: List[SubtitleSegment]) -> List[str]:
@@ -221,6 +582,113 @@ def extract_text_for_translation(segments: List[SubtitleSegment]) -> List[str]:
     return [segment.text for segment in segments]
 
 
+def classify_passthrough(text: str) -> Optional[str]:
+    """
+    Decide whether a segment's text can be kept without translating it.
+
+    Markup is ignored. A segment passes through when every line is empty,
+    has no letters (music notes, numbers, punctuation), is a URL or email
+    address, or is an upper-case speaker label.
+
+    Args:
+        text: Segment text
+
+    Returns:
+        PASSTHROUGH_SPEAKER_TAG, PASSTHROUGH_URL or PASSTHROUGH_NO_WORDS (the
+        first that applies to some line, in that order), or None if the text
+        needs translating
+    """
+    reasons = set()
+    for line in MARKUP_PATTERN.sub("", text).splitlines():
+        line = line.strip()
+        if not any(character.isalpha() for character in line):
+            reasons.add(PASSTHROUGH_NO_WORDS)
+        elif URL_LINE_PATTERN.match(line):
+            reasons.add(PASSTHROUGH_URL)
+        elif SPEAKER_TAG_LINE_PATTERN.match(line):
+            reasons.add(PASSTHROUGH_SPEAKER_TAG)
+        else:
+            return None
+    for reason in (PASSTHROUGH_SPEAKER_TAG, PASSTHROUGH_URL):
+        if reason in reasons:
+            return reason
+    return PASSTHROUGH_NO_WORDS
+
+
+class TranslationPrefilter:
+    """
+    Segments of a file that do not need their own slot in a request.
+
+    Passthrough segments (see classify_passthrough()) keep their original
+    text. Of segments with exactly the same text, only the first is sent; the
+    others take its translation once it arrives.
+    """
+
+    def __init__(self, segments: List[SubtitleSegment]):
+        """
+        Classify the segments of a file.
+
+        Args:
+            segments: Source segments, indexed by position
+        """
+        self.segments = segments
+        # Position -> passthrough reason
+        self.passthrough: Dict[int, str] = {}
+        # Position -> position of the first segment with the same text
+        self.duplicate_of: Dict[int, int] = {}
+        # Position sent for translation -> positions that reuse its translation
+        self.duplicates: Dict[int, List[int]] = {}
+
+        first_position_by_text: Dict[str, int] = {}
+        for position, segment in enumerate(segments):
+            reason = classify_passthrough(segment.text)
+            if reason:
+                self.passthrough[position] = reason
+                continue
+            first_position = first_position_by_text.setdefault(segment.text, position)
+            if first_position != position:
+                self.duplicate_of[position] = first_position
+                self.duplicates.setdefault(first_position, []).append(position)
+
+    @property
+    def local_positions(self) -> Set[int]:
+        """Positions whose translation is produced without a request."""
+        return set(self.passthrough) | set(self.duplicate_of)
+
+    def expand(
+        self,
+        translated_segments: Dict[int, SubtitleSegment],
+        positions: Optional[Iterable[int]] = None,
+    ) -> Dict[int, SubtitleSegment]:
+        """
+        Fill in local positions from the translations available so far.
+
+        Args:
+            translated_segments: Translated segments keyed by source position
+            positions: Newly translated positions whose duplicates to fill;
+                by default passthrough segments and the duplicates of every
+                translated position are filled
+
+        Returns:
+            Segments for local positions not yet in translated_segments,
+            keyed by source position
+        """
+        expanded: Dict[int, SubtitleSegment] = {}
+        if positions is None:
+            for position in self.passthrough:
+                if position not in translated_segments:
+                    expanded[position] = self.segments[position]
+            positions = translated_segments
+        for position in positions:
+            if position not in translated_segments:
+                continue
+            text = translated_segments[position].text
+            for duplicate in self.duplicates.get(position, ()):
+                if duplicate not in translated_segments:
+                    expanded[duplicate] = self.segments[duplicate].with_text(text)
+        return expanded
+
+
 def _format_chunk_info(
     chunk_index: Optional[int] = None, total_chunks: Optional[int] = None
 ) -> str:
@@ -344,7 +812,8 @@ def _build_translated_segments_with_missing(
 
     Args:
         segments: Original subtitle segments
-        translation_map: Mapping from segment number (1-based) to translation text
+        translation_map: Mapping from prompt segment number (1-based position
+            within this chunk) to translation text
         missing_index: 0-based index of the segment that's missing a translation
 
     Returns:
@@ -353,7 +822,9 @@ def _build_translated_segments_with_missing(
     translated_segments = []
 
     for i, segment in enumerate(segments):
-        segment_number = segment.index  # Segment numbers are 1-based
+        segment_number = segment.index
+        # Prompts number segments [1]..[n] per chunk, not by subtitle index
+        prompt_number = i + 1
 
         if i == missing_index:
             # Use original text for the missing translation
@@ -361,17 +832,10 @@ def _build_translated_segments_with_missing(
                 f"Using original text for segment {segment_number} "
                 f"(translation missing)"
             )
-            translated_segments.append(
-                SubtitleSegment(
-                    index=segment.index,
-                    start_time=segment.start_time,
-                    end_time=segment.end_time,
-                    text=segment.text,  # Keep original text
-                )
-            )
+            translated_segments.append(segment)  # Keep original text
         else:
             # Use translated text from the map
-            translated_text = translation_map.get(segment_number)
+            translated_text = translation_map.get(prompt_number)
             if translated_text is None:
                 # Fallback: if mapping fails, use original text
                 logger.warning(
@@ -380,14 +844,7 @@ def _build_translated_segments_with_missing(
                 )
                 translated_text = segment.text
 
-            translated_segments.append(
-                SubtitleSegment(
-                    index=segment.index,
-                    start_time=segment.start_time,
-                    end_time=segment.end_time,
-                    text=translated_text,
-                )
-            )
+            translated_segments.append(segment.with_text(translated_text))
 
     return translated_segments
 
@@ -505,18 +962,10 @@ def merge_translations(
         )
 
     # Normal case: counts match exactly
-    translated_segments = []
-    for segment, translation in zip(segments, translations):
-        translated_segments.append(
-            SubtitleSegment(
-                index=segment.index,
-                start_time=segment.start_time,
-                end_time=segment.end_time,
-                text=translation.strip(),
-            )
-        )
-
-    return translated_segments
+    return [
+        segment.with_text(translation.strip())
+        for segment, translation in zip(segments, translations)
+    ]
 
 
 def merge_translated_chunks(
@@ -546,21 +995,14 @@ def merge_translated_chunks(
         return []
 
     # Sort segments by original index to ensure chronological order
-    sorted_segments = sorted(translated_segments, key=lambda seg: seg.index)
-
-    # Renumber segments sequentially starting from 1
-    merged_segments = []
-    for new_index, segment in enumerate(sorted_segments, start=1):
-        merged_segments.append(
-            SubtitleSegment(
-                index=new_index,
-                start_time=segment.start_time,
-                end_time=segment.end_time,
-                text=segment.text,
-            )
-        )
+    sorted_segments = sorted(translated_segments, key=attrgetter("index"))
 
-    return merged_segments
+    # Renumber segments sequentially starting from 1, reusing segments whose
+    # number is already correct instead of copying them
+    return [
+        segment if segment.index == new_index else segment.with_index(new_index)
+        for new_index, segment in enumerate(sorted_segments, start=1)
+    ]
 
 
 def chunk_segments(
@@ -596,37 +1038,232 @@ def chunk_segments(
     return chunks
 
 
+def _iter_segment_token_counts(
+    segments: Iterable[SubtitleSegment],
+    model: str,
+    chars_per_token: Optional[float] = None,
+) -> Iterator[Tuple[SubtitleSegment, int]]:
+    """
+    Pair each segment with its token count, counting in batches.
+
+    Segments are pulled TOKEN_COUNT_BATCH_SIZE at a time so token counting
+    can use the batched, cached counter while still consuming the input in a
+    single pass.
+
+    Args:
+        segments: Subtitle segments (list or any iterable)
+        model: Model name for token counting
+        chars_per_token: Calibrated ratio used when token counts are estimated
+
+    Yields:
+        (segment, token_count) tuples in input order
+    """
+    from common.token_counter import count_tokens_many
+
+    segment_iter = iter(segments)
+    while True:
+        batch = list(islice(segment_iter, TOKEN_COUNT_BATCH_SIZE))
+        if not batch:
+            return
+        token_counts = count_tokens_many(
+            [segment.text for segment in batch], model, chars_per_token
+        )
+        yield from zip(batch, token_counts)
+
+
+def _balanced_chunk_count(
+    total_weight: int,
+    total_tokens: int,
+    segment_count: int,
+    effective_limit: int,
+    max_segments_per_chunk: int,
+    parallel_slots: int,
+) -> int:
+    """
+    Choose how many chunks a balanced split should aim for.
+
+    The minimum is what the token and segment limits require. When that
+    needs more than one round of parallel requests, it is rounded up to a
+    multiple of parallel_slots so every round is full and equal. When
+    everything fits in one round, extra chunks only help up to
+    parallel_slots, and chunks are not shrunk below
+    BALANCED_MIN_CHUNK_FRACTION of the limit just to occupy idle slots.
+
+    Returns:
+        Target number of chunks (at least 1, at most segment_count)
+    """
+    required = max(
+        math.ceil(total_tokens / effective_limit) if effective_limit > 0 else 1,
+        math.ceil(segment_count / max_segments_per_chunk),
+        1,
+    )
+
+    if required > parallel_slots:
+        target = math.ceil(required / parallel_slots) * parallel_slots
+    else:
+        min_chunk_weight = max(1, int(effective_limit * BALANCED_MIN_CHUNK_FRACTION))
+        target = min(parallel_slots, max(required, total_weight // min_chunk_weight))
+
+    return max(1, min(target, segment_count))
+
+
+def _split_balanced(
+    counted_segments: List[Tuple[SubtitleSegment, int]],
+    effective_limit: int,
+    max_segments_per_chunk: int,
+    parallel_slots: int,
+) -> List[List[SubtitleSegment]]:
+    """
+    Partition segments into chunks of near-equal estimated output tokens.
+
+    Parallel chunks finish when the largest one does, so the split aims for
+    equal chunks instead of filling each to the limit and leaving a small
+    remainder. Output size is estimated as each segment's tokens plus
+    SEGMENT_MARKER_TOKENS. Each boundary is placed at the ideal cumulative
+    weight for the chunks still to be cut, then moved to the longest timestamp
+    gap within BALANCED_BOUNDARY_TOLERANCE of it, so chunks tend to end
+    between scenes rather than mid-conversation. Token and segment limits
+    always win; if they force extra chunks, those are simply appended.
+
+    Args:
+        counted_segments: (segment, token_count) pairs in order
+        effective_limit: Token limit per chunk (after safety margin)
+        max_segments_per_chunk: Maximum segments per chunk
+        parallel_slots: Number of chunks translated concurrently
+
+    Returns:
+        List of segment chunks
+    """
+    segment_count = len(counted_segments)
+    if not segment_count:
+        return []
+
+    segments = [segment for segment, _ in counted_segments]
+
+    # Prefix sums: cumulative_*[i] covers segments[:i]
+    cumulative_tokens = [0]
+    cumulative_weight = [0]
+    for _, tokens in counted_segments:
+        cumulative_tokens.append(cumulative_tokens[-1] + tokens)
+        cumulative_weight.append(cumulative_weight[-1] + tokens + SEGMENT_MARKER_TOKENS)
+    total_weight = cumulative_weight[-1]
+
+    target_chunks = _balanced_chunk_count(
+        total_weight,
+        cumulative_tokens[-1],
+        segment_count,
+        effective_limit,
+        max_segments_per_chunk,
+        parallel_slots,
+    )
+
+    chunks: List[List[SubtitleSegment]] = []
+    start = 0
+    while start < segment_count:
+        # Furthest end the token and segment limits allow (always >= 1 segment)
+        token_end = (
+            bisect_right(cumulative_tokens, cumulative_tokens[start] + effective_limit)
+            - 1
+        )
+        furthest = max(
+            start + 1, min(token_end, start + max_segments_per_chunk, segment_count)
+        )
+
+        remaining_chunks = max(1, target_chunks - len(chunks))
+        if remaining_chunks == 1:
+            end = furthest
+        else:
+            remaining_weight = total_weight - cumulative_weight[start]
+            average = remaining_weight / remaining_chunks
+            ideal = cumulative_weight[start] + average
+            tolerance = average * BALANCED_BOUNDARY_TOLERANCE
+
+            # Earliest end that still lets the rest fit in the remaining chunks
+            later_chunks = remaining_chunks - 1
+            earliest = min(
+                furthest,
+                max(
+                    start + 1,
+                    segment_count - later_chunks * max_segments_per_chunk,
+                    bisect_left(
+                        cumulative_tokens,
+                        cumulative_tokens[-1] - later_chunks * effective_limit,
+                    ),
+                ),
+            )
+
+            low = max(earliest, bisect_left(cumulative_weight, ideal - tolerance))
+            high = min(furthest, bisect_right(cumulative_weight, ideal + tolerance) - 1)
+
+            if low <= high:
+                # Prefer the longest pause, then the boundary closest to ideal
+                end = max(
+                    range(low, high + 1),
+                    key=lambda boundary: (
+                        segments[boundary].start_ms - segments[boundary - 1].end_ms,
+                        -abs(cumulative_weight[boundary] - ideal),
+                    ),
+                )
+            else:
+                # Window empty (one huge segment) or outside the limits
+                end = min(
+                    furthest, max(earliest, bisect_left(cumulative_weight, ideal))
+                )
+
+        chunks.append(segments[start:end])
+        start = end
+
+    logger.info(
+        f"Split {segment_count} segments into {len(chunks)} balanced chunks "
+        f"for {parallel_slots} parallel slots (limit: {effective_limit} tokens, "
+        f"target chunk ~{total_weight // max(1, len(chunks))} output tokens)"
+    )
+
+    return chunks
+
+
 def split_subtitle_content(
-    segments: List[SubtitleSegment],
+    segments: Iterable[SubtitleSegment],
     max_tokens: int,
     model: str = "gpt-4",
     safety_margin: float = 0.8,
     max_segments_per_chunk: int = 200,
+    chars_per_token: Optional[float] = None,
+    mode: str = CHUNKING_MODE_GREEDY,
+    parallel_slots: int = 1,
 ) -> List[List[SubtitleSegment]]:
     """
     Split subtitle segments into token-safe chunks.
 
     This function splits segments based on token count rather than segment count,
     ensuring that translation requests stay within model token limits. Individual
-    subtitle segments are never split across chunks.
+    subtitle segments are never split across chunks. In greedy mode segments are
+    consumed in a single pass, so a lazy iterator such as SRTParser.iter_parse()
+    can be passed directly. Balanced mode needs all token counts up front and
+    produces near-equal chunks sized for parallel_slots concurrent requests
+    (see _split_balanced).
 
     Args:
-        segments: List of subtitle segments to split
+        segments: Subtitle segments to split (list or any iterable)
         max_tokens: Maximum tokens per chunk
         model: Model name for token counting (default: 'gpt-4')
         safety_margin: Safety margin as fraction of max_tokens (default: 0.8)
                       Example: 0.8 means use 80% of token limit
         max_segments_per_chunk: Maximum number of segments per chunk (default: 200)
                                This prevents API timeouts with very large chunks
+        chars_per_token: Calibrated characters per token for the source language,
+                         used only when tiktoken cannot count exactly (default: 4)
+        mode: CHUNKING_MODE_GREEDY (fill each chunk to the limit) or
+              CHUNKING_MODE_BALANCED (equalize chunks across parallel slots)
+        parallel_slots: Number of chunks translated concurrently (balanced mode)
 
     Returns:
         List of segment chunks, each respecting token limits
 
     Raises:
-        ValueError: If segments is None, max_tokens <= 0, or safety_margin invalid
+        ValueError: If segments is None, max_tokens <= 0, safety_margin invalid,
+                    mode is unknown or parallel_slots < 1
     """
-    from common.token_counter import count_tokens
-
     # Validate inputs
     if segments is None:
         raise ValueError("Segments list cannot be None")
@@ -639,19 +1276,34 @@ def split_subtitle_content(
             f"safety_margin must be between 0.0 and 1.0, got {safety_margin}"
         )
 
-    if not segments:
-        return []
+    if mode not in CHUNKING_MODES:
+        raise ValueError(
+            f"Unknown chunking mode {mode!r}, expected one of {CHUNKING_MODES}"
+        )
+
+    if parallel_slots < 1:
+        raise ValueError(f"parallel_slots must be at least 1, got {parallel_slots}")
 
     # Calculate effective token limit with safety margin
     effective_limit = int(max_tokens * safety_margin)
 
+    if mode == CHUNKING_MODE_BALANCED:
+        return _split_balanced(
+            list(_iter_segment_token_counts(segments, model, chars_per_token)),
+            effective_limit,
+            max_segments_per_chunk,
+            parallel_slots,
+        )
+
     chunks = []
     current_chunk = []
     current_token_count = 0
+    segment_count = 0
 
-    for segment in segments:
-        # Count tokens for this segment
-        segment_tokens = count_tokens(segment.text, model)
+    for segment, segment_tokens in _iter_segment_token_counts(
+        segments, model, chars_per_token
+    ):
+        segment_count += 1
 
         # Check if adding this segment would exceed limit
         would_exceed_token_limit = (
@@ -696,8 +1348,11 @@ def split_subtitle_content(
             f"~{current_token_count} tokens"
         )
 
+    if not chunks:
+        return []
+
     logger.info(
-        f"Split {len(segments)} segments into {len(chunks)} token-aware chunks "
+        f"Split {segment_count} segments into {len(chunks)} token-aware chunks "
         f"(limit: {effective_limit} tokens)"
     )
 
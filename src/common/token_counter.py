@@ -4,20 +4,50 @@ This module provides accurate token counting using tiktoken for OpenAI models,
 with a fallback to simple estimation when tiktoken is unavailable.
 """
 
+import hashlib
 import logging
-from typing import Dict, Optional
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
-
-def estimate_tokens(text: str) -> int:
+# Maximum number of (model, text) token counts kept in the LRU cache
+TOKEN_COUNT_CACHE_SIZE = 50_000
+
+# Model name prefixes mapped to tiktoken encodings, checked in order before
+# falling back to tiktoken.encoding_for_model(). More specific prefixes must
+# come first (e.g. gpt-4o before gpt-4).
+MODEL_ENCODING_PREFIXES: Tuple[Tuple[str, str], ...] = (
+    ("gpt-5", "o200k_base"),
+    ("gpt-4.1", "o200k_base"),
+    ("gpt-4.5", "o200k_base"),
+    ("gpt-4o", "o200k_base"),
+    ("chatgpt-4o", "o200k_base"),
+    ("o1", "o200k_base"),
+    ("o3", "o200k_base"),
+    ("o4", "o200k_base"),
+    ("gpt-4", "cl100k_base"),
+    ("gpt-3.5", "cl100k_base"),
+)
+
+# Worker threads for tiktoken's batch encoder. tiktoken submits one pool task
+# per text, which costs more than encoding a subtitle line, so batches are
+# encoded on the calling thread unless this is raised.
+ENCODE_BATCH_THREADS = 1
+
+
+def estimate_tokens(text: str, chars_per_token: Optional[float] = None) -> int:
     """
     Estimate token count using simple heuristic.
 
-    Uses the rule of thumb: ~4 characters per token for English text.
+    Uses the rule of thumb: ~4 characters per token for English text, unless
+    a calibrated ratio for the text's language is supplied.
 
     Args:
         text: Text to estimate tokens for
+        chars_per_token: Observed characters per token (default: 4)
 
     Returns:
         Estimated number of tokens
@@ -25,18 +55,58 @@ def estimate_tokens(text: str) -> int:
     if not text:
         return 0
 
+    if chars_per_token:
+        return max(1, math.ceil(len(text) / chars_per_token))
+
     # Simple estimation: ~4 characters per token
     return max(1, len(text) // 4)
 
 
+def resolve_encoding_name(model: str) -> Optional[str]:
+    """
+    Resolve the tiktoken encoding name for a model from MODEL_ENCODING_PREFIXES.
+
+    Fine-tune ("ft:gpt-4o-mini:org::id") and provider ("openai/gpt-4o")
+    prefixes are ignored when matching.
+
+    Args:
+        model: Model name
+
+    Returns:
+        Encoding name, or None if no prefix rule matches
+    """
+    name = model.lower().rsplit("/", 1)[-1]
+    if name.startswith("ft:"):
+        name = name[3:]
+
+    for prefix, encoding_name in MODEL_ENCODING_PREFIXES:
+        if name.startswith(prefix):
+            return encoding_name
+
+    return None
+
+
+def _text_digest(text: str) -> bytes:
+    """Return a compact hash of text for use as a cache key."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
 class TokenCounter:
     """Token counter with tiktoken integration and estimation fallback."""
 
-    def __init__(self):
-        """Initialize token counter and attempt to load tiktoken."""
+    def __init__(self, cache_size: int = TOKEN_COUNT_CACHE_SIZE):
+        """
+        Initialize token counter and attempt to load tiktoken.
+
+        Args:
+            cache_size: Maximum number of token counts to remember (0 disables)
+        """
         self.tiktoken_available = False
         self.tiktoken = None
         self._encoding_cache: Dict[str, any] = {}
+        self._count_cache: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
 
         try:
             import tiktoken
@@ -55,7 +125,8 @@ class TokenCounter:
         Count tokens in text for specified model.
 
         Uses tiktoken for accurate counting when available, falls back to
-        estimation otherwise.
+        estimation otherwise. Exact counts are remembered in a bounded LRU
+        cache so repeated text is only encoded once.
 
         Args:
             text: Text to count tokens for
@@ -67,14 +138,17 @@ class TokenCounter:
         if not text:
             return 0
 
-        if not self.tiktoken_available:
+        encoding = self._get_encoding(model)
+        if encoding is None:
             return estimate_tokens(text)
 
+        key = (model, _text_digest(text))
+        cached = self._get_cached_count(key)
+        if cached is not None:
+            return cached
+
         try:
-            # Get or create encoding for model
-            encoding = self._get_encoding(model)
-            tokens = encoding.encode(text)
-            return len(tokens)
+            tokens = encoding.encode_ordinary(text)
         except Exception as e:
             logger.warning(
                 f"Error counting tokens with tiktoken for model {model}: {e}. "
@@ -82,30 +156,160 @@ class TokenCounter:
             )
             return estimate_tokens(text)
 
+        self._store_counts([(key, len(tokens))])
+        return len(tokens)
+
+    def count_tokens_many(
+        self,
+        texts: Sequence[str],
+        model: str,
+        chars_per_token: Optional[float] = None,
+    ) -> List[int]:
+        """
+        Count tokens for many texts at once.
+
+        Cached counts are reused and each remaining distinct text is encoded
+        once, in a single batch (across ENCODE_BATCH_THREADS threads if > 1).
+
+        Args:
+            texts: Texts to count tokens for
+            model: Model name (e.g., 'gpt-4', 'gpt-3.5-turbo')
+            chars_per_token: Calibrated ratio used when falling back to
+                estimation (default: 4 characters per token)
+
+        Returns:
+            Token counts in the same order as texts
+        """
+        encoding = self._get_encoding(model)
+        if encoding is None:
+            return [estimate_tokens(text, chars_per_token) for text in texts]
+
+        counts = [0] * len(texts)
+        # Texts not yet in the cache, mapped to every position they occur at
+        pending: Dict[Tuple[str, bytes], List[int]] = {}
+        pending_texts: List[str] = []
+
+        with self._cache_lock:
+            for position, text in enumerate(texts):
+                if not text:
+                    continue
+                key = (model, _text_digest(text))
+                cached = self._count_cache.get(key)
+                if cached is not None:
+                    self._count_cache.move_to_end(key)
+                    counts[position] = cached
+                elif key in pending:
+                    pending[key].append(position)
+                else:
+                    pending[key] = [position]
+                    pending_texts.append(text)
+
+        if not pending_texts:
+            return counts
+
+        try:
+            if ENCODE_BATCH_THREADS > 1:
+                encoded = encoding.encode_ordinary_batch(
+                    pending_texts, num_threads=ENCODE_BATCH_THREADS
+                )
+            else:
+                encoded = [encoding.encode_ordinary(text) for text in pending_texts]
+        except Exception as e:
+            logger.warning(
+                f"Error counting tokens with tiktoken for model {model}: {e}. "
+                f"Falling back to estimation."
+            )
+            for text, positions in zip(pending_texts, pending.values()):
+                for position in positions:
+                    counts[position] = estimate_tokens(text, chars_per_token)
+            return counts
+
+        new_counts = []
+        for (key, positions), tokens in zip(pending.items(), encoded):
+            for position in positions:
+                counts[position] = len(tokens)
+            new_counts.append((key, len(tokens)))
+        self._store_counts(new_counts)
+
+        return counts
+
+    def _get_cached_count(self, key: Tuple[str, bytes]) -> Optional[int]:
+        """Return a cached token count and mark it as recently used."""
+        with self._cache_lock:
+            cached = self._count_cache.get(key)
+            if cached is not None:
+                self._count_cache.move_to_end(key)
+            return cached
+
+    def _store_counts(self, entries: List[Tuple[Tuple[str, bytes], int]]) -> None:
+        """Insert token counts, evicting the least recently used beyond capacity."""
+        if self._cache_size <= 0:
+            return
+
+        with self._cache_lock:
+            for key, count in entries:
+                self._count_cache[key] = count
+                self._count_cache.move_to_end(key)
+            while len(self._count_cache) > self._cache_size:
+                self._count_cache.popitem(last=False)
+
     def _get_encoding(self, model: str):
         """
         Get encoding for model, using cache when possible.
 
+        The encoding is resolved once per model, through
+        resolve_encoding_name() first and tiktoken's own model table second.
+        Models that cannot be resolved are cached as None and the fallback
+        to estimation is logged once, so callers never pay for a failed
+        lookup per segment.
+
         Args:
             model: Model name
 
         Returns:
-            Encoding instance
-
-        Raises:
-            Exception: If encoding cannot be loaded
+            Encoding instance, or None if token counts must be estimated
         """
-        if model not in self._encoding_cache:
-            self._encoding_cache[model] = self.tiktoken.encoding_for_model(model)
-            logger.debug(f"Loaded and cached encoding for model: {model}")
+        if not self.tiktoken_available:
+            return None
 
-        return self._encoding_cache[model]
+        if model in self._encoding_cache:
+            return self._encoding_cache[model]
+
+        encoding = None
+        encoding_name = resolve_encoding_name(model)
+        try:
+            if encoding_name is not None:
+                encoding = self.tiktoken.get_encoding(encoding_name)
+            else:
+                encoding = self.tiktoken.encoding_for_model(model)
+        except Exception as e:
+            logger.warning(
+                f"No tiktoken encoding for model {model} ({e}). "
+                f"Falling back to estimation (~4 chars per token) for this model."
+            )
+        else:
+            logger.debug(
+                f"Loaded and cached encoding {encoding.name} for model: {model}"
+            )
+
+        self._encoding_cache[model] = encoding
+        return encoding
 
 
 # Singleton instance for convenience
 _token_counter_instance: Optional[TokenCounter] = None
 
 
+def _get_token_counter() -> TokenCounter:
+    """Return the shared TokenCounter, creating it on first use."""
+    global _token_counter_instance
+
+    if _token_counter_instance is None:
+        _token_counter_instance = TokenCounter()
+
+    return _token_counter_instance
+
+
 def count_tokens(text: str, model: str = "gpt-4") -> int:
     """
     Count tokens in text for specified model.
@@ -119,9 +323,26 @@ def count_tokens(text: str, model: str = "gpt-4") -> int:
     Returns:
         Number of tokens in text
     """
-    global _token_counter_instance
+    return _get_token_counter().count_tokens(text, model)
 
-    if _token_counter_instance is None:
-        _token_counter_instance = TokenCounter()
 
-    return _token_counter_instance.count_tokens(text, model)
+def count_tokens_many(
+    texts: Sequence[str],
+    model: str = "gpt-4",
+    chars_per_token: Optional[float] = None,
+) -> List[int]:
+    """
+    Count tokens for a batch of texts for specified model.
+
+    Convenience function that uses the singleton TokenCounter instance, so
+    counts cached here are shared with count_tokens().
+
+    Args:
+        texts: Texts to count tokens for
+        model: Model name (default: 'gpt-4')
+        chars_per_token: Calibrated ratio used when falling back to estimation
+
+    Returns:
+        Token counts in the same order as texts
+    """
+    return _get_token_counter().count_tokens_many(texts, model, chars_per_token)
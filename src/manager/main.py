@@ -364,6 +364,7 @@ async def enqueue_subtitle_translation_job(request: SubtitleTranslateRequest):
             request.subtitle_path,
             request.source_language,
             request.target_language,
+            target_languages=request.target_languages,
         )
 
         if not success:
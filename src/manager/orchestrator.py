@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 import aio_pika
@@ -250,6 +250,7 @@ class SubtitleOrchestrator:
         subtitle_file_path: str,
         source_language: str,
         target_language: str,
+        target_languages: Optional[List[str]] = None,
     ) -> bool:
         """
         Enqueue a subtitle translation task.
@@ -259,6 +260,8 @@ class SubtitleOrchestrator:
             subtitle_file_path: Path to the downloaded subtitle file
             source_language: Source language code (e.g., 'en')
             target_language: Target language code (e.g., 'es')
+            target_languages: Optional further target language codes to
+                translate from the same parse of the file
 
         Returns:
             True if task was successfully enqueued, False otherwise
@@ -279,6 +282,7 @@ class SubtitleOrchestrator:
                 subtitle_file_path=subtitle_file_path,
                 source_language=source_language,
                 target_language=target_language,
+                target_languages=target_languages or [],
             )
 
             message = Message(
@@ -1,6 +1,6 @@
 """Manager-specific schemas and models."""
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
@@ -112,6 +112,10 @@ class SubtitleTranslateRequest(BaseModel):
     )
     source_language: str = Field(..., description="Source language code (e.g., 'en')")
     target_language: str = Field(..., description="Target language code (e.g., 'es')")
+    target_languages: List[str] = Field(
+        default_factory=list,
+        description="Further target language codes translated in the same job",
+    )
     video_title: Optional[str] = Field(
         None, description="Optional video title for reference"
     )
@@ -156,6 +160,23 @@ class SubtitleTranslateRequest(BaseModel):
             raise ValueError("language must be a 2-character ISO 639-1 code")
         return v.lower().strip()
 
+    @field_validator("target_languages")
+    @classmethod
+    def validate_target_languages(cls, v: List[str]) -> List[str]:
+        """
+        Validate every extra target language is a valid ISO code.
+
+        Args:
+            v: Language codes to validate
+
+        Returns:
+            Lowercased and stripped language codes
+
+        Raises:
+            ValueError: If any language code is invalid
+        """
+        return [cls.validate_language_code(language) for language in v]
+
     class Config:
         json_schema_extra = {
             "example": {
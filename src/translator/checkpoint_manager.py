@@ -1,9 +1,34 @@
-"""Checkpoint manager for saving and resuming translation progress."""
-
+"""Checkpoint manager for saving and resuming translation progress.
+
+Progress is recorded in an append-only JSONL journal: a header line with the
+request metadata followed by one line per translated chunk, appended as soon
+as that chunk is translated. A worker that dies mid-job therefore loses only
+the chunks that were still in flight.
+
+Records are keyed by the positions of the source segments they translate
+(stored as ranges), not by chunk number, so a resumed job can chunk the
+untranslated segments differently (e.g. after a chunking setting changed)
+without losing work. The header carries a hash of the source segments so a
+checkpoint is never applied to a different file.
+
+Records are compact (one JSON array per segment, no indentation) and, with
+CHECKPOINT_COMPRESSION, each is written as its own gzip member, so appending
+never rewrites earlier data and the cost of a checkpoint write depends only on
+the chunk being recorded. The journal is compacted (rewritten as a header plus
+a single record) only when a translation starts or resumes.
+
+Chunk-keyed JSON snapshots from save_checkpoint are still read for
+compatibility.
+"""
+
+import gzip
 import json
 import logging
+import os
+import zlib
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 from common.config import settings
@@ -13,6 +38,44 @@ from common.utils import DateTimeUtils
 
 logger = logging.getLogger(__name__)
 
+# Header version of the journal format
+JOURNAL_VERSION = 1
+
+# Journal records are compact, single-line JSON
+JSON_SEPARATORS = (",", ":")
+
+
+def positions_to_ranges(positions: Iterable[int]) -> List[List[int]]:
+    """
+    Collapse segment positions into [start, end) ranges, in the given order.
+
+    Args:
+        positions: Segment positions
+
+    Returns:
+        List of [start, end) pairs
+    """
+    ranges: List[List[int]] = []
+    for position in positions:
+        if ranges and ranges[-1][1] == position:
+            ranges[-1][1] += 1
+        else:
+            ranges.append([position, position + 1])
+    return ranges
+
+
+def ranges_to_positions(ranges: Iterable[List[int]]) -> List[int]:
+    """
+    Expand [start, end) ranges back into segment positions.
+
+    Args:
+        ranges: List of [start, end) pairs
+
+    Returns:
+        Segment positions in range order
+    """
+    return [position for start, end in ranges for position in range(start, end)]
+
 
 class CheckpointManager:
     """Manages checkpoint save/load/cleanup operations for translation resumption."""
@@ -20,6 +83,7 @@ class CheckpointManager:
     def __init__(self):
         """Initialize the checkpoint manager."""
         self._checkpoint_dir = self._get_checkpoint_directory()
+        self._compress = settings.checkpoint_compression
 
     def _get_checkpoint_directory(self) -> Path:
         """
@@ -52,6 +116,51 @@ class CheckpointManager:
         filename = f"{request_id}.{target_language}.checkpoint.json"
         return self._checkpoint_dir / filename
 
+    def get_journal_path(
+        self,
+        request_id: UUID,
+        target_language: str,
+        compressed: Optional[bool] = None,
+    ) -> Path:
+        """
+        Generate checkpoint journal path for a translation request.
+
+        Args:
+            request_id: Unique identifier for the translation request
+            target_language: Target language code
+            compressed: Whether the journal is gzip-compressed (defaults to
+                the CHECKPOINT_COMPRESSION setting)
+
+        Returns:
+            Path to checkpoint journal file
+        """
+        if compressed is None:
+            compressed = self._compress
+        suffix = ".gz" if compressed else ""
+        filename = f"{request_id}.{target_language}.checkpoint.jsonl{suffix}"
+        return self._checkpoint_dir / filename
+
+    def _find_journal_path(
+        self, request_id: UUID, target_language: str
+    ) -> Optional[Path]:
+        """
+        Find an existing checkpoint journal, compressed or not.
+
+        Args:
+            request_id: Unique identifier for the translation request
+            target_language: Target language code
+
+        Returns:
+            Path to the journal, preferring the configured format, or None
+        """
+        for compressed in (self._compress, not self._compress):
+            journal_path = self.get_journal_path(
+                request_id, target_language, compressed
+            )
+            if journal_path.exists():
+                return journal_path
+        return None
+
     def checkpoint_exists(self, request_id: UUID, target_language: str) -> bool:
         """
         Check if a checkpoint exists for the given request.
@@ -63,8 +172,10 @@ class CheckpointManager:
         Returns:
             True if checkpoint exists, False otherwise
         """
-        checkpoint_path = self.get_checkpoint_path(request_id, target_language)
-        return checkpoint_path.exists()
+        return (
+            self._find_journal_path(request_id, target_language) is not None
+            or self.get_checkpoint_path(request_id, target_language).exists()
+        )
 
     def _serialize_segments(self, segments: List[SubtitleSegment]) -> List[dict]:
         """
@@ -86,6 +197,41 @@ class CheckpointManager:
             for segment in segments
         ]
 
+    @staticmethod
+    def _serialize_segment_rows(segments: List[SubtitleSegment]) -> List[list]:
+        """
+        Serialize SubtitleSegment objects to compact rows for the journal.
+
+        Args:
+            segments: List of SubtitleSegment objects
+
+        Returns:
+            List of [index, start_time, end_time, text] rows
+        """
+        return [
+            [segment.index, segment.start_time, segment.end_time, segment.text]
+            for segment in segments
+        ]
+
+    @staticmethod
+    def _segment_row_to_dict(row: list) -> dict:
+        """
+        Convert a journal segment row to the checkpoint dictionary form.
+
+        Args:
+            row: [index, start_time, end_time, text] row
+
+        Returns:
+            Segment dictionary
+        """
+        index, start_time, end_time, text = row
+        return {
+            "index": index,
+            "start_time": start_time,
+            "end_time": end_time,
+            "text": text,
+        }
+
     def _deserialize_segments(self, segment_dicts: List[dict]) -> List[SubtitleSegment]:
         """
         Deserialize dictionaries back to SubtitleSegment objects.
@@ -124,7 +270,12 @@ class CheckpointManager:
         translated_segments: List[SubtitleSegment],
     ) -> TranslationCheckpoint:
         """
-        Save checkpoint after successful chunk translation.
+        Save a chunk-keyed JSON snapshot checkpoint.
+
+        Translations record their progress in the journal (start_journal,
+        append_segments). Snapshots are the format load_checkpoint still
+        reads for jobs interrupted before the journal existed, and this
+        writes them.
 
         Args:
             request_id: Unique identifier for the translation request
@@ -158,13 +309,13 @@ class CheckpointManager:
 
         checkpoint_path = self.get_checkpoint_path(request_id, target_language)
 
-        # Check if checkpoint exists to preserve created_at
-        existing_checkpoint = None
+        # Preserve created_at of an existing checkpoint
+        created_at = None
         if checkpoint_path.exists():
             try:
-                existing_checkpoint = await self.load_checkpoint(
-                    request_id, target_language
-                )
+                created_at = TranslationCheckpoint.model_validate_json(
+                    checkpoint_path.read_text(encoding="utf-8")
+                ).created_at
             except Exception as e:
                 logger.warning(
                     f"Could not load existing checkpoint to preserve created_at: {e}"
@@ -183,11 +334,7 @@ class CheckpointManager:
             completed_chunks=completed_chunks,
             translated_segments=segment_dicts,
             checkpoint_path=str(checkpoint_path),
-            created_at=(
-                existing_checkpoint.created_at
-                if existing_checkpoint
-                else DateTimeUtils.get_current_utc_datetime()
-            ),
+            created_at=created_at or DateTimeUtils.get_current_utc_datetime(),
             updated_at=DateTimeUtils.get_current_utc_datetime(),
         )
 
@@ -206,12 +353,301 @@ class CheckpointManager:
 
         return checkpoint
 
+    async def start_journal(
+        self,
+        request_id: UUID,
+        subtitle_file_path: str,
+        source_language: str,
+        target_language: str,
+        total_chunks: int,
+        translated_segments: Dict[int, SubtitleSegment],
+        source_hash: Optional[str] = None,
+    ) -> Path:
+        """
+        Write a fresh checkpoint journal holding the segments translated so far.
+
+        Called when a translation starts or resumes. The journal is rewritten
+        atomically, which also drops duplicate or torn records and replaces a
+        chunk-keyed checkpoint.
+
+        Args:
+            request_id: Unique identifier for the translation request
+            subtitle_file_path: Path to source subtitle file
+            source_language: Source language code
+            target_language: Target language code
+            total_chunks: Number of chunks this run translates
+            translated_segments: Translated segments keyed by source position
+            source_hash: Hash of the source segments
+
+        Returns:
+            Path to checkpoint journal file
+
+        Raises:
+            IOError: If journal file cannot be written
+        """
+        journal_path = self.get_journal_path(request_id, target_language)
+        stale_journal_path = self.get_journal_path(
+            request_id, target_language, not self._compress
+        )
+        now = DateTimeUtils.get_current_utc_datetime().isoformat()
+        header = {
+            "type": "header",
+            "version": JOURNAL_VERSION,
+            "request_id": str(request_id),
+            "subtitle_file_path": subtitle_file_path,
+            "source_language": source_language,
+            "target_language": target_language,
+            "total_chunks": total_chunks,
+            "source_hash": source_hash,
+            "created_at": now,
+        }
+        lines = [json.dumps(header, ensure_ascii=False, separators=JSON_SEPARATORS)]
+        if translated_segments:
+            positions = sorted(translated_segments)
+            lines.append(
+                self._serialize_segments_record(
+                    positions,
+                    [translated_segments[position] for position in positions],
+                    now,
+                )
+            )
+
+        temp_path = journal_path.with_name(f".{journal_path.name}.tmp")
+        try:
+            temp_path.write_bytes(
+                self._encode_journal_text("\n".join(lines) + "\n", journal_path)
+            )
+            os.replace(temp_path, journal_path)
+        except Exception as e:
+            logger.error(f"❌ Failed to write checkpoint journal: {e}")
+            raise IOError(f"Failed to write checkpoint journal: {e}") from e
+
+        # The journal now holds everything a JSON snapshot (or a journal in
+        # the other format) did
+        self.get_checkpoint_path(request_id, target_language).unlink(missing_ok=True)
+        stale_journal_path.unlink(missing_ok=True)
+
+        logger.info(
+            f"✅ Started checkpoint journal: {journal_path} "
+            f"({len(translated_segments)} segments already translated)"
+        )
+        return journal_path
+
+    def _serialize_segments_record(
+        self,
+        positions: List[int],
+        segments: List[SubtitleSegment],
+        completed_at: str,
+    ) -> str:
+        """
+        Serialize translated segments as a journal line.
+
+        Args:
+            positions: Source position of each segment
+            segments: Translated segments
+            completed_at: ISO timestamp of completion
+
+        Returns:
+            JSON line without trailing newline
+        """
+        return json.dumps(
+            {
+                "type": "segments",
+                "ranges": positions_to_ranges(positions),
+                "segments": self._serialize_segment_rows(segments),
+                "completed_at": completed_at,
+            },
+            ensure_ascii=False,
+            separators=JSON_SEPARATORS,
+        )
+
+    @staticmethod
+    def _encode_journal_text(text: str, journal_path: Path) -> bytes:
+        """
+        Encode journal lines for writing, as a gzip member if compressed.
+
+        Args:
+            text: Complete journal lines
+            journal_path: Journal the bytes are written to
+
+        Returns:
+            Bytes to write or append
+        """
+        data = text.encode("utf-8")
+        if journal_path.suffix == ".gz":
+            return gzip.compress(data, compresslevel=6, mtime=0)
+        return data
+
+    @staticmethod
+    def _read_journal_text(journal_path: Path) -> str:
+        """
+        Read a journal, decompressing each gzip member if compressed.
+
+        A compressed member cut short by a crash is dropped like a torn line.
+
+        Args:
+            journal_path: Path to checkpoint journal file
+
+        Returns:
+            Journal text
+        """
+        data = journal_path.read_bytes()
+        if journal_path.suffix != ".gz":
+            return data.decode("utf-8")
+
+        parts = []
+        while data:
+            decompressor = zlib.decompressobj(wbits=31)
+            try:
+                part = decompressor.decompress(data)
+            except zlib.error as e:
+                if not parts:
+                    raise ValueError(f"Corrupted compressed journal: {e}") from e
+                logger.warning(f"⚠️  Ignoring corrupted last record in {journal_path}")
+                break
+            if not decompressor.eof:
+                logger.warning(f"⚠️  Ignoring incomplete last record in {journal_path}")
+                break
+            parts.append(part)
+            data = decompressor.unused_data
+        return b"".join(parts).decode("utf-8")
+
+    async def append_segments(
+        self,
+        request_id: UUID,
+        target_language: str,
+        positions: List[int],
+        segments: List[SubtitleSegment],
+    ) -> None:
+        """
+        Append a translated chunk's segments to the checkpoint journal.
+
+        The record is flushed to disk before returning, so it survives the
+        worker being killed right after.
+
+        Args:
+            request_id: Unique identifier for the translation request
+            target_language: Target language code
+            positions: Source position of each translated segment
+            segments: Translated segments
+
+        Raises:
+            ValueError: If positions and segments differ in length
+            IOError: If the journal is missing or cannot be written
+        """
+        if len(positions) != len(segments):
+            raise ValueError(
+                f"Got {len(positions)} positions for {len(segments)} segments"
+            )
+
+        journal_path = self._find_journal_path(request_id, target_language)
+        if journal_path is None:
+            raise IOError(
+                f"Checkpoint journal not started: "
+                f"{self.get_journal_path(request_id, target_language)}"
+            )
+
+        line = self._serialize_segments_record(
+            positions,
+            segments,
+            DateTimeUtils.get_current_utc_datetime().isoformat(),
+        )
+        try:
+            with open(journal_path, "ab") as journal:
+                journal.write(self._encode_journal_text(line + "\n", journal_path))
+                journal.flush()
+                os.fsync(journal.fileno())
+        except Exception as e:
+            logger.error(f"❌ Failed to append to checkpoint journal: {e}")
+            raise IOError(f"Failed to append to checkpoint journal: {e}") from e
+
+        logger.debug(f"💾 Journaled {len(segments)} segments to {journal_path}")
+
+    def _load_journal(self, journal_path: Path) -> TranslationCheckpoint:
+        """
+        Replay a checkpoint journal into a checkpoint.
+
+        A torn last line (the worker died mid-write) is ignored. If a segment
+        was recorded more than once, the last record wins.
+
+        Args:
+            journal_path: Path to checkpoint journal file
+
+        Returns:
+            TranslationCheckpoint with segments in source order
+
+        Raises:
+            ValueError: If the journal is invalid or corrupted
+        """
+        lines = self._read_journal_text(journal_path).splitlines()
+        header = None
+        segments_by_position: Dict[int, dict] = {}
+        updated_at = None
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                if line_number == len(lines):
+                    logger.warning(
+                        f"⚠️  Ignoring incomplete last record in {journal_path}"
+                    )
+                    break
+                raise ValueError(
+                    f"Corrupted checkpoint journal line {line_number}: {e}"
+                ) from e
+
+            record_type = record.get("type")
+            if record_type == "header":
+                if record.get("version") != JOURNAL_VERSION:
+                    raise ValueError(
+                        f"Unsupported checkpoint journal version {record.get('version')}"
+                    )
+                header = record
+            elif record_type == "segments":
+                positions = ranges_to_positions(record["ranges"])
+                if len(positions) != len(record["segments"]):
+                    raise ValueError(
+                        f"Checkpoint journal line {line_number} has "
+                        f"{len(positions)} positions for {len(record['segments'])} segments"
+                    )
+                segments_by_position.update(
+                    zip(
+                        positions,
+                        map(self._segment_row_to_dict, record["segments"]),
+                    )
+                )
+                updated_at = record["completed_at"]
+
+        if header is None:
+            raise ValueError("Checkpoint journal has no header")
+
+        translated_positions = sorted(segments_by_position)
+        return TranslationCheckpoint(
+            request_id=header["request_id"],
+            subtitle_file_path=header["subtitle_file_path"],
+            source_language=header["source_language"],
+            target_language=header["target_language"],
+            total_chunks=header["total_chunks"],
+            source_hash=header.get("source_hash"),
+            checkpoint_path=str(journal_path),
+            created_at=datetime.fromisoformat(header["created_at"]),
+            updated_at=datetime.fromisoformat(updated_at or header["created_at"]),
+            translated_positions=translated_positions,
+            translated_segments=[
+                segments_by_position[position] for position in translated_positions
+            ],
+        )
+
     async def load_checkpoint(
         self, request_id: UUID, target_language: str
     ) -> Optional[TranslationCheckpoint]:
         """
         Load existing checkpoint if available.
 
+        The checkpoint journal is preferred; a JSON snapshot is used otherwise.
+
         Args:
             request_id: Unique identifier for the translation request
             target_language: Target language code
@@ -223,6 +659,20 @@ class CheckpointManager:
             FileNotFoundError: If checkpoint file doesn't exist
             ValueError: If checkpoint data is invalid or corrupted
         """
+        journal_path = self._find_journal_path(request_id, target_language)
+        if journal_path is not None:
+            try:
+                checkpoint = self._load_journal(journal_path)
+            except Exception as e:
+                logger.error(f"❌ Failed to load checkpoint: {journal_path} - {e}")
+                raise ValueError(f"Failed to load checkpoint: {e}") from e
+
+            logger.info(
+                f"✅ Loaded checkpoint: {journal_path} "
+                f"({len(checkpoint.translated_segments)} segments translated)"
+            )
+            return checkpoint
+
         checkpoint_path = self.get_checkpoint_path(request_id, target_language)
 
         if not checkpoint_path.exists():
@@ -269,25 +719,31 @@ class CheckpointManager:
 
     async def cleanup_checkpoint(self, request_id: UUID, target_language: str) -> bool:
         """
-        Remove checkpoint file after successful completion.
+        Remove checkpoint files after successful completion.
 
         Args:
             request_id: Unique identifier for the translation request
             target_language: Target language code
 
         Returns:
-            True if checkpoint was removed, False if it didn't exist
+            True if a checkpoint was removed, False if none existed
         """
-        checkpoint_path = self.get_checkpoint_path(request_id, target_language)
+        removed = False
+        for checkpoint_path in (
+            self.get_journal_path(request_id, target_language, compressed=False),
+            self.get_journal_path(request_id, target_language, compressed=True),
+            self.get_checkpoint_path(request_id, target_language),
+        ):
+            if not checkpoint_path.exists():
+                logger.debug(f"Checkpoint file does not exist: {checkpoint_path}")
+                continue
 
-        if not checkpoint_path.exists():
-            logger.debug(f"Checkpoint file does not exist: {checkpoint_path}")
-            return False
-
-        try:
-            checkpoint_path.unlink()
-            logger.info(f"✅ Cleaned up checkpoint: {checkpoint_path}")
-            return True
-        except Exception as e:
-            logger.warning(f"⚠️  Failed to cleanup checkpoint: {checkpoint_path} - {e}")
-            return False
+            try:
+                checkpoint_path.unlink()
+                logger.info(f"✅ Cleaned up checkpoint: {checkpoint_path}")
+                removed = True
+            except Exception as e:
+                logger.warning(
+                    f"⚠️  Failed to cleanup checkpoint: {checkpoint_path} - {e}"
+                )
+        return removed
@@ -0,0 +1,208 @@
+"""Learned chunk size limits for adaptive chunk bisection.
+
+When a translation request is truncated (finish_reason=length), retrying the
+same chunk fails the same way. The orchestrator instead splits the chunk in
+half and records the smaller size here, so the rest of the job and later jobs
+on the same model and target language start from a chunk size that is known
+to fit. Limits are kept per target language because translations into wordy
+languages need far more completion tokens than others.
+
+A limit is not permanent: after CHUNK_SIZE_GROWTH_SUCCESSES chunks of the full
+limited size translate without truncation, it grows by a quarter, and once it
+reaches TRANSLATION_MAX_SEGMENTS_PER_CHUNK it is dropped altogether.
+
+Limits are kept in-process and mirrored to Redis with a TTL so all translator
+workers share them and a limit learned under a low max_completion_tokens
+eventually expires once the configuration changes.
+"""
+
+import logging
+from typing import Dict, Optional, Tuple
+
+from redis.exceptions import RedisError
+
+from common.config import settings
+from common.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+# Redis key holding the learned segments-per-chunk limit for a model and
+# target language
+CHUNK_SIZE_KEY_PREFIX = "translator:chunk_size_limit"
+
+# Learned limits expire if not changed again within this period
+CHUNK_SIZE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Untruncated chunks of the full limited size needed before a limit grows
+CHUNK_SIZE_GROWTH_SUCCESSES = 5
+
+
+class ChunkSizeMemory:
+    """Remembers the largest chunk size (in segments) known to fit per model and language."""
+
+    def __init__(self):
+        """Initialize empty in-process limits."""
+        self._limits: Dict[Tuple[str, str], int] = {}
+        # Untruncated full-size chunks since the limit last changed
+        self._successes: Dict[Tuple[str, str], int] = {}
+
+    @staticmethod
+    def _get_key(model: str, target_language: str) -> str:
+        """
+        Generate Redis key for a model and target language.
+
+        Args:
+            model: OpenAI model name
+            target_language: Target language code
+
+        Returns:
+            Redis key string
+        """
+        return f"{CHUNK_SIZE_KEY_PREFIX}:{model}:{target_language}"
+
+    def get(self, model: str, target_language: str) -> Optional[int]:
+        """
+        Get the learned chunk size limit without touching Redis.
+
+        Args:
+            model: OpenAI model name
+            target_language: Target language code
+
+        Returns:
+            Maximum segments per chunk, or None if nothing has been learned
+        """
+        return self._limits.get((model, target_language))
+
+    def _set_limit(
+        self, model: str, target_language: str, limit: Optional[int]
+    ) -> None:
+        """Set (or with None, drop) an in-process limit and restart growth counting."""
+        if limit is None:
+            self._limits.pop((model, target_language), None)
+        else:
+            self._limits[(model, target_language)] = limit
+        self._successes.pop((model, target_language), None)
+
+    async def refresh(self, model: str, target_language: str) -> Optional[int]:
+        """
+        Reload a learned limit from Redis, shared by all workers.
+
+        Redis is authoritative when connected, so an expired limit is dropped
+        in-process too. Falls back to the in-process limit otherwise.
+
+        Args:
+            model: OpenAI model name
+            target_language: Target language code
+
+        Returns:
+            Maximum segments per chunk, or None if nothing has been learned
+        """
+        if redis_client.connected and redis_client.client:
+            try:
+                value = await redis_client.client.get(
+                    self._get_key(model, target_language)
+                )
+                limit = None if value is None else int(value)
+                if limit != self.get(model, target_language):
+                    self._set_limit(model, target_language, limit)
+            except (RedisError, ValueError) as e:
+                logger.warning(
+                    f"Failed to load chunk size limit for {model} ({target_language}): {e}"
+                )
+
+        limit = self.get(model, target_language)
+        if limit is not None:
+            logger.info(
+                f"📐 Using learned chunk size limit for {model} ({target_language}): {limit}"
+            )
+        return limit
+
+    async def record_limit(
+        self, model: str, target_language: str, max_segments: int
+    ) -> None:
+        """
+        Lower a learned chunk size limit after a truncated response.
+
+        Args:
+            model: OpenAI model name
+            target_language: Target language code
+            max_segments: Chunk size (in segments) to try from now on
+        """
+        max_segments = max(1, max_segments)
+        current = self.get(model, target_language)
+        if current is not None and current <= max_segments:
+            # Truncated at or above the limit: start counting towards growth again
+            self._successes.pop((model, target_language), None)
+            return
+
+        self._set_limit(model, target_language, max_segments)
+        logger.info(
+            f"📐 Learned chunk size limit for {model} ({target_language}): {max_segments}"
+        )
+
+        if not (redis_client.connected and redis_client.client):
+            return
+
+        try:
+            key = self._get_key(model, target_language)
+            stored = await redis_client.client.get(key)
+            if stored is not None and int(stored) <= max_segments:
+                self._set_limit(model, target_language, int(stored))
+                return
+            await redis_client.client.set(key, max_segments, ex=CHUNK_SIZE_TTL_SECONDS)
+        except (RedisError, ValueError) as e:
+            logger.warning(
+                f"Failed to record chunk size limit for {model} ({target_language}): {e}"
+            )
+
+    async def record_success(
+        self, model: str, target_language: str, chunk_size: int
+    ) -> None:
+        """
+        Count an untruncated chunk, growing the limit after enough full-size ones.
+
+        Args:
+            model: OpenAI model name
+            target_language: Target language code
+            chunk_size: Segments in the chunk that was translated
+        """
+        current = self.get(model, target_language)
+        if current is None or chunk_size < current:
+            return
+
+        pair = (model, target_language)
+        self._successes[pair] = self._successes.get(pair, 0) + 1
+        if self._successes[pair] < CHUNK_SIZE_GROWTH_SUCCESSES:
+            return
+
+        grown = current + max(1, current // 4)
+        if grown >= settings.translation_max_segments_per_chunk:
+            grown = None
+        self._set_limit(model, target_language, grown)
+        logger.info(
+            f"📐 Chunk size limit for {model} ({target_language}) "
+            f"{f'grown to {grown}' if grown else 'lifted'} after "
+            f"{CHUNK_SIZE_GROWTH_SUCCESSES} untruncated chunks of {current}"
+        )
+
+        if not (redis_client.connected and redis_client.client):
+            return
+
+        try:
+            key = self._get_key(model, target_language)
+            stored = await redis_client.client.get(key)
+            if stored is not None and int(stored) < current:
+                # Another worker lowered the limit meanwhile
+                self._set_limit(model, target_language, int(stored))
+            elif grown is None:
+                await redis_client.client.delete(key)
+            else:
+                await redis_client.client.set(key, grown, ex=CHUNK_SIZE_TTL_SECONDS)
+        except (RedisError, ValueError) as e:
+            logger.warning(
+                f"Failed to record chunk size limit for {model} ({target_language}): {e}"
+            )
+
+
+# Global instance shared by all translation jobs in this process
+chunk_size_memory = ChunkSizeMemory()
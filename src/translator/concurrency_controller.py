@@ -0,0 +1,257 @@
+"""Adaptive (AIMD) concurrency for parallel chunk translation.
+
+The number of chunks translated at once used to be a fixed setting chosen by
+hand. When adaptive concurrency is enabled, the limit starts from that setting
+and then follows additive-increase / multiplicative-decrease:
+
+- after a full window of successful requests (as many as the current limit)
+  the limit grows by one, up to the configured maximum;
+- a 429, a timeout, or p95 latency rising well above the best p95 seen so far
+  halves the limit, down to the configured minimum.
+
+Only requests started after the last decrease can trigger another one, so a
+burst of 429s from requests that were already in flight counts as a single
+congestion signal.
+
+The limit is kept per process and carries over between jobs, so it converges
+under sustained load. The current state, including the reason for the last
+change, is logged by the translator worker after each job.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from common.config import settings
+from common.utils import DateTimeUtils
+
+logger = logging.getLogger(__name__)
+
+# Multiplicative decrease applied on a congestion signal
+DECREASE_FACTOR = 0.5
+
+# Number of recent request latencies used for the p95
+LATENCY_WINDOW = 20
+
+# Latency samples needed before p95 is compared with the baseline
+MIN_LATENCY_SAMPLES = 10
+
+
+def _percentile(values, fraction: float) -> float:
+    """
+    Get a percentile of values using the nearest-rank method.
+
+    Args:
+        values: Non-empty collection of numbers
+        fraction: Percentile as a fraction (0.95 for p95)
+
+    Returns:
+        The percentile value
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+class AdaptiveConcurrencyController:
+    """Limits in-flight chunk requests and adapts the limit to API health."""
+
+    def __init__(self):
+        """Initialize the controller with no limit chosen yet."""
+        self.limit: Optional[int] = None
+        self.in_flight = 0
+        self.last_change_reason: Optional[str] = None
+        self.last_changed_at: Optional[str] = None
+        self._successes_since_change = 0
+        self._last_decrease_at = 0.0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._baseline_p95: Optional[float] = None
+        self._condition: Optional[asyncio.Condition] = None
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Check whether adaptive concurrency is turned on."""
+        return bool(settings.translation_adaptive_concurrency)
+
+    def _bounds(self) -> tuple[int, int]:
+        """
+        Get the configured minimum and maximum limit.
+
+        Returns:
+            Tuple of (minimum, maximum), both at least 1
+        """
+        minimum = max(1, settings.translation_min_parallel_requests)
+        maximum = max(minimum, settings.translation_max_parallel_requests)
+        return minimum, maximum
+
+    def start(self, initial_limit: int) -> int:
+        """
+        Set the starting limit the first time the controller is used.
+
+        Later jobs keep the limit learned by earlier ones.
+
+        Args:
+            initial_limit: Static parallel request count for the model
+
+        Returns:
+            The current limit
+        """
+        if self.limit is None:
+            minimum, maximum = self._bounds()
+            self._set_limit(
+                min(max(initial_limit, minimum), maximum),
+                "initial limit from translation parallel requests setting",
+            )
+        return self.limit
+
+    def _set_limit(self, limit: int, reason: str) -> None:
+        """
+        Change the limit and record why.
+
+        Args:
+            limit: New limit
+            reason: Human-readable reason for the change
+        """
+        previous = self.limit
+        self.limit = limit
+        self.last_change_reason = reason
+        self.last_changed_at = DateTimeUtils.get_current_utc_datetime().isoformat()
+        self._successes_since_change = 0
+        logger.info(f"🎚️  Translation concurrency {previous} -> {limit}: {reason}")
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Get the condition used to wait for a free slot."""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait until fewer requests than the current limit are in flight."""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < (self.limit or 1))
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            async with condition:
+                self.in_flight -= 1
+                condition.notify_all()
+
+    async def _notify(self) -> None:
+        """Wake waiters after the limit was raised."""
+        condition = self._get_condition()
+        async with condition:
+            condition.notify_all()
+
+    def get_p95_latency(self) -> Optional[float]:
+        """
+        Get p95 latency of recent successful requests.
+
+        Returns:
+            p95 in seconds, or None without enough samples
+        """
+        if len(self._latencies) < MIN_LATENCY_SAMPLES:
+            return None
+        return _percentile(self._latencies, 0.95)
+
+    async def record_success(self, latency_seconds: float) -> None:
+        """
+        Record a successful API request.
+
+        Args:
+            latency_seconds: Time the request took
+        """
+        if not self.is_enabled() or self.limit is None:
+            return
+
+        self._latencies.append(latency_seconds)
+        p95 = self.get_p95_latency()
+        if p95 is not None:
+            if self._baseline_p95 is None or p95 < self._baseline_p95:
+                self._baseline_p95 = p95
+            tolerance = settings.translation_concurrency_latency_tolerance
+            if p95 > self._baseline_p95 * tolerance:
+                reason = (
+                    f"p95 latency {p95:.1f}s exceeded {tolerance:g}x "
+                    f"baseline {self._baseline_p95:.1f}s"
+                )
+                # Relearn the baseline at the lower concurrency
+                self._latencies.clear()
+                self._baseline_p95 = None
+                self._decrease(reason)
+                return
+
+        self._successes_since_change += 1
+        _, maximum = self._bounds()
+        if self._successes_since_change >= self.limit and self.limit < maximum:
+            self._set_limit(
+                self.limit + 1,
+                f"{self._successes_since_change} consecutive successful requests",
+            )
+            await self._notify()
+
+    def record_congestion(self, reason: str, request_started: float) -> None:
+        """
+        Record a 429 or timeout and cut the limit.
+
+        Args:
+            reason: Kind of congestion signal, e.g. "rate limited (429)"
+            request_started: time.monotonic() when the failed request started
+        """
+        if not self.is_enabled() or self.limit is None:
+            return
+
+        self._successes_since_change = 0
+        # Requests already in flight when the limit was last cut report the
+        # same congestion again; count it once
+        if request_started < self._last_decrease_at:
+            return
+        self._decrease(reason)
+
+    def _decrease(self, reason: str) -> None:
+        """
+        Cut the limit multiplicatively.
+
+        Args:
+            reason: Reason for the cut
+        """
+        self._last_decrease_at = time.monotonic()
+        minimum, _ = self._bounds()
+        new_limit = max(minimum, math.floor(self.limit * DECREASE_FACTOR))
+        if new_limit != self.limit:
+            self._set_limit(new_limit, reason)
+        else:
+            self._successes_since_change = 0
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get the controller state for status logging.
+
+        Returns:
+            Dictionary with the current limit and why it last changed
+        """
+        minimum, maximum = self._bounds()
+        p95 = self.get_p95_latency()
+        return {
+            "enabled": self.is_enabled(),
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "min_limit": minimum,
+            "max_limit": maximum,
+            "last_change_reason": self.last_change_reason,
+            "last_changed_at": self.last_changed_at,
+            "p95_latency_seconds": round(p95, 3) if p95 is not None else None,
+            "baseline_p95_seconds": (
+                round(self._baseline_p95, 3) if self._baseline_p95 is not None else None
+            ),
+        }
+
+
+# Global concurrency controller instance
+concurrency_controller = AdaptiveConcurrencyController()
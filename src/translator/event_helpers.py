@@ -2,6 +2,7 @@
 
 import logging
 from pathlib import Path
+from typing import Dict, Optional
 from uuid import UUID
 
 from common.config import settings
@@ -15,7 +16,7 @@ from translator.schemas import TranslationTaskData
 logger = logging.getLogger(__name__)
 
 
-async def publish_translation_events(
+async def publish_translation_completed(
     request_id: UUID,
     output_path: Path,
     source_language: str,
@@ -23,9 +24,10 @@ async def publish_translation_events(
     duration_seconds: float,
     subtitle_file_path: str,
     download_url: str,
+    stats: Optional[dict] = None,
 ) -> None:
     """
-    Publish all translation-related events.
+    Publish a TRANSLATION_COMPLETED event for one finished target language.
 
     Args:
         request_id: Unique identifier for the translation request
@@ -35,8 +37,8 @@ async def publish_translation_events(
         duration_seconds: Translation duration in seconds
         subtitle_file_path: Path to source subtitle file
         download_url: Download URL for translated subtitle
+        stats: Optional per-job translation statistics (memory hits, tokens)
     """
-    # Publish TRANSLATION_COMPLETED event
     translation_completed_event = SubtitleEvent(
         event_type=EventType.TRANSLATION_COMPLETED,
         job_id=request_id,
@@ -49,26 +51,50 @@ async def publish_translation_events(
             "target_language": target_language,
             "subtitle_file_path": subtitle_file_path,
             "translated_path": str(output_path),
+            "download_url": download_url,
+            "translation_stats": stats or {},
         },
     )
     await event_publisher.publish_event(translation_completed_event)
 
     logger.info(
         f"📤 Published TRANSLATION_COMPLETED event for job {request_id} "
-        f"(duration: {duration_seconds:.2f}s)"
+        f"({target_language}, duration: {duration_seconds:.2f}s)"
     )
 
-    # Publish SUBTITLE_TRANSLATED event
+
+async def publish_subtitle_translated(
+    request_id: UUID,
+    task_data: TranslationTaskData,
+    translated_paths: Dict[str, str],
+    download_urls: Dict[str, str],
+) -> None:
+    """
+    Publish the single SUBTITLE_TRANSLATED event of a finished job.
+
+    translated_path and download_url refer to the first target language;
+    translated_paths and download_urls hold every target language.
+
+    Args:
+        request_id: Unique identifier for the translation request
+        task_data: Translation task data for the whole job
+        translated_paths: Translated subtitle file path per target language
+        download_urls: Download URL per target language
+    """
+    target_language = task_data.target_language
     subtitle_translated_event = SubtitleEvent(
         event_type=EventType.SUBTITLE_TRANSLATED,
         job_id=request_id,
         timestamp=DateTimeUtils.get_current_utc_datetime(),
         source="translator",
         payload={
-            "translated_path": str(output_path),
-            "source_language": source_language,
+            "translated_path": translated_paths[target_language],
+            "source_language": task_data.source_language,
             "target_language": target_language,
-            "download_url": download_url,
+            "target_languages": task_data.target_languages,
+            "download_url": download_urls[target_language],
+            "translated_paths": translated_paths,
+            "download_urls": download_urls,
         },
     )
     await event_publisher.publish_event(subtitle_translated_event)
@@ -76,39 +102,84 @@ async def publish_translation_events(
     logger.info(f"✅ Published SUBTITLE_TRANSLATED event for job {request_id}")
 
 
-async def finalize_translation(
+async def publish_translation_progress(
+    request_id: UUID,
+    partial_path: Path,
+    source_language: str,
+    target_language: str,
+    segments_ready: int,
+    total_segments: int,
+    ready_until: str,
+) -> None:
+    """
+    Publish a TRANSLATION_PROGRESS event for a longer translated prefix.
+
+    Args:
+        request_id: Unique identifier for the translation request
+        partial_path: Path to the partial translated subtitle file
+        source_language: Source language code
+        target_language: Target language code
+        segments_ready: Number of leading segments translated
+        total_segments: Number of segments in the subtitle file
+        ready_until: End timestamp of the last translated leading segment
+    """
+    progress_event = SubtitleEvent(
+        event_type=EventType.TRANSLATION_PROGRESS,
+        job_id=request_id,
+        timestamp=DateTimeUtils.get_current_utc_datetime(),
+        source="translator",
+        payload={
+            "partial_path": str(partial_path),
+            "source_language": source_language,
+            "target_language": target_language,
+            "segments_ready": segments_ready,
+            "total_segments": total_segments,
+            "ready_until": ready_until,
+        },
+    )
+    await event_publisher.publish_event(progress_event)
+
+    logger.info(
+        f"📤 Published TRANSLATION_PROGRESS event for job {request_id} "
+        f"({segments_ready}/{total_segments} segments, up to {ready_until})"
+    )
+
+
+async def finalize_language(
     request_id: UUID,
     output_path: Path,
     task_data: TranslationTaskData,
     duration_seconds: float,
 ) -> None:
     """
-    Finalize translation by updating status and publishing events.
+    Record one finished target language while the job may still be running.
+
+    The language's file path and download URL are merged into the job's
+    per-language maps and a TRANSLATION_COMPLETED event is published. The job
+    status stays TRANSLATE_IN_PROGRESS until finalize_translation.
 
     Args:
         request_id: Unique identifier for the translation request
         output_path: Path to translated subtitle file
-        task_data: Translation task data
-        duration_seconds: Translation duration in seconds
+        task_data: Translation task data for this target language
+        duration_seconds: Time from the start of the job until this language
+            finished, in seconds
     """
-    # Generate download URL
     download_url = URLUtils.generate_download_url(
         request_id, task_data.target_language, settings.download_base_url
     )
 
-    # Update status to COMPLETED after successful translation
     await redis_client.update_phase(
         request_id,
-        SubtitleStatus.COMPLETED,
+        SubtitleStatus.TRANSLATE_IN_PROGRESS,
         source="translator",
         metadata={
-            "translated_path": str(output_path),
-            "download_url": download_url,
+            "translated_paths": {task_data.target_language: str(output_path)},
+            "download_urls": {task_data.target_language: download_url},
         },
     )
-    logger.info(f"✅ Updated job {request_id} status to COMPLETED")
 
-    # Clean up checkpoint after successful completion
+    # The language's file is in place, so its checkpoint is no longer needed
     if settings.checkpoint_enabled and settings.checkpoint_cleanup_on_success:
         try:
             checkpoint_manager = CheckpointManager()
@@ -118,8 +189,7 @@ async def finalize_translation(
         except Exception as e:
             logger.warning(f"⚠️  Failed to cleanup checkpoint after completion: {e}")
 
-    # Publish translation events
-    await publish_translation_events(
+    await publish_translation_completed(
         request_id=request_id,
         output_path=output_path,
         source_language=task_data.source_language,
@@ -127,8 +197,57 @@ async def finalize_translation(
         duration_seconds=duration_seconds,
         subtitle_file_path=task_data.subtitle_file_path,
         download_url=download_url,
+        stats=task_data.stats.to_dict(),
     )
 
 
+async def finalize_translation(
+    request_id: UUID,
+    output_paths: Dict[str, Path],
+    task_data: TranslationTaskData,
+    duration_seconds: float,
+) -> None:
+    """
+    Finalize a job once every target language has been saved.
+
+    Sets the job to COMPLETED and publishes one SUBTITLE_TRANSLATED event
+    carrying the output of every target language.
 
+    Args:
+        request_id: Unique identifier for the translation request
+        output_paths: Translated subtitle file path per target language
+        task_data: Translation task data for the whole job
+        duration_seconds: Translation duration in seconds
+    """
+    translated_paths = {
+        target_language: str(output_paths[target_language])
+        for target_language in task_data.target_languages
+    }
+    download_urls = {
+        target_language: URLUtils.generate_download_url(
+            request_id, target_language, settings.download_base_url
+        )
+        for target_language in task_data.target_languages
+    }
+
+    # Update status to COMPLETED after every language is translated
+    await redis_client.update_phase(
+        request_id,
+        SubtitleStatus.COMPLETED,
+        source="translator",
+        metadata={
+            "translated_path": translated_paths[task_data.target_language],
+            "download_url": download_urls[task_data.target_language],
+            "translated_paths": translated_paths,
+            "download_urls": download_urls,
+        },
+    )
+    logger.info(
+        f"✅ Updated job {request_id} status to COMPLETED "
+        f"({', '.join(task_data.target_languages)}, "
+        f"duration: {duration_seconds:.2f}s)"
+    )
 
+    await publish_subtitle_translated(
+        request_id, task_data, translated_paths, download_urls
+    )
@@ -1,13 +1,104 @@
 """File I/O operations for subtitle files."""
 
 import logging
+import os
+import tempfile
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List
 
+from common.config import settings
 from common.subtitle_parser import SRTParser, SubtitleSegment
 
 logger = logging.getLogger(__name__)
 
+# Files at least this large are streamed through the line walker instead of
+# being loaded whole for the configured (regex by default) parse engine
+STREAMING_PARSE_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+# Write buffer for serialized subtitle output
+WRITE_BUFFER_SIZE = 256 * 1024
+
+
+def iter_subtitle_segments(subtitle_file_path: str) -> Iterator[SubtitleSegment]:
+    """
+    Lazily stream subtitle segments from a file on disk.
+
+    The file is read through a buffered binary handle and parsed in a single
+    forward pass, so callers such as split_subtitle_content() can consume
+    segments without the whole file being loaded first.
+
+    Args:
+        subtitle_file_path: Path to subtitle file
+
+    Yields:
+        SubtitleSegment objects in file order
+
+    Raises:
+        FileNotFoundError: If subtitle file doesn't exist
+    """
+    subtitle_path = Path(subtitle_file_path)
+    if not subtitle_path.exists():
+        raise FileNotFoundError(f"Subtitle file not found: {subtitle_file_path}")
+
+    with subtitle_path.open("rb") as subtitle_file:
+        yield from SRTParser.iter_parse(subtitle_file)
+
+
+def _default_file_mode() -> int:
+    """Return the permission bits a plain open() would give a new file."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def write_subtitle_file_atomic(
+    segments: Iterable[SubtitleSegment], output_path: Path
+) -> int:
+    """
+    Stream subtitle segments to disk and atomically move them into place.
+
+    Segments are serialized one at a time into a buffered temp file created
+    next to output_path, which is fsynced and then renamed over the target
+    with os.replace(). Readers therefore see either the previous file or the
+    complete new one, never a partially written subtitle.
+
+    Args:
+        segments: Iterable of SubtitleSegment objects to write
+        output_path: Final location of the subtitle file
+
+    Returns:
+        Number of segments written
+
+    Raises:
+        OSError: If the temp file cannot be written or renamed; the temp file
+            is removed and any existing output_path is left untouched
+    """
+    try:
+        file_mode = output_path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        file_mode = _default_file_mode()
+
+    fd, temp_name = tempfile.mkstemp(
+        dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(
+            fd, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE
+        ) as temp_file:
+            segment_count = SRTParser.write(segments, temp_file)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.chmod(temp_name, file_mode)
+        os.replace(temp_name, output_path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+    return segment_count
+
 
 async def read_and_parse_subtitle_file(
     subtitle_file_path: str,
@@ -31,12 +122,17 @@ async def read_and_parse_subtitle_file(
     if not subtitle_path.exists():
         raise FileNotFoundError(f"Subtitle file not found: {subtitle_file_path}")
 
-    srt_content = subtitle_path.read_text(encoding="utf-8")
-    logger.info(f"Read {len(srt_content)} characters from subtitle file")
+    file_size = subtitle_path.stat().st_size
+    if file_size >= STREAMING_PARSE_THRESHOLD_BYTES:
+        logger.info(f"Streaming {file_size} bytes from subtitle file")
+        segments = list(iter_subtitle_segments(subtitle_file_path))
+    else:
+        srt_content = subtitle_path.read_text(encoding="utf-8")
+        logger.info(f"Read {len(srt_content)} characters from subtitle file")
 
-    # Parse SRT content
-    logger.info("Parsing SRT content...")
-    segments = SRTParser.parse(srt_content)
+        # Parse SRT content
+        logger.info(f"Parsing SRT content ({settings.subtitle_parse_engine} engine)...")
+        segments = SRTParser.parse(srt_content, engine=settings.subtitle_parse_engine)
 
     if not segments:
         raise ValueError("No subtitle segments found in file")
@@ -45,42 +141,68 @@ async def read_and_parse_subtitle_file(
     return segments
 
 
+def get_translated_output_path(subtitle_file_path: str, target_language: str) -> Path:
+    """
+    Get the path a translated subtitle is saved to.
+
+    Args:
+        subtitle_file_path: Path to source subtitle file
+        target_language: Target language code
+
+    Returns:
+        Path for the translated file (language code replaced in the name)
+    """
+    from common.utils import PathUtils
+
+    return PathUtils.generate_subtitle_path_from_source(
+        subtitle_file_path, target_language
+    )
+
+
+def get_partial_output_path(subtitle_file_path: str, target_language: str) -> Path:
+    """
+    Get the path of the partial file written while a translation runs.
+
+    Args:
+        subtitle_file_path: Path to source subtitle file
+        target_language: Target language code
+
+    Returns:
+        Path next to the translated file, e.g. movie.es.partial.srt
+    """
+    output_path = get_translated_output_path(subtitle_file_path, target_language)
+    return output_path.with_name(f"{output_path.stem}.partial{output_path.suffix}")
+
+
 async def save_translated_file(
-    translated_segments: List[SubtitleSegment],
+    translated_segments: Iterable[SubtitleSegment],
     subtitle_file_path: str,
     target_language: str,
 ) -> Path:
     """
     Save translated segments to file.
 
+    A partial file left by progressive output is removed once the complete
+    translation is in place.
+
     Args:
-        translated_segments: List of translated subtitle segments
+        translated_segments: Translated subtitle segments (any iterable)
         subtitle_file_path: Path to source subtitle file
         target_language: Target language code
 
     Returns:
         Path to saved translated file
     """
-    # Format back to SRT
-    translated_srt = SRTParser.format(translated_segments)
-
-    # Save translated file - generate path by replacing language code
-    from common.utils import PathUtils
-
-    output_path = PathUtils.generate_subtitle_path_from_source(
-        subtitle_file_path, target_language
-    )
+    output_path = get_translated_output_path(subtitle_file_path, target_language)
 
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write translated content to file
-    output_path.write_text(translated_srt, encoding="utf-8")
+    # Stream translated content to a temp file and rename it into place
+    write_subtitle_file_atomic(translated_segments, output_path)
     logger.info(f"✅ Saved translated subtitle to: {output_path}")
     logger.info(f"   File size: {output_path.stat().st_size} bytes")
 
-    return output_path
-
-
-
+    get_partial_output_path(subtitle_file_path, target_language).unlink(missing_ok=True)
 
+    return output_path
@@ -0,0 +1,108 @@
+"""Markup placeholders around translation requests.
+
+Subtitle markup such as <i>, <font color="#ffff00"> or the ASS override
+{\\an8} costs tokens in the request and again in the response, and a model
+that edits a tag breaks the output. Before sending, each tag in a segment is
+replaced by a short numbered placeholder ({0}, {1}, ...); after translation
+the placeholders are swapped back for the original tags.
+
+Placeholders the model dropped are put back locally instead of retrying the
+request: tags that opened the segment go back at the start, the others at
+the end, in their original order. Placeholders the model invented or
+repeated are removed. Segments whose text already contains something that
+looks like a placeholder are sent unchanged.
+"""
+
+import re
+from typing import List, Tuple
+
+from common.config import settings
+from common.subtitle_parser import MARKUP_PATTERN
+
+# "{n}" placeholder standing for the n-th tag of a segment
+PLACEHOLDER_PATTERN = re.compile(r"\{(\d+)\}")
+
+
+class MarkupPlaceholders:
+    """Tags taken out of one segment's text."""
+
+    def __init__(self, text: str):
+        """
+        Replace the markup of a segment with placeholders.
+
+        Args:
+            text: Original segment text
+        """
+        self.tags: List[str] = []
+        # Number of tags that start the text, before any other character
+        self.leading_tags = 0
+        if PLACEHOLDER_PATTERN.search(text):
+            self.text = text
+            return
+
+        parts = []
+        last_end = 0
+        for match in MARKUP_PATTERN.finditer(text):
+            if match.start() == last_end and len(self.tags) == self.leading_tags:
+                self.leading_tags += 1
+            parts.append(text[last_end : match.start()])
+            parts.append(f"{{{len(self.tags)}}}")
+            self.tags.append(match.group(0))
+            last_end = match.end()
+        parts.append(text[last_end:])
+        self.text = "".join(parts)
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Check whether markup is replaced by placeholders before sending."""
+        return bool(settings.translation_markup_placeholders)
+
+    def restore(self, translated: str) -> Tuple[str, int]:
+        """
+        Put the original tags back into a translation.
+
+        Args:
+            translated: Translated text containing placeholders
+
+        Returns:
+            Tuple of (text with tags restored, number of tags that were
+            missing and had to be put back locally)
+        """
+        if not self.tags:
+            return translated, 0
+
+        used = set()
+
+        def replace(match: "re.Match[str]") -> str:
+            number = int(match.group(1))
+            if number >= len(self.tags) or number in used:
+                return ""
+            used.add(number)
+            return self.tags[number]
+
+        restored = PLACEHOLDER_PATTERN.sub(replace, translated)
+        missing = [number for number in range(len(self.tags)) if number not in used]
+        if not missing:
+            return restored, 0
+
+        leading = "".join(
+            self.tags[number] for number in missing if number < self.leading_tags
+        )
+        trailing = "".join(
+            self.tags[number] for number in missing if number >= self.leading_tags
+        )
+        return f"{leading}{restored.strip()}{trailing}", len(missing)
+
+
+def protect_markup(texts: List[str]) -> Tuple[List[str], List[MarkupPlaceholders]]:
+    """
+    Replace the markup of every text with placeholders.
+
+    Args:
+        texts: Original subtitle texts
+
+    Returns:
+        Tuple of (texts to send, placeholders to restore each text with)
+    """
+    placeholders = [MarkupPlaceholders(text) for text in texts]
+    return [placeholder.text for placeholder in placeholders], placeholders
@@ -67,6 +67,16 @@ async def parse_and_validate_message(
             f"Converted target language '{target_language_raw}' to ISO '{target_language}'"
         )
 
+    # Optional further targets translated from the same parse
+    target_languages_raw = message_data.get("target_languages") or []
+    if not isinstance(target_languages_raw, list):
+        raise ValueError("target_languages must be a list of language codes")
+    target_languages = [target_language]
+    for language_raw in target_languages_raw:
+        language = LanguageUtils.opensubtitles_to_iso(language_raw)
+        if language not in target_languages:
+            target_languages.append(language)
+
     request_id = UUID(request_id_str)
 
     return TranslationTaskData(
@@ -74,6 +84,7 @@ async def parse_and_validate_message(
         subtitle_file_path=subtitle_file_path,
         source_language=source_language,
         target_language=target_language,
+        target_languages=target_languages,
     )
 
 
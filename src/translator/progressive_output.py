@@ -0,0 +1,107 @@
+"""Progressive output of a translation in playback order.
+
+Without it, nothing can be watched until every chunk is translated and the
+final file is saved. When progressive output is enabled, a partial subtitle
+file (movie.es.partial.srt next to the final movie.es.srt) is rewritten each
+time the run of translated segments from the start of the file grows, and a
+TRANSLATION_PROGRESS event says how far it reaches. Chunks are scheduled
+earliest-timestamp first, so the beginning of the film is ready early.
+
+Each rewrite goes through write_subtitle_file_atomic(), so a player never
+reads a half-written file. The partial file is removed by
+save_translated_file() once the complete translation is saved.
+"""
+
+import asyncio
+import logging
+from typing import Dict
+
+from common.config import settings
+from common.subtitle_parser import SubtitleSegment, merge_translated_chunks
+from translator.event_helpers import publish_translation_progress
+from translator.file_operations import (
+    get_partial_output_path,
+    write_subtitle_file_atomic,
+)
+from translator.schemas import TranslationTaskData
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressiveSubtitleWriter:
+    """Writes the translated leading segments of a file as they complete."""
+
+    def __init__(self, task_data: TranslationTaskData, total_segments: int):
+        """
+        Initialize the writer.
+
+        Args:
+            task_data: Translation task data
+            total_segments: Number of segments in the subtitle file
+        """
+        self.task_data = task_data
+        self.total_segments = total_segments
+        self.partial_path = get_partial_output_path(
+            task_data.subtitle_file_path, task_data.target_language
+        )
+        self.segments_written = 0
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Check whether progressive output is turned on."""
+        return bool(settings.translation_progressive_output)
+
+    async def update(self, translated_segments: Dict[int, SubtitleSegment]) -> bool:
+        """
+        Rewrite the partial file if more leading segments are translated.
+
+        Failures are logged and otherwise ignored; progressive output never
+        fails a translation.
+
+        Args:
+            translated_segments: Translated segments keyed by source position
+
+        Returns:
+            True if the partial file was rewritten
+        """
+        async with self._lock:
+            prefix_length = self.segments_written
+            while (
+                prefix_length < self.total_segments
+                and prefix_length in translated_segments
+            ):
+                prefix_length += 1
+            if prefix_length == self.segments_written:
+                return False
+
+            prefix = [
+                translated_segments[position] for position in range(prefix_length)
+            ]
+            try:
+                self.partial_path.parent.mkdir(parents=True, exist_ok=True)
+                write_subtitle_file_atomic(
+                    merge_translated_chunks(prefix), self.partial_path
+                )
+            except Exception as e:
+                logger.warning(f"⚠️  Failed to write partial translation: {e}")
+                return False
+            self.segments_written = prefix_length
+
+            logger.info(
+                f"🎬 Partial translation ready up to {prefix[-1].end_time} "
+                f"({prefix_length}/{self.total_segments} segments): {self.partial_path}"
+            )
+            try:
+                await publish_translation_progress(
+                    request_id=self.task_data.request_id,
+                    partial_path=self.partial_path,
+                    source_language=self.task_data.source_language,
+                    target_language=self.task_data.target_language,
+                    segments_ready=prefix_length,
+                    total_segments=self.total_segments,
+                    ready_until=prefix[-1].end_time,
+                )
+            except Exception as e:
+                logger.warning(f"⚠️  Failed to publish translation progress: {e}")
+            return True
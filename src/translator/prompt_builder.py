@@ -0,0 +1,186 @@
+"""Prompt construction for subtitle translation requests.
+
+Every request used to carry a system message and a user message that repeated
+most of the same instructions, with the language names interpolated into both.
+The builder states the instructions once, in a system message that is
+identical for every chunk, language pair and job, and puts everything that
+varies (language pair, segment count, numbered segments) at the end of the
+user message. Identical leading tokens are what provider-side prompt caching
+matches on, so the instructions can be billed as cached input after the first
+request.
+
+TranslationPrompt.overhead_tokens() measures the prompt tokens that are not
+subtitle text, so the effect of the wording on input tokens can be tracked.
+"""
+
+import hashlib
+from typing import List
+
+from common.token_counter import count_tokens
+from translator.response_parsing import RESPONSE_FORMAT_JSON, RESPONSE_FORMAT_NUMBERED
+
+# Instructions shared by every translation request. Keep language names and
+# other per-request values out of this text so it stays a cacheable prefix.
+_TRANSLATION_STYLE = (
+    "You are a professional subtitle translator. Translate each numbered "
+    "subtitle segment from the source language into the target language "
+    "named in the request.\n\n"
+    "TRANSLATION STYLE:\n"
+    "- Translate each subtitle as a complete sentence or phrase, not word-by-word\n"
+    "- Use natural, idiomatic expressions and figures of speech in the target language\n"
+    "- Adapt cultural references and idioms to be natural in the target language\n"
+    "- Maintain the original meaning, tone and style\n"
+    "- Keep translations concise and readable in 2-3 seconds\n\n"
+)
+
+# Formatting rules when segments carry their markup
+_HTML_TAG_RULES = (
+    "FORMATTING REQUIREMENTS:\n"
+    "- Preserve all HTML tags (like <i>, <b>, <u>, etc.) exactly as they appear\n"
+    "- Only translate the text content inside the tags, not the tags themselves\n"
+    "- Preserve line breaks and formatting structure\n\n"
+    "Example:\n"
+    "Source: <i>like a lord or a king</i>\n"
+    "Target: <i>[natural idiomatic translation]</i>\n\n"
+)
+
+# Formatting rules when markup was replaced by {n} placeholders
+_PLACEHOLDER_RULES = (
+    "FORMATTING: Keep placeholders like {0} unchanged, around the words they "
+    "mark, and keep line breaks.\n\n"
+)
+
+# Response format rules
+_NUMBERED_RESPONSE_RULES = (
+    "Return ONLY the translations, numbered the same way as the request, "
+    "with no additional commentary. Format your response exactly like this:\n"
+    "[1]\nFirst translation\n\n"
+    "[2]\nSecond translation"
+)
+_JSON_RESPONSE_RULES = (
+    'Return a JSON object with a "translations" array holding one '
+    '{"id": n, "text": "..."} entry per segment, where n is the segment\'s '
+    "number in the request. Use \\n for line breaks inside text."
+)
+
+# Instructions for responses in the numbered "[n]" format
+TRANSLATION_INSTRUCTIONS = (
+    _TRANSLATION_STYLE + _HTML_TAG_RULES + _NUMBERED_RESPONSE_RULES
+)
+
+# Instructions for responses as JSON {id, text} entries
+JSON_TRANSLATION_INSTRUCTIONS = (
+    _TRANSLATION_STYLE + _HTML_TAG_RULES + _JSON_RESPONSE_RULES
+)
+
+# Instructions by (response format, markup replaced by placeholders)
+INSTRUCTIONS = {
+    (RESPONSE_FORMAT_NUMBERED, False): TRANSLATION_INSTRUCTIONS,
+    (RESPONSE_FORMAT_JSON, False): JSON_TRANSLATION_INSTRUCTIONS,
+    (RESPONSE_FORMAT_NUMBERED, True): (
+        _TRANSLATION_STYLE + _PLACEHOLDER_RULES + _NUMBERED_RESPONSE_RULES
+    ),
+    (RESPONSE_FORMAT_JSON, True): (
+        _TRANSLATION_STYLE + _PLACEHOLDER_RULES + _JSON_RESPONSE_RULES
+    ),
+}
+
+
+def get_prompt_version(response_format: str, markup_placeholders: bool) -> str:
+    """
+    Fingerprint the instructions a request is sent with.
+
+    Any change to the instruction wording gives a new version, so results
+    cached under the old prompt are not reused.
+
+    Args:
+        response_format: "numbered" or "json"
+        markup_placeholders: Whether markup is replaced by {n} placeholders
+
+    Returns:
+        Short hex digest of the instructions
+    """
+    return hashlib.blake2b(
+        INSTRUCTIONS[(response_format, markup_placeholders)].encode("utf-8"),
+        digest_size=8,
+    ).hexdigest()
+
+
+def build_segment_request(
+    texts: List[str], source_language: str, target_language: str
+) -> str:
+    """
+    Build the user message: the language pair, then the numbered segments.
+
+    Args:
+        texts: Subtitle texts to translate
+        source_language: Source language name (e.g., 'English')
+        target_language: Target language name (e.g., 'Hebrew')
+
+    Returns:
+        User message content
+    """
+    numbered_texts = [f"[{i}]\n{text}" for i, text in enumerate(texts, 1)]
+    return (
+        f"Translate the following {len(texts)} subtitle segments "
+        f"from {source_language} to {target_language}.\n\n"
+        + "\n\n".join(numbered_texts)
+    )
+
+
+class TranslationPrompt:
+    """Messages for one translation request."""
+
+    def __init__(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        response_format: str = RESPONSE_FORMAT_NUMBERED,
+        markup_placeholders: bool = False,
+    ):
+        """
+        Build the messages for a request.
+
+        Args:
+            texts: Subtitle texts to translate
+            source_language: Source language name (e.g., 'English')
+            target_language: Target language name (e.g., 'Hebrew')
+            response_format: "numbered" or "json"
+            markup_placeholders: Whether markup in texts was replaced by {n}
+                placeholders (see translator.markup_placeholders)
+        """
+        self.instructions = INSTRUCTIONS[(response_format, markup_placeholders)]
+        self.texts = texts
+        self.source_language = source_language
+        self.target_language = target_language
+        self.user_message = build_segment_request(
+            texts, source_language, target_language
+        )
+
+    @property
+    def messages(self) -> List[dict]:
+        """Chat messages, static instructions first."""
+        return [
+            {"role": "system", "content": self.instructions},
+            {"role": "user", "content": self.user_message},
+        ]
+
+    def overhead_tokens(self, model: str) -> int:
+        """
+        Count the prompt tokens spent on anything but the subtitle text.
+
+        The instructions and the request line with its segment markers are
+        counted without the texts, so the result does not depend on how the
+        tokenizer merges subtitle text with its surroundings.
+
+        Args:
+            model: Model whose tokenizer to count with
+
+        Returns:
+            Overhead tokens of the request
+        """
+        skeleton = build_segment_request(
+            [""] * len(self.texts), self.source_language, self.target_language
+        )
+        return count_tokens(self.instructions, model) + count_tokens(skeleton, model)
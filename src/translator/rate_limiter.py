@@ -0,0 +1,422 @@
+"""Cluster-wide OpenAI rate limiter shared by all translator processes.
+
+Each translator replica limits its own concurrency, but OpenAI enforces
+requests-per-minute (RPM) and tokens-per-minute (TPM) limits per account and
+model. Without coordination, replicas find the limit by collecting 429s,
+back off in sync, and then collide again.
+
+This module keeps two token buckets per model in a Redis hash. The RPM
+bucket refills at RPM/60 requests per second and the TPM bucket at TPM/60
+tokens per second; each holds at most one minute of capacity. Before a
+request, acquire() atomically takes one request and the request's estimated
+tokens from both buckets, or sleeps until the buckets hold enough.
+
+Retry-After and x-ratelimit-* headers from 429 responses pause all
+replicas until the provider's reset time. Successful responses are checked
+too, so a remaining count that reaches 0 pauses requests before the
+provider starts rejecting them.
+"""
+
+import asyncio
+import logging
+import math
+import random
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional, Tuple
+
+from redis.exceptions import RedisError
+
+from common.config import settings
+from common.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+# Redis hash holding both buckets for a model
+RATE_LIMIT_KEY_PREFIX = "translator:rate_limit"
+
+# Bucket state expires after this long without requests (buckets are full again)
+RATE_LIMIT_STATE_TTL_MS = 5 * 60 * 1000
+
+# Random extra delay (fraction of the wait) so waiting replicas don't wake in sync
+WAIT_JITTER_FRACTION = 0.1
+
+# Longest single sleep before re-checking the buckets
+MAX_WAIT_SECONDS = 60.0
+
+_DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNIT_MS = {"ms": 1, "s": 1000, "m": 60_000, "h": 3_600_000}
+
+
+def parse_reset_duration(value: str) -> Optional[int]:
+    """
+    Parse an x-ratelimit-reset-* header value such as "1s", "6m0s" or "20ms".
+
+    Args:
+        value: Header value
+
+    Returns:
+        Duration in milliseconds, or None if the value is not recognized
+    """
+    parts = _DURATION_PART_RE.findall(value.strip())
+    if not parts:
+        return None
+    return int(sum(float(amount) * _DURATION_UNIT_MS[unit] for amount, unit in parts))
+
+
+def get_retry_after_ms(headers: Optional[Mapping[str, str]]) -> Optional[int]:
+    """
+    Work out how long the provider asked us to wait.
+
+    Checks retry-after-ms, retry-after (seconds or HTTP date) and, when a
+    remaining count is exhausted, the matching x-ratelimit-reset-* header.
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+
+    Returns:
+        Milliseconds to wait, or None if the headers don't say
+    """
+    if not headers:
+        return None
+
+    waits = []
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            waits.append(int(float(retry_after_ms)))
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            waits.append(int(float(retry_after) * 1000))
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                waits.append(int((retry_at.timestamp() - time.time()) * 1000))
+            except (TypeError, ValueError):
+                pass
+
+    for kind in ("requests", "tokens"):
+        if headers.get(f"x-ratelimit-remaining-{kind}") == "0":
+            reset = headers.get(f"x-ratelimit-reset-{kind}")
+            reset_ms = parse_reset_duration(reset) if reset else None
+            if reset_ms is not None:
+                waits.append(reset_ms)
+
+    waits = [wait for wait in waits if wait > 0]
+    return max(waits) if waits else None
+
+
+def take_capacity(
+    state: Dict[str, float],
+    now_ms: int,
+    requests_per_minute: int,
+    tokens_per_minute: int,
+    cost: int,
+) -> Tuple[int, Dict[str, float]]:
+    """
+    Refill both buckets and try to take one request and cost tokens.
+
+    Same algorithm as OpenAIRateLimiter.TAKE_CAPACITY_SCRIPT, used when the
+    script cannot run.
+
+    Args:
+        state: Stored bucket state (may be empty)
+        now_ms: Current time in milliseconds
+        requests_per_minute: RPM limit (0 disables the request bucket)
+        tokens_per_minute: TPM limit (0 disables the token bucket)
+        cost: Tokens the request is expected to use
+
+    Returns:
+        Tuple of (milliseconds to wait, new state); capacity was taken if the
+        wait is 0
+    """
+    updated = float(state.get("updated_ms", now_ms))
+    elapsed = max(0.0, now_ms - updated)
+    requests = min(
+        requests_per_minute,
+        float(state.get("requests", requests_per_minute))
+        + elapsed * requests_per_minute / 60000,
+    )
+    tokens = min(
+        tokens_per_minute,
+        float(state.get("tokens", tokens_per_minute))
+        + elapsed * tokens_per_minute / 60000,
+    )
+    blocked_until = float(state.get("blocked_until_ms", 0))
+
+    wait = max(0.0, blocked_until - now_ms)
+    if requests_per_minute > 0 and requests < 1:
+        wait = max(wait, (1 - requests) * 60000 / requests_per_minute)
+    if tokens_per_minute > 0 and tokens < cost:
+        wait = max(wait, (cost - tokens) * 60000 / tokens_per_minute)
+
+    wait_ms = math.ceil(wait)
+    if wait_ms == 0:
+        if requests_per_minute > 0:
+            requests -= 1
+        if tokens_per_minute > 0:
+            tokens -= cost
+
+    new_state = {
+        "requests": requests,
+        "tokens": tokens,
+        "updated_ms": now_ms,
+        "blocked_until_ms": blocked_until,
+    }
+    return wait_ms, new_state
+
+
+class OpenAIRateLimiter:
+    """Redis-backed RPM/TPM token buckets shared by all translator workers."""
+
+    # Lua script for atomic refill-and-take on both buckets; returns the
+    # milliseconds to wait (0 if capacity was taken)
+    TAKE_CAPACITY_SCRIPT = """
+    local key = KEYS[1]
+    local now = tonumber(ARGV[1])
+    local rpm = tonumber(ARGV[2])
+    local tpm = tonumber(ARGV[3])
+    local cost = tonumber(ARGV[4])
+    local ttl = tonumber(ARGV[5])
+
+    local state = redis.call('HMGET', key, 'requests', 'tokens', 'updated_ms', 'blocked_until_ms')
+    local updated = tonumber(state[3]) or now
+    local elapsed = math.max(0, now - updated)
+    local requests = math.min(rpm, (tonumber(state[1]) or rpm) + elapsed * rpm / 60000)
+    local tokens = math.min(tpm, (tonumber(state[2]) or tpm) + elapsed * tpm / 60000)
+    local blocked_until = tonumber(state[4]) or 0
+
+    local wait = math.max(0, blocked_until - now)
+    if rpm > 0 and requests < 1 then
+        wait = math.max(wait, (1 - requests) * 60000 / rpm)
+    end
+    if tpm > 0 and tokens < cost then
+        wait = math.max(wait, (cost - tokens) * 60000 / tpm)
+    end
+
+    wait = math.ceil(wait)
+    if wait == 0 then
+        if rpm > 0 then requests = requests - 1 end
+        if tpm > 0 then tokens = tokens - cost end
+    end
+
+    redis.call('HSET', key, 'requests', tostring(requests), 'tokens', tostring(tokens),
+        'updated_ms', now, 'blocked_until_ms', blocked_until)
+    redis.call('PEXPIRE', key, ttl)
+    return wait
+    """
+
+    def __init__(self):
+        """Initialize the limiter."""
+        self._take_capacity_script = None
+        # Pause learned from headers, honored even when Redis is unavailable
+        self._blocked_until: Dict[str, float] = {}
+
+    @staticmethod
+    def _get_key(model: str) -> str:
+        """
+        Generate Redis key for a model's buckets.
+
+        Args:
+            model: OpenAI model name
+
+        Returns:
+            Redis key string
+        """
+        return f"{RATE_LIMIT_KEY_PREFIX}:{model}"
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Whether an RPM or TPM limit is configured."""
+        return (
+            settings.openai_requests_per_minute > 0
+            or settings.openai_tokens_per_minute > 0
+        )
+
+    async def _ensure_script_loaded(self) -> None:
+        """Ensure the Lua script is registered with the Redis client."""
+        if self._take_capacity_script is None and redis_client.client:
+            try:
+                self._take_capacity_script = redis_client.client.register_script(
+                    self.TAKE_CAPACITY_SCRIPT
+                )
+            except Exception as e:
+                logger.warning(f"Failed to register rate limit Lua script: {e}")
+
+    async def acquire(self, model: str, estimated_tokens: int) -> float:
+        """
+        Wait until the shared buckets allow one more request.
+
+        Does nothing if no limit is configured. Without Redis only pauses
+        requested by response headers are honored.
+
+        Args:
+            model: OpenAI model name
+            estimated_tokens: Prompt plus completion tokens the request may use
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+
+        local_wait = self._blocked_until.get(model, 0.0) - time.monotonic()
+        if local_wait > 0:
+            logger.info(f"⏳ Waiting {local_wait:.1f}s for OpenAI rate limit reset")
+            await asyncio.sleep(local_wait)
+            waited += local_wait
+
+        if not self.is_enabled() or not (
+            redis_client.connected and redis_client.client
+        ):
+            return waited
+
+        tokens_per_minute = settings.openai_tokens_per_minute
+        # A request larger than the whole bucket must still be allowed through
+        cost = (
+            min(estimated_tokens, tokens_per_minute)
+            if tokens_per_minute > 0
+            else estimated_tokens
+        )
+
+        while True:
+            try:
+                wait_ms = await self._take_capacity(model, cost)
+            except RedisError as e:
+                logger.warning(f"Rate limiter unavailable, not limiting: {e}")
+                return waited
+
+            if wait_ms <= 0:
+                return waited
+
+            delay = min(
+                MAX_WAIT_SECONDS,
+                wait_ms / 1000 * (1 + random.uniform(0, WAIT_JITTER_FRACTION)),
+            )
+            logger.debug(f"Rate limit reached for {model}, waiting {delay:.2f}s")
+            await asyncio.sleep(delay)
+            waited += delay
+
+    async def _take_capacity(self, model: str, cost: int) -> int:
+        """
+        Try to take capacity from both buckets.
+
+        Args:
+            model: OpenAI model name
+            cost: Tokens to take from the TPM bucket
+
+        Returns:
+            Milliseconds to wait before trying again (0 if capacity was taken)
+        """
+        key = self._get_key(model)
+        now_ms = int(time.time() * 1000)
+        requests_per_minute = settings.openai_requests_per_minute
+        tokens_per_minute = settings.openai_tokens_per_minute
+
+        await self._ensure_script_loaded()
+        if self._take_capacity_script:
+            try:
+                return int(
+                    await self._take_capacity_script(
+                        keys=[key],
+                        args=[
+                            now_ms,
+                            requests_per_minute,
+                            tokens_per_minute,
+                            cost,
+                            RATE_LIMIT_STATE_TTL_MS,
+                        ],
+                    )
+                )
+            except RedisError as script_error:
+                # Lua script failed (e.g., FakeRedis doesn't support evalsha)
+                logger.debug(
+                    f"Rate limit Lua script failed: {script_error}. "
+                    "Using fallback method."
+                )
+
+        return await self._fallback_take_capacity(
+            key, now_ms, requests_per_minute, tokens_per_minute, cost
+        )
+
+    async def _fallback_take_capacity(
+        self,
+        key: str,
+        now_ms: int,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        cost: int,
+    ) -> int:
+        """
+        Non-atomic version of the Lua script.
+
+        Args:
+            key: Redis key for the model's buckets
+            now_ms: Current time in milliseconds
+            requests_per_minute: RPM limit
+            tokens_per_minute: TPM limit
+            cost: Tokens to take from the TPM bucket
+
+        Returns:
+            Milliseconds to wait before trying again (0 if capacity was taken)
+        """
+        state = await redis_client.client.hgetall(key)
+        wait_ms, new_state = take_capacity(
+            state, now_ms, requests_per_minute, tokens_per_minute, cost
+        )
+        pipe = redis_client.client.pipeline()
+        pipe.hset(key, mapping=new_state)
+        pipe.pexpire(key, RATE_LIMIT_STATE_TTL_MS)
+        await pipe.execute()
+        return wait_ms
+
+    async def observe_headers(
+        self, model: str, headers: Optional[Mapping[str, str]]
+    ) -> Optional[int]:
+        """
+        Pause requests for a model as asked by rate limit response headers.
+
+        The pause applies in-process immediately and, through the shared
+        bucket state, to every other replica.
+
+        Args:
+            model: OpenAI model name
+            headers: Response headers from a rate limited or successful request
+
+        Returns:
+            Milliseconds of pause applied, or None if the headers asked for none
+        """
+        wait_ms = get_retry_after_ms(headers)
+        if wait_ms is None:
+            return None
+
+        self._blocked_until[model] = max(
+            self._blocked_until.get(model, 0.0), time.monotonic() + wait_ms / 1000
+        )
+        logger.warning(
+            f"⚠️  OpenAI asked to wait {wait_ms / 1000:.1f}s before more {model} requests"
+        )
+
+        if redis_client.connected and redis_client.client:
+            key = self._get_key(model)
+            blocked_until_ms = int(time.time() * 1000) + wait_ms
+            try:
+                stored = await redis_client.client.hget(key, "blocked_until_ms")
+                if stored is None or float(stored) < blocked_until_ms:
+                    pipe = redis_client.client.pipeline()
+                    pipe.hset(key, "blocked_until_ms", blocked_until_ms)
+                    pipe.pexpire(key, RATE_LIMIT_STATE_TTL_MS + wait_ms)
+                    await pipe.execute()
+            except (RedisError, ValueError) as e:
+                logger.warning(f"Failed to share rate limit pause for {model}: {e}")
+
+        return wait_ms
+
+
+# Global rate limiter shared by all translation requests in this process
+openai_rate_limiter = OpenAIRateLimiter()
@@ -0,0 +1,185 @@
+"""Parsing of translation responses in the numbered and JSON formats.
+
+The numbered format ("[1]\\ntext\\n\\n[2]\\ntext") is parsed with the same
+anchored marker pattern the stream parser uses: a marker counts only at the
+start of a line and only with digits inside the brackets, so SDH tags such as
+"[door creaks]" or "[MUSIC]" inside a subtitle no longer split it.
+
+With TRANSLATION_RESPONSE_FORMAT=json the model is asked for a JSON object
+{"translations": [{"id": 1, "text": "..."}]} under a strict JSON schema, and
+the response is validated entry by entry.
+
+ResponseFormatStats counts, per format, how many responses did not parse to
+the expected number of segments and how those mismatches were resolved, so
+the formats can be compared from the translator worker's status log.
+"""
+
+import json
+import logging
+import threading
+from typing import Any, Dict
+
+from translator.stream_parser import SEGMENT_MARKER_PATTERN
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_FORMAT_NUMBERED = "numbered"
+RESPONSE_FORMAT_JSON = "json"
+
+# response_format for Chat Completions in JSON mode
+TRANSLATIONS_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "subtitle_translations",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "translations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "text": {"type": "string"},
+                        },
+                        "required": ["id", "text"],
+                        "additionalProperties": False,
+                    },
+                }
+            },
+            "required": ["translations"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+def parse_numbered_response(response: str, expected_count: int) -> Dict[int, str]:
+    """
+    Parse "[n]" blocks from a numbered response.
+
+    Text before the first marker, repeated numbers and numbers outside
+    1..expected_count are ignored.
+
+    Args:
+        response: Raw response content
+        expected_count: Number of segments in the request
+
+    Returns:
+        Translated texts keyed by 1-based segment number
+    """
+    translations: Dict[int, str] = {}
+    markers = list(SEGMENT_MARKER_PATTERN.finditer(response))
+    for marker, next_marker in zip(markers, markers[1:] + [None]):
+        number = int(marker.group(1))
+        if number in translations or not 1 <= number <= expected_count:
+            continue
+        end = next_marker.start() if next_marker else len(response)
+        translations[number] = response[marker.end() : end].strip()
+    return translations
+
+
+def parse_json_response(response: str, expected_count: int) -> Dict[int, str]:
+    """
+    Parse and validate a JSON response of {id, text} entries.
+
+    Both {"translations": [...]} and a bare array are accepted. Entries
+    without an integer id and a string text, repeated ids and ids outside
+    1..expected_count are ignored; content that is not JSON parses to nothing.
+
+    Args:
+        response: Raw response content
+        expected_count: Number of segments in the request
+
+    Returns:
+        Translated texts keyed by 1-based segment number
+    """
+    try:
+        data = json.loads(response)
+    except json.JSONDecodeError as e:
+        logger.warning(f"⚠️  Translation response is not valid JSON: {e}")
+        return {}
+
+    entries = data.get("translations") if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        logger.warning("⚠️  Translation response JSON has no translations array")
+        return {}
+
+    translations: Dict[int, str] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        number = entry.get("id")
+        text = entry.get("text")
+        if isinstance(number, bool) or not isinstance(number, int):
+            continue
+        if not isinstance(text, str) or number in translations:
+            continue
+        if 1 <= number <= expected_count:
+            translations[number] = text.strip()
+    return translations
+
+
+class ResponseFormatStats:
+    """Process-wide parse outcome counters per response format."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, int]] = {}
+
+    def _increment(self, response_format: str, counter: str) -> None:
+        """Add one to a counter of a format."""
+        with self._lock:
+            counts = self._counts.setdefault(
+                response_format,
+                {"responses": 0, "mismatches": 0, "repaired": 0, "resent": 0},
+            )
+            counts[counter] += 1
+
+    def record_response(self, response_format: str, mismatched: bool) -> None:
+        """
+        Record one parsed response.
+
+        Args:
+            response_format: Format the response was requested in
+            mismatched: Whether it parsed to a different number of segments
+                than were sent
+        """
+        self._increment(response_format, "responses")
+        if mismatched:
+            self._increment(response_format, "mismatches")
+
+    def record_repaired(self, response_format: str) -> None:
+        """Record a mismatch filled in by re-requesting only missing segments."""
+        self._increment(response_format, "repaired")
+
+    def record_resent(self, response_format: str) -> None:
+        """Record a mismatch that sent the whole chunk back for a paid retry."""
+        self._increment(response_format, "resent")
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get counters and rates per format for the worker status log.
+
+        Returns:
+            Per-format counts with mismatch_rate and resend_rate (per response)
+        """
+        with self._lock:
+            status = {}
+            for response_format, counts in self._counts.items():
+                responses = counts["responses"]
+                status[response_format] = {
+                    **counts,
+                    "mismatch_rate": (
+                        round(counts["mismatches"] / responses, 4) if responses else 0.0
+                    ),
+                    "resend_rate": (
+                        round(counts["resent"] / responses, 4) if responses else 0.0
+                    ),
+                }
+            return status
+
+
+# Global response format stats instance
+response_format_stats = ResponseFormatStats()
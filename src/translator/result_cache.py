@@ -0,0 +1,235 @@
+"""Content-addressed cache of whole translated subtitle files.
+
+The same subtitle is often translated more than once: jobs are re-run, a
+video is re-added, or one release shows up under two library paths. Finished
+translations are kept on disk under a key derived from the parsed source
+content, the language pair, the model, the response format and the prompt
+version, so a repeat job can put the previous output in place without calling
+OpenAI.
+
+Cache entries are hard links to the translated files when the filesystem
+allows it (copies otherwise), so a hit costs no extra disk space. Entries
+unused for TRANSLATION_RESULT_CACHE_MAX_AGE_DAYS are dropped, and above
+TRANSLATION_RESULT_CACHE_MAX_SIZE_MB the least recently used ones are evicted.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable
+
+from common.config import settings
+from common.subtitle_parser import SubtitleSegment
+
+logger = logging.getLogger(__name__)
+
+
+def compute_source_hash(segments: Iterable[SubtitleSegment]) -> str:
+    """
+    Hash the content of parsed subtitle segments.
+
+    Only timing and text are hashed, so the same subtitles saved with a BOM,
+    CRLF line endings, extra blank lines or different numbering share a hash.
+
+    Args:
+        segments: Parsed source subtitle segments
+
+    Returns:
+        Hex digest of the normalized content
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    for segment in segments:
+        digest.update(
+            f"{segment.start_ms}\x1f{segment.end_ms}\x1f{segment.text}\x1e".encode(
+                "utf-8"
+            )
+        )
+    return digest.hexdigest()
+
+
+def _place_file(source: Path, destination: Path) -> None:
+    """
+    Atomically put a hard link to (or copy of) source at destination.
+
+    Args:
+        source: Existing file
+        destination: Path to create or replace
+    """
+    fd, temp_name = tempfile.mkstemp(
+        dir=destination.parent, prefix=f".{destination.name}.", suffix=".tmp"
+    )
+    os.close(fd)
+    try:
+        os.unlink(temp_name)
+        try:
+            os.link(source, temp_name)
+        except OSError:
+            # Cross-device or no hard link support
+            shutil.copy2(source, temp_name)
+        os.replace(temp_name, destination)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class TranslationResultCache:
+    """Stores finished translations keyed by source content hash."""
+
+    def __init__(self):
+        """Initialize the cache directory."""
+        self._cache_dir = self._get_cache_directory()
+
+    def _get_cache_directory(self) -> Path:
+        """
+        Get the result cache directory path.
+
+        Returns:
+            Path to result cache directory
+        """
+        if settings.translation_result_cache_path:
+            cache_path = Path(settings.translation_result_cache_path)
+        else:
+            cache_path = Path(settings.subtitle_storage_path) / "translation_cache"
+
+        cache_path.mkdir(parents=True, exist_ok=True)
+        return cache_path
+
+    @staticmethod
+    def build_key(
+        source_hash: str,
+        source_language: str,
+        target_language: str,
+        model: str,
+        response_format: str,
+        prompt_version: str,
+    ) -> str:
+        """
+        Build the cache key for a translation.
+
+        Args:
+            source_hash: Result of compute_source_hash() for the source file
+            source_language: Source language code
+            target_language: Target language code
+            model: OpenAI model name
+            response_format: Response format requests are sent with
+            prompt_version: Fingerprint of the translation instructions
+
+        Returns:
+            Cache key (safe to use as a file name)
+        """
+        return hashlib.blake2b(
+            f"{source_hash}:{source_language}:{target_language}:{model}:"
+            f"{response_format}:{prompt_version}".encode("utf-8"),
+            digest_size=20,
+        ).hexdigest()
+
+    def get_cache_path(self, key: str) -> Path:
+        """
+        Get the cached file path for a key.
+
+        Args:
+            key: Cache key from build_key()
+
+        Returns:
+            Path of the cached translation
+        """
+        return self._cache_dir / f"{key}.srt"
+
+    def restore(self, key: str, output_path: Path) -> bool:
+        """
+        Put a cached translation at output_path, if one exists.
+
+        Args:
+            key: Cache key from build_key()
+            output_path: Where the translated subtitle belongs
+
+        Returns:
+            True on a cache hit, False otherwise
+        """
+        cache_path = self.get_cache_path(key)
+        if not cache_path.exists():
+            return False
+
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            _place_file(cache_path, output_path)
+            # Mark the entry as recently used for eviction
+            os.utime(cache_path)
+        except OSError as e:
+            logger.warning(f"⚠️  Failed to restore cached translation {key}: {e}")
+            return False
+
+        logger.info(f"♻️  Restored cached translation to {output_path}")
+        return True
+
+    def store(self, key: str, output_path: Path) -> None:
+        """
+        Add a finished translation to the cache.
+
+        Failures are logged and ignored; the translation itself succeeded.
+
+        Args:
+            key: Cache key from build_key()
+            output_path: Translated subtitle file to cache
+        """
+        try:
+            _place_file(output_path, self.get_cache_path(key))
+            logger.debug(f"Cached translation {output_path} as {key}")
+        except OSError as e:
+            logger.warning(f"⚠️  Failed to cache translation {output_path}: {e}")
+            return
+
+        self.evict()
+
+    def evict(self) -> int:
+        """
+        Remove expired entries, then the least recently used ones over the size limit.
+
+        Removing an entry only unlinks the cache's hard link; translated files
+        that share it are untouched.
+
+        Returns:
+            Number of entries removed
+        """
+        entries = []
+        for cache_path in self._cache_dir.glob("*.srt"):
+            try:
+                stat = cache_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, cache_path))
+        # Oldest (least recently used) first
+        entries.sort()
+
+        expires_before = (
+            time.time() - settings.translation_result_cache_max_age_days * 24 * 60 * 60
+        )
+        max_bytes = settings.translation_result_cache_max_size_mb * 1024 * 1024
+        total_bytes = sum(size for _, size, _ in entries)
+
+        removed = 0
+        for mtime, size, cache_path in entries:
+            if mtime >= expires_before and total_bytes <= max_bytes:
+                break
+            try:
+                cache_path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(
+                    f"⚠️  Failed to evict cached translation {cache_path}: {e}"
+                )
+                continue
+            total_bytes -= size
+            removed += 1
+
+        if removed:
+            logger.info(f"🧹 Evicted {removed} cached translations")
+        return removed
@@ -7,6 +7,62 @@ from common.schemas import TranslationCheckpoint
 from common.subtitle_parser import SubtitleSegment
 
 
+class TranslationJobStats:
+    """Per-job counters reported in the TRANSLATION_COMPLETED payload."""
+
+    def __init__(self):
+        self.segments_translated = 0
+        self.memory_hits = 0
+        # Estimated prompt + completion tokens not sent thanks to memory hits
+        self.tokens_saved = 0
+        # Segments kept or copied locally by the pre-filter, and the
+        # estimated prompt + completion tokens that avoided
+        self.prefiltered_segments = 0
+        self.prefilter_tokens_saved = 0
+        self.api_requests = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        # Prompt tokens billed at the provider's cached-input rate
+        self.cached_tokens = 0
+        # Prompt tokens spent on instructions and segment markers
+        self.prompt_overhead_tokens = 0
+        # Markup tags the model dropped, restored without a retry
+        self.markup_repairs = 0
+
+    @property
+    def memory_hit_rate(self) -> float:
+        """Fraction of translated segments served from translation memory."""
+        if not self.segments_translated:
+            return 0.0
+        return self.memory_hits / self.segments_translated
+
+    def record_result(self, result: "TranslationResult") -> None:
+        """Add the usage reported by one translate_batch call."""
+        self.api_requests += 1
+        self.prompt_tokens += result.prompt_tokens
+        self.completion_tokens += result.completion_tokens
+        self.cached_tokens += result.cached_tokens
+        self.prompt_overhead_tokens += result.overhead_tokens
+        self.markup_repairs += result.markup_repairs
+
+    def to_dict(self) -> dict:
+        """Serialize counters for event payloads."""
+        return {
+            "segments_translated": self.segments_translated,
+            "memory_hits": self.memory_hits,
+            "memory_hit_rate": round(self.memory_hit_rate, 4),
+            "tokens_saved": self.tokens_saved,
+            "prefiltered_segments": self.prefiltered_segments,
+            "prefilter_tokens_saved": self.prefilter_tokens_saved,
+            "api_requests": self.api_requests,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached_tokens": self.cached_tokens,
+            "prompt_overhead_tokens": self.prompt_overhead_tokens,
+            "markup_repairs": self.markup_repairs,
+        }
+
+
 class TranslationTaskData:
     """Data structure for parsed translation task."""
 
@@ -16,11 +72,35 @@ class TranslationTaskData:
         subtitle_file_path: str,
         source_language: str,
         target_language: str,
+        target_languages: Optional[List[str]] = None,
     ):
         self.request_id = request_id
         self.subtitle_file_path = subtitle_file_path
         self.source_language = source_language
         self.target_language = target_language
+        # Every target language of the task, target_language first
+        self.target_languages = target_languages or [target_language]
+        self.stats = TranslationJobStats()
+
+    def for_language(self, target_language: str) -> "TranslationTaskData":
+        """
+        Get the task data for one target language of the task.
+
+        Args:
+            target_language: One of target_languages
+
+        Returns:
+            This object for target_language itself, otherwise a single-target
+            copy with its own stats
+        """
+        if target_language == self.target_language:
+            return self
+        return TranslationTaskData(
+            request_id=self.request_id,
+            subtitle_file_path=self.subtitle_file_path,
+            source_language=self.source_language,
+            target_language=target_language,
+        )
 
 
 class CheckpointState:
@@ -30,12 +110,47 @@ class CheckpointState:
         self,
         checkpoint: Optional[TranslationCheckpoint],
         all_translated_segments: List[SubtitleSegment],
-        start_chunk_idx: int,
     ):
         self.checkpoint = checkpoint
         self.all_translated_segments = all_translated_segments
-        self.start_chunk_idx = start_chunk_idx
 
 
+class TranslationResult:
+    """Outcome of a single translate_batch call.
+
+    Returned per call so concurrent chunks never share state on the
+    translator instance.
+    """
 
+    def __init__(
+        self,
+        translations: List[str],
+        parsed_segment_numbers: Optional[List[int]] = None,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        latency_seconds: float = 0.0,
+        finish_reason: Optional[str] = None,
+        first_segment_seconds: Optional[float] = None,
+        cached_tokens: int = 0,
+        overhead_tokens: int = 0,
+    ):
+        self.translations = translations
+        # 1-based numbers parsed from the response, or None if all were parsed
+        self.parsed_segment_numbers = parsed_segment_numbers
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.latency_seconds = latency_seconds
+        self.finish_reason = finish_reason
+        # Time until a streamed response completed its first segment
+        self.first_segment_seconds = first_segment_seconds
+        # Prompt tokens read from the provider's prompt cache
+        self.cached_tokens = cached_tokens
+        # Prompt tokens other than the subtitle text (instructions, markers)
+        self.overhead_tokens = overhead_tokens
+        # Markup tags missing from the response and put back locally
+        self.markup_repairs = 0
 
+    @property
+    def total_tokens(self) -> int:
+        """Prompt plus completion tokens reported for the call."""
+        return self.prompt_tokens + self.completion_tokens
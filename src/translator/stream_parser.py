@@ -0,0 +1,99 @@
+"""Incremental parsing of numbered translation blocks from a streamed response.
+
+The translation prompt asks for blocks like "[1]\\ntext\\n\\n[2]\\ntext". While
+a completion streams in, a block is known to be complete once the marker of
+the next block has arrived; the last block is complete when the stream ends
+normally. SegmentStreamParser hands out each block at that point so finished
+segments can be used before the whole response is in.
+
+Markers are only recognized at the start of a line and only once their closing
+bracket has arrived, so a marker split across two deltas never closes a block
+early.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+# "[n]" at the start of a line, optionally indented
+SEGMENT_MARKER_PATTERN = re.compile(r"^[ \t]*\[(\d+)\]", re.MULTILINE)
+
+
+class SegmentStreamParser:
+    """Collects streamed text and returns numbered blocks as they close."""
+
+    def __init__(self, expected_count: int):
+        """
+        Initialize the parser.
+
+        Args:
+            expected_count: Number of segments in the request; blocks numbered
+                outside 1..expected_count are ignored
+        """
+        self.expected_count = expected_count
+        self._buffer = ""
+        self._current_number: Optional[int] = None
+        self._emitted: set[int] = set()
+
+    @property
+    def completed_count(self) -> int:
+        """Number of distinct blocks returned so far."""
+        return len(self._emitted)
+
+    def feed(self, text: str) -> List[Tuple[int, str]]:
+        """
+        Add streamed text and return the blocks it completed.
+
+        Args:
+            text: Next piece of the response content
+
+        Returns:
+            List of (segment_number, text) for blocks closed by this text,
+            with 1-based segment numbers
+        """
+        self._buffer += text
+        completed = []
+        search_from = 0
+        while True:
+            match = SEGMENT_MARKER_PATTERN.search(self._buffer, search_from)
+            if match is None:
+                break
+            # The buffer starts right after the open block's marker, where "^"
+            # also matches; that is not a new marker
+            if match.start() == 0 and self._current_number is not None:
+                search_from = match.end()
+                continue
+
+            self._close_current(self._buffer[: match.start()], completed)
+            self._current_number = int(match.group(1))
+            self._buffer = self._buffer[match.end() :]
+            search_from = 0
+        return completed
+
+    def finish(self) -> List[Tuple[int, str]]:
+        """
+        Close the last block once the response is known to be complete.
+
+        Returns:
+            The last block as a one-item list, or an empty list
+        """
+        completed: List[Tuple[int, str]] = []
+        self._close_current(self._buffer, completed)
+        self._current_number = None
+        self._buffer = ""
+        return completed
+
+    def _close_current(self, text: str, completed: List[Tuple[int, str]]) -> None:
+        """
+        Record the open block as complete, if it is one worth returning.
+
+        Args:
+            text: Text of the open block
+            completed: List to append (segment_number, text) to
+        """
+        number = self._current_number
+        if number is None or number in self._emitted:
+            return
+        if not 1 <= number <= self.expected_count:
+            return
+        self._emitted.add(number)
+        completed.append((number, text.strip()))
@@ -0,0 +1,235 @@
+"""Self-calibrating token estimates from real OpenAI usage.
+
+When tiktoken is unavailable, token counts fall back to a flat ~4 characters
+per token, which badly misjudges languages such as Hebrew, Japanese or Arabic.
+This module records the usage OpenAI reports for each language pair against
+the characters that were sent, and turns the running totals into:
+
+- a source-language chars-per-token ratio for split_subtitle_content()
+- a completion-tokens-per-source-character ratio for max_completion_tokens
+
+Totals are kept in-process and mirrored to a Redis hash per language pair so
+all translator workers learn from each other.
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from redis.exceptions import RedisError
+
+from common.config import settings
+from common.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+# Redis hash holding running totals for a source/target language pair
+CALIBRATION_KEY_PREFIX = "translator:token_calibration"
+
+# Calibration keys expire if a language pair goes unused for this long
+CALIBRATION_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Characters per token assumed for English prompt instructions
+INSTRUCTION_CHARS_PER_TOKEN = 4.0
+
+# Headroom applied to the predicted completion size
+COMPLETION_TOKEN_HEADROOM = 1.3
+
+# Calibrated max_completion_tokens never exceeds this multiple of the setting
+MAX_COMPLETION_TOKENS_MULTIPLIER = 4
+
+
+@dataclass
+class TokenCalibration:
+    """Running usage totals for one source/target language pair."""
+
+    samples: int = 0
+    source_chars: int = 0
+    source_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def is_reliable(self) -> bool:
+        """Whether enough usage has been observed to trust the ratios."""
+        return (
+            self.samples >= settings.token_calibration_min_samples
+            and self.source_chars > 0
+            and self.source_tokens > 0
+        )
+
+    @property
+    def chars_per_token(self) -> Optional[float]:
+        """Observed source-language characters per prompt token, if reliable."""
+        if not self.is_reliable:
+            return None
+        return self.source_chars / self.source_tokens
+
+    @property
+    def completion_tokens_per_char(self) -> Optional[float]:
+        """Observed completion tokens per source character, if reliable."""
+        if not self.is_reliable or self.completion_tokens <= 0:
+            return None
+        return self.completion_tokens / self.source_chars
+
+    def max_completion_tokens(self, source_chars: int, configured: int) -> int:
+        """
+        Size the completion budget for a chunk of source text.
+
+        Args:
+            source_chars: Characters of subtitle text in the chunk
+            configured: Configured max_completion_tokens (used as the floor)
+
+        Returns:
+            Completion token limit to request
+        """
+        ratio = self.completion_tokens_per_char
+        if ratio is None:
+            return configured
+
+        predicted = math.ceil(source_chars * ratio * COMPLETION_TOKEN_HEADROOM)
+        return min(
+            max(configured, predicted), configured * MAX_COMPLETION_TOKENS_MULTIPLIER
+        )
+
+
+class TokenCalibrator:
+    """Collects per-language-pair usage and serves calibrated token ratios."""
+
+    def __init__(self):
+        """Initialize empty in-process calibration totals."""
+        self._calibrations: Dict[Tuple[str, str], TokenCalibration] = {}
+
+    @staticmethod
+    def _get_key(source_language: str, target_language: str) -> str:
+        """
+        Generate Redis key for a language pair.
+
+        Args:
+            source_language: Source language code
+            target_language: Target language code
+
+        Returns:
+            Redis key string
+        """
+        return f"{CALIBRATION_KEY_PREFIX}:{source_language}:{target_language}"
+
+    def get(self, source_language: str, target_language: str) -> TokenCalibration:
+        """
+        Get the current calibration for a language pair without touching Redis.
+
+        Args:
+            source_language: Source language code
+            target_language: Target language code
+
+        Returns:
+            TokenCalibration (empty if nothing has been observed)
+        """
+        if not settings.token_calibration_enabled:
+            return TokenCalibration()
+        return self._calibrations.get(
+            (source_language, target_language), TokenCalibration()
+        )
+
+    async def refresh(
+        self, source_language: str, target_language: str
+    ) -> TokenCalibration:
+        """
+        Reload a language pair's totals from Redis, shared by all workers.
+
+        Falls back to the in-process totals when Redis is unavailable.
+
+        Args:
+            source_language: Source language code
+            target_language: Target language code
+
+        Returns:
+            Current TokenCalibration for the language pair
+        """
+        if not settings.token_calibration_enabled:
+            return TokenCalibration()
+
+        pair = (source_language, target_language)
+        if redis_client.connected and redis_client.client:
+            try:
+                totals = await redis_client.client.hgetall(
+                    self._get_key(source_language, target_language)
+                )
+                if totals:
+                    self._calibrations[pair] = TokenCalibration(
+                        samples=int(totals.get("samples", 0)),
+                        source_chars=int(totals.get("source_chars", 0)),
+                        source_tokens=int(totals.get("source_tokens", 0)),
+                        completion_tokens=int(totals.get("completion_tokens", 0)),
+                    )
+            except (RedisError, ValueError) as e:
+                logger.warning(f"Failed to load token calibration for {pair}: {e}")
+
+        calibration = self.get(source_language, target_language)
+        if calibration.is_reliable:
+            logger.info(
+                f"📏 Token calibration {source_language}->{target_language}: "
+                f"{calibration.chars_per_token:.2f} chars/token, "
+                f"{calibration.completion_tokens_per_char:.3f} completion tokens/char "
+                f"({calibration.samples} samples)"
+            )
+        return calibration
+
+    async def record_usage(
+        self,
+        source_language: str,
+        target_language: str,
+        source_chars: int,
+        instruction_chars: int,
+        prompt_tokens: int,
+        completion_tokens: int,
+    ) -> None:
+        """
+        Record token usage reported by OpenAI for one translation request.
+
+        The prompt's fixed instructions are discounted at
+        INSTRUCTION_CHARS_PER_TOKEN so the remaining prompt tokens can be
+        attributed to the subtitle text itself.
+
+        Args:
+            source_language: Source language code
+            target_language: Target language code
+            source_chars: Characters of subtitle text sent
+            instruction_chars: Characters of prompt text other than subtitles
+            prompt_tokens: usage.prompt_tokens from the response
+            completion_tokens: usage.completion_tokens from the response
+        """
+        if not settings.token_calibration_enabled or source_chars <= 0:
+            return
+
+        source_tokens = prompt_tokens - math.ceil(
+            instruction_chars / INSTRUCTION_CHARS_PER_TOKEN
+        )
+        if source_tokens <= 0 or completion_tokens <= 0:
+            return
+
+        pair = (source_language, target_language)
+        calibration = self._calibrations.setdefault(pair, TokenCalibration())
+        calibration.samples += 1
+        calibration.source_chars += source_chars
+        calibration.source_tokens += source_tokens
+        calibration.completion_tokens += completion_tokens
+
+        if not (redis_client.connected and redis_client.client):
+            return
+
+        try:
+            key = self._get_key(source_language, target_language)
+            pipe = redis_client.client.pipeline()
+            pipe.hincrby(key, "samples", 1)
+            pipe.hincrby(key, "source_chars", source_chars)
+            pipe.hincrby(key, "source_tokens", source_tokens)
+            pipe.hincrby(key, "completion_tokens", completion_tokens)
+            pipe.expire(key, CALIBRATION_TTL_SECONDS)
+            await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to record token calibration for {pair}: {e}")
+
+
+# Global calibrator instance shared by the translator service and orchestrator
+token_calibrator = TokenCalibrator()
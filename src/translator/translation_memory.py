@@ -0,0 +1,225 @@
+"""Translation memory for subtitle lines that repeat across files.
+
+Theme-song lyrics, recaps, credits and short replies ("Yes.", "What?") recur
+in every episode of a series. Their translations are stored in Redis keyed
+by normalized source text, language pair, model, response format, prompt
+version and markup placeholder setting, so later chunks and later jobs sent
+with the same prompt can skip sending them to OpenAI.
+
+Each entry is a plain string key with a TTL that is renewed whenever the
+entry is used, so rarely used lines expire first. With Redis configured
+for maxmemory-policy allkeys-lru, memory pressure evicts the least recently
+used entries as well.
+"""
+
+import hashlib
+import logging
+import re
+import unicodedata
+from typing import Dict, List, Sequence
+
+from redis.exceptions import RedisError
+
+from common.config import settings
+from common.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for translation memory entries
+MEMORY_KEY_PREFIX = "translator:memory"
+
+# Lines longer than this are unlikely to repeat verbatim and are not stored
+MAX_MEMORY_TEXT_CHARS = 300
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize subtitle text for translation memory lookups.
+
+    Unicode is NFC-normalized and runs of whitespace (including line breaks)
+    are collapsed. Case and punctuation are kept, since they change the
+    translation.
+
+    Args:
+        text: Subtitle text
+
+    Returns:
+        Normalized text
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+class TranslationMemory:
+    """Redis-backed store of previously translated subtitle lines."""
+
+    @staticmethod
+    def _get_key(
+        text: str,
+        source_language: str,
+        target_language: str,
+        model: str,
+        response_format: str,
+        prompt_version: str,
+        markup_placeholders: bool,
+    ) -> str:
+        """
+        Generate Redis key for a line of source text.
+
+        Args:
+            text: Normalized source text
+            source_language: Source language code
+            target_language: Target language code
+            model: OpenAI model name
+            response_format: Response format requests are sent with
+            prompt_version: Fingerprint of the translation instructions
+            markup_placeholders: Whether markup is replaced by {n} placeholders
+
+        Returns:
+            Redis key string
+        """
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        return (
+            f"{MEMORY_KEY_PREFIX}:{model}:{response_format}:{prompt_version}:"
+            f"{int(markup_placeholders)}:{source_language}:{target_language}:{digest}"
+        )
+
+    @staticmethod
+    def _is_available() -> bool:
+        """Whether translation memory is enabled and Redis is connected."""
+        return bool(
+            settings.translation_memory_enabled
+            and redis_client.connected
+            and redis_client.client
+        )
+
+    async def lookup(
+        self,
+        texts: Sequence[str],
+        source_language: str,
+        target_language: str,
+        model: str,
+        response_format: str,
+        prompt_version: str,
+        markup_placeholders: bool,
+    ) -> Dict[int, str]:
+        """
+        Look up remembered translations for a batch of texts.
+
+        Args:
+            texts: Source subtitle texts
+            source_language: Source language code
+            target_language: Target language code
+            model: OpenAI model name
+            response_format: Response format requests are sent with
+            prompt_version: Fingerprint of the translation instructions
+            markup_placeholders: Whether markup is replaced by {n} placeholders
+
+        Returns:
+            Mapping from position in texts to remembered translation
+        """
+        if not self._is_available():
+            return {}
+
+        positions: List[int] = []
+        keys: List[str] = []
+        for position, text in enumerate(texts):
+            normalized = normalize_text(text)
+            if normalized and len(normalized) <= MAX_MEMORY_TEXT_CHARS:
+                positions.append(position)
+                keys.append(
+                    self._get_key(
+                        normalized,
+                        source_language,
+                        target_language,
+                        model,
+                        response_format,
+                        prompt_version,
+                        markup_placeholders,
+                    )
+                )
+
+        if not keys:
+            return {}
+
+        try:
+            values = await redis_client.client.mget(keys)
+            hits = {
+                position: value
+                for position, value in zip(positions, values)
+                if value is not None
+            }
+            if hits:
+                # Renew the TTL of entries that are still in use
+                pipe = redis_client.client.pipeline()
+                for position, key in zip(positions, keys):
+                    if position in hits:
+                        pipe.expire(key, self._ttl_seconds())
+                await pipe.execute()
+            return hits
+        except RedisError as e:
+            logger.warning(f"Translation memory lookup failed: {e}")
+            return {}
+
+    async def store(
+        self,
+        texts: Sequence[str],
+        translations: Sequence[str],
+        source_language: str,
+        target_language: str,
+        model: str,
+        response_format: str,
+        prompt_version: str,
+        markup_placeholders: bool,
+    ) -> None:
+        """
+        Remember translations for a batch of texts.
+
+        Args:
+            texts: Source subtitle texts
+            translations: Translations in the same order as texts
+            source_language: Source language code
+            target_language: Target language code
+            model: OpenAI model name
+            response_format: Response format requests are sent with
+            prompt_version: Fingerprint of the translation instructions
+            markup_placeholders: Whether markup is replaced by {n} placeholders
+        """
+        if not self._is_available():
+            return
+
+        entries = {}
+        for text, translation in zip(texts, translations):
+            normalized = normalize_text(text)
+            if normalized and translation and len(normalized) <= MAX_MEMORY_TEXT_CHARS:
+                key = self._get_key(
+                    normalized,
+                    source_language,
+                    target_language,
+                    model,
+                    response_format,
+                    prompt_version,
+                    markup_placeholders,
+                )
+                entries[key] = translation
+
+        if not entries:
+            return
+
+        try:
+            pipe = redis_client.client.pipeline()
+            for key, translation in entries.items():
+                pipe.set(key, translation, ex=self._ttl_seconds())
+            await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to store translation memory entries: {e}")
+
+    @staticmethod
+    def _ttl_seconds() -> int:
+        """Entry TTL from settings."""
+        return settings.translation_memory_ttl_days * 24 * 60 * 60
+
+
+# Global translation memory instance
+translation_memory = TranslationMemory()
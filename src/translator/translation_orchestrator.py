@@ -2,23 +2,62 @@
 
 import asyncio
 import logging
-from typing import List
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set
 from uuid import UUID
 
 from common.config import settings
 from common.subtitle_parser import (
     SubtitleSegment,
+    TranslationPrefilter,
     extract_text_for_translation,
     merge_translated_chunks,
     merge_translations,
     split_subtitle_content,
 )
+from common.token_counter import count_tokens_many
 from translator.checkpoint_manager import CheckpointManager
+from translator.chunk_size_memory import chunk_size_memory
+from translator.concurrency_controller import concurrency_controller
+from translator.markup_placeholders import MarkupPlaceholders
+from translator.progressive_output import ProgressiveSubtitleWriter
+from translator.result_cache import compute_source_hash
 from translator.schemas import CheckpointState, TranslationTaskData
-from translator.translation_service import SubtitleTranslator
+from translator.token_calibration import token_calibrator
+from translator.translation_memory import translation_memory
+from translator.translation_service import SubtitleTranslator, TranslationTruncatedError
 
 logger = logging.getLogger(__name__)
 
+# Streamed segments are journaled in batches of this many while a chunk is
+# still being translated
+STREAM_CHECKPOINT_SEGMENTS = 20
+
+# Called with (index into the chunk, translated segment) as segments of a
+# streamed response complete
+ChunkSegmentCallback = Callable[[int, SubtitleSegment], Awaitable[None]]
+
+
+def _remap_segment_callback(
+    on_segment: Optional[ChunkSegmentCallback], indices: Sequence[int]
+) -> Optional[ChunkSegmentCallback]:
+    """
+    Adapt a chunk's segment callback to a sub-list of the chunk.
+
+    Args:
+        on_segment: Callback taking indices into the whole chunk, or None
+        indices: Chunk index of each item of the sub-list
+
+    Returns:
+        Callback taking indices into the sub-list, or None
+    """
+    if on_segment is None:
+        return None
+
+    async def remapped(index: int, segment: SubtitleSegment) -> None:
+        await on_segment(indices[index], segment)
+
+    return remapped
+
 
 async def load_checkpoint_state(
     request_id: UUID,
@@ -43,7 +82,6 @@ async def load_checkpoint_state(
     checkpoint_manager = CheckpointManager()
     checkpoint = None
     all_translated_segments = []
-    start_chunk_idx = 0
 
     if settings.checkpoint_enabled:
         try:
@@ -52,8 +90,8 @@ async def load_checkpoint_state(
             )
             if checkpoint:
                 logger.info(
-                    f"📂 Found checkpoint: {len(checkpoint.completed_chunks)}/"
-                    f"{checkpoint.total_chunks} chunks completed"
+                    f"📂 Found checkpoint: {len(checkpoint.translated_segments)} "
+                    f"segments translated"
                 )
 
                 # Validate checkpoint matches current request
@@ -66,9 +104,9 @@ async def load_checkpoint_state(
                             checkpoint
                         )
                     )
-                    start_chunk_idx = len(checkpoint.completed_chunks)
                     logger.info(
-                        f"🔄 Resuming translation from chunk {start_chunk_idx + 1}"
+                        f"🔄 Resuming translation: skipping {len(all_translated_segments)} "
+                        f"already translated segments"
                     )
                 else:
                     logger.warning(
@@ -84,115 +122,780 @@ async def load_checkpoint_state(
     return CheckpointState(
         checkpoint=checkpoint,
         all_translated_segments=all_translated_segments,
-        start_chunk_idx=start_chunk_idx,
     )
 
 
-async def translate_segments_with_checkpoint(
-    segments: List[SubtitleSegment],
+async def translate_chunk_adaptively(
+    chunk: List[SubtitleSegment],
     task_data: TranslationTaskData,
     translator: SubtitleTranslator,
-    checkpoint_state: CheckpointState,
+    chunk_index: Optional[int] = None,
+    total_chunks: Optional[int] = None,
+    on_segment: Optional[ChunkSegmentCallback] = None,
 ) -> List[SubtitleSegment]:
     """
-    Translate subtitle segments, resuming from checkpoint if available.
+    Translate one chunk, bisecting it when the response is truncated.
+
+    With adaptive chunking enabled, a chunk larger than the size learned for
+    the model and target language is translated in pieces of that size, and
+    a truncated response halves the chunk, records the new size in
+    chunk_size_memory and translates each half (recursing as needed). The
+    pieces are translated one after another so the caller's concurrency slot
+    is not exceeded. Untruncated chunks of the full learned size let the
+    limit grow back.
 
     Args:
-        segments: List of subtitle segments to translate
+        chunk: Subtitle segments to translate
         task_data: Translation task data
         translator: SubtitleTranslator instance
-        checkpoint_state: Checkpoint state information
+        chunk_index: Optional chunk index for error messages
+        total_chunks: Optional total chunk count for error messages
+        on_segment: Optional callback for segments of streamed responses
 
     Returns:
-        List of translated subtitle segments
+        Translated segments in the same order as chunk
 
     Raises:
-        Exception: If translation fails for any chunk
+        TranslationTruncatedError: If a single segment still cannot fit, or
+            adaptive chunking is disabled
     """
-    # Split into token-aware chunks for API limits
-    chunks = split_subtitle_content(
-        segments,
-        max_tokens=settings.translation_max_tokens_per_chunk,
-        model=settings.openai_model,
-        safety_margin=settings.translation_token_safety_margin,
-        max_segments_per_chunk=settings.translation_max_segments_per_chunk,
+    model = settings.openai_model
+    target_language = task_data.target_language
+    learned_limit = (
+        chunk_size_memory.get(model, target_language)
+        if settings.translation_adaptive_chunking
+        else None
     )
+    if learned_limit and len(chunk) > learned_limit:
+        translated: List[SubtitleSegment] = []
+        for start in range(0, len(chunk), learned_limit):
+            piece = chunk[start : start + learned_limit]
+            translated.extend(
+                await translate_chunk_adaptively(
+                    piece,
+                    task_data,
+                    translator,
+                    chunk_index,
+                    total_chunks,
+                    _remap_segment_callback(
+                        on_segment, range(start, start + len(piece))
+                    ),
+                )
+            )
+        return translated
 
-    # If checkpoint exists, validate total chunks match
-    if checkpoint_state.checkpoint and checkpoint_state.checkpoint.total_chunks != len(
-        chunks
-    ):
+    texts = extract_text_for_translation(chunk)
+    # Only streaming translators are handed a callback
+    stream_kwargs = {}
+    if on_segment:
+
+        async def on_text(index: int, text: str) -> None:
+            await on_segment(index, chunk[index].with_text(text))
+
+        stream_kwargs["on_segment"] = on_text
+
+    try:
+        result = await translator.translate_batch(
+            texts, task_data.source_language, task_data.target_language, **stream_kwargs
+        )
+    except TranslationTruncatedError:
+        if not settings.translation_adaptive_chunking or len(chunk) <= 1:
+            raise
+
+        half = len(chunk) // 2
         logger.warning(
-            f"⚠️  Checkpoint total_chunks ({checkpoint_state.checkpoint.total_chunks}) doesn't match "
+            f"✂️  Response truncated for {len(chunk)} segments, "
+            f"splitting into {half} + {len(chunk) - half}"
+        )
+        await chunk_size_memory.record_limit(model, target_language, len(chunk) - half)
+        first_half = await translate_chunk_adaptively(
+            chunk[:half],
+            task_data,
+            translator,
+            chunk_index,
+            total_chunks,
+            on_segment,
+        )
+        second_half = await translate_chunk_adaptively(
+            chunk[half:],
+            task_data,
+            translator,
+            chunk_index,
+            total_chunks,
+            _remap_segment_callback(on_segment, range(half, len(chunk))),
+        )
+        return first_half + second_half
+
+    task_data.stats.record_result(result)
+    if learned_limit:
+        # Full-size chunks that fit let a learned limit grow back
+        await chunk_size_memory.record_success(model, target_language, len(chunk))
+
+    # Merge translations back (with chunk context for better error messages).
+    # Parsed segment numbers come from this call's result, never from
+    # shared translator state, so concurrent chunks cannot mix them up.
+    return merge_translations(
+        chunk,
+        result.translations,
+        chunk_index=chunk_index,
+        total_chunks=total_chunks,
+        parsed_segment_numbers=result.parsed_segment_numbers,
+    )
+
+
+async def translate_chunk_with_memory(
+    chunk: List[SubtitleSegment],
+    task_data: TranslationTaskData,
+    translator: SubtitleTranslator,
+    chunk_index: Optional[int] = None,
+    total_chunks: Optional[int] = None,
+    on_segment: Optional[ChunkSegmentCallback] = None,
+) -> List[SubtitleSegment]:
+    """
+    Translate one chunk, serving repeated lines from translation memory.
+
+    Segments with a remembered translation are left out of the request and
+    put back in place afterwards; the rest go through
+    translate_chunk_adaptively() and are stored for next time (except in mock
+    mode, whose placeholder translations must never be served later). Hits and the
+    tokens they saved are added to task_data.stats.
+
+    Args:
+        chunk: Subtitle segments to translate
+        task_data: Translation task data
+        translator: SubtitleTranslator instance
+        chunk_index: Optional chunk index for error messages
+        total_chunks: Optional total chunk count for error messages
+        on_segment: Optional callback for segments of streamed responses
+
+    Returns:
+        Translated segments in the same order as chunk
+    """
+    model = settings.openai_model
+    # Translations are only reused under the prompt they were produced with
+    prompt_setup = (
+        SubtitleTranslator.get_response_format(),
+        SubtitleTranslator.get_prompt_version(),
+        MarkupPlaceholders.is_enabled(),
+    )
+    texts = extract_text_for_translation(chunk)
+    hits = await translation_memory.lookup(
+        texts,
+        task_data.source_language,
+        task_data.target_language,
+        model,
+        *prompt_setup,
+    )
+
+    miss_positions = [
+        position for position in range(len(chunk)) if position not in hits
+    ]
+    misses = [chunk[position] for position in miss_positions]
+    translated_misses = (
+        await translate_chunk_adaptively(
+            misses,
+            task_data,
+            translator,
+            chunk_index,
+            total_chunks,
+            _remap_segment_callback(on_segment, miss_positions),
+        )
+        if misses
+        else []
+    )
+
+    # Lines left untranslated (e.g. one missing from the response) are not
+    # remembered, so a fallback to the original text is never cached; neither
+    # are the placeholder translations of mock mode (no OpenAI client)
+    new_entries = (
+        [
+            (original.text, translated.text)
+            for original, translated in zip(misses, translated_misses)
+            if translated.text != original.text
+        ]
+        if translator.client is not None
+        else []
+    )
+    if new_entries:
+        source_texts, translations = zip(*new_entries)
+        await translation_memory.store(
+            source_texts,
+            translations,
+            task_data.source_language,
+            task_data.target_language,
+            model,
+            *prompt_setup,
+        )
+
+    task_data.stats.segments_translated += len(chunk)
+    if not hits:
+        return translated_misses
+
+    task_data.stats.memory_hits += len(hits)
+    task_data.stats.tokens_saved += _estimate_tokens_saved(
+        [texts[position] for position in hits], task_data, model
+    )
+    logger.info(
+        f"🧠 Translation memory served {len(hits)}/{len(chunk)} segments"
+        f"{_format_chunk_label(chunk_index, total_chunks)}"
+    )
+
+    translated_iter = iter(translated_misses)
+    return [
+        segment.with_text(hits[position]) if position in hits else next(translated_iter)
+        for position, segment in enumerate(chunk)
+    ]
+
+
+def _estimate_tokens_saved(
+    texts: List[str], task_data: TranslationTaskData, model: str
+) -> int:
+    """
+    Estimate prompt plus completion tokens avoided by not sending texts.
+
+    Args:
+        texts: Source texts served from translation memory
+        task_data: Translation task data
+        model: OpenAI model name
+
+    Returns:
+        Estimated number of tokens saved
+    """
+    calibration = token_calibrator.get(
+        task_data.source_language, task_data.target_language
+    )
+    prompt_tokens = sum(
+        count_tokens_many(texts, model, chars_per_token=calibration.chars_per_token)
+    )
+    completion_ratio = calibration.completion_tokens_per_char
+    if completion_ratio is None:
+        # Without calibration assume translations are about as long as sources
+        return prompt_tokens * 2
+    return prompt_tokens + round(sum(len(text) for text in texts) * completion_ratio)
+
+
+def _format_chunk_label(chunk_index: Optional[int], total_chunks: Optional[int]) -> str:
+    """Format " (chunk i/n)" for log messages, or "" when unknown."""
+    if chunk_index is None or total_chunks is None:
+        return ""
+    return f" (chunk {chunk_index + 1}/{total_chunks})"
+
+
+def _group_completed_chunks(
+    checkpoint_state: CheckpointState, chunks: List[List[SubtitleSegment]]
+) -> Dict[int, List[SubtitleSegment]]:
+    """
+    Split checkpointed segments back into their completed chunks.
+
+    Chunk-keyed checkpoints store completed chunk indices and their translated
+    segments in chunk order; each translated chunk has as many segments as the
+    source chunk, so the chunking that wrote the checkpoint tells where each
+    one ends.
+
+    Args:
+        checkpoint_state: Loaded checkpoint state
+        chunks: Source chunks of the whole file
+
+    Returns:
+        Translated segments keyed by completed chunk index (empty to start
+        fresh)
+    """
+    checkpoint = checkpoint_state.checkpoint
+    if not checkpoint:
+        return {}
+
+    completed_indices = sorted(set(checkpoint.completed_chunks))
+    expected_segments = sum(len(chunks[idx]) for idx in completed_indices)
+    if expected_segments != len(checkpoint_state.all_translated_segments):
+        logger.warning(
+            f"⚠️  Checkpoint has {len(checkpoint_state.all_translated_segments)} segments but its "
+            f"completed chunks hold {expected_segments}, starting fresh translation"
+        )
+        return {}
+
+    completed_chunks = {}
+    position = 0
+    for chunk_idx in completed_indices:
+        chunk_length = len(chunks[chunk_idx])
+        completed_chunks[chunk_idx] = checkpoint_state.all_translated_segments[
+            position : position + chunk_length
+        ]
+        position += chunk_length
+    return completed_chunks
+
+
+def _restore_translated_segments(
+    checkpoint_state: CheckpointState,
+    segments: List[SubtitleSegment],
+    source_hash: str,
+    split_chunks: Callable[[List[SubtitleSegment]], List[List[SubtitleSegment]]],
+) -> Dict[int, SubtitleSegment]:
+    """
+    Get the segments a checkpoint already translated, by source position.
+
+    Args:
+        checkpoint_state: Loaded checkpoint state
+        segments: All source segments
+        source_hash: Hash of the source segments
+        split_chunks: Chunks a list of segments with the current settings
+
+    Returns:
+        Translated segments keyed by source position (empty to start fresh)
+    """
+    checkpoint = checkpoint_state.checkpoint
+    if not checkpoint:
+        return {}
+
+    if checkpoint.source_hash and checkpoint.source_hash != source_hash:
+        logger.warning(
+            "⚠️  Subtitle content changed since the checkpoint, starting fresh translation"
+        )
+        return {}
+
+    if checkpoint.translated_positions is not None:
+        positions = checkpoint.translated_positions
+        if len(positions) != len(checkpoint_state.all_translated_segments) or any(
+            position >= len(segments) for position in positions
+        ):
+            logger.warning(
+                "⚠️  Checkpoint segments don't match the subtitle file, starting fresh translation"
+            )
+            return {}
+        return dict(zip(positions, checkpoint_state.all_translated_segments))
+
+    # Chunk-keyed JSON snapshot: only usable if the file still chunks the same way
+    chunks = split_chunks(segments)
+    if checkpoint.total_chunks != len(chunks):
+        logger.warning(
+            f"⚠️  Checkpoint total_chunks ({checkpoint.total_chunks}) doesn't match "
             f"current chunks ({len(chunks)}), starting fresh translation"
         )
-        checkpoint_state.checkpoint = None
-        checkpoint_state.all_translated_segments = []
-        checkpoint_state.start_chunk_idx = 0
+        return {}
+
+    translated = {}
+    chunk_start = 0
+    completed_chunks = _group_completed_chunks(checkpoint_state, chunks)
+    for chunk_idx, chunk in enumerate(chunks):
+        if chunk_idx in completed_chunks:
+            for offset, segment in enumerate(completed_chunks[chunk_idx]):
+                translated[chunk_start + offset] = segment
+        chunk_start += len(chunk)
+    return translated
+
+
+class _LanguagePass:
+    """Per-language state of a (possibly multi-target) translation pass."""
+
+    def __init__(
+        self,
+        task_data: TranslationTaskData,
+        translated_segments: Dict[int, SubtitleSegment],
+        chunks: List[List[SubtitleSegment]],
+        chunk_positions: List[List[int]],
+    ):
+        self.task_data = task_data
+        # Translated segments keyed by source position
+        self.translated_segments = translated_segments
+        self.chunks = chunks
+        # Source position of every segment in each chunk
+        self.chunk_positions = chunk_positions
+        self.checkpoint_manager: Optional[CheckpointManager] = None
+        self.progressive_writer: Optional[ProgressiveSubtitleWriter] = None
+        # Chunks not yet translated successfully
+        self.chunks_left = len(chunks)
+
+
+async def _start_checkpoint_journal(
+    language_pass: _LanguagePass, source_hash: str
+) -> Optional[CheckpointManager]:
+    """
+    Start the checkpoint journal a language's chunks are recorded in.
+
+    Args:
+        language_pass: Language to journal
+        source_hash: Hash of the source segments
+
+    Returns:
+        CheckpointManager to append to, or None if checkpointing is off or
+        the journal could not be started
+    """
+    if not settings.checkpoint_enabled:
+        return None
+
+    task_data = language_pass.task_data
+    try:
+        checkpoint_manager = CheckpointManager()
+        await checkpoint_manager.start_journal(
+            request_id=task_data.request_id,
+            subtitle_file_path=task_data.subtitle_file_path,
+            source_language=task_data.source_language,
+            target_language=task_data.target_language,
+            total_chunks=len(language_pass.chunks),
+            translated_segments=language_pass.translated_segments,
+            source_hash=source_hash,
+        )
+        return checkpoint_manager
+    except Exception as e:
+        logger.warning(f"⚠️  Failed to start checkpoint journal: {e}")
+        # Continue translation even if checkpointing is unavailable
+        return None
+
+
+async def translate_segments_for_languages(
+    segments: List[SubtitleSegment],
+    language_tasks: List[TranslationTaskData],
+    translator: SubtitleTranslator,
+    checkpoint_states: Dict[str, CheckpointState],
+    on_language_translated: Optional[
+        Callable[[TranslationTaskData, List[SubtitleSegment]], Awaitable[None]]
+    ] = None,
+) -> Dict[str, List[SubtitleSegment]]:
+    """
+    Translate subtitle segments into one or more languages in a single pass.
+
+    The source is chunked once and every (chunk, language) request shares
+    one concurrency budget, scheduled earliest timestamp first. A language
+    resuming from a checkpoint only chunks the segments it still needs.
+    As soon as all chunks of a language are translated, its merged segments
+    are passed to on_language_translated, while other languages may still
+    be in progress.
+
+    Args:
+        segments: List of subtitle segments to translate
+        language_tasks: Translation task data, one per target language
+        translator: SubtitleTranslator instance
+        checkpoint_states: Checkpoint state per target language
+        on_language_translated: Optional callback run with each language's
+            task data and merged segments when that language completes
+
+    Returns:
+        Translated, sequentially numbered segments per target language
+
+    Raises:
+        Exception: If translation fails for any chunk (languages whose chunks
+            all succeeded have been passed to on_language_translated)
+    """
+    # Use observed chars/token for the language pairs when tokens are
+    # estimated; with several targets the smallest (most tokens) is used
+    chars_per_token_values = []
+    for task_data in language_tasks:
+        calibration = await token_calibrator.refresh(
+            task_data.source_language, task_data.target_language
+        )
+        if calibration.chars_per_token is not None:
+            chars_per_token_values.append(calibration.chars_per_token)
+    chars_per_token = min(chars_per_token_values, default=None)
+
+    # Chunks larger than a size already learned to truncate are split on the
+    # fly, so chunk numbering stays stable
+    if settings.translation_adaptive_chunking:
+        for task_data in language_tasks:
+            await chunk_size_memory.refresh(
+                settings.openai_model, task_data.target_language
+            )
 
-    # Translate remaining chunks in parallel
     parallel_requests = settings.get_translation_parallel_requests()
+
+    def split_chunks(
+        segments_to_split: List[SubtitleSegment],
+    ) -> List[List[SubtitleSegment]]:
+        """Split segments into token-aware chunks for API limits."""
+        return split_subtitle_content(
+            segments_to_split,
+            max_tokens=settings.translation_max_tokens_per_chunk,
+            model=settings.openai_model,
+            safety_margin=settings.translation_token_safety_margin,
+            max_segments_per_chunk=settings.translation_max_segments_per_chunk,
+            chars_per_token=chars_per_token,
+            mode=settings.translation_chunking_mode,
+            parallel_slots=parallel_requests,
+        )
+
+    # Segments a checkpoint already translated are kept whatever chunking
+    # produced them; only the rest is chunked and sent. Languages that still
+    # need the same segments share one chunking.
+    source_hash = compute_source_hash(segments)
+
+    # Segments without words to translate are kept as they are, and repeated
+    # lines are sent once and copied to the other positions afterwards
+    prefilter = None
+    local_positions: Set[int] = set()
+    if settings.translation_prefilter_enabled:
+        prefilter = TranslationPrefilter(segments)
+        local_positions = prefilter.local_positions
+        if local_positions:
+            logger.info(
+                f"✂️  Pre-filter keeps {len(prefilter.passthrough)} segments without "
+                f"translation and reuses {len(prefilter.duplicate_of)} repeated "
+                f"segments ({len(local_positions)}/{len(segments)} not sent)"
+            )
+
+    chunkings: Dict[tuple, List[List[SubtitleSegment]]] = {}
+    language_passes: List[_LanguagePass] = []
+    for task_data in language_tasks:
+        translated_segments = _restore_translated_segments(
+            checkpoint_states[task_data.target_language],
+            segments,
+            source_hash,
+            split_chunks,
+        )
+        if prefilter:
+            translated_segments.update(prefilter.expand(translated_segments))
+            task_data.stats.prefiltered_segments += len(local_positions)
+            task_data.stats.prefilter_tokens_saved += _estimate_tokens_saved(
+                [segments[position].text for position in local_positions],
+                task_data,
+                settings.openai_model,
+            )
+        pending_positions = tuple(
+            position
+            for position in range(len(segments))
+            if position not in translated_segments and position not in local_positions
+        )
+        if pending_positions not in chunkings:
+            chunkings[pending_positions] = split_chunks(
+                [segments[position] for position in pending_positions]
+            )
+        chunks = chunkings[pending_positions]
+
+        chunk_positions = []
+        position_iter = iter(pending_positions)
+        for chunk in chunks:
+            chunk_positions.append([next(position_iter) for _ in chunk])
+
+        language_pass = _LanguagePass(
+            task_data, translated_segments, chunks, chunk_positions
+        )
+
+        # Record each chunk in the checkpoint journal as soon as it completes
+        language_pass.checkpoint_manager = await _start_checkpoint_journal(
+            language_pass, source_hash
+        )
+
+        if translated_segments:
+            logger.info(
+                f"🔄 {len(translated_segments)}/{len(segments)} "
+                f"{task_data.target_language} segments restored from checkpoint, "
+                f"{len(pending_positions)} left in {len(chunks)} chunks"
+            )
+
+        # Keep a watchable partial file of the translated start of the subtitle
+        if ProgressiveSubtitleWriter.is_enabled():
+            language_pass.progressive_writer = ProgressiveSubtitleWriter(
+                task_data, len(segments)
+            )
+            await language_pass.progressive_writer.update(translated_segments)
+
+        language_passes.append(language_pass)
+
+    # With streamed responses, finished segments of a chunk are journaled
+    # while the rest of it is still being translated
+    streaming = SubtitleTranslator.is_streaming_enabled()
+
+    # Translate remaining chunks in parallel, with either a fixed number of
+    # concurrent requests or a limit that adapts to API health
+    adaptive_concurrency = concurrency_controller.is_enabled()
+    if adaptive_concurrency:
+        parallel_requests = concurrency_controller.start(parallel_requests)
     semaphore = asyncio.Semaphore(parallel_requests)
 
+    total_chunks = sum(len(language_pass.chunks) for language_pass in language_passes)
+    languages_label = (
+        f" into {len(language_passes)} languages" if len(language_passes) > 1 else ""
+    )
     logger.info(
-        f"🚀 Starting parallel translation of {len(chunks) - checkpoint_state.start_chunk_idx} chunks "
+        f"🚀 Starting parallel translation of {total_chunks} chunks{languages_label} "
         f"with {parallel_requests} concurrent requests"
+        f"{' (adaptive)' if adaptive_concurrency else ''}"
     )
 
+    results_by_language: Dict[str, List[SubtitleSegment]] = {}
+
+    async def _finish_language(language_pass: _LanguagePass) -> None:
+        """Merge a fully translated language and hand it to the caller."""
+        task_data = language_pass.task_data
+        checkpoint_state = checkpoint_states[task_data.target_language]
+
+        # Collect segments in source order
+        checkpoint_state.all_translated_segments = [
+            language_pass.translated_segments[position]
+            for position in range(len(segments))
+        ]
+
+        stats = task_data.stats
+        if stats.prefiltered_segments:
+            logger.info(
+                f"✂️  Pre-filter avoided ~{stats.prefilter_tokens_saved} tokens "
+                f"({stats.prefiltered_segments} segments not sent)"
+            )
+        if stats.memory_hits:
+            logger.info(
+                f"🧠 Translation memory hit rate: {stats.memory_hit_rate:.1%} "
+                f"({stats.memory_hits}/{stats.segments_translated} segments, "
+                f"~{stats.tokens_saved} tokens saved)"
+            )
+        if stats.prompt_tokens:
+            logger.info(
+                f"📝 Prompt tokens: {stats.prompt_tokens} over {stats.api_requests} "
+                f"requests, {stats.prompt_overhead_tokens} instruction overhead, "
+                f"{stats.cached_tokens} served from the prompt cache"
+            )
+
+        # Merge and renumber translated segments
+        merged_segments = merge_translated_chunks(
+            checkpoint_state.all_translated_segments
+        )
+        logger.info(
+            f"✅ Merged {len(checkpoint_state.all_translated_segments)} segments into "
+            f"{len(merged_segments)} sequentially numbered segments"
+            f"{f' ({task_data.target_language})' if languages_label else ''}"
+        )
+        results_by_language[task_data.target_language] = merged_segments
+
+        if on_language_translated:
+            await on_language_translated(task_data, merged_segments)
+
     async def _translate_chunk_parallel(
+        language_pass: _LanguagePass,
         chunk_idx: int,
-        chunk: List[SubtitleSegment],
         semaphore: asyncio.Semaphore,
     ) -> tuple[int, List[SubtitleSegment]]:
         """
-        Translate a single chunk with semaphore-controlled concurrency.
+        Translate a single chunk with semaphore-controlled concurrency,
+        record it in the checkpoint journal and extend the partial output.
+
+        With streaming, segments are journaled in batches as they arrive, and
+        whatever arrived is journaled if the chunk then fails. The chunk that
+        completes its language finishes that language.
 
         Args:
+            language_pass: Target language the chunk is translated into
             chunk_idx: Index of the chunk being translated
-            chunk: List of SubtitleSegment objects to translate
-            semaphore: Semaphore to limit concurrent API requests
+            semaphore: Semaphore to limit concurrent API requests (unused
+                when adaptive concurrency is enabled)
 
         Returns:
             Tuple of (chunk_idx, translated_chunk) for ordering
         """
-        async with semaphore:
-            logger.info(
-                f"🔄 Translating chunk {chunk_idx + 1}/{len(chunks)} ({len(chunk)} segments)"
-            )
+        task_data = language_pass.task_data
+        chunks = language_pass.chunks
+        chunk = chunks[chunk_idx]
+        chunk_positions = language_pass.chunk_positions
+        checkpoint_manager = language_pass.checkpoint_manager
+        chunk_label = (
+            f"{chunk_idx + 1}/{len(chunks)}"
+            f"{f' ({task_data.target_language})' if languages_label else ''}"
+        )
+        streamed_segments: Dict[int, SubtitleSegment] = {}
+
+        async def checkpoint_streamed_segments() -> None:
+            """Journal the streamed segments not journaled yet."""
+            positions = sorted(streamed_segments)
+            if not positions:
+                return
+            segments_to_journal = [
+                streamed_segments.pop(position) for position in positions
+            ]
+            try:
+                await checkpoint_manager.append_segments(
+                    task_data.request_id,
+                    task_data.target_language,
+                    positions,
+                    segments_to_journal,
+                )
+            except Exception as e:
+                logger.warning(
+                    f"⚠️  Failed to checkpoint streamed segments of chunk "
+                    f"{chunk_label}: {e}"
+                )
 
-            # Extract text from segments
-            texts = extract_text_for_translation(chunk)
+        async def on_segment(index: int, segment: SubtitleSegment) -> None:
+            streamed_segments[chunk_positions[chunk_idx][index]] = segment
+            if len(streamed_segments) >= STREAM_CHECKPOINT_SEGMENTS:
+                await checkpoint_streamed_segments()
+
+        async with concurrency_controller.slot() if adaptive_concurrency else semaphore:
+            logger.info(f"🔄 Translating chunk {chunk_label} ({len(chunk)} segments)")
+
+            # Translate (repeated lines come from translation memory),
+            # splitting the chunk if the response is truncated
+            try:
+                translated_chunk = await translate_chunk_with_memory(
+                    chunk,
+                    task_data,
+                    translator,
+                    chunk_index=chunk_idx,
+                    total_chunks=len(chunks),
+                    on_segment=(
+                        on_segment if streaming and checkpoint_manager else None
+                    ),
+                )
+            except Exception:
+                await checkpoint_streamed_segments()
+                raise
+            # The whole chunk is journaled below
+            streamed_segments.clear()
 
-            # Translate
-            translations = await translator.translate_batch(
-                texts, task_data.source_language, task_data.target_language
+            logger.info(
+                f"✅ Completed chunk {chunk_label} "
+                f"({len(translated_chunk)} segments translated)"
             )
 
-            # Get parsed segment numbers if available (for accurate missing segment identification)
-            parsed_segment_numbers = translator.get_last_parsed_segment_numbers()
+        if checkpoint_manager:
+            try:
+                await checkpoint_manager.append_segments(
+                    task_data.request_id,
+                    task_data.target_language,
+                    chunk_positions[chunk_idx],
+                    translated_chunk,
+                )
+            except Exception as e:
+                logger.warning(f"⚠️  Failed to checkpoint chunk {chunk_label}: {e}")
+                # Continue translation even if checkpoint save fails
 
-            # Merge translations back (with chunk context for better error messages)
-            translated_chunk = merge_translations(
-                chunk,
-                translations,
-                chunk_index=chunk_idx,
-                total_chunks=len(chunks),
-                parsed_segment_numbers=parsed_segment_numbers,
+        language_pass.translated_segments.update(
+            zip(chunk_positions[chunk_idx], translated_chunk)
+        )
+        if prefilter:
+            language_pass.translated_segments.update(
+                prefilter.expand(
+                    language_pass.translated_segments, chunk_positions[chunk_idx]
+                )
             )
-
-            logger.info(
-                f"✅ Completed chunk {chunk_idx + 1}/{len(chunks)} "
-                f"({len(translated_chunk)} segments translated)"
+        if language_pass.progressive_writer:
+            await language_pass.progressive_writer.update(
+                language_pass.translated_segments
             )
 
-            return chunk_idx, translated_chunk
-
-    # Create tasks for all remaining chunks
+        language_pass.chunks_left -= 1
+        if language_pass.chunks_left == 0:
+            await _finish_language(language_pass)
+
+        return chunk_idx, translated_chunk
+
+    # Languages restored entirely from checkpoints are already complete
+    for language_pass in language_passes:
+        if not language_pass.chunks:
+            await _finish_language(language_pass)
+
+    # Create tasks for every (chunk, language) pair of untranslated segments,
+    # earliest timestamp first so the start of the film is translated first
+    schedule = sorted(
+        (
+            (language_idx, chunk_idx)
+            for language_idx, language_pass in enumerate(language_passes)
+            for chunk_idx in range(len(language_pass.chunks))
+        ),
+        key=lambda item: (
+            min(
+                segment.start_ms for segment in language_passes[item[0]].chunks[item[1]]
+            ),
+            item[0],
+        ),
+    )
     tasks = [
-        _translate_chunk_parallel(chunk_idx, chunk, semaphore)
-        for chunk_idx, chunk in enumerate(
-            chunks[checkpoint_state.start_chunk_idx :], checkpoint_state.start_chunk_idx
-        )
+        _translate_chunk_parallel(language_passes[language_idx], chunk_idx, semaphore)
+        for language_idx, chunk_idx in schedule
     ]
 
     # Execute all chunks in parallel (results may complete out of order)
@@ -202,17 +905,19 @@ async def translate_segments_with_checkpoint(
     # Process results and handle any exceptions
     valid_results = []
     failed_chunks = []
-    for i, result in enumerate(results):
+    for (language_idx, chunk_idx), result in sorted(zip(schedule, results)):
+        language_pass = language_passes[language_idx]
         if isinstance(result, Exception):
-            chunk_idx = checkpoint_state.start_chunk_idx + i
             logger.error(
-                f"❌ Chunk {chunk_idx + 1}/{len(chunks)} translation failed: {result}"
+                f"❌ Chunk {chunk_idx + 1}/{len(language_pass.chunks)} "
+                f"{language_pass.task_data.target_language} translation failed: {result}"
             )
             failed_chunks.append((chunk_idx, result))
         else:
             valid_results.append(result)
 
     # If any chunks failed, raise an error with context about which chunks failed
+    # (chunks that succeeded are already in the checkpoint journal)
     if failed_chunks:
         failed_indices = [idx for idx, _ in failed_chunks]
         error_msg = (
@@ -224,55 +929,42 @@ async def translate_segments_with_checkpoint(
         # Raise the first exception to maintain backward compatibility
         raise failed_chunks[0][1]
 
-    # Sort by chunk_idx to ensure segments are in correct order
-    valid_results.sort(key=lambda x: x[0])
-
-    # Extend segments in correct order
-    completed_chunk_indices = []
-    for chunk_idx, translated_chunk in valid_results:
-        checkpoint_state.all_translated_segments.extend(translated_chunk)
-        completed_chunk_indices.append(chunk_idx)
-
-    if completed_chunk_indices:
-        chunk_range = (
-            f"{min(completed_chunk_indices) + 1}-{max(completed_chunk_indices) + 1}"
-        )
+    if valid_results:
         logger.info(
-            f"✅ Completed parallel translation batch: "
-            f"{len(completed_chunk_indices)} chunks ({chunk_range})"
+            f"✅ Completed parallel translation batch: {len(valid_results)} chunks"
+            f"{languages_label}"
         )
     else:
         logger.info("✅ No chunks to translate")
 
-    # Save checkpoint after parallel batch completion
-    if settings.checkpoint_enabled:
-        try:
-            checkpoint_manager = CheckpointManager()
-            # Include all previously completed chunks plus newly completed ones
-            all_completed_chunks = (
-                list(range(checkpoint_state.start_chunk_idx)) + completed_chunk_indices
-            )
-            await checkpoint_manager.save_checkpoint(
-                request_id=task_data.request_id,
-                subtitle_file_path=task_data.subtitle_file_path,
-                source_language=task_data.source_language,
-                target_language=task_data.target_language,
-                total_chunks=len(chunks),
-                completed_chunks=all_completed_chunks,
-                translated_segments=checkpoint_state.all_translated_segments,
-            )
-            logger.info(
-                f"💾 Saved checkpoint: {len(all_completed_chunks)}/{len(chunks)} chunks completed"
-            )
-        except Exception as e:
-            logger.warning(f"⚠️  Failed to save checkpoint after parallel batch: {e}")
-            # Continue translation even if checkpoint save fails
+    return results_by_language
 
-    # Merge and renumber translated segments
-    merged_segments = merge_translated_chunks(checkpoint_state.all_translated_segments)
-    logger.info(
-        f"✅ Merged {len(checkpoint_state.all_translated_segments)} segments into "
-        f"{len(merged_segments)} sequentially numbered segments"
-    )
 
-    return merged_segments
+async def translate_segments_with_checkpoint(
+    segments: List[SubtitleSegment],
+    task_data: TranslationTaskData,
+    translator: SubtitleTranslator,
+    checkpoint_state: CheckpointState,
+) -> List[SubtitleSegment]:
+    """
+    Translate subtitle segments, resuming from checkpoint if available.
+
+    Args:
+        segments: List of subtitle segments to translate
+        task_data: Translation task data
+        translator: SubtitleTranslator instance
+        checkpoint_state: Checkpoint state information
+
+    Returns:
+        List of translated subtitle segments
+
+    Raises:
+        Exception: If translation fails for any chunk
+    """
+    translated = await translate_segments_for_languages(
+        segments,
+        [task_data],
+        translator,
+        {task_data.target_language: checkpoint_state},
+    )
+    return translated[task_data.target_language]
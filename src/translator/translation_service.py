@@ -1,17 +1,68 @@
 """Translation service for subtitle translation using OpenAI GPT-5-nano."""
 
+import asyncio
 import logging
-from typing import List, Optional, Tuple
+import time
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
 
-from openai import AsyncOpenAI
+import httpx
+from openai import APITimeoutError, AsyncOpenAI, DefaultAsyncHttpxClient, RateLimitError
 
 from common.config import settings
 from common.retry_utils import retry_with_exponential_backoff
 from common.subtitle_parser import TranslationCountMismatchError
+from common.token_counter import count_tokens
 from common.utils import LanguageUtils
+from translator.concurrency_controller import concurrency_controller
+from translator.markup_placeholders import MarkupPlaceholders, protect_markup
+from translator.prompt_builder import (
+    TranslationPrompt,
+    build_segment_request,
+    get_prompt_version,
+)
+from translator.rate_limiter import openai_rate_limiter
+from translator.response_parsing import (
+    RESPONSE_FORMAT_JSON,
+    RESPONSE_FORMAT_NUMBERED,
+    TRANSLATIONS_RESPONSE_FORMAT,
+    parse_json_response,
+    parse_numbered_response,
+    response_format_stats,
+)
+from translator.schemas import TranslationResult
+from translator.stream_parser import SegmentStreamParser
+from translator.token_calibration import token_calibrator
 
 logger = logging.getLogger(__name__)
 
+# A count mismatch is repaired by re-requesting only the missing segments when
+# at most this fraction of the chunk is missing; otherwise the chunk is retried
+REPAIR_MAX_MISSING_FRACTION = 0.5
+
+# Called with (index into the request's texts, translated text) for each
+# segment of a streamed response as soon as it is complete
+SegmentCallback = Callable[[int, str], Awaitable[None]]
+
+
+class TranslationTruncatedError(ValueError):
+    """
+    Exception raised when a translation response hit the completion token limit.
+
+    Resending the same chunk fails the same way, so this error is permanent
+    for the retry decorator; the orchestrator bisects the chunk instead.
+    """
+
+    def __init__(self, segment_count: int, message: str):
+        """
+        Initialize the error.
+
+        Args:
+            segment_count: Number of segments in the truncated request
+            message: Error message with usage details
+        """
+        self.segment_count = segment_count
+        super().__init__(message)
+
 
 class SubtitleTranslator:
     """Handles subtitle translation using OpenAI GPT-5-nano."""
@@ -19,9 +70,6 @@ class SubtitleTranslator:
     def __init__(self):
         """Initialize the translator with OpenAI async client."""
         self.client = None
-        self._last_parsed_segment_numbers = (
-            None  # Store parsed segment numbers for merge_translations
-        )
         if settings.openai_api_key:
             # Initialize AsyncOpenAI client with proper configuration
             # Note: Retry logic is handled by retry_with_exponential_backoff decorator
@@ -30,6 +78,10 @@ class SubtitleTranslator:
                 api_key=settings.openai_api_key,
                 timeout=60.0,  # 60 second timeout for translation requests
                 max_retries=0,  # Let retry decorator handle retries
+                # Read the rate limit headers of every response, streamed or not
+                http_client=DefaultAsyncHttpxClient(
+                    event_hooks={"response": [self._observe_rate_limit_headers]}
+                ),
             )
             logger.info(
                 f"Initialized OpenAI async client with model: {settings.openai_model}"
@@ -39,19 +91,6 @@ class SubtitleTranslator:
                 "OpenAI API key not configured - translator will run in mock mode"
             )
 
-    def get_last_parsed_segment_numbers(self) -> Optional[List[int]]:
-        """
-        Get parsed segment numbers from the last translation call.
-
-        This is used by merge_translations to accurately identify which segments
-        were successfully parsed when there's a mismatch in translation count.
-
-        Returns:
-            List of parsed segment numbers (1-based) from last translation,
-            or None if not available or all translations were parsed successfully.
-        """
-        return self._last_parsed_segment_numbers
-
     @property
     def _retry_decorator(self):
         """
@@ -67,9 +106,32 @@ class SubtitleTranslator:
             max_delay=settings.openai_retry_max_delay,
         )
 
+    @staticmethod
+    def is_streaming_enabled() -> bool:
+        """Check whether completions are streamed segment by segment."""
+        return bool(settings.translation_streaming)
+
+    @staticmethod
+    def get_response_format() -> str:
+        """Get the configured response format: "numbered" or "json"."""
+        if settings.translation_response_format == RESPONSE_FORMAT_JSON:
+            return RESPONSE_FORMAT_JSON
+        return RESPONSE_FORMAT_NUMBERED
+
+    @classmethod
+    def get_prompt_version(cls) -> str:
+        """Get the fingerprint of the instructions requests are sent with."""
+        return get_prompt_version(
+            cls.get_response_format(), MarkupPlaceholders.is_enabled()
+        )
+
     async def translate_batch(
-        self, texts: List[str], source_language: str, target_language: str
-    ) -> List[str]:
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        on_segment: Optional[SegmentCallback] = None,
+    ) -> TranslationResult:
         """
         Translate a batch of subtitle texts using GPT-5-nano.
 
@@ -77,27 +139,240 @@ class SubtitleTranslator:
         and transient API failures with exponential backoff. Formatting is
         preserved through retry cycles via the translation prompt.
 
+        Everything about the call is returned in the result rather than kept
+        on the instance, so one translator can serve many concurrent chunks
+        and jobs.
+
+        With streaming enabled, on_segment receives each segment as soon as
+        the response has moved past it, including segments of an attempt that
+        later fails; a retried attempt may deliver the same index again.
+
         Args:
             texts: List of subtitle text strings to translate
             source_language: Source language code (e.g., 'en')
             target_language: Target language code (e.g., 'es')
+            on_segment: Optional callback for segments of a streamed response
 
         Returns:
-            List of translated text strings
+            TranslationResult with translations, parsed segment numbers,
+            token usage, latency and finish reason
         """
         if not self.client:
             logger.warning(
                 "Mock mode: Returning original texts with [TRANSLATED] prefix"
             )
-            return [f"[TRANSLATED to {target_language}] {text}" for text in texts]
+            return TranslationResult(
+                translations=[
+                    f"[TRANSLATED to {target_language}] {text}" for text in texts
+                ]
+            )
+
+        # Send compact placeholders instead of markup and put the tags back
+        # into every translation, including streamed segments
+        placeholders = None
+        if MarkupPlaceholders.is_enabled():
+            texts, placeholders = protect_markup(texts)
+            if on_segment:
+                on_segment = self._restore_segment_callback(on_segment, placeholders)
 
         # Apply retry decorator dynamically to handle rate limits and API failures
-        decorated_method = self._retry_decorator(self._translate_batch_impl)
-        return await decorated_method(texts, source_language, target_language)
+        decorated_method = self._retry_decorator(self._translate_batch_with_repair)
+        result = await decorated_method(
+            texts, source_language, target_language, on_segment
+        )
+        if placeholders:
+            self._restore_markup(result, placeholders)
+        return result
+
+    @staticmethod
+    def _restore_segment_callback(
+        on_segment: SegmentCallback, placeholders: List[MarkupPlaceholders]
+    ) -> SegmentCallback:
+        """
+        Wrap a segment callback so it receives text with markup restored.
+
+        Args:
+            on_segment: Callback for segments of a streamed response
+            placeholders: Placeholders of each text in the request
+
+        Returns:
+            Callback taking text with placeholders
+        """
+
+        async def restored_segment(index: int, text: str) -> None:
+            await on_segment(index, placeholders[index].restore(text)[0])
+
+        return restored_segment
+
+    @staticmethod
+    def _restore_markup(
+        result: TranslationResult, placeholders: List[MarkupPlaceholders]
+    ) -> None:
+        """
+        Replace placeholders in a result's translations with the original tags.
+
+        Args:
+            result: Result of translating the texts with placeholders
+            placeholders: Placeholders of each text in the request
+        """
+        segment_numbers = result.parsed_segment_numbers or range(
+            1, len(result.translations) + 1
+        )
+        restored = []
+        for number, translation in zip(segment_numbers, result.translations):
+            text, missing = placeholders[number - 1].restore(translation)
+            result.markup_repairs += missing
+            restored.append(text)
+        result.translations = restored
+        if result.markup_repairs:
+            logger.info(
+                f"🏷️  Put back {result.markup_repairs} markup tags missing "
+                f"from the translation"
+            )
+
+    async def _translate_batch_with_repair(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        on_segment: Optional[SegmentCallback] = None,
+    ) -> TranslationResult:
+        """
+        Translate a batch, repairing count mismatches with a follow-up request.
+
+        When the response is missing more than one segment, the segments that
+        did parse are kept and only the missing ones are sent again (with
+        their own retries). If too much of the chunk is missing, or the
+        repair cannot fill the gaps, the mismatch error propagates so the
+        whole chunk is retried as before.
+
+        Args:
+            texts: List of subtitle text strings to translate
+            source_language: Source language code (e.g., 'en')
+            target_language: Target language code (e.g., 'es')
+            on_segment: Optional callback for segments of a streamed response
+
+        Returns:
+            TranslationResult for the batch
+
+        Raises:
+            TranslationCountMismatchError: If the mismatch cannot be repaired
+        """
+        try:
+            return await self._translate_batch_impl(
+                texts, source_language, target_language, on_segment
+            )
+        except TranslationCountMismatchError as error:
+            response_format = self.get_response_format()
+            missing_numbers = error.missing_segment_numbers
+            if (
+                not error.translations
+                or len(missing_numbers) > len(texts) * REPAIR_MAX_MISSING_FRACTION
+            ):
+                response_format_stats.record_resent(response_format)
+                raise
+
+            logger.info(
+                f"🩹 Re-requesting {len(missing_numbers)} missing segments "
+                f"out of {len(texts)}: {missing_numbers[:10]}"
+            )
+            repair_on_segment = None
+            if on_segment:
+
+                async def forward_repaired_segment(index: int, text: str) -> None:
+                    await on_segment(missing_numbers[index] - 1, text)
+
+                repair_on_segment = forward_repaired_segment
+
+            repair_method = self._retry_decorator(self._translate_batch_impl)
+            try:
+                repair = await repair_method(
+                    [texts[number - 1] for number in missing_numbers],
+                    source_language,
+                    target_language,
+                    repair_on_segment,
+                )
+                result = self._combine_repaired_translations(
+                    error, missing_numbers, repair
+                )
+            except TranslationCountMismatchError:
+                response_format_stats.record_resent(response_format)
+                raise
+            response_format_stats.record_repaired(response_format)
+            return result
+
+    @staticmethod
+    def _combine_repaired_translations(
+        error: TranslationCountMismatchError,
+        missing_numbers: List[int],
+        repair: TranslationResult,
+    ) -> TranslationResult:
+        """
+        Combine a partially parsed response with the repair request's result.
+
+        Args:
+            error: Mismatch error carrying the originally parsed translations
+            missing_numbers: Segment numbers (1-based) sent in the repair request
+            repair: Result of translating only the missing segments
+
+        Returns:
+            TranslationResult covering the whole batch, in segment order, with
+            parsed_segment_numbers set if one segment is still missing
+
+        Raises:
+            TranslationCountMismatchError: If more than one segment is still
+                missing after the repair
+        """
+        translation_map = {
+            number: text
+            for number, text in zip(error.parsed_segment_numbers, error.translations)
+            if 1 <= number <= error.expected_count
+        }
+
+        original_count = len(translation_map)
+
+        # Repair responses are numbered [1]..[k] within the repair request
+        repair_numbers = repair.parsed_segment_numbers or range(
+            1, len(repair.translations) + 1
+        )
+        for repair_number, text in zip(repair_numbers, repair.translations):
+            if 1 <= repair_number <= len(missing_numbers):
+                translation_map[missing_numbers[repair_number - 1]] = text
+
+        parsed_numbers = sorted(translation_map)
+        if error.expected_count - len(parsed_numbers) > 1:
+            raise TranslationCountMismatchError(
+                expected_count=error.expected_count,
+                actual_count=len(parsed_numbers),
+                parsed_segment_numbers=parsed_numbers,
+                translations=[translation_map[number] for number in parsed_numbers],
+            )
+
+        logger.info(
+            f"✅ Repaired {len(parsed_numbers) - original_count} "
+            f"of {len(missing_numbers)} missing segments"
+        )
+        return TranslationResult(
+            translations=[translation_map[number] for number in parsed_numbers],
+            parsed_segment_numbers=(
+                parsed_numbers if len(parsed_numbers) < error.expected_count else None
+            ),
+            # Usage of the first request was recorded before it failed to parse
+            prompt_tokens=repair.prompt_tokens,
+            completion_tokens=repair.completion_tokens,
+            latency_seconds=repair.latency_seconds,
+            finish_reason=repair.finish_reason,
+            cached_tokens=repair.cached_tokens,
+            overhead_tokens=repair.overhead_tokens,
+        )
 
     async def _translate_batch_impl(
-        self, texts: List[str], source_language: str, target_language: str
-    ) -> List[str]:
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        on_segment: Optional[SegmentCallback] = None,
+    ) -> TranslationResult:
         """
         Internal implementation of batch translation.
 
@@ -109,18 +384,24 @@ class SubtitleTranslator:
             texts: List of subtitle text strings to translate
             source_language: Source language code (e.g., 'en')
             target_language: Target language code (e.g., 'es')
+            on_segment: Optional callback for segments of a streamed response
 
         Returns:
-            List of translated text strings
+            TranslationResult for this API call
         """
         # Convert language codes to language names for OpenAI
         source_lang_name = LanguageUtils.iso_to_language_name(source_language)
         target_lang_name = LanguageUtils.iso_to_language_name(target_language)
 
-        # Prepare the prompt for GPT-5-nano
-        # Formatting preservation is maintained through this prompt structure
-        prompt = self._build_translation_prompt(
-            texts, source_lang_name, target_lang_name
+        # Static instructions first and the segments last, so the instructions
+        # are a prefix the provider can cache across chunks and languages
+        response_format = self.get_response_format()
+        prompt = TranslationPrompt(
+            texts,
+            source_lang_name,
+            target_lang_name,
+            response_format,
+            markup_placeholders=MarkupPlaceholders.is_enabled(),
         )
 
         logger.info(
@@ -138,33 +419,28 @@ class SubtitleTranslator:
                 f"Consider reducing max_segments_per_chunk or increasing max_completion_tokens."
             )
 
+        # Size the completion budget from observed usage for this language pair
+        source_chars = sum(len(text) for text in texts)
+        calibration = token_calibrator.get(source_language, target_language)
+        max_completion_tokens = calibration.max_completion_tokens(
+            source_chars, settings.openai_max_tokens
+        )
+        if max_completion_tokens != settings.openai_max_tokens:
+            logger.debug(
+                f"Calibrated max_completion_tokens to {max_completion_tokens} "
+                f"for {source_chars} source characters"
+            )
+
         # Build API request parameters
         # Some models (like gpt-5-nano) only support default temperature (1)
         # Only include temperature if model supports custom values
         api_params = {
             "model": settings.openai_model,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": (
-                        f"You are a professional subtitle translator specializing in natural, "
-                        f"idiomatic translations from {source_lang_name} to {target_lang_name}. "
-                        f"Your translations should:\n"
-                        f"- Translate complete sentences and phrases naturally, not word-by-word\n"
-                        f"- Use appropriate figures of speech and idiomatic expressions in {target_lang_name}\n"
-                        f"- Adapt cultural references to be natural in {target_lang_name}\n"
-                        f"- Maintain the original meaning, tone, and style\n"
-                        f"- Be concise and readable within 2-3 seconds (suitable for subtitles)\n"
-                        f"- Preserve all HTML tags (like <i>, <b>, <u>, etc.) exactly as they appear\n"
-                        f"- Only translate the text content inside tags, keeping tags unchanged"
-                    ),
-                },
-                {"role": "user", "content": prompt},
-            ],
+            "messages": prompt.messages,
             # For reasoning models like gpt-5-nano, need higher token limit
             # Reasoning tokens consume completion budget, so we need more headroom
             # If using gpt-5-nano, consider increasing OPENAI_MAX_TOKENS to 8192 or higher
-            "max_completion_tokens": settings.openai_max_tokens,  # Required for gpt-5-nano model
+            "max_completion_tokens": max_completion_tokens,  # Required for gpt-5-nano model
             "timeout": 60.0,  # Per-request timeout override
         }
 
@@ -173,23 +449,88 @@ class SubtitleTranslator:
         if "nano" not in settings.openai_model.lower():
             api_params["temperature"] = settings.openai_temperature
 
-        # Call OpenAI Chat Completions API with proper async configuration
-        response = await self.client.chat.completions.create(**api_params)
-
-        # Check if response is valid
-        if not response.choices or len(response.choices) == 0:
-            raise ValueError("OpenAI API returned no choices in response")
+        if response_format == RESPONSE_FORMAT_JSON:
+            api_params["response_format"] = TRANSLATIONS_RESPONSE_FORMAT
+            # Segments can only be handed out early from "[n]" blocks
+            on_segment = None
+
+        streaming = self.is_streaming_enabled()
+        if streaming:
+            api_params["stream"] = True
+            api_params["stream_options"] = {"include_usage": True}
+
+        # Wait for capacity under the cluster-wide RPM/TPM limits (and any
+        # pause a previous 429 asked for)
+        estimated_tokens = (
+            self._estimate_request_tokens(api_params["messages"])
+            + max_completion_tokens
+            if openai_rate_limiter.is_enabled()
+            else 0
+        )
+        await openai_rate_limiter.acquire(settings.openai_model, estimated_tokens)
 
-        choice = response.choices[0]
-        message_content = choice.message.content
+        # Call OpenAI Chat Completions API with proper async configuration
+        request_started = time.monotonic()
+        first_segment_seconds = None
+        try:
+            response = await self.client.chat.completions.create(**api_params)
+            if streaming:
+                (
+                    message_content,
+                    finish_reason,
+                    usage,
+                    first_segment_seconds,
+                ) = await self._consume_stream(
+                    response, len(texts), on_segment, request_started
+                )
+        except RateLimitError as e:
+            # Pause every replica for as long as the provider asked
+            await openai_rate_limiter.observe_headers(
+                settings.openai_model, getattr(e.response, "headers", None)
+            )
+            concurrency_controller.record_congestion(
+                "rate limited (429)", request_started
+            )
+            raise
+        except (APITimeoutError, asyncio.TimeoutError):
+            concurrency_controller.record_congestion(
+                "request timed out", request_started
+            )
+            raise
+        latency_seconds = time.monotonic() - request_started
+        await concurrency_controller.record_success(latency_seconds)
+
+        if not streaming:
+            # Check if response is valid
+            if not response.choices or len(response.choices) == 0:
+                raise ValueError("OpenAI API returned no choices in response")
+
+            choice = response.choices[0]
+            message_content = choice.message.content
+            finish_reason = choice.finish_reason
+            usage = getattr(response, "usage", None)
+
+        prompt_tokens, completion_tokens = self._get_usage_tokens(usage)
+        cached_tokens = self._get_cached_tokens(usage)
+        overhead_tokens = prompt.overhead_tokens(settings.openai_model)
+        if finish_reason == "stop":
+            # A truncated completion is capped at max_completion_tokens and
+            # would bias the calibrated completion ratio low
+            await self._record_usage(
+                api_params["messages"],
+                source_chars,
+                prompt_tokens,
+                completion_tokens,
+                source_language,
+                target_language,
+            )
 
         # Handle truncated responses
-        if choice.finish_reason == "length":
+        if finish_reason == "length":
             if not message_content:
                 # Check if all tokens were used for reasoning (common with reasoning models)
                 usage_info = ""
-                if hasattr(response, "usage") and response.usage:
-                    usage = response.usage
+                if usage:
                     reasoning_tokens = (
                         getattr(
                             usage.completion_tokens_details, "reasoning_tokens", None
@@ -213,10 +554,19 @@ class SubtitleTranslator:
                     else:
                         usage_info = f"Usage: {usage}"
 
-                raise ValueError(
+                raise TranslationTruncatedError(
+                    len(texts),
                     f"OpenAI API response was truncated (finish_reason=length) but content is empty. "
                     f"{usage_info} "
-                    f"Consider reducing chunk size (current: {len(texts)} segments)."
+                    f"Consider reducing chunk size (current: {len(texts)} segments).",
+                )
+            elif settings.translation_adaptive_chunking and len(texts) > 1:
+                # A partial body would only be retried or patched up; let the
+                # orchestrator split the chunk instead
+                raise TranslationTruncatedError(
+                    len(texts),
+                    f"OpenAI API response was truncated (finish_reason=length) after "
+                    f"{len(message_content)} characters ({len(texts)} segments).",
                 )
             else:
                 logger.warning(
@@ -227,27 +577,230 @@ class SubtitleTranslator:
         elif not message_content:
             raise ValueError(
                 f"OpenAI API returned empty content. "
-                f"Response finish_reason: {choice.finish_reason}, "
-                f"Usage: {response.usage if hasattr(response, 'usage') else 'N/A'}"
+                f"Response finish_reason: {finish_reason}, "
+                f"Usage: {usage or 'N/A'}"
             )
 
         # Parse the response (always returns tuple)
         translations, parsed_segment_numbers = self._parse_translation_response(
-            message_content, len(texts)
+            message_content, len(texts), response_format
+        )
+
+        first_segment_info = (
+            f", first segment after {first_segment_seconds:.1f}s"
+            if first_segment_seconds is not None
+            else ""
+        )
+        logger.info(
+            f"Successfully translated {len(translations)} segments "
+            f"in {latency_seconds:.1f}s{first_segment_info} ({prompt_tokens} prompt "
+            f"[{overhead_tokens} overhead, {cached_tokens} cached] + "
+            f"{completion_tokens} completion tokens)"
+        )
+        return TranslationResult(
+            translations=translations,
+            # None if all translations parsed successfully, or a list if there was a mismatch
+            parsed_segment_numbers=parsed_segment_numbers,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            latency_seconds=latency_seconds,
+            finish_reason=finish_reason,
+            first_segment_seconds=first_segment_seconds,
+            cached_tokens=cached_tokens,
+            overhead_tokens=overhead_tokens,
+        )
+
+    async def _consume_stream(
+        self,
+        stream: Any,
+        expected_count: int,
+        on_segment: Optional[SegmentCallback],
+        request_started: float,
+    ) -> Tuple[str, Optional[str], Any, Optional[float]]:
+        """
+        Read a streamed completion, handing out segments as they complete.
+
+        A segment is complete once the next "[n]" marker arrives; the last one
+        only when the stream finishes with finish_reason "stop", since a
+        truncated response may have cut it short. Segments already handed out
+        stay with the caller if the stream then stalls or is truncated.
+
+        Args:
+            stream: Async iterator of chat completion chunks
+            expected_count: Number of segments in the request
+            on_segment: Optional callback for completed segments
+            request_started: time.monotonic() when the request was sent
+
+        Returns:
+            Tuple of (content, finish_reason, usage, first_segment_seconds)
+
+        Raises:
+            asyncio.TimeoutError: If no chunk arrives within
+                translation_stream_idle_timeout seconds
+        """
+        parser = SegmentStreamParser(expected_count)
+        content_parts: List[str] = []
+        finish_reason = None
+        usage = None
+        first_segment_seconds = None
+        idle_timeout = settings.translation_stream_idle_timeout or None
+
+        async def deliver(completed: List[Tuple[int, str]]) -> None:
+            nonlocal first_segment_seconds
+            if completed and first_segment_seconds is None:
+                first_segment_seconds = time.monotonic() - request_started
+            if on_segment:
+                for number, text in completed:
+                    await on_segment(number - 1, text)
+
+        iterator = stream.__aiter__()
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(
+                        iterator.__anext__(), timeout=idle_timeout
+                    )
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        f"⏱️  Stream stalled for {idle_timeout:g}s after "
+                        f"{parser.completed_count}/{expected_count} segments"
+                    )
+                    raise
+
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                delta = choice.delta.content if choice.delta else None
+                if delta:
+                    content_parts.append(delta)
+                    await deliver(parser.feed(delta))
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None and finish_reason is None:
+                await close()
+
+        if finish_reason == "stop":
+            await deliver(parser.finish())
+        elif finish_reason == "length":
+            logger.warning(
+                f"⚠️  Stream truncated after {parser.completed_count}/{expected_count} "
+                f"complete segments"
+            )
+        return "".join(content_parts), finish_reason, usage, first_segment_seconds
+
+    @staticmethod
+    async def _observe_rate_limit_headers(response: httpx.Response) -> None:
+        """
+        Pace requests from the rate limit headers of successful responses.
+
+        A successful response whose x-ratelimit-remaining-* count reached 0
+        pauses further requests until the matching reset, before the provider
+        starts answering with 429s. Rate limited responses are reported where
+        their RateLimitError is raised.
+
+        Args:
+            response: HTTP response from the OpenAI API
+        """
+        if response.is_success:
+            await openai_rate_limiter.observe_headers(
+                settings.openai_model, response.headers
+            )
+
+    @staticmethod
+    def _estimate_request_tokens(messages: List[dict]) -> int:
+        """
+        Estimate the prompt tokens of a request for rate limiting.
+
+        Args:
+            messages: Messages to be sent
+
+        Returns:
+            Estimated prompt tokens
+        """
+        return sum(
+            count_tokens(message["content"], settings.openai_model)
+            for message in messages
         )
 
-        # Store parsed_segment_numbers for use in merge_translations
-        # Will be None if all translations parsed successfully, or a list if there was a mismatch
-        self._last_parsed_segment_numbers = parsed_segment_numbers
+    @staticmethod
+    def _get_usage_tokens(usage) -> Tuple[int, int]:
+        """
+        Extract (prompt_tokens, completion_tokens) from a response's usage.
+
+        Args:
+            usage: Usage of a chat completion, or None
+
+        Returns:
+            Token counts, or zeros when the response carries no usage
+        """
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        completion_tokens = getattr(usage, "completion_tokens", None)
+        if not isinstance(prompt_tokens, int) or not isinstance(completion_tokens, int):
+            return 0, 0
+        return prompt_tokens, completion_tokens
+
+    @staticmethod
+    def _get_cached_tokens(usage) -> int:
+        """
+        Extract the prompt tokens served from the provider's prompt cache.
+
+        Args:
+            usage: Usage of a chat completion, or None
+
+        Returns:
+            usage.prompt_tokens_details.cached_tokens, or 0 if not reported
+        """
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        return cached_tokens if isinstance(cached_tokens, int) else 0
+
+    async def _record_usage(
+        self,
+        messages: List[dict],
+        source_chars: int,
+        prompt_tokens: int,
+        completion_tokens: int,
+        source_language: str,
+        target_language: str,
+    ) -> None:
+        """
+        Feed reported token usage into the per-language-pair calibration.
 
-        logger.info(f"Successfully translated {len(translations)} segments")
-        return translations
+        Args:
+            messages: Messages sent in the request
+            source_chars: Characters of subtitle text in the request
+            prompt_tokens: usage.prompt_tokens from the response
+            completion_tokens: usage.completion_tokens from the response
+            source_language: Source language code
+            target_language: Target language code
+        """
+        if not prompt_tokens or not completion_tokens:
+            return
+
+        prompt_chars = sum(len(message["content"]) for message in messages)
+        await token_calibrator.record_usage(
+            source_language,
+            target_language,
+            source_chars=source_chars,
+            instruction_chars=prompt_chars - source_chars,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+        )
 
     def _build_translation_prompt(
         self, texts: List[str], source_language: str, target_language: str
     ) -> str:
         """
-        Build the translation prompt for GPT-5-nano.
+        Build the user message of a translation request.
+
+        The instructions are sent separately as the system message; see
+        translator.prompt_builder.
 
         Args:
             texts: List of texts to translate
@@ -255,42 +808,15 @@ class SubtitleTranslator:
             target_language: Target language name (e.g., 'Hebrew')
 
         Returns:
-            Formatted prompt string
-        """
-        # Number each text for easy parsing
-        numbered_texts = []
-        for i, text in enumerate(texts, 1):
-            numbered_texts.append(f"[{i}]\n{text}")
-
-        prompt = (
-            f"Translate the following {len(texts)} subtitle segments "
-            f"from {source_language} to {target_language}.\n\n"
-            f"TRANSLATION STYLE:\n"
-            f"- Translate each subtitle as a complete sentence or phrase, not word-by-word\n"
-            f"- Use natural, idiomatic expressions and figures of speech in {target_language}\n"
-            f"- Adapt cultural references and idioms to be natural in {target_language}\n"
-            f"- Maintain the original meaning and tone while making it sound natural in {target_language}\n"
-            f"- Keep translations concise and suitable for subtitle display (readable in 2-3 seconds)\n\n"
-            f"FORMATTING REQUIREMENTS:\n"
-            f"- Preserve all HTML tags (like <i>, <b>, <u>, etc.) exactly as they appear\n"
-            f"- Only translate the text content inside the tags, not the tags themselves\n"
-            f"- Preserve line breaks and formatting structure\n\n"
-            f"Example:\n"
-            f"Source: <i>like a lord or a king</i>\n"
-            f"Target: <i>[natural idiomatic translation in {target_language}]</i>\n\n"
-            f"Return ONLY the translations, numbered the same way, "
-            f"with no additional commentary.\n\n"
-            f"Format your response exactly like this:\n"
-            f"[1]\nNatural translation with preserved HTML tags\n\n"
-            f"[2]\nNatural translation with preserved HTML tags\n\n"
-            f"etc.\n\n"
-            f"Subtitles to translate:\n\n" + "\n\n".join(numbered_texts)
-        )
-
-        return prompt
+            User message with the numbered segments
+        """
+        return build_segment_request(texts, source_language, target_language)
 
     def _parse_translation_response(
-        self, response: str, expected_count: int
+        self,
+        response: str,
+        expected_count: int,
+        response_format: str = RESPONSE_FORMAT_NUMBERED,
     ) -> Tuple[List[str], Optional[List[int]]]:
         """
         Parse GPT-5-nano's translation response.
@@ -298,10 +824,12 @@ class SubtitleTranslator:
         Args:
             response: Raw response from GPT-5-nano
             expected_count: Expected number of translations
+            response_format: Format the response was requested in
+                ("numbered" or "json")
 
         Returns:
             Tuple of (translations, parsed_segment_numbers):
-            - translations: List of translated texts
+            - translations: List of translated texts, in segment order
             - parsed_segment_numbers: List of parsed segment numbers (1-based),
               or None when all translations were parsed successfully
 
@@ -310,27 +838,15 @@ class SubtitleTranslator:
                 doesn't match the expected count. This is a transient error that
                 should be retried.
         """
-        translations = []
-        parsed_segment_numbers = []
-
-        # Split by numbered segments
-        segments = response.split("[")
-
-        for segment in segments:
-            if not segment.strip():
-                continue
-
-            # Extract number and text
-            parts = segment.split("]", 1)
-            if len(parts) == 2:
-                try:
-                    segment_number = int(parts[0].strip())  # Validate number format
-                    text = parts[1].strip()
-                    translations.append(text)
-                    parsed_segment_numbers.append(segment_number)
-                except ValueError:
-                    # Invalid segment number format - skip this segment
-                    continue
+        if response_format == RESPONSE_FORMAT_JSON:
+            translation_map = parse_json_response(response, expected_count)
+        else:
+            translation_map = parse_numbered_response(response, expected_count)
+        parsed_segment_numbers = sorted(translation_map)
+        translations = [translation_map[number] for number in parsed_segment_numbers]
+        response_format_stats.record_response(
+            response_format, mismatched=len(translations) != expected_count
+        )
 
         if len(translations) != expected_count:
             missing_count = expected_count - len(translations)
@@ -368,6 +884,7 @@ class SubtitleTranslator:
                 actual_count=len(translations),
                 parsed_segment_numbers=parsed_segment_numbers,
                 response_sample=response_sample,
+                translations=translations,
             )
 
         # Normal case: all translations parsed successfully
@@ -21,16 +21,26 @@ from common.redis_client import redis_client  # noqa: E402
 from common.schemas import SubtitleStatus  # noqa: E402
 from common.shutdown_manager import ShutdownManager  # noqa: E402
 from common.utils import DateTimeUtils  # noqa: E402
+from translator.concurrency_controller import concurrency_controller  # noqa: E402
 from translator.error_handler import handle_translation_error  # noqa: E402
-from translator.event_helpers import finalize_translation  # noqa: E402
+from translator.event_helpers import (  # noqa: E402
+    finalize_language,
+    finalize_translation,
+)
 from translator.file_operations import (  # noqa: E402
+    get_translated_output_path,
     read_and_parse_subtitle_file,
     save_translated_file,
 )
 from translator.message_handler import parse_and_validate_message  # noqa: E402
+from translator.response_parsing import response_format_stats  # noqa: E402
+from translator.result_cache import (  # noqa: E402
+    TranslationResultCache,
+    compute_source_hash,
+)
 from translator.translation_orchestrator import (  # noqa: E402
     load_checkpoint_state,
-    translate_segments_with_checkpoint,
+    translate_segments_for_languages,
 )
 from translator.translation_service import SubtitleTranslator  # noqa: E402
 
@@ -44,6 +54,27 @@ QUEUE_WAIT_TIMEOUT = 1.1  # asyncio timeout (slightly longer than queue timeout)
 BUSY_WAIT_SLEEP = 0.1  # Sleep duration to reduce CPU usage during empty queue
 
 
+def log_translation_status() -> None:
+    """Log the adaptive concurrency limit and the parse outcomes per response format."""
+    concurrency = concurrency_controller.get_status()
+    if concurrency["enabled"] and concurrency["limit"] is not None:
+        p95 = concurrency["p95_latency_seconds"]
+        logger.info(
+            f"📊 Translation concurrency limit {concurrency['limit']} "
+            f"({concurrency['min_limit']}-{concurrency['max_limit']}), "
+            f"p95 latency {f'{p95}s' if p95 is not None else 'n/a'}, "
+            f"last change at {concurrency['last_changed_at']}: "
+            f"{concurrency['last_change_reason']}"
+        )
+    for response_format, stats in response_format_stats.get_status().items():
+        logger.info(
+            f"📊 Response format {response_format}: {stats['responses']} responses, "
+            f"{stats['mismatches']} mismatches ({stats['mismatch_rate']:.1%}), "
+            f"{stats['repaired']} repaired, {stats['resent']} resent "
+            f"({stats['resend_rate']:.1%})"
+        )
+
+
 async def process_translation_message(
     message: AbstractIncomingMessage, translator: SubtitleTranslator
 ) -> None:
@@ -52,11 +83,13 @@ async def process_translation_message(
 
     This function orchestrates the translation workflow by:
     1. Parsing and validating the message
-    2. Loading checkpoint state if available
-    3. Reading and parsing the subtitle file
-    4. Translating segments (with checkpoint resumption)
-    5. Saving the translated file
-    6. Finalizing by updating status and publishing events
+    2. Loading checkpoint state for each target language
+    3. Reading and parsing the subtitle file once
+    4. Restoring cached translations of the same content, and translating
+       the remaining languages together (with checkpoint resumption),
+       saving each language's file as soon as it is complete
+    5. Publishing each language's file as soon as it is in place, and
+       completing the job once every language is saved
 
     Args:
         message: RabbitMQ message containing translation task
@@ -80,36 +113,108 @@ async def process_translation_message(
             request_id, SubtitleStatus.TRANSLATE_IN_PROGRESS, source="translator"
         )
 
+        # One pass per target language over a single parse of the source
+        language_tasks = [
+            task_data.for_language(target_language)
+            for target_language in task_data.target_languages
+        ]
+
         # Load checkpoint state if available
-        checkpoint_state = await load_checkpoint_state(
-            request_id,
-            task_data.subtitle_file_path,
-            task_data.source_language,
-            task_data.target_language,
-        )
+        checkpoint_states = {}
+        for language_task in language_tasks:
+            checkpoint_states[language_task.target_language] = (
+                await load_checkpoint_state(
+                    request_id,
+                    language_task.subtitle_file_path,
+                    language_task.source_language,
+                    language_task.target_language,
+                )
+            )
 
         # Read and parse subtitle file
         segments = await read_and_parse_subtitle_file(task_data.subtitle_file_path)
 
-        # Translate segments (with checkpoint resumption)
-        translated_segments = await translate_segments_with_checkpoint(
-            segments, task_data, translator, checkpoint_state
-        )
+        # Saved or restored file per target language
+        output_paths = {}
+
+        def elapsed_seconds():
+            """Seconds since the translation started."""
+            return (
+                DateTimeUtils.get_current_utc_datetime() - translation_start_time
+            ).total_seconds()
+
+        async def language_done(language_task, output_path):
+            """Publish one language's file without completing the job."""
+            output_paths[language_task.target_language] = output_path
+            duration_seconds = elapsed_seconds()
+            logger.info(
+                f"✅ Translation to {language_task.target_language} completed "
+                f"in {duration_seconds:.2f} seconds"
+            )
+            await finalize_language(
+                request_id, output_path, language_task, duration_seconds
+            )
 
-        # Save translated file
-        output_path = await save_translated_file(
-            translated_segments, task_data.subtitle_file_path, task_data.target_language
-        )
+        # Reuse an earlier translation of the same content, language pair,
+        # model and prompt. Mock mode (no OpenAI client) neither reads nor
+        # writes the cache, so placeholder translations are never served.
+        result_cache = None
+        cache_keys = {}
+        if settings.translation_result_cache_enabled and translator.client is not None:
+            result_cache = TranslationResultCache()
+            source_hash = compute_source_hash(segments)
+            response_format = SubtitleTranslator.get_response_format()
+            prompt_version = SubtitleTranslator.get_prompt_version()
+            for language_task in language_tasks:
+                cache_key = result_cache.build_key(
+                    source_hash,
+                    language_task.source_language,
+                    language_task.target_language,
+                    settings.openai_model,
+                    response_format,
+                    prompt_version,
+                )
+                cache_keys[language_task.target_language] = cache_key
+                cached_output_path = get_translated_output_path(
+                    language_task.subtitle_file_path, language_task.target_language
+                )
+                if result_cache.restore(cache_key, cached_output_path):
+                    await language_done(language_task, cached_output_path)
+
+        async def save_language(language_task, translated_segments):
+            """Save one language's file as soon as its translation is complete."""
+            output_path = await save_translated_file(
+                translated_segments,
+                language_task.subtitle_file_path,
+                language_task.target_language,
+            )
+            if result_cache is not None:
+                result_cache.store(
+                    cache_keys[language_task.target_language], output_path
+                )
+            await language_done(language_task, output_path)
+
+        pending_tasks = [
+            language_task
+            for language_task in language_tasks
+            if language_task.target_language not in output_paths
+        ]
+        if pending_tasks:
+            # Translate segments (with checkpoint resumption)
+            await translate_segments_for_languages(
+                segments,
+                pending_tasks,
+                translator,
+                checkpoint_states,
+                on_language_translated=save_language,
+            )
 
-        # Calculate translation duration
-        translation_end_time = DateTimeUtils.get_current_utc_datetime()
-        duration_seconds = (
-            translation_end_time - translation_start_time
-        ).total_seconds()
+        # Complete the job only once every language is saved
+        duration_seconds = elapsed_seconds()
         logger.info(f"✅ Translation completed in {duration_seconds:.2f} seconds")
-
-        # Finalize translation (update status and publish events)
-        await finalize_translation(request_id, output_path, task_data, duration_seconds)
+        await finalize_translation(
+            request_id, output_paths, task_data, duration_seconds
+        )
 
         logger.info("✅ Translation completed successfully!")
 
@@ -236,6 +341,8 @@ async def consume_translation_messages() -> None:
                         # Message will be nacked automatically by context manager
                         break
 
+                    log_translation_status()
+
                 except asyncio.TimeoutError:
                     # No message received within timeout, reduce busy-wait
                     await asyncio.sleep(BUSY_WAIT_SLEEP)
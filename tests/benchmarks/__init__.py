@@ -0,0 +1,5 @@
+"""Performance benchmarks for the subtitle translation pipeline.
+
+These tests are marked ``slow`` and print their measurements; run them with
+``pytest tests/benchmarks -m slow -s`` to see the numbers.
+"""
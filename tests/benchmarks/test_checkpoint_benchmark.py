@@ -0,0 +1,125 @@
+"""Checkpoint write cost for long translation jobs."""
+
+import asyncio
+import time
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from common.subtitle_parser import SRTParser
+from tests.benchmarks.utils import generate_srt_content
+from translator.checkpoint_manager import CheckpointManager
+
+NUM_SEGMENTS = 5000
+SEGMENTS_PER_CHUNK = 100
+
+
+def _make_manager(tmp_path, compression: bool) -> CheckpointManager:
+    """Create a checkpoint manager writing under tmp_path."""
+    settings = type(
+        "obj",
+        (object,),
+        {
+            "checkpoint_storage_path": str(tmp_path / f"checkpoints-{compression}"),
+            "subtitle_storage_path": str(tmp_path),
+            "checkpoint_compression": compression,
+        },
+    )()
+    with patch("translator.checkpoint_manager.settings", settings):
+        return CheckpointManager()
+
+
+async def _snapshot_writes(manager, request_id, chunks):
+    """Save a whole-file snapshot after every chunk; return per-save costs."""
+    costs = []
+    done = []
+    path = manager.get_checkpoint_path(request_id, "es")
+    for chunk_idx, chunk in enumerate(chunks):
+        done.extend(chunk)
+        start = time.perf_counter()
+        await manager.save_checkpoint(
+            request_id=request_id,
+            subtitle_file_path="/media/show.en.srt",
+            source_language="en",
+            target_language="es",
+            total_chunks=len(chunks),
+            completed_chunks=list(range(chunk_idx + 1)),
+            translated_segments=done,
+        )
+        costs.append((time.perf_counter() - start, path.stat().st_size))
+    return costs
+
+
+async def _journal_writes(manager, request_id, chunks):
+    """Append every chunk to a journal; return per-append costs."""
+    journal_path = await manager.start_journal(
+        request_id=request_id,
+        subtitle_file_path="/media/show.en.srt",
+        source_language="en",
+        target_language="es",
+        total_chunks=len(chunks),
+        translated_segments={},
+        source_hash="benchmark",
+    )
+    costs = []
+    position = 0
+    for chunk in chunks:
+        size_before = journal_path.stat().st_size
+        start = time.perf_counter()
+        await manager.append_segments(
+            request_id, "es", list(range(position, position + len(chunk))), chunk
+        )
+        costs.append(
+            (time.perf_counter() - start, journal_path.stat().st_size - size_before)
+        )
+        position += len(chunk)
+    return costs, journal_path.stat().st_size
+
+
+@pytest.mark.slow
+class TestCheckpointWriteBenchmark:
+    """Compare whole-file snapshots with the append-only journal."""
+
+    def test_journal_write_cost_stays_flat(self, tmp_path):
+        """Each journal append costs the same at chunk 1 and chunk 50."""
+        segments = SRTParser.parse(generate_srt_content(NUM_SEGMENTS))
+        chunks = [
+            segments[i : i + SEGMENTS_PER_CHUNK]
+            for i in range(0, len(segments), SEGMENTS_PER_CHUNK)
+        ]
+
+        snapshot_costs = asyncio.run(
+            _snapshot_writes(_make_manager(tmp_path, False), uuid4(), chunks)
+        )
+        journal_costs, journal_size = asyncio.run(
+            _journal_writes(_make_manager(tmp_path, False), uuid4(), chunks)
+        )
+        gzip_costs, gzip_size = asyncio.run(
+            _journal_writes(_make_manager(tmp_path, True), uuid4(), chunks)
+        )
+
+        def describe(costs):
+            seconds = sum(cost[0] for cost in costs)
+            written = sum(cost[1] for cost in costs)
+            return (
+                f"total {seconds:.3f}s, {written / 1e6:.2f} MB written, "
+                f"first {costs[0][1] / 1e3:.1f} KB / last {costs[-1][1] / 1e3:.1f} KB"
+            )
+
+        print(
+            f"\nCheckpointing {NUM_SEGMENTS} segments in {len(chunks)} chunks:\n"
+            f"  JSON snapshot per chunk: {describe(snapshot_costs)}\n"
+            f"  journal append:          {describe(journal_costs)}, "
+            f"file {journal_size / 1e3:.0f} KB\n"
+            f"  gzip journal append:     {describe(gzip_costs)}, "
+            f"file {gzip_size / 1e3:.0f} KB"
+        )
+
+        # Snapshots grow with the job; journal records depend only on the chunk
+        assert snapshot_costs[-1][1] > 40 * snapshot_costs[0][1]
+        assert journal_costs[-1][1] < 1.2 * journal_costs[0][1]
+        assert sum(cost[1] for cost in journal_costs) < (
+            sum(cost[1] for cost in snapshot_costs) / 10
+        )
+        assert gzip_size < journal_size
@@ -0,0 +1,95 @@
+"""Simulated makespan of greedy vs balanced chunking under parallel translation."""
+
+import heapq
+import random
+from unittest.mock import patch
+
+import pytest
+
+from common.subtitle_parser import (
+    SEGMENT_MARKER_TOKENS,
+    SubtitleSegment,
+    split_subtitle_content,
+)
+from common.token_counter import TokenCounter, estimate_tokens
+from tests.benchmarks.utils import SAMPLE_LINES
+
+# Simple latency model for one chat completion: fixed overhead plus output
+# generation time (prompt processing is comparatively cheap)
+REQUEST_OVERHEAD_SECONDS = 1.5
+OUTPUT_TOKENS_PER_SECOND = 80.0
+
+
+def _episode_segments(num_segments: int, seed: int):
+    """Create segments with varied text lengths and occasional scene gaps."""
+    rng = random.Random(seed)
+    segments = []
+    start_ms = 0
+    for index in range(1, num_segments + 1):
+        text = " ".join(rng.choices(SAMPLE_LINES, k=rng.randint(1, 3)))
+        duration = rng.randint(900, 4000)
+        segments.append(SubtitleSegment(index, start_ms, start_ms + duration, text))
+        gap = rng.choice([80, 120, 200, 400]) if rng.random() > 0.05 else 8000
+        start_ms += duration + gap
+    return segments
+
+
+def _simulate_makespan(chunks, parallel_slots: int) -> float:
+    """
+    Simulate chunks started in order on a fixed number of parallel slots.
+
+    Mirrors translate_segments_with_checkpoint: all chunks are gathered at
+    once and a semaphore admits them in creation order.
+    """
+    finish_times = [0.0] * parallel_slots
+    heapq.heapify(finish_times)
+    for chunk in chunks:
+        output_tokens = sum(
+            estimate_tokens(segment.text) + SEGMENT_MARKER_TOKENS for segment in chunk
+        )
+        duration = REQUEST_OVERHEAD_SECONDS + output_tokens / OUTPUT_TOKENS_PER_SECOND
+        heapq.heappush(finish_times, heapq.heappop(finish_times) + duration)
+    return max(finish_times)
+
+
+@pytest.mark.slow
+class TestChunkingMakespanBenchmark:
+    """Compare wall-clock makespan of greedy and balanced chunking."""
+
+    @pytest.mark.parametrize("parallel_slots", [3, 6])
+    def test_balanced_makespan(self, parallel_slots):
+        """Balanced chunks never finish later than greedy ones."""
+        counter = TokenCounter()
+        counter.tiktoken_available = False
+
+        print(
+            f"\nSimulated makespan with {parallel_slots} parallel requests "
+            f"(limit 8000 x 0.8 tokens, 100 segments/chunk):"
+        )
+        with patch("common.token_counter._get_token_counter", return_value=counter):
+            for num_segments in (350, 700, 1100, 2400):
+                segments = _episode_segments(num_segments, seed=num_segments)
+                results = {}
+                for mode in ("greedy", "balanced"):
+                    chunks = split_subtitle_content(
+                        segments,
+                        max_tokens=8000,
+                        safety_margin=0.8,
+                        max_segments_per_chunk=100,
+                        mode=mode,
+                        parallel_slots=parallel_slots,
+                    )
+                    results[mode] = (
+                        len(chunks),
+                        _simulate_makespan(chunks, parallel_slots),
+                    )
+
+                greedy_chunks, greedy_time = results["greedy"]
+                balanced_chunks, balanced_time = results["balanced"]
+                print(
+                    f"  {num_segments:>5} segments: greedy {greedy_chunks:>2} chunks "
+                    f"{greedy_time:6.1f}s | balanced {balanced_chunks:>2} chunks "
+                    f"{balanced_time:6.1f}s ({greedy_time / balanced_time:.2f}x)"
+                )
+
+                assert balanced_time <= greedy_time
@@ -0,0 +1,110 @@
+"""Benchmarks for SRT parsing on large concatenated-season files."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from common.subtitle_parser import SRTParser
+from tests.benchmarks.utils import (
+    generate_srt_content,
+    measure,
+    time_call,
+    write_season_srt,
+)
+
+
+@pytest.mark.slow
+class TestStreamingParserBenchmark:
+    """Compare eager and streaming parsing of multi-MB SRT files."""
+
+    @pytest.fixture
+    def season_srt(self, tmp_path):
+        """Write a ~3MB concatenated-season file (48 episodes x 900 cues)."""
+        return write_season_srt(tmp_path)
+
+    def test_streaming_parse_memory_and_throughput(self, season_srt):
+        """Streaming parse keeps peak memory flat while matching eager output."""
+        size_mb = season_srt.stat().st_size / (1024 * 1024)
+
+        def eager_parse():
+            return len(SRTParser.parse(season_srt.read_text(encoding="utf-8")))
+
+        def streaming_count():
+            with season_srt.open("rb") as srt_file:
+                return sum(1 for _ in SRTParser.iter_parse(srt_file))
+
+        def streaming_collect():
+            with season_srt.open("rb") as srt_file:
+                return len(list(SRTParser.iter_parse(srt_file)))
+
+        eager_count, eager_time, eager_peak = measure(eager_parse)
+        stream_count, stream_time, stream_peak = measure(streaming_count)
+        collect_count, collect_time, collect_peak = measure(streaming_collect)
+
+        print(
+            f"\nSRT parse on {size_mb:.1f} MB ({eager_count} segments):\n"
+            f"  eager parse:       {eager_time:.3f}s "
+            f"({size_mb / eager_time:.1f} MB/s), peak {eager_peak / 1e6:.1f} MB\n"
+            f"  streaming (count): {stream_time:.3f}s "
+            f"({size_mb / stream_time:.1f} MB/s), peak {stream_peak / 1e6:.1f} MB\n"
+            f"  streaming (list):  {collect_time:.3f}s "
+            f"({size_mb / collect_time:.1f} MB/s), peak {collect_peak / 1e6:.1f} MB"
+        )
+
+        assert eager_count == stream_count == collect_count
+        # Consuming the stream never holds more than one cue plus a read buffer
+        assert stream_peak < eager_peak / 10
+        # Collecting still avoids the decoded-file and line-list copies
+        assert collect_peak < eager_peak
+
+
+@pytest.mark.slow
+class TestParseEngineBenchmark:
+    """Compare the regex and line-walker parse engines."""
+
+    @staticmethod
+    def _real_downloads():
+        """SRT files from SRT_BENCHMARK_DIR (e.g. OpenSubtitles downloads), if set."""
+        directory = os.environ.get("SRT_BENCHMARK_DIR")
+        if not directory:
+            return []
+        return sorted(Path(directory).glob("*.srt"))
+
+    def _compare_engines(self, label: str, content: str) -> float:
+        lines_time = time_call(
+            lambda: SRTParser.parse(content, engine=SRTParser.ENGINE_LINES), repeat=5
+        )
+        regex_time = time_call(
+            lambda: SRTParser.parse(content, engine=SRTParser.ENGINE_REGEX), repeat=5
+        )
+        speedup = lines_time / regex_time
+        print(
+            f"\n{label}: lines {lines_time * 1000:.1f} ms, "
+            f"regex {regex_time * 1000:.1f} ms, speedup {speedup:.2f}x"
+        )
+        assert SRTParser.parse(
+            content, engine=SRTParser.ENGINE_REGEX
+        ) == SRTParser.parse(content, engine=SRTParser.ENGINE_LINES)
+        return speedup
+
+    @pytest.mark.parametrize("line_ending", ["\n", "\r\n"], ids=["lf", "crlf"])
+    def test_regex_engine_speedup_on_synthetic_file(self, line_ending):
+        """The regex engine beats the line walker on a season-sized file."""
+        content = generate_srt_content(40_000).replace("\n", line_ending)
+
+        speedup = self._compare_engines(
+            f"synthetic 40k cues ({line_ending!r})", content
+        )
+
+        assert speedup > 1.0
+
+    def test_regex_engine_speedup_on_real_downloads(self):
+        """Report the speedup on real downloads from SRT_BENCHMARK_DIR."""
+        files = self._real_downloads()
+        if not files:
+            pytest.skip("Set SRT_BENCHMARK_DIR to a folder of downloaded .srt files")
+
+        for srt_path in files:
+            content = srt_path.read_text(encoding="utf-8", errors="replace")
+            self._compare_engines(srt_path.name, content)
@@ -0,0 +1,88 @@
+"""Benchmarks for the compact subtitle segment representation."""
+
+import sys
+from dataclasses import dataclass
+
+import pytest
+
+from common.subtitle_parser import (
+    SRTParser,
+    SubtitleSegment,
+    merge_translated_chunks,
+    merge_translations,
+    split_subtitle_content,
+)
+from tests.benchmarks.utils import generate_srt_content, measure, time_call
+
+SEGMENT_COUNT = 20_000
+
+
+@dataclass
+class LegacySubtitleSegment:
+    """Previous segment layout: __dict__-backed with string timestamps."""
+
+    index: int
+    start_time: str
+    end_time: str
+    text: str
+
+
+@pytest.mark.slow
+class TestSubtitleSegmentBenchmark:
+    """Measure per-segment memory and full-pipeline CPU."""
+
+    def test_per_segment_memory(self):
+        """Slotted integer-millisecond segments use less memory per cue."""
+
+        def build_legacy():
+            return [
+                LegacySubtitleSegment(i, f"00:00:{i % 60:02d},000", "00:01:00,000", "x")
+                for i in range(SEGMENT_COUNT)
+            ]
+
+        def build_compact():
+            return [
+                SubtitleSegment(i, i * 1000, 60_000, "x") for i in range(SEGMENT_COUNT)
+            ]
+
+        _, _, legacy_peak = measure(build_legacy)
+        _, _, compact_peak = measure(build_compact)
+        legacy_per_segment = legacy_peak / SEGMENT_COUNT
+        compact_per_segment = compact_peak / SEGMENT_COUNT
+
+        print(
+            f"\nPer-segment memory (excluding text):\n"
+            f"  legacy dataclass: {legacy_per_segment:.0f} B "
+            f"(object {sys.getsizeof(build_legacy()[0])} B + __dict__)\n"
+            f"  slotted segment:  {compact_per_segment:.0f} B"
+        )
+
+        assert compact_per_segment < legacy_per_segment
+
+    def test_full_pipeline_cpu(self):
+        """Report CPU time for parse, merge and format on a large file."""
+        content = generate_srt_content(SEGMENT_COUNT)
+        segments = SRTParser.parse(content)
+        chunks = split_subtitle_content(segments, max_tokens=8000, model="gpt-4")
+        translations = [[f"T {segment.text}" for segment in chunk] for chunk in chunks]
+
+        def merge_all():
+            merged = []
+            for chunk, chunk_translations in zip(chunks, translations):
+                merged.extend(merge_translations(chunk, chunk_translations))
+            return merge_translated_chunks(merged)
+
+        merged = merge_all()
+        parse_time = time_call(lambda: SRTParser.parse(content))
+        merge_time = time_call(merge_all)
+        format_time = time_call(lambda: SRTParser.format(merged))
+
+        print(
+            f"\nPipeline CPU for {SEGMENT_COUNT} segments:\n"
+            f"  parse:  {parse_time * 1000:.1f} ms\n"
+            f"  merge:  {merge_time * 1000:.1f} ms\n"
+            f"  format: {format_time * 1000:.1f} ms"
+        )
+
+        assert len(merged) == SEGMENT_COUNT
+        assert SRTParser.parse(SRTParser.format(merged)) == merged
@@ -0,0 +1,42 @@
+"""Benchmarks for writing translated SRT output."""
+
+import pytest
+
+from common.subtitle_parser import SRTParser
+from tests.benchmarks.utils import measure, write_season_srt
+from translator.file_operations import write_subtitle_file_atomic
+
+
+@pytest.mark.slow
+class TestStreamingWriterBenchmark:
+    """Compare format()+write_text with the streaming atomic writer."""
+
+    def test_streaming_write_memory(self, tmp_path):
+        """Streaming writes avoid materializing the whole output string."""
+        season_srt = write_season_srt(tmp_path)
+        with season_srt.open("rb") as srt_file:
+            segments = list(SRTParser.iter_parse(srt_file))
+        eager_path = tmp_path / "eager.srt"
+        stream_path = tmp_path / "stream.srt"
+
+        def eager_write():
+            return eager_path.write_text(SRTParser.format(segments), encoding="utf-8")
+
+        def streaming_write():
+            return write_subtitle_file_atomic(segments, stream_path)
+
+        _, eager_time, eager_peak = measure(eager_write)
+        _, stream_time, stream_peak = measure(streaming_write)
+        size_mb = stream_path.stat().st_size / (1024 * 1024)
+
+        print(
+            f"\nSRT write of {len(segments)} segments ({size_mb:.1f} MB):\n"
+            f"  format + write_text: {eager_time:.3f}s, "
+            f"peak {eager_peak / 1e6:.1f} MB\n"
+            f"  streaming atomic:    {stream_time:.3f}s, "
+            f"peak {stream_peak / 1e6:.1f} MB"
+        )
+
+        assert stream_path.read_bytes() == eager_path.read_bytes()
+        # Only the write buffer and one formatted entry are held at a time
+        assert stream_peak < eager_peak / 4
@@ -0,0 +1,104 @@
+"""Benchmarks for token counting during subtitle chunking."""
+
+import random
+
+import pytest
+
+from common import token_counter
+from common.subtitle_parser import SubtitleSegment, split_subtitle_content
+from common.token_counter import TokenCounter
+from tests.benchmarks.utils import SAMPLE_LINES, time_call
+
+WORDS = (
+    "you I the to what we it that is know don't here this just no get right "
+    "go about have me all was can they she he out come there okay think look "
+    "really tell going back something want never time sorry mean well please "
+    "nothing anything thought talking wait night last found before where"
+).split()
+
+
+def _local_encoding(tiktoken):
+    """
+    Build a small byte-level BPE encoding that needs no network download.
+
+    Every byte plus each prefix of WORDS is a mergeable token, which gives
+    encode() realistic work without fetching the OpenAI vocabulary files.
+    """
+    ranks = {bytes([byte]): byte for byte in range(256)}
+    for word in WORDS:
+        for end in range(2, len(word) + 1):
+            for token in (word[:end], " " + word[:end]):
+                ranks.setdefault(token.encode("utf-8"), len(ranks))
+    return tiktoken.Encoding(
+        name="benchmark_words",
+        pat_str=r"""'s|'t|'re|'ve|'m|'ll|'d| ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+|\s+""",
+        mergeable_ranks=ranks,
+        special_tokens={},
+    )
+
+
+def _dialogue_segments(num_segments: int):
+    """Create segments of mostly unique dialogue with some stock repeats."""
+    rng = random.Random(42)
+    segments = []
+    for index in range(1, num_segments + 1):
+        if index % 10 == 0:
+            text = SAMPLE_LINES[index % len(SAMPLE_LINES)]
+        else:
+            text = " ".join(rng.choices(WORDS, k=rng.randint(4, 14))).capitalize()
+            if index % 3 == 0:
+                text += "\n" + " ".join(rng.choices(WORDS, k=rng.randint(3, 10)))
+        segments.append(SubtitleSegment(index, index * 3000, index * 3000 + 2500, text))
+    return segments
+
+
+@pytest.mark.slow
+class TestTokenCountingBenchmark:
+    """Compare per-segment and batched, cached token counting."""
+
+    def test_batched_counting_speedup(self, monkeypatch):
+        """Batch counting with the LRU beats per-segment encode on 2,400 cues."""
+        tiktoken = pytest.importorskip("tiktoken")
+        encoding = _local_encoding(tiktoken)
+        segments = _dialogue_segments(2400)
+
+        def fresh_counter(cache_size):
+            counter = TokenCounter(cache_size=cache_size)
+            counter._encoding_cache["gpt-4"] = encoding
+            return counter
+
+        def per_segment():
+            # Previous behaviour: one uncached encode() call per segment
+            return [len(encoding.encode(segment.text)) for segment in segments]
+
+        def chunk_cold():
+            monkeypatch.setattr(
+                token_counter, "_token_counter_instance", fresh_counter(50_000)
+            )
+            return split_subtitle_content(segments, max_tokens=1000)
+
+        def chunk_warm():
+            return split_subtitle_content(segments, max_tokens=1000)
+
+        per_segment_counts = per_segment()
+        chunks = chunk_cold()
+        per_segment_time = time_call(per_segment, repeat=5)
+        cold_time = time_call(chunk_cold, repeat=5)
+        warm_time = time_call(chunk_warm, repeat=5)
+
+        print(
+            f"\nToken counting for {len(segments)} segments:\n"
+            f"  per-segment encode():      {per_segment_time * 1000:.1f} ms\n"
+            f"  split (batched, cold LRU): {cold_time * 1000:.1f} ms "
+            f"({per_segment_time / cold_time:.2f}x)\n"
+            f"  split (warm LRU / retry):  {warm_time * 1000:.1f} ms "
+            f"({per_segment_time / warm_time:.2f}x)"
+        )
+
+        batched_counts = token_counter._token_counter_instance.count_tokens_many(
+            [segment.text for segment in segments], "gpt-4"
+        )
+        assert batched_counts == per_segment_counts
+        assert sum(len(chunk) for chunk in chunks) == len(segments)
+        assert cold_time < per_segment_time
+        assert warm_time < cold_time
@@ -0,0 +1,121 @@
+"""Utility functions for performance benchmarks."""
+
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+from common.subtitle_parser import format_srt_timestamp
+
+# Lines cycled through to build synthetic, realistically sized cues
+SAMPLE_LINES = [
+    "Previously on...",
+    "<i>Where were you last night?</i>",
+    "I don't know what you're talking about.",
+    "- Yes.\n- What?",
+    "We need to get out of here before they find us.",
+    "♪ Theme song playing ♪",
+    "[door creaks]",
+    "That's not what I meant and you know it.",
+]
+
+
+def generate_srt_content(num_segments: int, start_index: int = 1) -> str:
+    """
+    Generate synthetic SRT content with realistic cue lengths and timing.
+
+    Args:
+        num_segments: Number of cues to generate
+        start_index: Index of the first cue
+
+    Returns:
+        SRT file content
+    """
+    entries = []
+    for offset in range(num_segments):
+        start_ms = offset * 3500
+        text = SAMPLE_LINES[offset % len(SAMPLE_LINES)]
+        entries.append(
+            f"{start_index + offset}\n"
+            f"{format_srt_timestamp(start_ms)} --> "
+            f"{format_srt_timestamp(start_ms + 3000)}\n"
+            f"{text}\n"
+        )
+    return "\n".join(entries)
+
+
+def write_season_srt(
+    directory: Path, episodes: int = 48, segments_per_episode: int = 900
+) -> Path:
+    """
+    Write a concatenated-season SRT file (several episodes back to back).
+
+    Args:
+        directory: Directory to write the file into
+        episodes: Number of episodes to concatenate
+        segments_per_episode: Cues per episode
+
+    Returns:
+        Path to the written file
+    """
+    path = directory / "season.en.srt"
+    with path.open("w", encoding="utf-8") as srt_file:
+        for episode in range(episodes):
+            srt_file.write(
+                generate_srt_content(
+                    segments_per_episode, start_index=episode * segments_per_episode + 1
+                )
+            )
+            srt_file.write("\n")
+    return path
+
+
+def measure(func: Callable[[], Any]) -> Tuple[Any, float, int]:
+    """
+    Run a callable and measure wall time and peak traced memory.
+
+    Args:
+        func: Zero-argument callable to run
+
+    Returns:
+        Tuple of (result, elapsed_seconds, peak_bytes)
+    """
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def time_call(func: Callable[[], Any], repeat: int = 3) -> float:
+    """
+    Return the best wall time of several runs of a callable.
+
+    Like timeit, garbage collection is disabled while timing so results are not
+    skewed by collections triggered by earlier tests.
+
+    Args:
+        func: Zero-argument callable to run
+        repeat: Number of runs
+
+    Returns:
+        Fastest run in seconds
+    """
+    timings = []
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return min(timings)
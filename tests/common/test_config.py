@@ -69,12 +69,33 @@ class TestSettingsDefaults:
         # Translation Token Limits defaults
         assert settings.translation_max_tokens_per_chunk == 8000
         assert settings.translation_token_safety_margin == 0.8
+        assert settings.translation_chunking_mode == "greedy"
+        assert settings.translation_adaptive_chunking is False
+        assert settings.translation_memory_enabled is False
+        assert settings.translation_memory_ttl_days == 30
+        assert settings.token_calibration_enabled is False
+        assert settings.token_calibration_min_samples == 3
+        assert settings.translation_streaming is False
+        assert settings.translation_stream_idle_timeout == 30.0
+        assert settings.translation_progressive_output is False
+        assert settings.translation_prefilter_enabled is False
+        assert settings.translation_markup_placeholders is False
+        assert settings.translation_response_format == "numbered"
+        assert settings.translation_adaptive_concurrency is False
+        assert settings.translation_min_parallel_requests == 1
+        assert settings.translation_max_parallel_requests == 16
+        assert settings.translation_concurrency_latency_tolerance == 2.0
+
+        # Subtitle Parsing defaults
+        assert settings.subtitle_parse_engine == "regex"
 
         # OpenAI Retry Configuration defaults
         assert settings.openai_max_retries == 3
         assert settings.openai_retry_initial_delay == 2.0
         assert settings.openai_retry_max_delay == 60.0
         assert settings.openai_retry_exponential_base == 2
+        assert settings.openai_requests_per_minute == 0
+        assert settings.openai_tokens_per_minute == 0
 
         # File Storage defaults
         assert settings.subtitle_storage_path == "./storage/subtitles"
@@ -82,12 +103,18 @@ class TestSettingsDefaults:
         # Checkpoint Configuration defaults
         assert settings.checkpoint_enabled is True
         assert settings.checkpoint_cleanup_on_success is True
+        assert settings.checkpoint_compression is False
         # checkpoint_storage_path can be None or empty string (both mean use default)
         assert (
             settings.checkpoint_storage_path is None
             or settings.checkpoint_storage_path == ""
         )
 
+        # Translation Result Cache defaults
+        assert settings.translation_result_cache_enabled is False
+        assert settings.translation_result_cache_max_age_days == 30
+        assert settings.translation_result_cache_max_size_mb == 1024
+
         # Subtitle Language Configuration defaults
         assert settings.subtitle_desired_language == "en"
         assert settings.subtitle_fallback_language == "en"
@@ -299,6 +326,27 @@ class TestSettingsTypeValidation:
         with pytest.raises(ValidationError):
             Settings()
 
+    def test_invalid_subtitle_parse_engine(self, monkeypatch):
+        """Test that an unknown SRT parse engine is rejected at startup."""
+        monkeypatch.setenv("SUBTITLE_PARSE_ENGINE", "regexp")
+
+        with pytest.raises(ValidationError):
+            Settings()
+
+    def test_invalid_translation_chunking_mode(self, monkeypatch):
+        """Test that an unknown chunking mode is rejected at startup."""
+        monkeypatch.setenv("TRANSLATION_CHUNKING_MODE", "balance")
+
+        with pytest.raises(ValidationError):
+            Settings()
+
+    def test_invalid_translation_response_format(self, monkeypatch):
+        """Test that an unknown response format is rejected at startup."""
+        monkeypatch.setenv("TRANSLATION_RESPONSE_FORMAT", "jsonl")
+
+        with pytest.raises(ValidationError):
+            Settings()
+
     def test_invalid_type_for_bool_field(self, monkeypatch):
         """Test that invalid types for bool fields raise ValidationError."""
         # Pydantic is lenient with bool, but we can test edge cases
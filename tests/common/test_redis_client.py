@@ -250,6 +250,35 @@ class TestRedisJobClientStatusTracking:
         assert updated_job.error_message == "Test error"
         assert updated_job.download_url == "https://example.com/subtitle.srt"
 
+    async def test_update_phase_merges_per_language_outputs(
+        self, fake_redis_job_client, sample_subtitle_response
+    ):
+        """Test that each language's completion keeps earlier languages' outputs."""
+        await fake_redis_job_client.save_job(sample_subtitle_response)
+
+        for language in ("es", "fr"):
+            await fake_redis_job_client.update_phase(
+                sample_subtitle_response.id,
+                SubtitleStatus.COMPLETED,
+                source="translator",
+                metadata={
+                    "translated_paths": {language: f"/subs/movie.{language}.srt"},
+                    "download_urls": {
+                        language: f"https://example.com/movie.{language}.srt"
+                    },
+                },
+            )
+
+        updated_job = await fake_redis_job_client.get_job(sample_subtitle_response.id)
+        assert updated_job.translated_paths == {
+            "es": "/subs/movie.es.srt",
+            "fr": "/subs/movie.fr.srt",
+        }
+        assert updated_job.download_urls == {
+            "es": "https://example.com/movie.es.srt",
+            "fr": "https://example.com/movie.fr.srt",
+        }
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
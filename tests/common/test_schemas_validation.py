@@ -106,6 +106,7 @@ class TestEventTypeEnum:
             EventType.SUBTITLE_TRANSLATE_REQUESTED,
             EventType.SUBTITLE_TRANSLATED,
             EventType.TRANSLATION_COMPLETED,
+            EventType.TRANSLATION_PROGRESS,
             EventType.JOB_FAILED,
             EventType.MEDIA_FILE_DETECTED,
             EventType.SUBTITLE_REQUESTED,
@@ -125,6 +126,7 @@ class TestEventTypeEnum:
             "subtitle.translate.requested",
             "subtitle.translated",
             "translation.completed",
+            "translation.progress",
             "job.failed",
             "media.file.detected",
             "subtitle.requested",
@@ -1,15 +1,25 @@
 """Tests for SRT subtitle parser."""
 
+import io
+from unittest.mock import patch
+
 import pytest
 
 from common.subtitle_parser import (
     DEFAULT_MAX_SEGMENTS_PER_CHUNK,
+    PASSTHROUGH_NO_WORDS,
+    PASSTHROUGH_SPEAKER_TAG,
+    PASSTHROUGH_URL,
     SRTParser,
     SubtitleSegment,
+    TranslationPrefilter,
     chunk_segments,
+    classify_passthrough,
     extract_text_for_translation,
+    format_srt_timestamp,
     merge_translated_chunks,
     merge_translations,
+    parse_srt_timestamp,
 )
 
 
@@ -30,6 +40,59 @@ class TestSubtitleSegment:
 
         assert result == expected
 
+    def test_subtitle_segment_stores_integer_milliseconds(self):
+        """Test timestamp strings are converted to integer milliseconds."""
+        segment = SubtitleSegment(1, "01:02:03,456", "01:02:05,000", "Text")
+
+        assert segment.start_ms == 3_723_456
+        assert segment.end_ms == 3_725_000
+        assert segment.start_time == "01:02:03,456"
+        assert segment.end_time == "01:02:05,000"
+
+    def test_subtitle_segment_accepts_milliseconds(self):
+        """Test segments can be built directly from millisecond offsets."""
+        segment = SubtitleSegment(1, 1000, 4000, "Text")
+
+        assert segment == SubtitleSegment(1, "00:00:01,000", "00:00:04,000", "Text")
+
+    def test_subtitle_segment_is_slotted(self):
+        """Test segments carry no per-instance __dict__."""
+        segment = SubtitleSegment(1, 0, 1000, "Text")
+
+        assert not hasattr(segment, "__dict__")
+
+    @pytest.mark.parametrize(
+        "timestamp", ["00:00:01.000", "0:00:01,000", "00:00:01", "garbage"]
+    )
+    def test_subtitle_segment_rejects_invalid_timestamp(self, timestamp):
+        """Test malformed timestamp strings raise ValueError."""
+        with pytest.raises(ValueError):
+            SubtitleSegment(1, timestamp, "00:00:04,000", "Text")
+
+    def test_subtitle_segment_with_text_and_index(self):
+        """Test copy helpers keep timing and replace one field."""
+        segment = SubtitleSegment(3, 1000, 4000, "Hello")
+
+        assert segment.with_text("Hola") == SubtitleSegment(3, 1000, 4000, "Hola")
+        assert segment.with_index(1) == SubtitleSegment(1, 1000, 4000, "Hello")
+        assert segment.text == "Hello"
+        assert segment.index == 3
+
+    @pytest.mark.parametrize(
+        "milliseconds,expected",
+        [
+            (0, "00:00:00,000"),
+            (1, "00:00:00,001"),
+            (61_001, "00:01:01,001"),
+            (3_600_000, "01:00:00,000"),
+            (100 * 3_600_000, "100:00:00,000"),
+        ],
+    )
+    def test_timestamp_round_trip(self, milliseconds, expected):
+        """Test timestamp formatting and parsing are inverse operations."""
+        assert format_srt_timestamp(milliseconds) == expected
+        assert parse_srt_timestamp(expected) == milliseconds
+
 
 class TestSRTParser:
     """Test SRT parser functionality."""
@@ -115,6 +178,70 @@ Some text
         assert "Welcome to this video" in formatted
 
 
+class TestSRTParserStreaming:
+    """Test streaming SRT parsing from file objects."""
+
+    SRT_CONTENT = (
+        "1\n00:00:01,000 --> 00:00:04,000\nFirst line\nSecond line\n\n"
+        "2\n00:00:05,000 --> 00:00:08,000\nAnother subtitle\n\n"
+        "3\n00:00:09,000 --> 00:00:12,000\nLast one\n"
+    )
+
+    @pytest.mark.parametrize(
+        "stream_factory",
+        [
+            lambda content: io.BytesIO(content.encode("utf-8")),
+            lambda content: io.BytesIO(("\ufeff" + content).encode("utf-8")),
+            lambda content: io.BytesIO(content.replace("\n", "\r\n").encode("utf-8")),
+            lambda content: io.StringIO(content),
+            lambda content: io.StringIO("\ufeff" + content),
+        ],
+        ids=["bytes", "bytes-bom", "bytes-crlf", "text", "text-bom"],
+    )
+    def test_iter_parse_matches_parse(self, stream_factory):
+        """Test streaming parse yields the same segments as parse()."""
+        expected = SRTParser.parse(self.SRT_CONTENT)
+
+        segments = list(SRTParser.iter_parse(stream_factory(self.SRT_CONTENT)))
+
+        assert segments == expected
+        assert segments[0].text == "First line\nSecond line"
+
+    def test_iter_parse_is_lazy(self):
+        """Test segments are yielded before the stream is fully consumed."""
+        content = "\n".join(
+            f"{i}\n00:00:01,000 --> 00:00:02,000\nSubtitle {i}\n"
+            for i in range(1, 5001)
+        ).encode("utf-8")
+        stream = io.BytesIO(content)
+
+        iterator = SRTParser.iter_parse(stream)
+        first = next(iterator)
+
+        assert first.index == 1
+        assert stream.tell() < len(content)
+
+    def test_iter_parse_leaves_stream_open(self):
+        """Test the caller's binary stream is not closed by the parser."""
+        stream = io.BytesIO(self.SRT_CONTENT.encode("utf-8"))
+
+        list(SRTParser.iter_parse(stream))
+
+        assert not stream.closed
+
+    def test_iter_parse_skips_invalid_entries(self):
+        """Test malformed entries are skipped without stopping the stream."""
+        content = (
+            "1\ninvalid timestamp\nSome text\n\n"
+            "2\n00:00:05,000 --> 00:00:08,000\nValid subtitle\n"
+        )
+
+        segments = list(SRTParser.iter_parse(io.StringIO(content)))
+
+        assert len(segments) == 1
+        assert segments[0].index == 2
+
+
 class TestTextExtractionAndMerging:
     """Test text extraction and translation merging."""
 
@@ -164,6 +291,20 @@ class TestTextExtractionAndMerging:
         assert exc_info.value.actual_count == 1
         assert "expected 3 translations" in str(exc_info.value).lower()
 
+    def test_mismatch_error_carries_parsed_translations(self):
+        """Test the mismatch error exposes parsed translations and missing numbers."""
+        from common.subtitle_parser import TranslationCountMismatchError
+
+        error = TranslationCountMismatchError(
+            expected_count=5,
+            actual_count=2,
+            parsed_segment_numbers=[4, 1],
+            translations=["Cuatro", "Uno"],
+        )
+
+        assert error.translations == ["Cuatro", "Uno"]
+        assert error.missing_segment_numbers == [2, 3, 5]
+
     def test_merge_translations_allows_one_missing(self, sample_segments):
         """Test that 1 missing translation is allowed and uses original text."""
         translations = ["Hola", "Mundo"]  # Only 2 translations for 3 segments
@@ -525,6 +666,232 @@ class TestSplitSubtitleContent:
         assert "\n" in all_segments[0].text
         assert "\n" in all_segments[1].text
 
+    def test_split_subtitle_content_uses_calibrated_ratio(self):
+        """Test a lower chars-per-token ratio yields smaller estimated chunks."""
+        from common.subtitle_parser import split_subtitle_content
+        from common.token_counter import TokenCounter
+
+        segments = [
+            SubtitleSegment(i, i * 1000, i * 1000 + 900, "שלום, מה שלומך היום?")
+            for i in range(1, 41)
+        ]
+
+        with patch("common.token_counter._get_token_counter") as mock_get_counter:
+            counter = TokenCounter()
+            counter.tiktoken_available = False
+            mock_get_counter.return_value = counter
+
+            default_chunks = split_subtitle_content(segments, max_tokens=100)
+            calibrated_chunks = split_subtitle_content(
+                segments, max_tokens=100, chars_per_token=2.0
+            )
+
+        assert len(calibrated_chunks) > len(default_chunks)
+        assert sum(len(chunk) for chunk in calibrated_chunks) == len(segments)
+
+    def test_split_subtitle_content_accepts_iterator(self, sample_segments):
+        """Test splitting consumes a lazy iterator the same way as a list."""
+        from common.subtitle_parser import split_subtitle_content
+
+        from_list = split_subtitle_content(
+            sample_segments, max_tokens=10, model="gpt-4"
+        )
+        from_iterator = split_subtitle_content(
+            iter(sample_segments), max_tokens=10, model="gpt-4"
+        )
+
+        assert from_iterator == from_list
+        assert split_subtitle_content(iter([]), max_tokens=10) == []
+
+
+class TestBalancedSplitSubtitleContent:
+    """Test balanced chunk partitioning for parallel translation."""
+
+    @staticmethod
+    def _segments(count, text="x" * 40, gap_ms=100, long_gaps=()):
+        """Build segments of equal text (10 estimated tokens) and fixed gaps."""
+        segments = []
+        start_ms = 0
+        for index in range(1, count + 1):
+            if index in long_gaps:
+                start_ms += 5000
+            segments.append(SubtitleSegment(index, start_ms, start_ms + 1000, text))
+            start_ms += 1000 + gap_ms
+        return segments
+
+    @pytest.fixture(autouse=True)
+    def estimating_counter(self):
+        """Count tokens by estimation (~4 chars per token) for stable sizes."""
+        from common.token_counter import TokenCounter
+
+        counter = TokenCounter()
+        counter.tiktoken_available = False
+        with patch("common.token_counter._get_token_counter", return_value=counter):
+            yield
+
+    def test_balanced_avoids_small_trailing_chunk(self):
+        """Test balanced chunks are near-equal where greedy leaves a remainder."""
+        from common.subtitle_parser import split_subtitle_content
+
+        segments = self._segments(130)
+
+        greedy = split_subtitle_content(
+            segments, max_tokens=500, safety_margin=1.0, max_segments_per_chunk=200
+        )
+        balanced = split_subtitle_content(
+            segments,
+            max_tokens=500,
+            safety_margin=1.0,
+            max_segments_per_chunk=200,
+            mode="balanced",
+            parallel_slots=3,
+        )
+
+        assert [len(chunk) for chunk in greedy] == [50, 50, 30]
+        assert sorted(len(chunk) for chunk in balanced) == [43, 43, 44]
+        assert [s for chunk in balanced for s in chunk] == segments
+
+    def test_balanced_fills_parallel_slots(self):
+        """Test chunk count is rounded up to a multiple of the parallel slots."""
+        from common.subtitle_parser import split_subtitle_content
+
+        segments = self._segments(140)
+
+        chunks = split_subtitle_content(
+            segments,
+            max_tokens=500,
+            safety_margin=1.0,
+            mode="balanced",
+            parallel_slots=6,
+        )
+
+        assert len(chunks) == 6
+        assert max(len(c) for c in chunks) - min(len(c) for c in chunks) <= 1
+
+    def test_balanced_does_not_shrink_chunks_below_minimum(self):
+        """Test small files are not split just to occupy idle slots."""
+        from common.subtitle_parser import split_subtitle_content
+
+        segments = self._segments(20)
+
+        chunks = split_subtitle_content(
+            segments, max_tokens=1000, mode="balanced", parallel_slots=6
+        )
+
+        assert len(chunks) == 1
+
+    def test_balanced_prefers_long_timestamp_gap(self):
+        """Test boundaries move to a nearby pause between scenes."""
+        from common.subtitle_parser import split_subtitle_content
+
+        segments = self._segments(100, long_gaps=(47,))
+
+        chunks = split_subtitle_content(
+            segments,
+            max_tokens=1000,
+            safety_margin=1.0,
+            mode="balanced",
+            parallel_slots=2,
+        )
+
+        assert [len(chunk) for chunk in chunks] == [46, 54]
+        assert chunks[1][0].index == 47
+
+    def test_balanced_respects_limits(self):
+        """Test balanced chunks never exceed the token or segment limits."""
+        from common.subtitle_parser import split_subtitle_content
+
+        segments = self._segments(97, long_gaps=(10, 33, 61, 80))
+
+        chunks = split_subtitle_content(
+            segments,
+            max_tokens=300,
+            safety_margin=0.8,
+            max_segments_per_chunk=20,
+            mode="balanced",
+            parallel_slots=4,
+        )
+
+        assert all(len(chunk) <= 20 for chunk in chunks)
+        assert all(len(chunk) * 10 <= 240 for chunk in chunks)
+        assert [s for chunk in chunks for s in chunk] == segments
+
+    def test_balanced_keeps_oversized_segment_alone(self):
+        """Test a segment above the limit still gets its own chunk."""
+        from common.subtitle_parser import split_subtitle_content
+
+        segments = self._segments(10)
+        segments[4] = segments[4].with_text("y" * 2000)
+
+        chunks = split_subtitle_content(
+            segments, max_tokens=100, safety_margin=1.0, mode="balanced"
+        )
+
+        assert [segments[4]] in chunks
+        assert [s for chunk in chunks for s in chunk] == segments
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"mode": "optimal"}, {"mode": "balanced", "parallel_slots": 0}],
+    )
+    def test_invalid_balanced_arguments(self, kwargs):
+        """Test unknown modes and invalid slot counts are rejected."""
+        from common.subtitle_parser import split_subtitle_content
+
+        with pytest.raises(ValueError):
+            split_subtitle_content(self._segments(3), max_tokens=100, **kwargs)
+
+
+class TestTranslationPrefilter:
+    """Test classifying segments that need no translation request."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("♪♪", PASSTHROUGH_NO_WORDS),
+            ("<i>♪ ♪</i>", PASSTHROUGH_NO_WORDS),
+            ("1984", PASSTHROUGH_NO_WORDS),
+            ("...", PASSTHROUGH_NO_WORDS),
+            ("", PASSTHROUGH_NO_WORDS),
+            ("www.example.com", PASSTHROUGH_URL),
+            ("https://example.com/watch\n♪", PASSTHROUGH_URL),
+            ("JOHN:", PASSTHROUGH_SPEAKER_TAG),
+            ("- DR. WHO:", PASSTHROUGH_SPEAKER_TAG),
+            ("Hello", None),
+            ("[MUSIC]", None),
+            ("JOHN: Hi there", None),
+            ("♪ La la la ♪", None),
+        ],
+    )
+    def test_classify_passthrough(self, text, expected):
+        """Test only text without words to translate passes through."""
+        assert classify_passthrough(text) == expected
+
+    def test_duplicates_sent_once_and_expanded(self):
+        """Test repeated lines reuse the first one's translation with their own timing."""
+        segments = [
+            SubtitleSegment(1, 0, 1000, "Hello"),
+            SubtitleSegment(2, 2000, 3000, "♪♪"),
+            SubtitleSegment(3, 4000, 5000, "Hello"),
+            SubtitleSegment(4, 6000, 7000, "Goodbye"),
+            SubtitleSegment(5, 8000, 9000, "Hello"),
+        ]
+        prefilter = TranslationPrefilter(segments)
+
+        assert prefilter.passthrough == {1: PASSTHROUGH_NO_WORDS}
+        assert prefilter.duplicate_of == {2: 0, 4: 0}
+        assert prefilter.local_positions == {1, 2, 4}
+
+        translated = {3: segments[3].with_text("Adiós")}
+        expanded = prefilter.expand(translated)
+        assert expanded == {1: segments[1]}
+
+        translated[0] = segments[0].with_text("Hola")
+        expanded = prefilter.expand(translated, [0])
+        assert sorted(expanded) == [2, 4]
+        assert expanded[4].text == "Hola"
+        assert (expanded[4].index, expanded[4].start_ms) == (5, 8000)
+
 
 class TestMergeTranslatedChunks:
     """Test merging translated chunks functionality."""
@@ -725,3 +1092,23 @@ class TestSRTFormatting:
         assert "1\n" in formatted or formatted.startswith("1\n")
         assert "\n2\n" in formatted or "\n\n2\n" in formatted
         assert "\n3\n" in formatted or "\n\n3\n" in formatted
+
+    def test_write_matches_format(self):
+        """Test the streaming writer produces the same text as format()."""
+        segments = [
+            SubtitleSegment(1, "00:00:01,000", "00:00:04,000", "Line one\nLine two"),
+            SubtitleSegment(2, "00:00:04,500", "00:00:08,000", "Another"),
+        ]
+        buffer = io.StringIO()
+
+        written = SRTParser.write(iter(segments), buffer)
+
+        assert written == 2
+        assert buffer.getvalue() == SRTParser.format(segments)
+
+    def test_write_empty_iterable(self):
+        """Test writing no segments leaves the stream empty."""
+        buffer = io.StringIO()
+
+        assert SRTParser.write([], buffer) == 0
+        assert buffer.getvalue() == ""
@@ -0,0 +1,191 @@
+"""Conformance suite shared by every SRT parse engine."""
+
+import io
+
+import pytest
+
+from common.subtitle_parser import SRTParser, SubtitleSegment
+
+
+def _parse_with_regex(content):
+    return SRTParser.parse(content, engine=SRTParser.ENGINE_REGEX)
+
+
+def _parse_with_lines(content):
+    return SRTParser.parse(content, engine=SRTParser.ENGINE_LINES)
+
+
+def _parse_with_stream(content):
+    return list(SRTParser.iter_parse(io.BytesIO(content.encode("utf-8"))))
+
+
+ENGINES = pytest.mark.parametrize(
+    "parse",
+    [_parse_with_regex, _parse_with_lines, _parse_with_stream],
+    ids=["regex", "lines", "stream"],
+)
+
+WELL_FORMED = (
+    "1\n00:00:01,000 --> 00:00:04,000\nWelcome to this video\n\n"
+    "2\n00:00:04,500 --> 00:00:08,000\n<i>Two lines</i>\nof text\n\n"
+    "3\n01:02:03,456 --> 01:02:05,000\n♪ Music ♪\n"
+)
+
+# (content, expected segments) pairs every engine must agree on
+CONFORMANCE_CASES = {
+    "empty": ("", []),
+    "only-newlines": ("\n\n\n", []),
+    "well-formed": (
+        WELL_FORMED,
+        [
+            SubtitleSegment(1, 1000, 4000, "Welcome to this video"),
+            SubtitleSegment(2, 4500, 8000, "<i>Two lines</i>\nof text"),
+            SubtitleSegment(3, 3_723_456, 3_725_000, "♪ Music ♪"),
+        ],
+    ),
+    "bom": (
+        "\ufeff1\n00:00:01,000 --> 00:00:04,000\nHello\n",
+        [SubtitleSegment(1, 1000, 4000, "Hello")],
+    ),
+    "crlf": (
+        WELL_FORMED.replace("\n", "\r\n"),
+        [
+            SubtitleSegment(1, 1000, 4000, "Welcome to this video"),
+            SubtitleSegment(2, 4500, 8000, "<i>Two lines</i>\nof text"),
+            SubtitleSegment(3, 3_723_456, 3_725_000, "♪ Music ♪"),
+        ],
+    ),
+    "padded-lines": (
+        "  1  \n00:00:01,000-->00:00:02,000\n  Left  \n\tRight\t\n",
+        [SubtitleSegment(1, 1000, 2000, "Left\nRight")],
+    ),
+    "extra-blank-lines": (
+        "\n\n1\n00:00:01,000 --> 00:00:02,000\nA\n\n\n\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nB\n\n\n",
+        [SubtitleSegment(1, 1000, 2000, "A"), SubtitleSegment(2, 3000, 4000, "B")],
+    ),
+    "timing-with-position": (
+        "1\n00:00:01,000 --> 00:00:02,000 X1:100 X2:200 Y1:10 Y2:20\nPositioned\n",
+        [SubtitleSegment(1, 1000, 2000, "Positioned")],
+    ),
+    "empty-cue": (
+        "1\n00:00:01,000 --> 00:00:02,000\n\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nKept\n",
+        [SubtitleSegment(2, 3000, 4000, "Kept")],
+    ),
+    "invalid-timestamp": (
+        "1\ninvalid timestamp\nSome text\n\n"
+        "2\n00:00:05,000 --> 00:00:08,000\nValid\n",
+        [SubtitleSegment(2, 5000, 8000, "Valid")],
+    ),
+    "garbage-between-cues": (
+        "1\n00:00:01,000 --> 00:00:02,000\nA\n\n"
+        "not a cue\n\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nB\n",
+        [SubtitleSegment(1, 1000, 2000, "A"), SubtitleSegment(2, 3000, 4000, "B")],
+    ),
+    "missing-blank-separator": (
+        "1\n00:00:01,000 --> 00:00:02,000\nA\n" "2\n00:00:03,000 --> 00:00:04,000\nB\n",
+        [SubtitleSegment(1, 1000, 2000, "A\n2\n00:00:03,000 --> 00:00:04,000\nB")],
+    ),
+    "signed-index-fallback": (
+        "+1\n00:00:01,000 --> 00:00:02,000\nSigned\n\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nNormal\n",
+        [
+            SubtitleSegment(1, 1000, 2000, "Signed"),
+            SubtitleSegment(2, 3000, 4000, "Normal"),
+        ],
+    ),
+    "index-at-end-of-file": (
+        "1\n00:00:01,000 --> 00:00:02,000\nA\n\n2\n",
+        [SubtitleSegment(1, 1000, 2000, "A")],
+    ),
+    "timing-at-end-of-file": (
+        "1\n00:00:01,000 --> 00:00:02,000\nA\n\n2\n00:00:03,000 --> 00:00:04,000",
+        [SubtitleSegment(1, 1000, 2000, "A")],
+    ),
+}
+
+
+@ENGINES
+@pytest.mark.parametrize(
+    "content,expected",
+    list(CONFORMANCE_CASES.values()),
+    ids=list(CONFORMANCE_CASES.keys()),
+)
+def test_engine_conformance(parse, content, expected):
+    """Every engine produces the same segments for the shared cases."""
+    assert parse(content) == expected
+
+
+# Malformed input and the output every engine must produce for it: a number
+# directly before a timing line is that cue's index, and a line after the
+# timing line is text until the next blank line, even if it looks like an
+# index or a timing line
+MALFORMED_CASES = {
+    "repeated-index": (
+        "1\n1\n00:00:01,000 --> 00:00:02,000\nA\n\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nB\n",
+        [SubtitleSegment(1, 1000, 2000, "A"), SubtitleSegment(2, 3000, 4000, "B")],
+    ),
+    "stray-number-before-index": (
+        "1\n00:00:01,000 --> 00:00:02,000\nA\n\n"
+        "99\n2\n00:00:03,000 --> 00:00:04,000\nB\n",
+        [SubtitleSegment(1, 1000, 2000, "A"), SubtitleSegment(2, 3000, 4000, "B")],
+    ),
+    "index-without-timing": (
+        "7\n\n2\n00:00:03,000 --> 00:00:04,000\nB\n",
+        [SubtitleSegment(2, 3000, 4000, "B")],
+    ),
+    "timing-line-in-text": (
+        "1\n00:00:01,000 --> 00:00:02,000\nA\n00:00:02,500 --> 00:00:03,000\nmore\n\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nB\n",
+        [
+            SubtitleSegment(1, 1000, 2000, "A\n00:00:02,500 --> 00:00:03,000\nmore"),
+            SubtitleSegment(2, 3000, 4000, "B"),
+        ],
+    ),
+    "repeated-timing-line": (
+        "1\n00:00:01,000 --> 00:00:02,000\n00:00:01,500 --> 00:00:02,500\nA\n",
+        [SubtitleSegment(1, 1000, 2000, "00:00:01,500 --> 00:00:02,500\nA")],
+    ),
+    "timing-without-index": (
+        "1\n00:00:01,000 --> 00:00:02,000\nA\n\n"
+        "00:00:02,500 --> 00:00:03,000\nOrphan\n\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nB\n",
+        [SubtitleSegment(1, 1000, 2000, "A"), SubtitleSegment(2, 3000, 4000, "B")],
+    ),
+    "number-in-text": (
+        "1\n00:00:01,000 --> 00:00:02,000\nA\n42\nB\n",
+        [SubtitleSegment(1, 1000, 2000, "A\n42\nB")],
+    ),
+    "text-without-index": (
+        "Orphan text\nmore\n\n2\n00:00:03,000 --> 00:00:04,000\nB\n",
+        [SubtitleSegment(2, 3000, 4000, "B")],
+    ),
+}
+
+
+@ENGINES
+@pytest.mark.parametrize(
+    "content,expected",
+    list(MALFORMED_CASES.values()),
+    ids=list(MALFORMED_CASES.keys()),
+)
+def test_engine_conformance_on_malformed_input(parse, content, expected):
+    """Every engine recovers the same segments from malformed input."""
+    assert parse(content) == expected
+
+
+@ENGINES
+def test_engine_round_trips_formatted_output(parse):
+    """Formatting parsed segments and parsing again is lossless."""
+    segments = parse(WELL_FORMED)
+
+    assert parse(SRTParser.format(segments)) == segments
+
+
+def test_parse_rejects_unknown_engine():
+    """An unknown engine name raises ValueError."""
+    with pytest.raises(ValueError, match="Unknown SRT parse engine"):
+        SRTParser.parse(WELL_FORMED, engine="fast")
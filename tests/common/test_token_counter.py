@@ -2,7 +2,31 @@
 
 import pytest
 
-from common.token_counter import TokenCounter, count_tokens, estimate_tokens
+from common.token_counter import (
+    TokenCounter,
+    count_tokens,
+    count_tokens_many,
+    estimate_tokens,
+    resolve_encoding_name,
+)
+
+
+class WordEncoding:
+    """Minimal tiktoken-like encoding that splits on whitespace and records calls."""
+
+    name = "whitespace"
+
+    def __init__(self):
+        self.encoded_texts = []
+        self.batch_calls = 0
+
+    def encode_ordinary(self, text):
+        self.encoded_texts.append(text)
+        return text.split()
+
+    def encode_ordinary_batch(self, texts, num_threads=8):
+        self.batch_calls += 1
+        return [self.encode_ordinary(text) for text in texts]
 
 
 class TestEstimateTokens:
@@ -123,6 +147,154 @@ Line 3"""
         assert isinstance(result, int)
 
 
+class TestCountTokensMany:
+    """Test batched, cached token counting."""
+
+    @pytest.fixture
+    def encoding(self):
+        """Provide a recording fake encoding."""
+        return WordEncoding()
+
+    @pytest.fixture
+    def counter(self, encoding):
+        """Provide TokenCounter wired to the fake encoding."""
+        counter = TokenCounter(cache_size=3)
+        counter.tiktoken_available = True
+        counter._encoding_cache["gpt-4"] = encoding
+        return counter
+
+    def test_counts_in_input_order(self, counter, encoding):
+        """Test counts line up with the input texts."""
+        result = counter.count_tokens_many(["one", "two words", "", "a b c"], "gpt-4")
+
+        assert result == [1, 2, 0, 3]
+        assert encoding.encoded_texts == ["one", "two words", "a b c"]
+
+    def test_thread_pool_used_when_configured(self, counter, encoding, monkeypatch):
+        """Test misses go through the batch encoder when threads are enabled."""
+        monkeypatch.setattr("common.token_counter.ENCODE_BATCH_THREADS", 4)
+
+        result = counter.count_tokens_many(["one", "two words"], "gpt-4")
+
+        assert result == [1, 2]
+        assert encoding.batch_calls == 1
+
+    def test_duplicate_texts_encoded_once(self, counter, encoding):
+        """Test repeated lines within and across batches are not re-encoded."""
+        counter.count_tokens_many(["Yes.", "No.", "Yes."], "gpt-4")
+        result = counter.count_tokens_many(["Yes.", "No."], "gpt-4")
+
+        assert result == [1, 1]
+        assert encoding.encoded_texts == ["Yes.", "No."]
+
+    def test_cache_shared_with_count_tokens(self, counter, encoding):
+        """Test single-text counting reuses batch results."""
+        counter.count_tokens_many(["hello there"], "gpt-4")
+
+        assert counter.count_tokens("hello there", "gpt-4") == 2
+        assert encoding.encoded_texts == ["hello there"]
+
+    def test_cache_is_bounded_lru(self, counter, encoding):
+        """Test the least recently used count is evicted past capacity."""
+        counter.count_tokens_many(["a", "b", "c"], "gpt-4")
+        counter.count_tokens("a", "gpt-4")
+        counter.count_tokens_many(["d"], "gpt-4")
+
+        assert len(counter._count_cache) == 3
+        counter.count_tokens_many(["a", "b"], "gpt-4")
+        assert encoding.encoded_texts == ["a", "b", "c", "d", "b"]
+
+    def test_encoding_error_falls_back_to_estimation(self, counter, encoding):
+        """Test batch encoding failures fall back to estimation."""
+        encoding.encode_ordinary = lambda text: 1 / 0
+
+        result = counter.count_tokens_many(["x" * 40, "", "x" * 40], "gpt-4")
+
+        assert result == [10, 0, 10]
+
+    def test_module_function_matches_single_counts(self):
+        """Test count_tokens_many agrees with count_tokens."""
+        texts = ["Hello, world!", "This is subtitle number 2", "Hello, world!"]
+
+        assert count_tokens_many(texts, "gpt-4") == [
+            count_tokens(text, "gpt-4") for text in texts
+        ]
+
+
+class TestEncodingResolution:
+    """Test model-to-encoding resolution and negative caching."""
+
+    @pytest.mark.parametrize(
+        "model,expected",
+        [
+            ("gpt-5-nano", "o200k_base"),
+            ("gpt-5", "o200k_base"),
+            ("gpt-4o-mini", "o200k_base"),
+            ("GPT-4o", "o200k_base"),
+            ("gpt-4.1-mini", "o200k_base"),
+            ("o3-mini", "o200k_base"),
+            ("ft:gpt-4o-mini:acme::abc123", "o200k_base"),
+            ("openai/gpt-5-mini", "o200k_base"),
+            ("gpt-4", "cl100k_base"),
+            ("gpt-4-turbo", "cl100k_base"),
+            ("gpt-3.5-turbo", "cl100k_base"),
+            ("unsupported-model-xyz", None),
+        ],
+    )
+    def test_resolve_encoding_name(self, model, expected):
+        """Test prefix rules map models to encodings."""
+        assert resolve_encoding_name(model) == expected
+
+    @pytest.fixture
+    def fake_tiktoken(self):
+        """Provide a tiktoken stand-in that records lookups."""
+
+        class FakeTiktoken:
+            def __init__(self):
+                self.get_encoding_calls = []
+                self.encoding_for_model_calls = []
+
+            def get_encoding(self, name):
+                self.get_encoding_calls.append(name)
+                return WordEncoding()
+
+            def encoding_for_model(self, model):
+                self.encoding_for_model_calls.append(model)
+                raise KeyError(f"Could not automatically map {model} to a tokeniser")
+
+        return FakeTiktoken()
+
+    @pytest.fixture
+    def counter(self, fake_tiktoken):
+        """Provide TokenCounter using the fake tiktoken."""
+        counter = TokenCounter()
+        counter.tiktoken_available = True
+        counter.tiktoken = fake_tiktoken
+        return counter
+
+    def test_prefix_rule_uses_named_encoding(self, counter, fake_tiktoken):
+        """Test known prefixes load their encoding by name, once."""
+        counter.count_tokens("one two", "gpt-5-nano")
+        counter.count_tokens_many(["three"], "gpt-5-nano")
+
+        assert fake_tiktoken.get_encoding_calls == ["o200k_base"]
+        assert fake_tiktoken.encoding_for_model_calls == []
+
+    def test_unknown_model_resolved_once(self, counter, fake_tiktoken, caplog):
+        """Test unknown models are looked up and warned about only once."""
+        texts = ["x" * 40] * 5
+
+        with caplog.at_level("WARNING", logger="common.token_counter"):
+            for text in texts:
+                assert counter.count_tokens(text, "mystery-model") == 10
+            assert counter.count_tokens_many(texts, "mystery-model") == [10] * 5
+
+        assert fake_tiktoken.encoding_for_model_calls == ["mystery-model"]
+        assert counter._encoding_cache["mystery-model"] is None
+        assert len(caplog.records) == 1
+        assert "mystery-model" in caplog.records[0].getMessage()
+
+
 class TestCountTokensFunction:
     """Test the convenience count_tokens function."""
 
@@ -230,3 +402,21 @@ class TestTokenCounterEdgeCases:
         assert result1 > 0
         assert result2 > 0
         assert result3 > 0
+
+
+class TestCalibratedEstimates:
+    """Test estimation with a calibrated chars-per-token ratio."""
+
+    def test_estimate_tokens_with_ratio(self):
+        """Test dense scripts are estimated with their observed ratio."""
+        text = "こんにちは世界" * 10  # 70 characters
+
+        assert estimate_tokens(text) == 17
+        assert estimate_tokens(text, chars_per_token=1.5) == 47
+
+    def test_count_tokens_many_uses_ratio_without_encoding(self):
+        """Test batch estimation honours the calibrated ratio."""
+        counter = TokenCounter()
+        counter.tiktoken_available = False
+
+        assert counter.count_tokens_many(["x" * 30, ""], "gpt-4", 2.0) == [15, 0]
@@ -696,6 +696,33 @@ class TestSubtitleTranslateEndpoint:
             data = response.json()
             assert data["video_title"] == "Translation Job"  # Default title
 
+    def test_translate_request_with_several_target_languages(self, client):
+        """Test extra target languages are validated and passed to the orchestrator."""
+        with patch("manager.main.redis_client") as mock_redis, patch(
+            "manager.main.orchestrator"
+        ) as mock_orchestrator:
+
+            mock_redis.ensure_connected = AsyncMock(return_value=True)
+            mock_redis.save_job = AsyncMock(return_value=True)
+            mock_orchestrator.enqueue_translation_task = AsyncMock(return_value=True)
+
+            request_data = {
+                "subtitle_path": "/path/to/subtitle.srt",
+                "source_language": "en",
+                "target_language": "es",
+                "target_languages": ["FR", " de "],
+            }
+
+            response = client.post("/subtitles/translate", json=request_data)
+
+            assert response.status_code == 200
+            call_args = mock_orchestrator.enqueue_translation_task.call_args
+            assert call_args.kwargs["target_languages"] == ["fr", "de"]
+
+            request_data["target_languages"] = ["french"]
+            response = client.post("/subtitles/translate", json=request_data)
+            assert response.status_code == 422
+
     @pytest.mark.parametrize(
         "component,exception_type,exception_message",
         [
@@ -1,5 +1,6 @@
 """Tests for checkpoint manager functionality."""
 
+import gzip
 import json
 from pathlib import Path
 from uuid import uuid4
@@ -8,7 +9,12 @@ import pytest
 
 from common.schemas import TranslationCheckpoint
 from common.subtitle_parser import SubtitleSegment
-from translator.checkpoint_manager import CheckpointManager
+from translator.checkpoint_manager import (
+    JOURNAL_VERSION,
+    CheckpointManager,
+    positions_to_ranges,
+    ranges_to_positions,
+)
 
 
 class TestCheckpointManager:
@@ -25,6 +31,7 @@ class TestCheckpointManager:
                 (object,),
                 {
                     "checkpoint_storage_path": None,
+                    "checkpoint_compression": False,
                     "subtitle_storage_path": str(tmp_path),
                 },
             )(),
@@ -311,6 +318,7 @@ class TestCheckpointManager:
                 (object,),
                 {
                     "checkpoint_storage_path": str(custom_path),
+                    "checkpoint_compression": False,
                     "subtitle_storage_path": str(tmp_path),
                 },
             )(),
@@ -332,6 +340,7 @@ class TestCheckpointManager:
                 (object,),
                 {
                     "checkpoint_storage_path": None,
+                    "checkpoint_compression": False,
                     "subtitle_storage_path": str(storage_path),
                 },
             )(),
@@ -343,3 +352,187 @@ class TestCheckpointManager:
         expected_checkpoint_dir = storage_path / "checkpoints"
         assert expected_checkpoint_dir in checkpoint_path.parents
         assert expected_checkpoint_dir.exists()
+
+
+class TestPositionRanges:
+    """Test collapsing segment positions into ranges."""
+
+    def test_round_trip(self):
+        """Test positions survive conversion to ranges and back."""
+        positions = [0, 1, 2, 7, 9, 10]
+
+        assert positions_to_ranges(positions) == [[0, 3], [7, 8], [9, 11]]
+        assert ranges_to_positions(positions_to_ranges(positions)) == positions
+
+
+class TestCheckpointJournal:
+    """Test the append-only checkpoint journal, plain and compressed."""
+
+    @pytest.fixture(params=[False, True], ids=["plain", "gzip"])
+    def checkpoint_manager(self, request, tmp_path, monkeypatch):
+        """Create CheckpointManager with temporary storage."""
+        monkeypatch.setattr(
+            "translator.checkpoint_manager.settings",
+            type(
+                "obj",
+                (object,),
+                {
+                    "checkpoint_storage_path": None,
+                    "checkpoint_compression": request.param,
+                    "subtitle_storage_path": str(tmp_path),
+                },
+            )(),
+        )
+        return CheckpointManager()
+
+    @pytest.fixture
+    def request_id(self):
+        """Generate a test request ID."""
+        return uuid4()
+
+    @staticmethod
+    def make_segment(index):
+        """Create a translated segment."""
+        return SubtitleSegment(
+            index=index,
+            start_time=f"00:00:{index:02d},000",
+            end_time=f"00:00:{index:02d},900",
+            text=f"Línea {index}",
+        )
+
+    async def start(self, checkpoint_manager, request_id, translated_segments=None):
+        """Start a journal for a 4-chunk translation."""
+        return await checkpoint_manager.start_journal(
+            request_id=request_id,
+            subtitle_file_path="/path/to/subtitle.srt",
+            source_language="en",
+            target_language="es",
+            total_chunks=4,
+            translated_segments=translated_segments or {},
+            source_hash="abc123",
+        )
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_records_load_in_source_order(
+        self, checkpoint_manager, request_id
+    ):
+        """Test appended segments load sorted by source position, gaps included."""
+        await self.start(checkpoint_manager, request_id)
+        await checkpoint_manager.append_segments(
+            request_id, "es", [6], [self.make_segment(7)]
+        )
+        await checkpoint_manager.append_segments(
+            request_id, "es", [2, 3], [self.make_segment(3), self.make_segment(4)]
+        )
+
+        checkpoint = await checkpoint_manager.load_checkpoint(request_id, "es")
+
+        assert checkpoint.translated_positions == [2, 3, 6]
+        assert checkpoint.source_hash == "abc123"
+        assert [segment["index"] for segment in checkpoint.translated_segments] == [
+            3,
+            4,
+            7,
+        ]
+        assert checkpoint.translated_segments[0]["text"] == "Línea 3"
+
+    @pytest.mark.asyncio
+    async def test_records_store_position_ranges(self, checkpoint_manager, request_id):
+        """Test records key segments by ranges of source positions."""
+        journal_path = await self.start(checkpoint_manager, request_id)
+        await checkpoint_manager.append_segments(
+            request_id,
+            "es",
+            [4, 5, 6, 9],
+            [self.make_segment(i) for i in (5, 6, 7, 10)],
+        )
+
+        journal_text = checkpoint_manager._read_journal_text(journal_path)
+        record = json.loads(journal_text.splitlines()[-1])
+
+        assert record["ranges"] == [[4, 7], [9, 10]]
+
+    @pytest.mark.asyncio
+    async def test_torn_last_record_is_ignored(self, checkpoint_manager, request_id):
+        """Test a record cut short by a crash does not invalidate the journal."""
+        journal_path = await self.start(checkpoint_manager, request_id)
+        await checkpoint_manager.append_segments(
+            request_id, "es", [0], [self.make_segment(1)]
+        )
+        torn_record = b'{"type": "segments", "ranges": [[1, 2]], "segm'
+        if journal_path.suffix == ".gz":
+            torn_record = gzip.compress(torn_record + b'ents": []}\n')[:-6]
+        with open(journal_path, "ab") as journal:
+            journal.write(torn_record)
+
+        checkpoint = await checkpoint_manager.load_checkpoint(request_id, "es")
+
+        assert checkpoint.translated_positions == [0]
+
+    @pytest.mark.asyncio
+    async def test_unknown_journal_version_is_rejected(
+        self, checkpoint_manager, request_id
+    ):
+        """Test a journal in another format is not misread."""
+        journal_path = checkpoint_manager.get_journal_path(
+            request_id, "es", compressed=False
+        )
+        header = {
+            "type": "header",
+            "version": JOURNAL_VERSION + 1,
+            "request_id": str(request_id),
+            "subtitle_file_path": "/path/to/subtitle.srt",
+            "source_language": "en",
+            "target_language": "es",
+            "total_chunks": 4,
+            "created_at": "2025-01-01T00:00:00+00:00",
+        }
+        journal_path.write_text(f"{json.dumps(header)}\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="version"):
+            await checkpoint_manager.load_checkpoint(request_id, "es")
+
+    @pytest.mark.asyncio
+    async def test_start_journal_compacts_and_replaces_snapshot(
+        self, checkpoint_manager, request_id
+    ):
+        """Test restarting rewrites the journal and drops a JSON snapshot."""
+        await checkpoint_manager.save_checkpoint(
+            request_id=request_id,
+            subtitle_file_path="/path/to/subtitle.srt",
+            source_language="en",
+            target_language="es",
+            total_chunks=4,
+            completed_chunks=[0],
+            translated_segments=[self.make_segment(1)],
+        )
+
+        journal_path = await self.start(
+            checkpoint_manager,
+            request_id,
+            {0: self.make_segment(1), 1: self.make_segment(2)},
+        )
+
+        assert not checkpoint_manager.get_checkpoint_path(request_id, "es").exists()
+        lines = checkpoint_manager._read_journal_text(journal_path).splitlines()
+        assert [json.loads(line)["type"] for line in lines] == ["header", "segments"]
+        assert json.loads(lines[1])["ranges"] == [[0, 2]]
+
+    @pytest.mark.asyncio
+    async def test_append_requires_started_journal(
+        self, checkpoint_manager, request_id
+    ):
+        """Test appending without a header fails instead of writing a bad journal."""
+        with pytest.raises(IOError):
+            await checkpoint_manager.append_segments(
+                request_id, "es", [0], [self.make_segment(1)]
+            )
+
+    @pytest.mark.asyncio
+    async def test_cleanup_removes_journal(self, checkpoint_manager, request_id):
+        """Test cleanup deletes the journal."""
+        journal_path = await self.start(checkpoint_manager, request_id)
+
+        assert checkpoint_manager.checkpoint_exists(request_id, "es")
+        assert await checkpoint_manager.cleanup_checkpoint(request_id, "es") is True
+        assert not journal_path.exists()
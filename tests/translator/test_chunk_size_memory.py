@@ -0,0 +1,240 @@
+"""Tests for adaptive chunk bisection and learned chunk size limits."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from common.subtitle_parser import SubtitleSegment
+from translator.chunk_size_memory import (
+    CHUNK_SIZE_GROWTH_SUCCESSES,
+    CHUNK_SIZE_TTL_SECONDS,
+    ChunkSizeMemory,
+)
+from translator.schemas import TranslationResult, TranslationTaskData
+from translator.translation_orchestrator import translate_chunk_adaptively
+from translator.translation_service import TranslationTruncatedError
+
+MODEL = "gpt-4o-mini"
+
+
+@pytest.fixture
+def chunk_size_redis(fake_redis_job_client):
+    """Patch the chunk size memory onto a fakeredis-backed client."""
+    with patch("translator.chunk_size_memory.redis_client", fake_redis_job_client):
+        yield fake_redis_job_client
+
+
+@pytest.fixture
+def disconnected_redis(chunk_size_redis):
+    """Patch the chunk size memory's Redis client as unavailable."""
+    chunk_size_redis.connected = False
+    return chunk_size_redis
+
+
+@pytest.fixture
+def max_segments_per_chunk():
+    """Patch the configured chunk size the learned limits grow back to."""
+    with patch("translator.chunk_size_memory.settings") as mock_settings:
+        mock_settings.translation_max_segments_per_chunk = 100
+        yield mock_settings
+
+
+class TestChunkSizeMemory:
+    """Test recording and loading learned chunk size limits."""
+
+    @pytest.mark.asyncio
+    async def test_record_limit_only_lowers(self, disconnected_redis):
+        """Test a learned limit is never raised by a later, larger one."""
+        memory = ChunkSizeMemory()
+
+        await memory.record_limit(MODEL, "es", 50)
+        await memory.record_limit(MODEL, "es", 80)
+
+        assert memory.get(MODEL, "es") == 50
+        assert memory.get("gpt-4o", "es") is None
+
+    @pytest.mark.asyncio
+    async def test_limits_are_per_target_language(self, disconnected_redis):
+        """Test truncation in one target language does not shrink another."""
+        memory = ChunkSizeMemory()
+
+        await memory.record_limit(MODEL, "de", 20)
+
+        assert memory.get(MODEL, "de") == 20
+        assert memory.get(MODEL, "es") is None
+
+    @pytest.mark.asyncio
+    async def test_record_limit_writes_redis_with_ttl(self, chunk_size_redis):
+        """Test a new limit is mirrored to Redis with an expiry."""
+        memory = ChunkSizeMemory()
+
+        await memory.record_limit(MODEL, "es", 25)
+
+        key = f"translator:chunk_size_limit:{MODEL}:es"
+        assert await chunk_size_redis.client.get(key) == "25"
+        assert 0 < await chunk_size_redis.client.ttl(key) <= CHUNK_SIZE_TTL_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_record_limit_keeps_lower_shared_limit(self, chunk_size_redis):
+        """Test a lower limit learned by another worker is not overwritten."""
+        key = f"translator:chunk_size_limit:{MODEL}:es"
+        await chunk_size_redis.client.set(key, 10)
+        memory = ChunkSizeMemory()
+
+        await memory.record_limit(MODEL, "es", 25)
+
+        assert await chunk_size_redis.client.get(key) == "10"
+        assert memory.get(MODEL, "es") == 10
+
+    @pytest.mark.asyncio
+    async def test_refresh_follows_redis(self, chunk_size_redis):
+        """Test refresh loads shared limits and drops expired ones."""
+        key = f"translator:chunk_size_limit:{MODEL}:es"
+        memory = ChunkSizeMemory()
+        await chunk_size_redis.client.set(key, 40)
+
+        assert await memory.refresh(MODEL, "es") == 40
+
+        await chunk_size_redis.client.delete(key)
+        assert await memory.refresh(MODEL, "es") is None
+
+    @pytest.mark.asyncio
+    async def test_limit_grows_after_full_size_successes(
+        self, chunk_size_redis, max_segments_per_chunk
+    ):
+        """Test untruncated full-size chunks raise the limit by a quarter."""
+        memory = ChunkSizeMemory()
+        await memory.record_limit(MODEL, "es", 40)
+
+        for _ in range(CHUNK_SIZE_GROWTH_SUCCESSES - 1):
+            await memory.record_success(MODEL, "es", 40)
+        await memory.record_success(MODEL, "es", 12)
+        assert memory.get(MODEL, "es") == 40
+
+        await memory.record_success(MODEL, "es", 40)
+
+        assert memory.get(MODEL, "es") == 50
+        key = f"translator:chunk_size_limit:{MODEL}:es"
+        assert await chunk_size_redis.client.get(key) == "50"
+
+    @pytest.mark.asyncio
+    async def test_limit_is_lifted_at_configured_chunk_size(
+        self, chunk_size_redis, max_segments_per_chunk
+    ):
+        """Test a limit that grows back to the configured size is dropped."""
+        memory = ChunkSizeMemory()
+        await memory.record_limit(MODEL, "es", 90)
+
+        for _ in range(CHUNK_SIZE_GROWTH_SUCCESSES):
+            await memory.record_success(MODEL, "es", 90)
+
+        assert memory.get(MODEL, "es") is None
+        key = f"translator:chunk_size_limit:{MODEL}:es"
+        assert await chunk_size_redis.client.get(key) is None
+
+
+class TestTranslateChunkAdaptively:
+    """Test chunk bisection on truncated responses."""
+
+    @pytest.fixture
+    def mock_settings(self):
+        """Create mock orchestrator settings with adaptive chunking enabled."""
+        with patch("translator.translation_orchestrator.settings") as mock_settings:
+            mock_settings.openai_model = MODEL
+            mock_settings.translation_adaptive_chunking = True
+            yield mock_settings
+
+    @pytest.fixture
+    def memory(self, disconnected_redis):
+        """Patch a fresh chunk size memory into the orchestrator."""
+        memory = ChunkSizeMemory()
+        with patch("translator.translation_orchestrator.chunk_size_memory", memory):
+            yield memory
+
+    @pytest.fixture
+    def task_data(self):
+        """Create translation task data."""
+        return TranslationTaskData(uuid4(), "/tmp/test.en.srt", "en", "es")
+
+    @staticmethod
+    def make_segments(count):
+        """Create numbered subtitle segments."""
+        return [
+            SubtitleSegment(i, i * 1000, i * 1000 + 900, f"Line {i}")
+            for i in range(1, count + 1)
+        ]
+
+    @staticmethod
+    def make_translator(max_segments):
+        """Create a translator that truncates requests above max_segments."""
+
+        async def translate(texts, source_lang, target_lang):
+            if len(texts) > max_segments:
+                raise TranslationTruncatedError(len(texts), "truncated")
+            return TranslationResult([f"T {text}" for text in texts])
+
+        translator = MagicMock()
+        translator.translate_batch = AsyncMock(side_effect=translate)
+        return translator
+
+    @pytest.mark.asyncio
+    async def test_bisects_until_chunks_fit(self, mock_settings, memory, task_data):
+        """Test a truncated chunk is split recursively and the size is learned."""
+        translator = self.make_translator(max_segments=2)
+
+        translated = await translate_chunk_adaptively(
+            self.make_segments(7), task_data, translator
+        )
+
+        assert [segment.text for segment in translated] == [
+            f"T Line {i}" for i in range(1, 8)
+        ]
+        assert [segment.index for segment in translated] == list(range(1, 8))
+        assert memory.get(MODEL, "es") == 2
+
+    @pytest.mark.asyncio
+    async def test_learned_limit_applies_to_later_chunks(
+        self, mock_settings, memory, task_data
+    ):
+        """Test later chunks are pre-split instead of failing again."""
+        await memory.record_limit(MODEL, "es", 3)
+        translator = self.make_translator(max_segments=3)
+
+        translated = await translate_chunk_adaptively(
+            self.make_segments(8), task_data, translator
+        )
+
+        assert len(translated) == 8
+        sizes = [
+            len(call.args[0]) for call in translator.translate_batch.call_args_list
+        ]
+        assert sizes == [3, 3, 2]
+
+    @pytest.mark.asyncio
+    async def test_single_segment_truncation_raises(
+        self, mock_settings, memory, task_data
+    ):
+        """Test bisection stops at one segment."""
+        translator = self.make_translator(max_segments=0)
+
+        with pytest.raises(TranslationTruncatedError):
+            await translate_chunk_adaptively(
+                self.make_segments(2), task_data, translator
+            )
+
+    @pytest.mark.asyncio
+    async def test_disabled_raises_without_splitting(
+        self, mock_settings, memory, task_data
+    ):
+        """Test truncation propagates when adaptive chunking is off."""
+        mock_settings.translation_adaptive_chunking = False
+        translator = self.make_translator(max_segments=2)
+
+        with pytest.raises(TranslationTruncatedError):
+            await translate_chunk_adaptively(
+                self.make_segments(4), task_data, translator
+            )
+
+        assert translator.translate_batch.call_count == 1
+        assert memory.get(MODEL, "es") is None
@@ -0,0 +1,151 @@
+"""Tests for adaptive concurrency of parallel chunk translation."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from translator.concurrency_controller import AdaptiveConcurrencyController
+from translator.response_parsing import ResponseFormatStats
+from translator.worker import log_translation_status
+
+
+@pytest.fixture
+def controller_settings():
+    """Patch the controller's settings with adaptive concurrency enabled."""
+    with patch("translator.concurrency_controller.settings") as mock_settings:
+        mock_settings.translation_adaptive_concurrency = True
+        mock_settings.translation_min_parallel_requests = 1
+        mock_settings.translation_max_parallel_requests = 8
+        mock_settings.translation_concurrency_latency_tolerance = 2.0
+        yield mock_settings
+
+
+@pytest.fixture
+def controller(controller_settings):
+    """Create a controller started at 4 concurrent requests."""
+    controller = AdaptiveConcurrencyController()
+    controller.start(4)
+    return controller
+
+
+class TestAdaptiveConcurrencyController:
+    """Test AIMD limit changes."""
+
+    def test_start_clamps_and_keeps_learned_limit(self, controller_settings):
+        """Test the initial limit is clamped and later jobs keep the learned one."""
+        controller = AdaptiveConcurrencyController()
+
+        assert controller.start(20) == 8
+        controller.limit = 5
+        assert controller.start(3) == 5
+
+    @pytest.mark.asyncio
+    async def test_additive_increase_after_healthy_window(self, controller):
+        """Test the limit grows by one after as many successes as the limit."""
+        for _ in range(3):
+            await controller.record_success(1.0)
+        assert controller.limit == 4
+
+        await controller.record_success(1.0)
+
+        assert controller.limit == 5
+        assert "consecutive successful requests" in controller.last_change_reason
+
+    @pytest.mark.asyncio
+    async def test_increase_stops_at_maximum(self, controller):
+        """Test the limit never exceeds the configured maximum."""
+        for _ in range(100):
+            await controller.record_success(1.0)
+
+        assert controller.limit == 8
+
+    def test_rate_limit_halves_limit_once_per_burst(self, controller):
+        """Test 429s from requests already in flight count as one signal."""
+        started = time.monotonic()
+
+        controller.record_congestion("rate limited (429)", started)
+        controller.record_congestion("rate limited (429)", started)
+
+        assert controller.limit == 2
+        assert controller.last_change_reason == "rate limited (429)"
+
+        controller.record_congestion("request timed out", time.monotonic())
+
+        assert controller.limit == 1
+        assert controller.last_change_reason == "request timed out"
+
+    def test_decrease_stops_at_minimum(self, controller, controller_settings):
+        """Test the limit never drops below the configured minimum."""
+        controller_settings.translation_min_parallel_requests = 3
+
+        controller.record_congestion("rate limited (429)", time.monotonic())
+
+        assert controller.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_rising_p95_latency_cuts_limit(self, controller):
+        """Test p95 latency well above the baseline halves the limit."""
+        controller.limit = 8
+        for _ in range(10):
+            await controller.record_success(1.0)
+        limit_before = controller.limit
+
+        for _ in range(2):
+            await controller.record_success(5.0)
+
+        assert controller.limit == limit_before // 2
+        assert "p95 latency" in controller.last_change_reason
+
+    @pytest.mark.asyncio
+    async def test_disabled_ignores_signals(self, controller, controller_settings):
+        """Test the limit does not move when adaptive concurrency is off."""
+        controller_settings.translation_adaptive_concurrency = False
+
+        controller.record_congestion("rate limited (429)", time.monotonic())
+        for _ in range(10):
+            await controller.record_success(1.0)
+
+        assert controller.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_slot_enforces_limit(self, controller):
+        """Test no more than the current limit run at once."""
+        controller.limit = 2
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            async with controller.slot():
+                peak = max(peak, controller.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work() for _ in range(6)))
+
+        assert peak == 2
+        assert controller.in_flight == 0
+
+    def test_status_reports_limit_and_reason(self, controller):
+        """Test the controller state includes the limit and why it changed."""
+        controller.record_congestion("rate limited (429)", time.monotonic())
+
+        concurrency = controller.get_status()
+
+        assert concurrency["enabled"] is True
+        assert concurrency["limit"] == 2
+        assert concurrency["last_change_reason"] == "rate limited (429)"
+        assert concurrency["last_changed_at"] is not None
+
+    def test_worker_logs_limit_and_reason(self, controller):
+        """Test the translator worker logs the concurrency state after a job."""
+        controller.record_congestion("rate limited (429)", time.monotonic())
+
+        with patch("translator.worker.concurrency_controller", controller), patch(
+            "translator.worker.response_format_stats", ResponseFormatStats()
+        ), patch("translator.worker.logger") as mock_logger:
+            log_translation_status()
+
+        message = mock_logger.info.call_args[0][0]
+        assert "concurrency limit 2 (1-8)" in message
+        assert "rate limited (429)" in message
@@ -0,0 +1,90 @@
+"""Tests for translator file operations."""
+
+import os
+import stat
+
+import pytest
+
+from common.subtitle_parser import SRTParser, SubtitleSegment
+from translator.file_operations import (
+    get_partial_output_path,
+    save_translated_file,
+    write_subtitle_file_atomic,
+)
+
+
+@pytest.fixture
+def segments():
+    """Create a small list of translated segments."""
+    return [
+        SubtitleSegment(1, "00:00:01,000", "00:00:04,000", "Hola"),
+        SubtitleSegment(2, "00:00:04,500", "00:00:08,000", "Mundo"),
+    ]
+
+
+class TestWriteSubtitleFileAtomic:
+    """Test atomic streaming subtitle writes."""
+
+    def test_writes_formatted_content(self, tmp_path, segments):
+        """Test the written file matches SRTParser.format output."""
+        output_path = tmp_path / "movie.es.srt"
+
+        written = write_subtitle_file_atomic(iter(segments), output_path)
+
+        assert written == 2
+        assert output_path.read_text(encoding="utf-8") == SRTParser.format(segments)
+        assert list(tmp_path.iterdir()) == [output_path]
+
+    def test_replaces_existing_file_and_keeps_mode(self, tmp_path, segments):
+        """Test an existing file is replaced with its permissions preserved."""
+        output_path = tmp_path / "movie.es.srt"
+        output_path.write_text("old content", encoding="utf-8")
+        os.chmod(output_path, 0o640)
+
+        write_subtitle_file_atomic(segments, output_path)
+
+        assert output_path.read_text(encoding="utf-8") == SRTParser.format(segments)
+        assert stat.S_IMODE(output_path.stat().st_mode) == 0o640
+
+    def test_failure_leaves_existing_file_untouched(self, tmp_path, segments):
+        """Test a failing segment source never exposes a partial file."""
+        output_path = tmp_path / "movie.es.srt"
+        output_path.write_text("old content", encoding="utf-8")
+
+        def failing_segments():
+            yield segments[0]
+            raise RuntimeError("translation aborted")
+
+        with pytest.raises(RuntimeError):
+            write_subtitle_file_atomic(failing_segments(), output_path)
+
+        assert output_path.read_text(encoding="utf-8") == "old content"
+        assert list(tmp_path.iterdir()) == [output_path]
+
+
+class TestSaveTranslatedFile:
+    """Test saving translated subtitle files."""
+
+    @pytest.mark.asyncio
+    async def test_save_translated_file(self, tmp_path, segments):
+        """Test translated output is written next to the source file."""
+        source_path = tmp_path / "movie.en.srt"
+        source_path.write_text("", encoding="utf-8")
+
+        output_path = await save_translated_file(segments, str(source_path), "es")
+
+        assert output_path == tmp_path / "movie.es.srt"
+        assert output_path.read_text(encoding="utf-8") == SRTParser.format(segments)
+
+    @pytest.mark.asyncio
+    async def test_save_removes_partial_file(self, tmp_path, segments):
+        """Test the progressive partial file is removed once the full file is saved."""
+        source_path = tmp_path / "movie.en.srt"
+        source_path.write_text("", encoding="utf-8")
+        partial_path = get_partial_output_path(str(source_path), "es")
+        partial_path.write_text(SRTParser.format(segments[:1]), encoding="utf-8")
+
+        await save_translated_file(segments, str(source_path), "es")
+
+        assert partial_path == tmp_path / "movie.es.partial.srt"
+        assert not partial_path.exists()
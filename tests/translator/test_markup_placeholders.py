@@ -0,0 +1,99 @@
+"""Tests for markup placeholders around translation requests."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from translator.markup_placeholders import MarkupPlaceholders, protect_markup
+from translator.prompt_builder import INSTRUCTIONS, TRANSLATION_INSTRUCTIONS
+from translator.response_parsing import RESPONSE_FORMAT_NUMBERED
+from translator.translation_service import SubtitleTranslator
+
+
+class TestMarkupPlaceholders:
+    """Test swapping markup for placeholders and back."""
+
+    def test_round_trip_restores_tags(self):
+        """Test HTML, font and ASS override tags survive a round trip."""
+        text = '{\\an8}<i>Hello</i>, <font color="#ffff00">friend</font>'
+
+        placeholders = MarkupPlaceholders(text)
+
+        assert placeholders.text == "{0}{1}Hello{2}, {3}friend{4}"
+        assert placeholders.leading_tags == 2
+        assert placeholders.restore("{0}{1}Hola{2}, {3}amigo{4}") == (
+            '{\\an8}<i>Hola</i>, <font color="#ffff00">amigo</font>',
+            0,
+        )
+
+    def test_missing_placeholders_put_back_locally(self):
+        """Test dropped leading tags go first and the others go last."""
+        placeholders = MarkupPlaceholders("{\\an8}<i>Hello</i>")
+
+        assert placeholders.restore("{1}Hola") == ("{\\an8}<i>Hola</i>", 2)
+
+    def test_invented_and_repeated_placeholders_removed(self):
+        """Test placeholders that were not sent, or come back twice, are dropped."""
+        placeholders = MarkupPlaceholders("<i>Hello</i>")
+
+        assert placeholders.restore("{0}Hola{5}{1}{0}") == ("<i>Hola</i>", 0)
+
+    def test_text_with_placeholder_lookalike_sent_unchanged(self):
+        """Test text that already contains "{1}" is not protected."""
+        texts, placeholders = protect_markup(["<i>Option {1}</i>", "Plain"])
+
+        assert texts == ["<i>Option {1}</i>", "Plain"]
+        assert placeholders[0].restore("<i>Opción {1}</i>") == (
+            "<i>Opción {1}</i>",
+            0,
+        )
+
+    def test_placeholder_instructions_drop_html_rules(self):
+        """Test the placeholder instructions are shorter than the HTML tag rules."""
+        instructions = INSTRUCTIONS[(RESPONSE_FORMAT_NUMBERED, True)]
+
+        assert "{0}" in instructions
+        assert "HTML" not in instructions
+        assert len(instructions) < len(TRANSLATION_INSTRUCTIONS)
+
+
+class TestTranslateBatchPlaceholders:
+    """Test placeholders in SubtitleTranslator.translate_batch."""
+
+    @pytest.mark.asyncio
+    async def test_placeholders_sent_and_tags_restored(self):
+        """Test the request carries placeholders and the result carries tags."""
+        with patch("translator.translation_service.AsyncOpenAI"):
+            translator = SubtitleTranslator()
+
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "[1]\n{0}Hola{1}\n\n[2]\nAdiós"
+        response.choices[0].finish_reason = "stop"
+        translator.client = MagicMock()
+        translator.client.chat.completions.create = AsyncMock(return_value=response)
+
+        with patch("translator.translation_service.settings") as mock_settings, patch(
+            "translator.markup_placeholders.settings"
+        ) as placeholder_settings:
+            mock_settings.openai_api_key = "sk-test-key"
+            mock_settings.openai_model = "gpt-4o-mini"
+            mock_settings.openai_max_tokens = 4096
+            mock_settings.openai_max_retries = 0
+            mock_settings.translation_streaming = False
+            mock_settings.translation_response_format = "numbered"
+            placeholder_settings.translation_markup_placeholders = True
+            result = await translator.translate_batch(
+                ["<i>Hello</i>", '<font color="red">Goodbye</font>'], "en", "es"
+            )
+
+        messages = translator.client.chat.completions.create.call_args.kwargs[
+            "messages"
+        ]
+        assert "[1]\n{0}Hello{1}" in messages[1]["content"]
+        assert "<i>" not in messages[1]["content"]
+        assert result.translations == [
+            "<i>Hola</i>",
+            '<font color="red">Adiós</font>',
+        ]
+        assert result.markup_repairs == 2
@@ -0,0 +1,89 @@
+"""Tests for progressive output of translated subtitles."""
+
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from common.schemas import EventType
+from common.subtitle_parser import SRTParser, SubtitleSegment
+from translator.progressive_output import ProgressiveSubtitleWriter
+from translator.schemas import TranslationTaskData
+
+
+def make_segment(position: int) -> SubtitleSegment:
+    """Create the translated segment at a source position."""
+    start_ms = position * 2000
+    return SubtitleSegment(
+        position + 1, start_ms, start_ms + 1500, f"Texto {position + 1}"
+    )
+
+
+@pytest.fixture
+def writer(tmp_path):
+    """Create a writer for a five-segment file under tmp_path."""
+    task_data = TranslationTaskData(
+        request_id=uuid4(),
+        subtitle_file_path=str(tmp_path / "movie.en.srt"),
+        source_language="en",
+        target_language="es",
+    )
+    return ProgressiveSubtitleWriter(task_data, total_segments=5)
+
+
+@pytest.fixture
+def mock_publisher():
+    """Patch the event publisher used for progress events."""
+    with patch("translator.event_helpers.event_publisher") as publisher:
+        publisher.publish_event = AsyncMock(return_value=True)
+        yield publisher
+
+
+class TestProgressiveSubtitleWriter:
+    """Test partial files cover exactly the translated start of the file."""
+
+    @pytest.mark.asyncio
+    async def test_writes_only_contiguous_prefix(self, writer, mock_publisher):
+        """Test segments after a gap are not written until the gap is filled."""
+        translated = {position: make_segment(position) for position in (0, 1, 3)}
+
+        assert await writer.update(translated) is True
+
+        partial = SRTParser.parse(writer.partial_path.read_text(encoding="utf-8"))
+        assert writer.partial_path.name == "movie.es.partial.srt"
+        assert [segment.text for segment in partial] == ["Texto 1", "Texto 2"]
+
+        event = mock_publisher.publish_event.call_args[0][0]
+        assert event.event_type == EventType.TRANSLATION_PROGRESS
+        assert event.payload["segments_ready"] == 2
+        assert event.payload["total_segments"] == 5
+        assert event.payload["ready_until"] == "00:00:03,500"
+        assert event.payload["partial_path"] == str(writer.partial_path)
+
+    @pytest.mark.asyncio
+    async def test_rewrites_only_when_prefix_grows(self, writer, mock_publisher):
+        """Test a completion past the gap changes nothing; filling the gap does."""
+        translated = {0: make_segment(0)}
+        await writer.update(translated)
+
+        translated[2] = make_segment(2)
+        assert await writer.update(translated) is False
+
+        translated[1] = make_segment(1)
+        assert await writer.update(translated) is True
+
+        partial = SRTParser.parse(writer.partial_path.read_text(encoding="utf-8"))
+        assert [segment.index for segment in partial] == [1, 2, 3]
+        assert mock_publisher.publish_event.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_write_failure_does_not_raise(self, writer, mock_publisher):
+        """Test a failed write is logged and the translation carries on."""
+        with patch(
+            "translator.progressive_output.write_subtitle_file_atomic",
+            side_effect=OSError("disk full"),
+        ):
+            assert await writer.update({0: make_segment(0)}) is False
+
+        assert writer.segments_written == 0
+        mock_publisher.publish_event.assert_not_awaited()
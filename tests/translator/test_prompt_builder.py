@@ -0,0 +1,100 @@
+"""Tests for translation prompt construction."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from translator.markup_placeholders import MarkupPlaceholders
+from translator.prompt_builder import TRANSLATION_INSTRUCTIONS, TranslationPrompt
+from translator.schemas import TranslationJobStats
+from translator.translation_service import SubtitleTranslator
+
+
+class TestTranslationPrompt:
+    """Test the static instructions come first and the segments last."""
+
+    def test_instructions_identical_across_chunks_and_languages(self):
+        """Test the system message does not vary with the request."""
+        spanish = TranslationPrompt(["Hello"], "English", "Spanish")
+        hebrew = TranslationPrompt(["Goodbye", "Thanks"], "French", "Hebrew")
+
+        assert spanish.messages[0] == hebrew.messages[0]
+        assert spanish.messages[0]["content"] == TRANSLATION_INSTRUCTIONS
+        assert "Spanish" not in TRANSLATION_INSTRUCTIONS
+        assert "English" not in TRANSLATION_INSTRUCTIONS
+
+    def test_user_message_ends_with_numbered_segments(self):
+        """Test the language pair leads the user message and the segments end it."""
+        prompt = TranslationPrompt(["Hello", "Goodbye"], "English", "Spanish")
+
+        assert prompt.user_message == (
+            "Translate the following 2 subtitle segments from English to Spanish."
+            "\n\n[1]\nHello\n\n[2]\nGoodbye"
+        )
+        assert prompt.messages[1] == {"role": "user", "content": prompt.user_message}
+
+    def test_overhead_excludes_subtitle_text(self):
+        """Test overhead depends on the segment count, not on the text."""
+        short = TranslationPrompt(["Hi", "Yes"], "English", "Spanish")
+        long = TranslationPrompt(
+            ["A much longer line of dialogue", "And another one here"],
+            "English",
+            "Spanish",
+        )
+        more = TranslationPrompt(["Hi", "Yes", "No"], "English", "Spanish")
+
+        assert short.overhead_tokens("gpt-4o-mini") == long.overhead_tokens(
+            "gpt-4o-mini"
+        )
+        assert more.overhead_tokens("gpt-4o-mini") > short.overhead_tokens(
+            "gpt-4o-mini"
+        )
+
+
+class TestPromptUsageReporting:
+    """Test cached and overhead tokens are reported per call and per job."""
+
+    @pytest.mark.asyncio
+    async def test_cached_and_overhead_tokens_recorded(self):
+        """Test usage.prompt_tokens_details.cached_tokens reaches the job stats."""
+        with patch("translator.translation_service.AsyncOpenAI"):
+            translator = SubtitleTranslator()
+
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "[1]\nHola\n\n[2]\nAdiós"
+        response.choices[0].finish_reason = "stop"
+        response.usage.prompt_tokens = 1400
+        response.usage.completion_tokens = 12
+        response.usage.prompt_tokens_details.cached_tokens = 1024
+        translator.client = MagicMock()
+        translator.client.chat.completions.create = AsyncMock(return_value=response)
+
+        with patch("translator.translation_service.settings") as mock_settings:
+            mock_settings.openai_api_key = "sk-test-key"
+            mock_settings.openai_model = "gpt-4o-mini"
+            mock_settings.openai_max_tokens = 4096
+            mock_settings.openai_max_retries = 0
+            mock_settings.translation_streaming = False
+            result = await translator.translate_batch(["Hello", "Goodbye"], "en", "es")
+
+        expected_overhead = TranslationPrompt(
+            ["Hello", "Goodbye"],
+            "English",
+            "Spanish",
+            markup_placeholders=MarkupPlaceholders.is_enabled(),
+        ).overhead_tokens("gpt-4o-mini")
+        assert result.cached_tokens == 1024
+        assert result.overhead_tokens == expected_overhead
+
+        stats = TranslationJobStats()
+        stats.record_result(result)
+        assert stats.to_dict()["cached_tokens"] == 1024
+        assert stats.to_dict()["prompt_overhead_tokens"] == expected_overhead
+
+    def test_cached_tokens_default_to_zero(self):
+        """Test usage without prompt_tokens_details counts no cached tokens."""
+        usage = MagicMock(spec=["prompt_tokens", "completion_tokens"])
+
+        assert SubtitleTranslator._get_cached_tokens(usage) == 0
+        assert SubtitleTranslator._get_cached_tokens(None) == 0
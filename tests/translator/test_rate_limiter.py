@@ -0,0 +1,291 @@
+"""Tests for the cluster-wide OpenAI rate limiter."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from translator.rate_limiter import (
+    OpenAIRateLimiter,
+    get_retry_after_ms,
+    parse_reset_duration,
+    take_capacity,
+)
+
+MODEL = "gpt-4o-mini"
+
+
+class FakeClock:
+    """Wall and monotonic clock that only moves when asyncio.sleep is called."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Patch the limiter's time and sleep with a fake clock."""
+    fake_clock = FakeClock()
+    mock_time = MagicMock()
+    mock_time.time = fake_clock.time
+    mock_time.monotonic = fake_clock.monotonic
+    with patch("translator.rate_limiter.time", mock_time), patch(
+        "translator.rate_limiter.asyncio.sleep", fake_clock.sleep
+    ), patch("translator.rate_limiter.random.uniform", return_value=0):
+        yield fake_clock
+
+
+@pytest.fixture
+def limiter_settings():
+    """Patch the limiter's settings with RPM/TPM limits."""
+    with patch("translator.rate_limiter.settings") as mock_settings:
+        mock_settings.openai_requests_per_minute = 60
+        mock_settings.openai_tokens_per_minute = 6000
+        yield mock_settings
+
+
+@pytest.fixture
+def limiter_redis(fake_redis_job_client):
+    """Patch the limiter onto a fakeredis-backed client."""
+    with patch("translator.rate_limiter.redis_client", fake_redis_job_client):
+        yield fake_redis_job_client.client
+
+
+class TestHeaderParsing:
+    """Test reading wait times from rate limit headers."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [("1s", 1000), ("6m0s", 360_000), ("20ms", 20), ("1h2m3.5s", 3_723_500)],
+    )
+    def test_parse_reset_duration(self, value, expected):
+        """Test OpenAI reset durations are converted to milliseconds."""
+        assert parse_reset_duration(value) == expected
+
+    def test_parse_reset_duration_unrecognized(self):
+        """Test unknown formats are ignored."""
+        assert parse_reset_duration("soon") is None
+
+    def test_retry_after_headers(self):
+        """Test Retry-After variants and exhausted remaining counts."""
+        assert get_retry_after_ms(httpx.Headers({"Retry-After": "2"})) == 2000
+        assert get_retry_after_ms(httpx.Headers({"retry-after-ms": "350"})) == 350
+        assert (
+            get_retry_after_ms(
+                httpx.Headers(
+                    {
+                        "x-ratelimit-remaining-tokens": "0",
+                        "x-ratelimit-reset-tokens": "6m0s",
+                        "x-ratelimit-remaining-requests": "10",
+                        "x-ratelimit-reset-requests": "1s",
+                    }
+                )
+            )
+            == 360_000
+        )
+
+    def test_no_wait_requested(self):
+        """Test headers without limits request no pause."""
+        assert get_retry_after_ms(None) is None
+        assert get_retry_after_ms(httpx.Headers({"x-request-id": "abc"})) is None
+
+
+class TestTakeCapacity:
+    """Test the dual token bucket arithmetic."""
+
+    def test_fresh_buckets_take_capacity(self):
+        """Test full buckets admit a request and are debited."""
+        wait_ms, state = take_capacity({}, 0, 60, 6000, 1000)
+
+        assert wait_ms == 0
+        assert state["requests"] == 59
+        assert state["tokens"] == 5000
+
+    def test_token_bucket_waits_for_refill(self):
+        """Test a request larger than the remaining tokens waits for refill."""
+        state = {"requests": 10, "tokens": 500, "updated_ms": 0}
+
+        wait_ms, new_state = take_capacity(state, 0, 60, 6000, 1000)
+
+        # 500 missing tokens at 100 tokens/second
+        assert wait_ms == 5000
+        assert new_state["tokens"] == 500
+
+    def test_request_bucket_refills_over_time(self):
+        """Test an empty request bucket admits again after refilling."""
+        state = {"requests": 0, "tokens": 6000, "updated_ms": 0}
+
+        assert take_capacity(state, 0, 60, 0, 0)[0] == 1000
+        assert take_capacity(state, 1000, 60, 0, 0)[0] == 0
+
+    def test_blocked_until(self):
+        """Test a header-imposed pause holds every request."""
+        state = {"blocked_until_ms": 3000}
+
+        assert take_capacity(state, 1000, 60, 6000, 10)[0] == 2000
+
+
+class TestOpenAIRateLimiter:
+    """Test acquiring capacity through Redis."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_does_not_touch_redis(self, limiter_redis, clock):
+        """Test no limit configured means no waiting and no Redis state."""
+        with patch("translator.rate_limiter.settings") as mock_settings:
+            mock_settings.openai_requests_per_minute = 0
+            mock_settings.openai_tokens_per_minute = 0
+
+            assert await OpenAIRateLimiter().acquire(MODEL, 10_000) == 0
+
+        assert await limiter_redis.keys("translator:rate_limit:*") == []
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_when_tokens_run_out(
+        self, limiter_redis, limiter_settings, clock
+    ):
+        """Test requests beyond the TPM budget wait for the bucket to refill."""
+        limiter = OpenAIRateLimiter()
+
+        assert await limiter.acquire(MODEL, 4000) == 0
+        waited = await limiter.acquire(MODEL, 4000)
+
+        # 2000 tokens left, 2000 more needed at 100 tokens/second
+        assert waited == pytest.approx(20.0, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_buckets_are_shared_between_replicas(
+        self, limiter_redis, limiter_settings, clock
+    ):
+        """Test capacity taken by one process is unavailable to another."""
+        limiter_settings.openai_requests_per_minute = 1
+
+        assert await OpenAIRateLimiter().acquire(MODEL, 10) == 0
+        assert await OpenAIRateLimiter().acquire(MODEL, 10) == pytest.approx(
+            60.0, abs=0.01
+        )
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_is_clamped(
+        self, limiter_redis, limiter_settings, clock
+    ):
+        """Test a request larger than the whole TPM budget can still proceed."""
+        assert await OpenAIRateLimiter().acquire(MODEL, 50_000) == 0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_all_replicas(
+        self, limiter_redis, limiter_settings, clock
+    ):
+        """Test a Retry-After header pauses this and other processes."""
+        await OpenAIRateLimiter().observe_headers(
+            MODEL, httpx.Headers({"retry-after": "7"})
+        )
+
+        assert await OpenAIRateLimiter().acquire(MODEL, 10) == pytest.approx(
+            7.0, abs=0.01
+        )
+
+    @pytest.mark.asyncio
+    async def test_retry_after_honored_without_redis(self, clock):
+        """Test header pauses apply in-process when Redis is unavailable."""
+        limiter = OpenAIRateLimiter()
+        with patch("translator.rate_limiter.redis_client") as mock_redis:
+            mock_redis.connected = False
+            mock_redis.client = None
+
+            await limiter.observe_headers(MODEL, httpx.Headers({"retry-after": "3"}))
+            waited = await limiter.acquire(MODEL, 10)
+
+        assert waited == pytest.approx(3.0)
+
+
+class TestTranslatorRateLimiting:
+    """Test the translator acquires capacity and reports 429 headers."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_headers_are_reported(self):
+        """Test a 429's headers reach the limiter before the error is retried."""
+        from openai import RateLimitError
+
+        from translator.translation_service import SubtitleTranslator
+
+        with patch("translator.translation_service.settings") as mock_settings:
+            mock_settings.openai_api_key = "sk-test-key"
+            mock_settings.openai_model = MODEL
+            mock_settings.openai_max_tokens = 4096
+            mock_settings.openai_max_retries = 0
+            mock_settings.openai_retry_initial_delay = 0
+            mock_settings.openai_retry_max_delay = 0
+            mock_settings.openai_retry_exponential_base = 2
+
+            with patch("translator.translation_service.AsyncOpenAI"):
+                translator = SubtitleTranslator()
+
+            response = httpx.Response(
+                429,
+                headers={"retry-after": "5"},
+                request=httpx.Request("POST", "https://api.openai.com/v1"),
+            )
+            translator.client = MagicMock()
+            translator.client.chat.completions.create = AsyncMock(
+                side_effect=RateLimitError("Rate limited", response=response, body=None)
+            )
+
+            mock_limiter = MagicMock()
+            mock_limiter.is_enabled.return_value = True
+            mock_limiter.acquire = AsyncMock(return_value=0)
+            mock_limiter.observe_headers = AsyncMock(return_value=5000)
+
+            with patch(
+                "translator.translation_service.openai_rate_limiter", mock_limiter
+            ):
+                with pytest.raises(RateLimitError):
+                    await translator.translate_batch(["Hello"], "en", "es")
+
+        mock_limiter.acquire.assert_awaited_once()
+        model, estimated_tokens = mock_limiter.acquire.call_args[0]
+        assert model == MODEL
+        assert estimated_tokens > 4096
+        mock_limiter.observe_headers.assert_awaited_once_with(MODEL, response.headers)
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_on_success_pauses_requests(self, clock):
+        """Test a 200 response with no requests remaining paces the next request."""
+        from translator.translation_service import SubtitleTranslator
+
+        limiter = OpenAIRateLimiter()
+        response = httpx.Response(
+            200,
+            headers={
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-reset-requests": "2s",
+                "x-ratelimit-remaining-tokens": "150000",
+            },
+            request=httpx.Request("POST", "https://api.openai.com/v1"),
+        )
+
+        with patch("translator.rate_limiter.redis_client") as mock_redis, patch(
+            "translator.translation_service.openai_rate_limiter", limiter
+        ), patch("translator.translation_service.settings") as mock_settings:
+            mock_redis.connected = False
+            mock_redis.client = None
+            mock_settings.openai_api_key = "sk-test-key"
+            mock_settings.openai_model = MODEL
+
+            translator = SubtitleTranslator()
+            hooks = translator.client._client.event_hooks["response"]
+            for hook in hooks:
+                await hook(response)
+            waited = await limiter.acquire(MODEL, 10)
+
+        assert waited == pytest.approx(2.0)
@@ -0,0 +1,212 @@
+"""Tests for parsing translation responses."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from common.subtitle_parser import TranslationCountMismatchError
+from translator.response_parsing import (
+    TRANSLATIONS_RESPONSE_FORMAT,
+    ResponseFormatStats,
+    parse_json_response,
+    parse_numbered_response,
+)
+from translator.translation_service import SubtitleTranslator
+from translator.worker import log_translation_status
+
+
+def make_response(content: str) -> MagicMock:
+    """Build a non-streamed chat completion with the given content."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    response.choices[0].finish_reason = "stop"
+    return response
+
+
+@pytest.fixture
+def format_stats():
+    """Patch the translator's response format stats with a fresh instance."""
+    stats = ResponseFormatStats()
+    with patch("translator.translation_service.response_format_stats", stats):
+        yield stats
+
+
+@pytest.fixture
+def translator_settings():
+    """Patch the translator's settings for API calls without retries."""
+    with patch("translator.translation_service.settings") as mock_settings:
+        mock_settings.openai_api_key = "sk-test-key"
+        mock_settings.openai_model = "gpt-4o-mini"
+        mock_settings.openai_max_tokens = 4096
+        mock_settings.openai_max_retries = 0
+        mock_settings.translation_streaming = False
+        mock_settings.translation_response_format = "numbered"
+        yield mock_settings
+
+
+@pytest.fixture
+def translator(translator_settings):
+    """Create a translator whose client responses are set per test."""
+    with patch("translator.translation_service.AsyncOpenAI"):
+        translator = SubtitleTranslator()
+    translator.client = MagicMock()
+    return translator
+
+
+class TestParseNumberedResponse:
+    """Test the anchored "[n]" parser."""
+
+    def test_sdh_tags_do_not_split_segments(self):
+        """Test bracketed sound descriptions stay part of their segment."""
+        response = "[1]\n[door creaks]\n¿Hola?\n\n[2]\n[MÚSICA] Adiós [risas]"
+
+        assert parse_numbered_response(response, 2) == {
+            1: "[door creaks]\n¿Hola?",
+            2: "[MÚSICA] Adiós [risas]",
+        }
+
+    def test_preamble_duplicates_and_unknown_numbers_ignored(self):
+        """Test only the first block for each requested number is kept."""
+        response = "Here you go:\n[1]\nUno\n[3]\nTres\n[1]\nOtra vez\n[2]\nDos"
+
+        assert parse_numbered_response(response, 2) == {1: "Uno", 2: "Dos"}
+
+    def test_marker_inside_line_is_text(self):
+        """Test "[2]" in the middle of a line does not start a segment."""
+        assert parse_numbered_response("[1]\nCapítulo [2] empieza", 2) == {
+            1: "Capítulo [2] empieza"
+        }
+
+
+class TestParseJsonResponse:
+    """Test validation of {id, text} entries."""
+
+    def test_object_and_bare_array_accepted(self):
+        """Test both the schema's object and a bare array parse."""
+        entries = [{"id": 2, "text": "[MUSIC] Dos"}, {"id": 1, "text": "Uno"}]
+
+        assert parse_json_response(json.dumps({"translations": entries}), 2) == {
+            1: "Uno",
+            2: "[MUSIC] Dos",
+        }
+        assert parse_json_response(json.dumps(entries), 2) == {
+            1: "Uno",
+            2: "[MUSIC] Dos",
+        }
+
+    def test_invalid_entries_skipped(self):
+        """Test entries with bad ids or text, duplicates and unknown ids are dropped."""
+        entries = [
+            {"id": 1, "text": "Uno"},
+            {"id": 1, "text": "Otra vez"},
+            {"id": "2", "text": "Dos"},
+            {"id": True, "text": "Sí"},
+            {"id": 3, "text": None},
+            {"id": 9, "text": "Nueve"},
+            "Cuatro",
+        ]
+
+        assert parse_json_response(json.dumps({"translations": entries}), 4) == {
+            1: "Uno"
+        }
+
+    def test_non_json_parses_to_nothing(self):
+        """Test content that is not JSON yields no translations."""
+        assert parse_json_response("[1]\nUno", 1) == {}
+        assert parse_json_response('{"result": []}', 1) == {}
+
+
+class TestResponseFormats:
+    """Test the translator in each format and the mismatch counters."""
+
+    @pytest.mark.asyncio
+    async def test_json_mode_requests_schema_and_parses_entries(
+        self, translator, translator_settings, format_stats
+    ):
+        """Test JSON mode sends the schema and reads {id, text} entries."""
+        translator_settings.translation_response_format = "json"
+        translator.client.chat.completions.create = AsyncMock(
+            return_value=make_response(
+                json.dumps(
+                    {
+                        "translations": [
+                            {"id": 1, "text": "[puerta cruje] ¿Hola?"},
+                            {"id": 2, "text": "Adiós"},
+                        ]
+                    }
+                )
+            )
+        )
+
+        result = await translator.translate_batch(
+            ["[door creaks] Hello?", "Goodbye"], "en", "es"
+        )
+
+        assert result.translations == ["[puerta cruje] ¿Hola?", "Adiós"]
+        api_params = translator.client.chat.completions.create.call_args.kwargs
+        assert api_params["response_format"] == TRANSLATIONS_RESPONSE_FORMAT
+        assert "JSON" in api_params["messages"][0]["content"]
+        assert format_stats.get_status()["json"]["responses"] == 1
+        assert format_stats.get_status()["json"]["mismatches"] == 0
+
+    @pytest.mark.asyncio
+    async def test_numbered_mode_sends_no_schema(self, translator, format_stats):
+        """Test the default format keeps the plain numbered request."""
+        translator.client.chat.completions.create = AsyncMock(
+            return_value=make_response("[1]\n[MÚSICA]\n\n[2]\nAdiós")
+        )
+
+        result = await translator.translate_batch(["[MUSIC]", "Goodbye"], "en", "es")
+
+        assert result.translations == ["[MÚSICA]", "Adiós"]
+        api_params = translator.client.chat.completions.create.call_args.kwargs
+        assert "response_format" not in api_params
+        assert format_stats.get_status()["numbered"]["mismatch_rate"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_repaired_and_resent_mismatches_counted(
+        self, translator, format_stats
+    ):
+        """Test a repaired mismatch and a whole-chunk resend are told apart."""
+        translator.client.chat.completions.create = AsyncMock(
+            side_effect=[
+                make_response("[1]\nUno\n\n[2]\nDos\n\n[4]\nCuatro\n\n[6]\nSeis"),
+                make_response("[1]\nTres\n\n[2]\nCinco"),
+                make_response("[1]\nUno"),
+            ]
+        )
+
+        texts = ["One", "Two", "Three", "Four", "Five", "Six"]
+        result = await translator.translate_batch(texts, "en", "es")
+        assert result.translations[2] == "Tres"
+        with pytest.raises(TranslationCountMismatchError):
+            await translator.translate_batch(
+                ["One", "Two", "Three", "Four"], "en", "es"
+            )
+
+        status = format_stats.get_status()["numbered"]
+        assert status["responses"] == 3
+        assert status["mismatches"] == 2
+        assert status["repaired"] == 1
+        assert status["resent"] == 1
+        assert status["mismatch_rate"] == pytest.approx(0.6667)
+        assert status["resend_rate"] == pytest.approx(0.3333)
+
+    def test_worker_logs_format_stats(self):
+        """Test the translator worker logs parse outcomes per response format."""
+        format_stats = ResponseFormatStats()
+        format_stats.record_response("json", mismatched=True)
+        format_stats.record_resent("json")
+        format_stats.record_response("json", mismatched=False)
+
+        with patch("translator.worker.response_format_stats", format_stats), patch(
+            "translator.worker.logger"
+        ) as mock_logger:
+            log_translation_status()
+
+        message = mock_logger.info.call_args[0][0]
+        assert "Response format json: 2 responses" in message
+        assert "1 mismatches (50.0%)" in message
+        assert "1 resent (50.0%)" in message
@@ -0,0 +1,226 @@
+"""Tests for the whole-file translation result cache."""
+
+import json
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from common.subtitle_parser import SRTParser
+from translator.result_cache import TranslationResultCache, compute_source_hash
+from translator.schemas import TranslationResult
+from translator.translation_service import SubtitleTranslator
+from translator.worker import process_translation_message
+
+SOURCE_SRT = """1
+00:00:01,000 --> 00:00:04,000
+Hello world
+
+2
+00:00:05,000 --> 00:00:08,000
+How are you?
+"""
+
+
+@pytest.fixture
+def result_cache(tmp_path):
+    """Create a result cache in a temporary directory."""
+    with patch("translator.result_cache.settings") as mock_settings:
+        mock_settings.translation_result_cache_path = str(tmp_path / "cache")
+        mock_settings.translation_result_cache_max_age_days = 30
+        mock_settings.translation_result_cache_max_size_mb = 1
+        yield TranslationResultCache()
+
+
+class TestComputeSourceHash:
+    """Test source content hashing."""
+
+    def test_ignores_formatting_differences(self):
+        """Test BOM, CRLF line endings and numbering do not change the hash."""
+        variant = "﻿" + SOURCE_SRT.replace("1\n", "7\n", 1).replace("\n", "\r\n")
+
+        assert compute_source_hash(SRTParser.parse(variant)) == compute_source_hash(
+            SRTParser.parse(SOURCE_SRT)
+        )
+
+    def test_changes_with_text_and_timing(self):
+        """Test content changes produce a different hash."""
+        original = compute_source_hash(SRTParser.parse(SOURCE_SRT))
+
+        assert original != compute_source_hash(
+            SRTParser.parse(SOURCE_SRT.replace("world", "there"))
+        )
+        assert original != compute_source_hash(
+            SRTParser.parse(SOURCE_SRT.replace("00:00:08,000", "00:00:08,500"))
+        )
+
+
+class TestTranslationResultCache:
+    """Test storing and restoring cached translations."""
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            ("abc", "en", "fr", "gpt-4o-mini", "numbered", "v1"),
+            ("abc", "en", "es", "gpt-4o", "numbered", "v1"),
+            ("abc", "en", "es", "gpt-4o-mini", "json", "v1"),
+            ("abc", "en", "es", "gpt-4o-mini", "numbered", "v2"),
+        ],
+    )
+    def test_key_depends_on_languages_model_and_prompt(self, changed):
+        """Test keys differ per language pair, model, response format and prompt."""
+        parts = ("abc", "en", "es", "gpt-4o-mini", "numbered", "v1")
+        key = TranslationResultCache.build_key(*parts)
+
+        assert key != TranslationResultCache.build_key(*changed)
+        assert key == TranslationResultCache.build_key(*parts)
+
+    def test_restore_miss(self, result_cache, tmp_path):
+        """Test a missing entry is reported as a miss."""
+        assert result_cache.restore("missing", tmp_path / "out.es.srt") is False
+        assert not (tmp_path / "out.es.srt").exists()
+
+    def test_store_and_restore_hard_links(self, result_cache, tmp_path):
+        """Test a stored translation is linked into place on a hit."""
+        translated = tmp_path / "first" / "movie.es.srt"
+        translated.parent.mkdir()
+        translated.write_text("translated", encoding="utf-8")
+
+        result_cache.store("key", translated)
+        output_path = tmp_path / "second" / "movie.es.srt"
+
+        assert result_cache.restore("key", output_path) is True
+        assert output_path.read_text(encoding="utf-8") == "translated"
+        assert os.path.samefile(output_path, translated)
+
+    def test_restore_replaces_existing_output(self, result_cache, tmp_path):
+        """Test a hit overwrites a stale output file."""
+        translated = tmp_path / "movie.es.srt"
+        translated.write_text("translated", encoding="utf-8")
+        result_cache.store("key", translated)
+
+        output_path = tmp_path / "other.es.srt"
+        output_path.write_text("stale", encoding="utf-8")
+
+        assert result_cache.restore("key", output_path) is True
+        assert output_path.read_text(encoding="utf-8") == "translated"
+
+    def test_evicts_expired_entries(self, result_cache, tmp_path):
+        """Test entries unused for longer than the max age are removed."""
+        translated = tmp_path / "movie.es.srt"
+        translated.write_text("translated", encoding="utf-8")
+        result_cache.store("old", translated)
+        old_mtime = time.time() - 31 * 24 * 60 * 60
+        os.utime(result_cache.get_cache_path("old"), (old_mtime, old_mtime))
+
+        result_cache.store("new", tmp_path / "movie.es.srt")
+
+        assert not result_cache.get_cache_path("old").exists()
+        assert translated.exists()
+
+    def test_evicts_least_recently_used_over_size_limit(self, result_cache, tmp_path):
+        """Test the oldest entries go first once the cache exceeds its size."""
+        now = time.time()
+        for age, key in enumerate(["newer", "middle", "oldest"], 1):
+            translated = tmp_path / f"{key}.es.srt"
+            translated.write_bytes(b"x" * 300_000)
+            result_cache.store(key, translated)
+            mtime = now - age * 60
+            os.utime(result_cache.get_cache_path(key), (mtime, mtime))
+
+        # The fourth 300 KB entry takes the cache over its 1 MB limit
+        translated = tmp_path / "newest.es.srt"
+        translated.write_bytes(b"x" * 300_000)
+        result_cache.store("newest", translated)
+
+        assert not result_cache.get_cache_path("oldest").exists()
+        for key in ("middle", "newer", "newest"):
+            assert result_cache.get_cache_path(key).exists()
+
+
+class TestProcessTranslationMessageCache:
+    """Test the worker skips translation for content it has translated before."""
+
+    @pytest.fixture
+    def mock_settings(self, tmp_path):
+        """Create mock settings with the result cache enabled."""
+        mock_settings = MagicMock()
+        mock_settings.checkpoint_enabled = False
+        mock_settings.translation_max_tokens_per_chunk = 8000
+        mock_settings.translation_max_segments_per_chunk = 100
+        mock_settings.translation_chunking_mode = "greedy"
+        mock_settings.translation_adaptive_chunking = False
+        mock_settings.translation_result_cache_enabled = True
+        mock_settings.translation_result_cache_path = str(tmp_path / "cache")
+        mock_settings.translation_result_cache_max_age_days = 30
+        mock_settings.translation_result_cache_max_size_mb = 1024
+        mock_settings.openai_model = "gpt-4o-mini"
+        mock_settings.translation_token_safety_margin = 0.8
+        mock_settings.get_translation_parallel_requests = MagicMock(return_value=3)
+        return mock_settings
+
+    @staticmethod
+    async def translate_file(subtitle_file, translator, mock_settings):
+        """Run the worker on a subtitle file; return the finalize mock."""
+        subtitle_file.parent.mkdir()
+        subtitle_file.write_text(SOURCE_SRT, encoding="utf-8")
+
+        mock_message = MagicMock()
+        mock_message.body = json.dumps(
+            {
+                "request_id": str(uuid4()),
+                "subtitle_file_path": str(subtitle_file),
+                "source_language": "en",
+                "target_language": "es",
+            }
+        ).encode()
+
+        with patch("translator.worker.settings", mock_settings), patch(
+            "translator.translation_orchestrator.settings", mock_settings
+        ), patch("translator.result_cache.settings", mock_settings), patch(
+            "translator.worker.redis_client"
+        ) as mock_redis, patch(
+            "translator.worker.finalize_language", new_callable=AsyncMock
+        ), patch(
+            "translator.worker.finalize_translation", new_callable=AsyncMock
+        ) as mock_finalize:
+            mock_redis.update_phase = AsyncMock(return_value=True)
+            await process_translation_message(mock_message, translator)
+        return mock_finalize
+
+    @pytest.mark.asyncio
+    async def test_repeat_job_uses_cached_result(self, tmp_path, mock_settings):
+        """Test the same content under another path is served from the cache."""
+        mock_translator = MagicMock()
+        mock_translator.translate_batch = AsyncMock(
+            return_value=TranslationResult(["Hola mundo", "¿Cómo estás?"])
+        )
+
+        output_paths = []
+        for library in ("movies", "movies-4k"):
+            mock_finalize = await self.translate_file(
+                tmp_path / library / "movie.en.srt", mock_translator, mock_settings
+            )
+
+            mock_finalize.assert_awaited_once()
+            output_paths.append(mock_finalize.call_args[0][1]["es"])
+
+        assert mock_translator.translate_batch.await_count == 1
+        assert output_paths[1] == tmp_path / "movies-4k" / "movie.es.srt"
+        assert "Hola mundo" in output_paths[1].read_text(encoding="utf-8")
+
+    @pytest.mark.asyncio
+    async def test_mock_mode_is_not_cached(self, tmp_path, mock_settings):
+        """Test placeholder translations without an OpenAI key are never cached."""
+        with patch("translator.translation_service.settings") as translator_settings:
+            translator_settings.openai_api_key = None
+            translator = SubtitleTranslator()
+
+        mock_finalize = await self.translate_file(
+            tmp_path / "movies" / "movie.en.srt", translator, mock_settings
+        )
+
+        mock_finalize.assert_awaited_once()
+        assert not list((tmp_path / "cache").glob("*.srt"))
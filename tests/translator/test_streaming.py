@@ -0,0 +1,238 @@
+"""Tests for streamed translation responses."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from openai.types.chat import ChatCompletionChunk
+from openai.types.completion_usage import CompletionUsage
+
+from translator.stream_parser import SegmentStreamParser
+from translator.translation_service import SubtitleTranslator, TranslationTruncatedError
+
+
+def make_chunk(content=None, finish_reason=None, usage=None) -> ChatCompletionChunk:
+    """Build a streamed chat completion chunk."""
+    choices = []
+    if content is not None or finish_reason is not None:
+        choices.append(
+            {
+                "index": 0,
+                "delta": {"content": content},
+                "finish_reason": finish_reason,
+            }
+        )
+    return ChatCompletionChunk.model_validate(
+        {
+            "id": "chatcmpl-test",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "choices": choices,
+            "usage": usage,
+        }
+    )
+
+
+class FakeStream:
+    """Async stream of chunks that logs when each one is read."""
+
+    def __init__(self, chunks, events=None, stall_after=None):
+        self.chunks = chunks
+        self.events = events if events is not None else []
+        self.stall_after = stall_after
+        self.closed = False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for position, chunk in enumerate(self.chunks):
+            if position == self.stall_after:
+                await asyncio.sleep(10)
+            self.events.append(("chunk", position))
+            yield chunk
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def streaming_settings():
+    """Patch the translator's settings with streaming enabled."""
+    with patch("translator.translation_service.settings") as mock_settings:
+        mock_settings.openai_api_key = "sk-test-key"
+        mock_settings.openai_model = "gpt-4o-mini"
+        mock_settings.openai_temperature = 0.3
+        mock_settings.openai_max_tokens = 4096
+        mock_settings.openai_max_retries = 0
+        mock_settings.openai_retry_initial_delay = 0
+        mock_settings.openai_retry_max_delay = 0
+        mock_settings.openai_retry_exponential_base = 2
+        mock_settings.translation_adaptive_chunking = True
+        mock_settings.translation_streaming = True
+        mock_settings.translation_stream_idle_timeout = 5.0
+        yield mock_settings
+
+
+@pytest.fixture
+def streaming_translator(streaming_settings):
+    """Create a translator whose client returns a stream set per test."""
+    with patch("translator.translation_service.AsyncOpenAI"):
+        translator = SubtitleTranslator()
+    translator.client = MagicMock()
+    return translator
+
+
+class TestSegmentStreamParser:
+    """Test closing [n] blocks while text streams in."""
+
+    def test_block_closes_when_next_marker_arrives(self):
+        """Test a block is returned only once the following marker is complete."""
+        parser = SegmentStreamParser(3)
+
+        assert parser.feed("[1]\nHola") == []
+        assert parser.feed("\n\n[") == []
+        assert parser.feed("2]\nAdiós\n\n[3]") == [(1, "Hola"), (2, "Adiós")]
+        assert parser.feed("\nGracias") == []
+        assert parser.finish() == [(3, "Gracias")]
+        assert parser.completed_count == 3
+
+    def test_marker_split_across_multi_digit_number(self):
+        """Test "[1" followed by "0]" is read as marker 10, not 1."""
+        parser = SegmentStreamParser(11)
+        parser.feed("[9]\nNueve\n\n[1")
+
+        assert parser.feed("0]\nDiez\n\n[11]") == [(9, "Nueve"), (10, "Diez")]
+
+    def test_preamble_duplicates_and_unknown_numbers_ignored(self):
+        """Test text before [1], repeated blocks and out-of-range blocks are skipped."""
+        parser = SegmentStreamParser(2)
+
+        completed = parser.feed(
+            "Here are the translations:\n[1]\nUno\n[1]\nOtra vez\n[7]\nSiete\n[2]\nDos"
+        )
+
+        assert completed == [(1, "Uno")]
+        assert parser.finish() == [(2, "Dos")]
+
+    def test_brackets_inside_text_are_not_markers(self):
+        """Test "[n]" in the middle of a line does not split a block."""
+        parser = SegmentStreamParser(2)
+        parser.feed("[1]\nCapítulo [2] empieza\n[2]\nFin")
+
+        assert parser.finish() == [(2, "Fin")]
+
+
+class TestStreamingTranslation:
+    """Test the translator consuming streamed completions."""
+
+    @pytest.mark.asyncio
+    async def test_segments_delivered_before_stream_ends(self, streaming_translator):
+        """Test each segment reaches the callback as soon as its block closes."""
+        events = []
+        stream = FakeStream(
+            [
+                make_chunk("[1]\nHola"),
+                make_chunk("\n\n[2]\nAdiós"),
+                make_chunk("\n\n[3]\nGracias"),
+                make_chunk(finish_reason="stop"),
+                make_chunk(
+                    usage=CompletionUsage(
+                        prompt_tokens=300, completion_tokens=20, total_tokens=320
+                    )
+                ),
+            ],
+            events,
+        )
+        streaming_translator.client.chat.completions.create = AsyncMock(
+            return_value=stream
+        )
+
+        async def on_segment(index, text):
+            events.append(("segment", index, text))
+
+        result = await streaming_translator.translate_batch(
+            ["Hello", "Goodbye", "Thanks"], "en", "es", on_segment=on_segment
+        )
+
+        assert events == [
+            ("chunk", 0),
+            ("chunk", 1),
+            ("segment", 0, "Hola"),
+            ("chunk", 2),
+            ("segment", 1, "Adiós"),
+            ("chunk", 3),
+            ("chunk", 4),
+            ("segment", 2, "Gracias"),
+        ]
+        assert result.translations == ["Hola", "Adiós", "Gracias"]
+        assert result.finish_reason == "stop"
+        assert result.prompt_tokens == 300
+        assert result.completion_tokens == 20
+        assert result.first_segment_seconds is not None
+
+        api_params = streaming_translator.client.chat.completions.create.call_args
+        assert api_params.kwargs["stream"] is True
+        assert api_params.kwargs["stream_options"] == {"include_usage": True}
+
+    @pytest.mark.asyncio
+    async def test_truncated_stream_keeps_completed_segments(
+        self, streaming_translator
+    ):
+        """Test truncation raises after the segments before the cut were delivered."""
+        stream = FakeStream(
+            [
+                make_chunk("[1]\nHola\n\n[2]\nAdiós\n\n[3]\nGra"),
+                make_chunk(finish_reason="length"),
+            ]
+        )
+        streaming_translator.client.chat.completions.create = AsyncMock(
+            return_value=stream
+        )
+        delivered = []
+
+        async def on_segment(index, text):
+            delivered.append((index, text))
+
+        with pytest.raises(TranslationTruncatedError):
+            await streaming_translator.translate_batch(
+                ["Hello", "Goodbye", "Thanks"], "en", "es", on_segment=on_segment
+            )
+
+        # The cut-off last segment is never handed out
+        assert delivered == [(0, "Hola"), (1, "Adiós")]
+
+    @pytest.mark.asyncio
+    async def test_stalled_stream_times_out(
+        self, streaming_translator, streaming_settings
+    ):
+        """Test a stream that stops sending is aborted and closed."""
+        streaming_settings.translation_stream_idle_timeout = 0.05
+        stream = FakeStream(
+            [
+                make_chunk("[1]\nHola\n\n[2]"),
+                make_chunk("\nAdiós"),
+                make_chunk(finish_reason="stop"),
+            ],
+            stall_after=1,
+        )
+        streaming_translator.client.chat.completions.create = AsyncMock(
+            return_value=stream
+        )
+        delivered = []
+
+        async def on_segment(index, text):
+            delivered.append((index, text))
+
+        with patch(
+            "translator.translation_service.concurrency_controller"
+        ) as mock_controller:
+            with pytest.raises(asyncio.TimeoutError):
+                await streaming_translator.translate_batch(
+                    ["Hello", "Goodbye"], "en", "es", on_segment=on_segment
+                )
+
+        assert delivered == [(0, "Hola")]
+        assert stream.closed is True
+        mock_controller.record_congestion.assert_called_once()
@@ -0,0 +1,215 @@
+"""Tests for self-calibrating token estimates."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from translator.token_calibration import (
+    CALIBRATION_TTL_SECONDS,
+    TokenCalibration,
+    TokenCalibrator,
+)
+from translator.translation_service import SubtitleTranslator, TranslationTruncatedError
+
+
+@pytest.fixture(autouse=True)
+def calibration_enabled():
+    """Enable token calibration, which is opt-in."""
+    with patch("translator.token_calibration.settings.token_calibration_enabled", True):
+        yield
+
+
+@pytest.fixture
+def calibration_redis(fake_redis_job_client):
+    """Patch the calibrator onto a fakeredis-backed client."""
+    with patch("translator.token_calibration.redis_client", fake_redis_job_client):
+        yield fake_redis_job_client
+
+
+@pytest.fixture
+def disconnected_redis(calibration_redis):
+    """Patch the calibrator's Redis client as unavailable."""
+    calibration_redis.connected = False
+    return calibration_redis
+
+
+class TestTokenCalibration:
+    """Test calibration ratios and completion budgets."""
+
+    def test_unreliable_until_min_samples(self):
+        """Test ratios are withheld until enough requests are observed."""
+        calibration = TokenCalibration(
+            samples=2, source_chars=2000, source_tokens=1000, completion_tokens=3000
+        )
+
+        assert calibration.chars_per_token is None
+        assert calibration.max_completion_tokens(5000, 4096) == 4096
+
+    def test_ratios(self):
+        """Test chars/token and completion tokens/char from totals."""
+        calibration = TokenCalibration(
+            samples=3, source_chars=3000, source_tokens=1500, completion_tokens=6000
+        )
+
+        assert calibration.chars_per_token == 2.0
+        assert calibration.completion_tokens_per_char == 2.0
+
+    @pytest.mark.parametrize(
+        "source_chars,expected",
+        [
+            (100, 4096),  # Small chunk keeps the configured floor
+            (2000, 5200),  # 2000 chars * 2 tokens/char * 1.3 headroom
+            (100_000, 16384),  # Capped at 4x the configured value
+        ],
+    )
+    def test_max_completion_tokens(self, source_chars, expected):
+        """Test completion budget is predicted, floored and capped."""
+        calibration = TokenCalibration(
+            samples=3, source_chars=3000, source_tokens=1500, completion_tokens=6000
+        )
+
+        assert calibration.max_completion_tokens(source_chars, 4096) == expected
+
+
+class TestTokenCalibrator:
+    """Test recording and loading calibration totals."""
+
+    @pytest.mark.asyncio
+    async def test_record_usage_discounts_instructions(self, disconnected_redis):
+        """Test instruction overhead is removed before attributing prompt tokens."""
+        calibrator = TokenCalibrator()
+
+        await calibrator.record_usage(
+            "en",
+            "he",
+            source_chars=1000,
+            instruction_chars=2000,
+            prompt_tokens=800,
+            completion_tokens=900,
+        )
+
+        calibration = calibrator.get("en", "he")
+        assert calibration.samples == 1
+        assert calibration.source_tokens == 300  # 800 - 2000 / 4
+        assert calibration.completion_tokens == 900
+        assert calibrator.get("en", "es").samples == 0
+
+    @pytest.mark.asyncio
+    async def test_record_usage_skips_implausible_usage(self, disconnected_redis):
+        """Test usage smaller than the instruction estimate is ignored."""
+        calibrator = TokenCalibrator()
+
+        await calibrator.record_usage("en", "he", 10, 4000, 500, 20)
+
+        assert calibrator.get("en", "he").samples == 0
+
+    @pytest.mark.asyncio
+    async def test_record_usage_increments_redis(self, calibration_redis):
+        """Test usage totals are mirrored to a Redis hash."""
+        calibrator = TokenCalibrator()
+
+        await calibrator.record_usage("en", "ja", 1000, 400, 600, 1200)
+        await calibrator.record_usage("en", "ja", 1000, 400, 600, 1200)
+
+        key = "translator:token_calibration:en:ja"
+        assert await calibration_redis.client.hgetall(key) == {
+            "samples": "2",
+            "source_chars": "2000",
+            "source_tokens": "1000",
+            "completion_tokens": "2400",
+        }
+        assert 0 < await calibration_redis.client.ttl(key) <= CALIBRATION_TTL_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_refresh_loads_shared_totals(self, calibration_redis):
+        """Test refresh picks up totals recorded by other workers."""
+        await calibration_redis.client.hset(
+            "translator:token_calibration:en:he",
+            mapping={
+                "samples": "5",
+                "source_chars": "5000",
+                "source_tokens": "2500",
+                "completion_tokens": "7000",
+            },
+        )
+        calibrator = TokenCalibrator()
+
+        calibration = await calibrator.refresh("en", "he")
+
+        assert calibration.chars_per_token == 2.0
+        assert calibrator.get("en", "he") == calibration
+
+    @pytest.mark.asyncio
+    async def test_refresh_without_redis_uses_local_totals(self, disconnected_redis):
+        """Test refresh falls back to in-process totals."""
+        calibrator = TokenCalibrator()
+        for _ in range(3):
+            await calibrator.record_usage("en", "he", 1000, 400, 600, 1200)
+
+        calibration = await calibrator.refresh("en", "he")
+
+        assert calibration.chars_per_token == 2.0
+
+
+class TestTranslatorCalibration:
+    """Test the translator feeds and uses calibration."""
+
+    @pytest.fixture
+    def translator(self):
+        """Create translator with a mocked OpenAI client."""
+        with patch("translator.translation_service.settings") as mock_settings:
+            mock_settings.openai_api_key = "sk-test-key"
+            with patch("translator.translation_service.AsyncOpenAI"):
+                translator = SubtitleTranslator()
+
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "[1]\nשלום\n\n[2]\nלהתראות"
+        response.choices[0].finish_reason = "stop"
+        response.usage.prompt_tokens = 900
+        response.usage.completion_tokens = 700
+        translator.client = AsyncMock()
+        translator.client.chat.completions.create = AsyncMock(return_value=response)
+        return translator
+
+    @pytest.mark.asyncio
+    async def test_translate_records_usage_and_sizes_completion(self, translator):
+        """Test usage is recorded and calibrated budgets are requested."""
+        calibrator = TokenCalibrator()
+        calibrator._calibrations[("en", "he")] = TokenCalibration(
+            samples=3, source_chars=10, source_tokens=5, completion_tokens=5000
+        )
+
+        with patch("translator.translation_service.token_calibrator", calibrator):
+            with patch("translator.token_calibration.redis_client") as mock_redis:
+                mock_redis.connected = False
+                await translator.translate_batch(["Hello", "Goodbye"], "en", "he")
+
+        api_params = translator.client.chat.completions.create.call_args.kwargs
+        # 12 source chars * 500 completion tokens/char * 1.3 headroom
+        assert api_params["max_completion_tokens"] == 7800
+        calibration = calibrator.get("en", "he")
+        assert calibration.samples == 4
+        assert calibration.completion_tokens == 5700
+
+    @pytest.mark.asyncio
+    async def test_truncated_response_leaves_calibration_unchanged(self, translator):
+        """Test capped usage of a truncated response is not recorded."""
+        response = translator.client.chat.completions.create.return_value
+        response.choices[0].message.content = ""
+        response.choices[0].finish_reason = "length"
+        response.usage.completion_tokens_details.reasoning_tokens = 0
+        calibrator = TokenCalibrator()
+        calibrator._calibrations[("en", "he")] = TokenCalibration(
+            samples=3, source_chars=10, source_tokens=5, completion_tokens=5000
+        )
+
+        with patch("translator.translation_service.token_calibrator", calibrator):
+            with patch("translator.token_calibration.redis_client") as mock_redis:
+                mock_redis.connected = False
+                with pytest.raises(TranslationTruncatedError):
+                    await translator.translate_batch(["Hello", "Goodbye"], "en", "he")
+
+        calibration = calibrator.get("en", "he")
+        assert calibration.samples == 3
+        assert calibration.completion_tokens == 5000
@@ -0,0 +1,229 @@
+"""Tests for the translation memory of repeated subtitle lines."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from common.subtitle_parser import SubtitleSegment
+from translator.markup_placeholders import MarkupPlaceholders
+from translator.schemas import TranslationResult, TranslationTaskData
+from translator.translation_memory import TranslationMemory, normalize_text
+from translator.translation_orchestrator import translate_chunk_with_memory
+from translator.translation_service import SubtitleTranslator
+
+MODEL = "gpt-4o-mini"
+
+# Response format, prompt version and markup placeholder flag
+SETUP = ("numbered", "0123456789abcdef", True)
+
+
+def current_setup():
+    """Get the prompt setup the orchestrator keys translation memory with."""
+    return (
+        SubtitleTranslator.get_response_format(),
+        SubtitleTranslator.get_prompt_version(),
+        MarkupPlaceholders.is_enabled(),
+    )
+
+
+@pytest.fixture
+def memory_redis(fake_redis_job_client):
+    """Enable translation memory on a fakeredis-backed client."""
+    with patch(
+        "translator.translation_memory.redis_client", fake_redis_job_client
+    ), patch("translator.translation_memory.settings.translation_memory_enabled", True):
+        yield fake_redis_job_client.client
+
+
+class TestNormalizeText:
+    """Test source text normalization for memory keys."""
+
+    def test_collapses_whitespace(self):
+        """Test line breaks and repeated spaces do not change the key."""
+        assert normalize_text(" Previously on\n  Lost... ") == "Previously on Lost..."
+
+    def test_keeps_case_and_punctuation(self):
+        """Test case and punctuation are significant."""
+        assert normalize_text("Yes.") != normalize_text("yes?")
+
+
+class TestTranslationMemory:
+    """Test storing and looking up remembered translations."""
+
+    @pytest.mark.asyncio
+    async def test_store_and_lookup(self, memory_redis):
+        """Test stored lines are found by position, ignoring whitespace."""
+        memory = TranslationMemory()
+
+        await memory.store(
+            ["Yes.", "What?"], ["Sí.", "¿Qué?"], "en", "es", MODEL, *SETUP
+        )
+        hits = await memory.lookup(
+            ["Where?", "What?\n", "Yes."], "en", "es", MODEL, *SETUP
+        )
+
+        assert hits == {1: "¿Qué?", 2: "Sí."}
+
+    @pytest.mark.asyncio
+    async def test_lookup_is_scoped_to_language_pair_and_model(self, memory_redis):
+        """Test entries are not shared across targets or models."""
+        memory = TranslationMemory()
+
+        await memory.store(["Yes."], ["Sí."], "en", "es", MODEL, *SETUP)
+
+        assert await memory.lookup(["Yes."], "en", "fr", MODEL, *SETUP) == {}
+        assert await memory.lookup(["Yes."], "en", "es", "gpt-4o", *SETUP) == {}
+
+    @pytest.mark.asyncio
+    async def test_lookup_is_scoped_to_prompt_setup(self, memory_redis):
+        """Test entries are not reused after the prompt or response format changes."""
+        memory = TranslationMemory()
+        response_format, prompt_version, markup_placeholders = SETUP
+
+        await memory.store(["Yes."], ["Sí."], "en", "es", MODEL, *SETUP)
+
+        for changed_setup in (
+            ("json", prompt_version, markup_placeholders),
+            (response_format, "fedcba9876543210", markup_placeholders),
+            (response_format, prompt_version, not markup_placeholders),
+        ):
+            assert (
+                await memory.lookup(["Yes."], "en", "es", MODEL, *changed_setup) == {}
+            )
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self, memory_redis):
+        """Test entries are stored with the configured TTL."""
+        memory = TranslationMemory()
+
+        await memory.store(["Yes."], ["Sí."], "en", "es", MODEL, *SETUP)
+
+        keys = await memory_redis.keys("translator:memory:*")
+        assert len(keys) == 1
+        assert 0 < await memory_redis.ttl(keys[0]) <= 30 * 24 * 60 * 60
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, memory_redis):
+        """Test nothing is stored or served when disabled."""
+        memory = TranslationMemory()
+
+        with patch("translator.translation_memory.settings") as mock_settings:
+            mock_settings.translation_memory_enabled = False
+            await memory.store(["Yes."], ["Sí."], "en", "es", MODEL, *SETUP)
+            assert await memory.lookup(["Yes."], "en", "es", MODEL, *SETUP) == {}
+
+        assert await memory_redis.keys("translator:memory:*") == []
+
+
+class TestTranslateChunkWithMemory:
+    """Test the orchestrator skips remembered lines."""
+
+    @pytest.fixture
+    def mock_settings(self):
+        """Create mock orchestrator settings."""
+        with patch("translator.translation_orchestrator.settings") as mock_settings:
+            mock_settings.openai_model = MODEL
+            mock_settings.translation_adaptive_chunking = False
+            yield mock_settings
+
+    @pytest.fixture
+    def task_data(self):
+        """Create translation task data."""
+        return TranslationTaskData(uuid4(), "/tmp/test.en.srt", "en", "es")
+
+    @staticmethod
+    def make_segments(texts):
+        """Create subtitle segments for texts."""
+        return [
+            SubtitleSegment(i, i * 1000, i * 1000 + 900, text)
+            for i, text in enumerate(texts, 1)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_hits_are_not_sent(self, memory_redis, mock_settings, task_data):
+        """Test remembered lines are left out of the request and merged back."""
+        await TranslationMemory().store(
+            ["Yes."], ["Sí."], "en", "es", MODEL, *current_setup()
+        )
+
+        translator = MagicMock()
+        translator.translate_batch = AsyncMock(
+            return_value=TranslationResult(
+                ["Hola.", "Adiós."], prompt_tokens=50, completion_tokens=10
+            )
+        )
+
+        translated = await translate_chunk_with_memory(
+            self.make_segments(["Hello.", "Yes.", "Goodbye."]), task_data, translator
+        )
+
+        assert [segment.text for segment in translated] == ["Hola.", "Sí.", "Adiós."]
+        assert [segment.index for segment in translated] == [1, 2, 3]
+        translator.translate_batch.assert_awaited_once_with(
+            ["Hello.", "Goodbye."], "en", "es"
+        )
+
+        stats = task_data.stats
+        assert stats.segments_translated == 3
+        assert stats.memory_hits == 1
+        assert stats.memory_hit_rate == pytest.approx(1 / 3)
+        assert stats.tokens_saved > 0
+        assert stats.api_requests == 1
+        assert stats.prompt_tokens == 50
+
+    @pytest.mark.asyncio
+    async def test_all_hits_skip_the_request(
+        self, memory_redis, mock_settings, task_data
+    ):
+        """Test a fully remembered chunk makes no API call."""
+        await TranslationMemory().store(
+            ["Yes.", "No."], ["Sí.", "No."], "en", "es", MODEL, *current_setup()
+        )
+        translator = MagicMock()
+        translator.translate_batch = AsyncMock()
+
+        translated = await translate_chunk_with_memory(
+            self.make_segments(["Yes.", "No."]), task_data, translator
+        )
+
+        assert [segment.text for segment in translated] == ["Sí.", "No."]
+        translator.translate_batch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_new_translations_are_remembered(
+        self, memory_redis, mock_settings, task_data
+    ):
+        """Test translated lines are stored, but untranslated fallbacks are not."""
+        translator = MagicMock()
+        # Segment 3 is missing from the response and keeps its original text
+        translator.translate_batch = AsyncMock(
+            return_value=TranslationResult(
+                ["Hola.", "Sí."], parsed_segment_numbers=[1, 2]
+            )
+        )
+
+        await translate_chunk_with_memory(
+            self.make_segments(["Hello.", "Yes.", "Goodbye."]), task_data, translator
+        )
+
+        hits = await TranslationMemory().lookup(
+            ["Hello.", "Yes.", "Goodbye."], "en", "es", MODEL, *current_setup()
+        )
+        assert hits == {0: "Hola.", 1: "Sí."}
+
+    @pytest.mark.asyncio
+    async def test_mock_translations_are_not_remembered(
+        self, memory_redis, mock_settings, task_data
+    ):
+        """Test placeholder translations from mock mode never reach memory."""
+        with patch("translator.translation_service.settings") as translator_settings:
+            translator_settings.openai_api_key = None
+            translator = SubtitleTranslator()
+
+        translated = await translate_chunk_with_memory(
+            self.make_segments(["Hello.", "Yes."]), task_data, translator
+        )
+
+        assert translated[0].text == "[TRANSLATED to es] Hello."
+        assert await memory_redis.keys("*") == []
@@ -8,8 +8,11 @@ from uuid import uuid4
 
 import pytest
 
+from common.schemas import EventType, SubtitleStatus
 from common.shutdown_manager import ShutdownManager
 from common.subtitle_parser import SRTParser, SubtitleSegment
+from translator.file_operations import read_and_parse_subtitle_file
+from translator.schemas import TranslationResult
 from translator.translation_service import SubtitleTranslator
 from translator.worker import process_translation_message
 
@@ -64,9 +67,8 @@ class TestSubtitleTranslator:
         """Test translation in mock mode without API key."""
         texts = ["Hello world", "How are you?"]
 
-        translations = await translator_without_api_key.translate_batch(
-            texts, "en", "es"
-        )
+        result = await translator_without_api_key.translate_batch(texts, "en", "es")
+        translations = result.translations
 
         assert len(translations) == 2
         assert "[TRANSLATED to es]" in translations[0]
@@ -90,11 +92,40 @@ class TestSubtitleTranslator:
         )
 
         texts = ["Hello world", "How are you?"]
-        translations = await translator.translate_batch(texts, "en", "es")
+        result = await translator.translate_batch(texts, "en", "es")
+        translations = result.translations
 
         assert len(translations) == 2
         assert "Hola mundo" in translations[0]
         assert "¿Cómo estás?" in translations[1]
+        assert result.parsed_segment_numbers is None
+
+    @pytest.mark.asyncio
+    async def test_translate_batch_returns_call_metadata(self, translator_with_api_key):
+        """Test usage, latency and finish reason are reported per call."""
+        translator, _ = translator_with_api_key
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "[1]\nHola"
+        mock_response.choices[0].finish_reason = "stop"
+        mock_response.usage.prompt_tokens = 120
+        mock_response.usage.completion_tokens = 8
+
+        translator.client = AsyncMock()
+        translator.client.chat.completions.create = AsyncMock(
+            return_value=mock_response
+        )
+
+        result = await translator.translate_batch(["Hello"], "en", "es")
+
+        assert result.translations == ["Hola"]
+        assert result.prompt_tokens == 120
+        assert result.completion_tokens == 8
+        assert result.total_tokens == 128
+        assert result.finish_reason == "stop"
+        assert result.latency_seconds >= 0
+        assert not hasattr(translator, "_last_parsed_segment_numbers")
 
     def test_build_translation_prompt(self, translator_without_api_key):
         """Test translation prompt building."""
@@ -227,9 +258,10 @@ Subtitle 3
 
         mock_translator = MagicMock()
         mock_translator.translate_batch = AsyncMock(
-            return_value=["Traducido 1", "Traducido 2", "Traducido 3"]
+            return_value=TranslationResult(
+                ["Traducido 1", "Traducido 2", "Traducido 3"]
+            )
         )
-        mock_translator.get_last_parsed_segment_numbers = MagicMock(return_value=None)
 
         with patch_translator_dependencies() as (mock_redis, mock_pub), patch(
             "translator.worker.settings"
@@ -240,6 +272,8 @@ Subtitle 3
             mock_settings.checkpoint_enabled = False
             mock_settings.translation_max_tokens_per_chunk = 8000
             mock_settings.translation_max_segments_per_chunk = 100
+            mock_settings.translation_chunking_mode = "greedy"
+            mock_settings.translation_result_cache_enabled = False
             mock_settings.openai_model = "gpt-4o-mini"
             mock_settings.translation_token_safety_margin = 0.8
             mock_settings.subtitle_storage_path = str(tmp_path)
@@ -308,7 +342,6 @@ Hello world
 
         mock_translator = MagicMock()
         mock_translator.translate_batch = AsyncMock(side_effect=Exception("API Error"))
-        mock_translator.get_last_parsed_segment_numbers = MagicMock(return_value=None)
 
         with patch_translator_dependencies() as (mock_redis, mock_pub), patch(
             "translator.worker.settings"
@@ -319,6 +352,8 @@ Hello world
             mock_settings.checkpoint_enabled = False
             mock_settings.translation_max_tokens_per_chunk = 8000
             mock_settings.translation_max_segments_per_chunk = 100
+            mock_settings.translation_chunking_mode = "greedy"
+            mock_settings.translation_result_cache_enabled = False
             mock_settings.openai_model = "gpt-4o-mini"
             mock_settings.translation_token_safety_margin = 0.8
             mock_settings.get_translation_parallel_requests = MagicMock(return_value=3)
@@ -328,6 +363,30 @@ Hello world
             # Should publish JOB_FAILED event
             assert mock_pub.publish_event.called
 
+    @pytest.mark.asyncio
+    async def test_parse_message_with_several_target_languages(self):
+        """Test extra targets are normalized, deduplicated and listed after the primary."""
+        from translator.message_handler import parse_and_validate_message
+
+        mock_message = MagicMock()
+        mock_message.body = json.dumps(
+            {
+                "request_id": str(uuid4()),
+                "subtitle_file_path": "/media/movie.en.srt",
+                "source_language": "en",
+                "target_language": "es",
+                "target_languages": ["fre", "es", "de", "fr"],
+            }
+        ).encode()
+
+        task_data = await parse_and_validate_message(mock_message)
+
+        assert task_data.target_language == "es"
+        assert task_data.target_languages == ["es", "fr", "de"]
+        assert task_data.for_language("es") is task_data
+        assert task_data.for_language("fr").target_language == "fr"
+        assert task_data.for_language("fr").stats is not task_data.stats
+
 
 class TestSubtitleParserHelpers:
     """Test subtitle parser helper functions."""
@@ -455,7 +514,8 @@ class TestSubtitleTranslatorRetryBehavior:
         )
 
         texts = ["Hello world", "How are you?"]
-        translations = await translator.translate_batch(texts, "en", "es")
+        result = await translator.translate_batch(texts, "en", "es")
+        translations = result.translations
 
         # Should succeed after retries
         assert len(translations) == 2
@@ -497,7 +557,8 @@ class TestSubtitleTranslatorRetryBehavior:
         )
 
         texts = ["Hello", "Goodbye"]
-        translations = await translator.translate_batch(texts, "en", "fr")
+        result = await translator.translate_batch(texts, "en", "fr")
+        translations = result.translations
 
         # Should succeed after retry
         assert len(translations) == 2
@@ -601,7 +662,8 @@ class TestSubtitleTranslatorRetryBehavior:
         )
 
         texts = ["Hello\nworld", "How\nare you?"]
-        translations = await translator.translate_batch(texts, "en", "es")
+        result = await translator.translate_batch(texts, "en", "es")
+        translations = result.translations
 
         # Formatting should be preserved
         assert len(translations) == 2
@@ -635,7 +697,8 @@ class TestSubtitleTranslatorRetryBehavior:
         )
 
         texts = ["Hello", "Goodbye", "Thank you"]
-        translations = await translator.translate_batch(texts, "en", "it")
+        result = await translator.translate_batch(texts, "en", "it")
+        translations = result.translations
 
         # Should succeed after retries
         assert len(translations) == 3
@@ -683,7 +746,8 @@ class TestSubtitleTranslatorRetryBehavior:
 
         texts = ["Test"]
         start_time = asyncio.get_event_loop().time()
-        translations = await translator.translate_batch(texts, "en", "es")
+        result = await translator.translate_batch(texts, "en", "es")
+        translations = result.translations
         end_time = asyncio.get_event_loop().time()
         elapsed = end_time - start_time
 
@@ -693,6 +757,97 @@ class TestSubtitleTranslatorRetryBehavior:
         assert len(translations) == 1
         assert "Success" in translations[0]
 
+    @pytest.mark.asyncio
+    async def test_repairs_mismatch_by_requesting_only_missing_segments(
+        self, translator_with_api_key
+    ):
+        """Should keep parsed segments and re-request only the missing ones."""
+        translator, _ = translator_with_api_key
+
+        partial_response = MagicMock()
+        partial_response.choices = [MagicMock()]
+        partial_response.choices[0].message.content = (
+            "[1]\nUno\n\n[2]\nDos\n\n[4]\nCuatro\n\n[6]\nSeis"
+        )
+        repair_response = MagicMock()
+        repair_response.choices = [MagicMock()]
+        repair_response.choices[0].message.content = "[1]\nTres\n\n[2]\nCinco"
+
+        translator.client = AsyncMock()
+        translator.client.chat.completions.create = AsyncMock(
+            side_effect=[partial_response, repair_response]
+        )
+
+        texts = ["One", "Two", "Three", "Four", "Five", "Six"]
+        result = await translator.translate_batch(texts, "en", "es")
+
+        assert result.translations == ["Uno", "Dos", "Tres", "Cuatro", "Cinco", "Seis"]
+        assert result.parsed_segment_numbers is None
+        assert translator.client.chat.completions.create.call_count == 2
+
+        repair_prompt = translator.client.chat.completions.create.call_args_list[1][1][
+            "messages"
+        ][1]["content"]
+        assert "Translate the following 2 subtitle segments" in repair_prompt
+        assert "[1]\nThree" in repair_prompt
+        assert "[2]\nFive" in repair_prompt
+
+    @pytest.mark.asyncio
+    async def test_retries_whole_chunk_when_most_segments_missing(
+        self, translator_with_api_key
+    ):
+        """Should resend the whole chunk when too little of it parsed."""
+        translator, _ = translator_with_api_key
+
+        partial_response = MagicMock()
+        partial_response.choices = [MagicMock()]
+        partial_response.choices[0].message.content = "[1]\nUno"
+        full_response = MagicMock()
+        full_response.choices = [MagicMock()]
+        full_response.choices[0].message.content = (
+            "[1]\nUno\n\n[2]\nDos\n\n[3]\nTres\n\n[4]\nCuatro"
+        )
+
+        translator.client = AsyncMock()
+        translator.client.chat.completions.create = AsyncMock(
+            side_effect=[partial_response, full_response]
+        )
+
+        texts = ["One", "Two", "Three", "Four"]
+        result = await translator.translate_batch(texts, "en", "es")
+
+        assert result.translations == ["Uno", "Dos", "Tres", "Cuatro"]
+        retry_prompt = translator.client.chat.completions.create.call_args_list[1][1][
+            "messages"
+        ][1]["content"]
+        assert "Translate the following 4 subtitle segments" in retry_prompt
+
+    @pytest.mark.asyncio
+    async def test_truncated_response_is_not_retried(self, translator_with_api_key):
+        """Should raise TranslationTruncatedError instead of resending the chunk."""
+        from translator.translation_service import TranslationTruncatedError
+
+        translator, _ = translator_with_api_key
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "[1]\nUno\n\n[2]\nDo"
+        mock_response.choices[0].finish_reason = "length"
+
+        translator.client = AsyncMock()
+        translator.client.chat.completions.create = AsyncMock(
+            return_value=mock_response
+        )
+
+        with patch(
+            "translator.translation_service.settings.translation_adaptive_chunking",
+            True,
+        ), pytest.raises(TranslationTruncatedError) as exc_info:
+            await translator.translate_batch(["One", "Two", "Three"], "en", "es")
+
+        assert exc_info.value.segment_count == 3
+        assert translator.client.chat.completions.create.call_count == 1
+
 
 class TestCheckpointResumeIntegration:
     """Test checkpoint and resume functionality in translation worker."""
@@ -722,12 +877,11 @@ Goodbye!
         translator = MagicMock()
         translator.translate_batch = AsyncMock(
             side_effect=[
-                ["Hola mundo"],  # First chunk
-                ["¿Cómo estás?"],  # Second chunk
-                ["¡Adiós!"],  # Third chunk
+                TranslationResult(["Hola mundo"]),  # First chunk
+                TranslationResult(["¿Cómo estás?"]),  # Second chunk
+                TranslationResult(["¡Adiós!"]),  # Third chunk
             ]
         )
-        translator.get_last_parsed_segment_numbers = MagicMock(return_value=None)
         return translator
 
     @pytest.mark.asyncio
@@ -744,8 +898,14 @@ Goodbye!
         mock_settings.checkpoint_enabled = True
         mock_settings.checkpoint_cleanup_on_success = True
         mock_settings.subtitle_storage_path = str(tmp_path)
+        mock_settings.checkpoint_storage_path = str(tmp_path / "checkpoints")
+        mock_settings.checkpoint_compression = False
         mock_settings.translation_max_tokens_per_chunk = 8000
         mock_settings.translation_max_segments_per_chunk = 100
+        mock_settings.translation_chunking_mode = "greedy"
+        mock_settings.translation_adaptive_chunking = False
+        mock_settings.translation_prefilter_enabled = False
+        mock_settings.translation_result_cache_enabled = False
         mock_settings.openai_model = "gpt-5-nano"
         mock_settings.translation_token_safety_margin = 0.8
         mock_settings.get_translation_parallel_requests = MagicMock(return_value=3)
@@ -756,6 +916,7 @@ Goodbye!
             "translator.translation_orchestrator.settings", mock_settings
         )
         monkeypatch.setattr("common.config.settings", mock_settings)
+        monkeypatch.setattr("translator.checkpoint_manager.settings", mock_settings)
 
         # Mock Redis and event publisher
         with patch_translator_dependencies() as (mock_redis, mock_pub):
@@ -802,8 +963,14 @@ Goodbye!
         mock_settings.checkpoint_enabled = True
         mock_settings.checkpoint_cleanup_on_success = False  # Don't cleanup for test
         mock_settings.subtitle_storage_path = str(tmp_path)
+        mock_settings.checkpoint_storage_path = str(tmp_path / "checkpoints")
+        mock_settings.checkpoint_compression = False
         mock_settings.translation_max_tokens_per_chunk = 8000
         mock_settings.translation_max_segments_per_chunk = 100
+        mock_settings.translation_chunking_mode = "greedy"
+        mock_settings.translation_adaptive_chunking = False
+        mock_settings.translation_prefilter_enabled = False
+        mock_settings.translation_result_cache_enabled = False
         mock_settings.openai_model = "gpt-5-nano"
         mock_settings.translation_token_safety_margin = 0.8
         mock_settings.get_translation_parallel_requests = MagicMock(return_value=3)
@@ -877,8 +1044,14 @@ Goodbye!
         mock_settings.checkpoint_enabled = True
         mock_settings.checkpoint_cleanup_on_success = True
         mock_settings.subtitle_storage_path = str(tmp_path)
+        mock_settings.checkpoint_storage_path = str(tmp_path / "checkpoints")
+        mock_settings.checkpoint_compression = False
         mock_settings.translation_max_tokens_per_chunk = 8000
         mock_settings.translation_max_segments_per_chunk = 100
+        mock_settings.translation_chunking_mode = "greedy"
+        mock_settings.translation_adaptive_chunking = False
+        mock_settings.translation_prefilter_enabled = False
+        mock_settings.translation_result_cache_enabled = False
         mock_settings.openai_model = "gpt-5-nano"
         mock_settings.translation_token_safety_margin = 0.8
         mock_settings.get_translation_parallel_requests = MagicMock(return_value=3)
@@ -934,8 +1107,14 @@ Goodbye!
         mock_settings.checkpoint_enabled = False
         mock_settings.checkpoint_cleanup_on_success = False
         mock_settings.subtitle_storage_path = str(tmp_path)
+        mock_settings.checkpoint_storage_path = str(tmp_path / "checkpoints")
+        mock_settings.checkpoint_compression = False
         mock_settings.translation_max_tokens_per_chunk = 8000
         mock_settings.translation_max_segments_per_chunk = 100
+        mock_settings.translation_chunking_mode = "greedy"
+        mock_settings.translation_adaptive_chunking = False
+        mock_settings.translation_prefilter_enabled = False
+        mock_settings.translation_result_cache_enabled = False
         mock_settings.openai_model = "gpt-5-nano"
         mock_settings.translation_token_safety_margin = 0.8
         mock_settings.get_translation_parallel_requests = MagicMock(return_value=3)
@@ -986,8 +1165,14 @@ Goodbye!
         mock_settings.checkpoint_enabled = True
         mock_settings.checkpoint_cleanup_on_success = False
         mock_settings.subtitle_storage_path = str(tmp_path)
+        mock_settings.checkpoint_storage_path = str(tmp_path / "checkpoints")
+        mock_settings.checkpoint_compression = False
         mock_settings.translation_max_tokens_per_chunk = 8000
         mock_settings.translation_max_segments_per_chunk = 100
+        mock_settings.translation_chunking_mode = "greedy"
+        mock_settings.translation_adaptive_chunking = False
+        mock_settings.translation_prefilter_enabled = False
+        mock_settings.translation_result_cache_enabled = False
         mock_settings.openai_model = "gpt-5-nano"
         mock_settings.translation_token_safety_margin = 0.8
         mock_settings.get_translation_parallel_requests = MagicMock(return_value=3)
@@ -1073,9 +1258,8 @@ How are you?
         """Create a mock translator."""
         translator = MagicMock()
         translator.translate_batch = AsyncMock(
-            return_value=["Hola mundo", "¿Cómo estás?"]
+            return_value=TranslationResult(["Hola mundo", "¿Cómo estás?"])
         )
-        translator.get_last_parsed_segment_numbers = MagicMock(return_value=None)
         return translator
 
     @pytest.mark.asyncio
@@ -1092,8 +1276,14 @@ How are you?
         mock_settings.checkpoint_enabled = False
         mock_settings.checkpoint_cleanup_on_success = False
         mock_settings.subtitle_storage_path = str(tmp_path)
+        mock_settings.checkpoint_storage_path = str(tmp_path / "checkpoints")
+        mock_settings.checkpoint_compression = False
         mock_settings.translation_max_tokens_per_chunk = 8000
         mock_settings.translation_max_segments_per_chunk = 100
+        mock_settings.translation_chunking_mode = "greedy"
+        mock_settings.translation_adaptive_chunking = False
+        mock_settings.translation_prefilter_enabled = False
+        mock_settings.translation_result_cache_enabled = False
         mock_settings.openai_model = "gpt-5-nano"
         mock_settings.translation_token_safety_margin = 0.8
         mock_settings.download_base_url = None
@@ -1159,8 +1349,14 @@ How are you?
         mock_settings.checkpoint_enabled = False
         mock_settings.checkpoint_cleanup_on_success = False
         mock_settings.subtitle_storage_path = str(tmp_path)
+        mock_settings.checkpoint_storage_path = str(tmp_path / "checkpoints")
+        mock_settings.checkpoint_compression = False
         mock_settings.translation_max_tokens_per_chunk = 8000
         mock_settings.translation_max_segments_per_chunk = 100
+        mock_settings.translation_chunking_mode = "greedy"
+        mock_settings.translation_adaptive_chunking = False
+        mock_settings.translation_prefilter_enabled = False
+        mock_settings.translation_result_cache_enabled = False
         mock_settings.openai_model = "gpt-5-nano"
         mock_settings.translation_token_safety_margin = 0.8
         mock_settings.download_base_url = None
@@ -1190,7 +1386,7 @@ How are you?
             # Add small delay to ensure duration > 0
             async def delayed_translate(*args, **kwargs):
                 await asyncio.sleep(0.1)
-                return ["Hola mundo", "¿Cómo estás?"]
+                return TranslationResult(["Hola mundo", "¿Cómo estás?"])
 
             mock_translator.translate_batch = AsyncMock(side_effect=delayed_translate)
 
@@ -1227,8 +1423,14 @@ How are you?
         mock_settings.checkpoint_enabled = False
         mock_settings.checkpoint_cleanup_on_success = False
         mock_settings.subtitle_storage_path = str(tmp_path)
+        mock_settings.checkpoint_storage_path = str(tmp_path / "checkpoints")
+        mock_settings.checkpoint_compression = False
         mock_settings.translation_max_tokens_per_chunk = 8000
         mock_settings.translation_max_segments_per_chunk = 100
+        mock_settings.translation_chunking_mode = "greedy"
+        mock_settings.translation_adaptive_chunking = False
+        mock_settings.translation_prefilter_enabled = False
+        mock_settings.translation_result_cache_enabled = False
         mock_settings.openai_model = "gpt-5-nano"
         mock_settings.translation_token_safety_margin = 0.8
         mock_settings.download_base_url = None
@@ -1305,8 +1507,14 @@ How are you?
         mock_settings.checkpoint_enabled = False
         mock_settings.checkpoint_cleanup_on_success = False
         mock_settings.subtitle_storage_path = str(tmp_path)
+        mock_settings.checkpoint_storage_path = str(tmp_path / "checkpoints")
+        mock_settings.checkpoint_compression = False
         mock_settings.translation_max_tokens_per_chunk = 8000
         mock_settings.translation_max_segments_per_chunk = 100
+        mock_settings.translation_chunking_mode = "greedy"
+        mock_settings.translation_adaptive_chunking = False
+        mock_settings.translation_prefilter_enabled = False
+        mock_settings.translation_result_cache_enabled = False
         mock_settings.openai_model = "gpt-5-nano"
         mock_settings.translation_token_safety_margin = 0.8
 
@@ -1400,8 +1608,14 @@ Hello world
         mock_settings.checkpoint_enabled = False
         mock_settings.checkpoint_cleanup_on_success = False
         mock_settings.subtitle_storage_path = str(tmp_path)
+        mock_settings.checkpoint_storage_path = str(tmp_path / "checkpoints")
+        mock_settings.checkpoint_compression = False
         mock_settings.translation_max_tokens_per_chunk = 8000
         mock_settings.translation_max_segments_per_chunk = 100
+        mock_settings.translation_chunking_mode = "greedy"
+        mock_settings.translation_adaptive_chunking = False
+        mock_settings.translation_prefilter_enabled = False
+        mock_settings.translation_result_cache_enabled = False
         mock_settings.openai_model = "gpt-5-nano"
         mock_settings.translation_token_safety_margin = 0.8
         mock_settings.download_base_url = None
@@ -1416,8 +1630,9 @@ Hello world
 
         # Mock translator
         mock_translator = MagicMock()
-        mock_translator.translate_batch = AsyncMock(return_value=["Translated text"])
-        mock_translator.get_last_parsed_segment_numbers = MagicMock(return_value=None)
+        mock_translator.translate_batch = AsyncMock(
+            return_value=TranslationResult(["Translated text"])
+        )
 
         # Mock Redis and event publisher
         with patch_translator_dependencies() as (mock_redis, mock_pub):
@@ -1512,13 +1727,21 @@ class TestParallelTranslationProcessing:
         return str(srt_file)
 
     @pytest.fixture
-    def mock_settings_parallel(self):
+    def mock_settings_parallel(self, tmp_path):
         """Create mock settings with parallel processing enabled."""
         mock_settings = MagicMock()
         mock_settings.checkpoint_enabled = True
         mock_settings.checkpoint_cleanup_on_success = True
+        mock_settings.checkpoint_storage_path = str(tmp_path / "checkpoints")
+        mock_settings.checkpoint_compression = False
+        mock_settings.subtitle_storage_path = str(tmp_path)
+        mock_settings.download_base_url = None
         mock_settings.translation_max_tokens_per_chunk = self.TEST_MAX_TOKENS_PER_CHUNK
         mock_settings.translation_max_segments_per_chunk = self.TEST_SEGMENTS_PER_CHUNK
+        mock_settings.translation_chunking_mode = "greedy"
+        mock_settings.translation_adaptive_chunking = False
+        mock_settings.translation_prefilter_enabled = False
+        mock_settings.translation_result_cache_enabled = False
         mock_settings.openai_model = "gpt-4o-mini"
         mock_settings.translation_token_safety_margin = self.TEST_TOKEN_SAFETY_MARGIN
         mock_settings.translation_parallel_requests = self.TEST_PARALLEL_LIMIT_NORMAL
@@ -1553,11 +1776,10 @@ class TestParallelTranslationProcessing:
             call_order.append(len(call_times))
             # Simulate API delay using test constant
             await asyncio.sleep(self.TEST_API_DELAY_SECONDS)
-            return [f"Translated {text}" for text in texts]
+            return TranslationResult([f"Translated {text}" for text in texts])
 
         mock_translator = MagicMock()
         mock_translator.translate_batch = AsyncMock(side_effect=mock_translate_batch)
-        mock_translator.get_last_parsed_segment_numbers = MagicMock(return_value=None)
 
         with patch_translator_dependencies() as (mock_redis, mock_pub), patch(
             "translator.translation_orchestrator.settings", mock_settings_parallel
@@ -1618,11 +1840,10 @@ class TestParallelTranslationProcessing:
             # Use test constant for delay to allow other requests to start
             await asyncio.sleep(self.TEST_SEMAPHORE_DELAY_SECONDS)
             active_requests.pop()
-            return [f"Translated {text}" for text in texts]
+            return TranslationResult([f"Translated {text}" for text in texts])
 
         mock_translator = MagicMock()
         mock_translator.translate_batch = AsyncMock(side_effect=mock_translate_batch)
-        mock_translator.get_last_parsed_segment_numbers = MagicMock(return_value=None)
 
         with patch_translator_dependencies() as (mock_redis, mock_pub), patch(
             "translator.translation_orchestrator.settings", mock_settings_parallel
@@ -1666,11 +1887,12 @@ class TestParallelTranslationProcessing:
             # Use decreasing delay based on call count to simulate varying API response times
             delay = (self.TEST_API_DELAY_SECONDS * 2) - (call_count * 0.02)
             await asyncio.sleep(max(0.01, delay))
-            return [f"Translated chunk {call_count}: {text}" for text in texts]
+            return TranslationResult(
+                [f"Translated chunk {call_count}: {text}" for text in texts]
+            )
 
         mock_translator = MagicMock()
         mock_translator.translate_batch = AsyncMock(side_effect=mock_translate_batch)
-        mock_translator.get_last_parsed_segment_numbers = MagicMock(return_value=None)
 
         with patch_translator_dependencies() as (mock_redis, mock_pub), patch(
             "translator.translation_orchestrator.settings", mock_settings_parallel
@@ -1716,9 +1938,10 @@ class TestParallelTranslationProcessing:
 
         mock_translator = MagicMock()
         mock_translator.translate_batch = AsyncMock(
-            side_effect=lambda texts, sl, tl: [f"Translated {text}" for text in texts]
+            side_effect=lambda texts, sl, tl: TranslationResult(
+                [f"Translated {text}" for text in texts]
+            )
         )
-        mock_translator.get_last_parsed_segment_numbers = MagicMock(return_value=None)
 
         with patch_translator_dependencies() as (mock_redis, mock_pub), patch(
             "translator.translation_orchestrator.settings", mock_settings_parallel
@@ -1814,13 +2037,15 @@ class TestParallelTranslationProcessing:
 
         async def mock_translate_batch(texts, source_lang, target_lang):
             call_count[0] += 1
-            return [
-                f"Translated remaining chunk {call_count[0]}: {text}" for text in texts
-            ]
+            return TranslationResult(
+                [
+                    f"Translated remaining chunk {call_count[0]}: {text}"
+                    for text in texts
+                ]
+            )
 
         mock_translator = MagicMock()
         mock_translator.translate_batch = AsyncMock(side_effect=mock_translate_batch)
-        mock_translator.get_last_parsed_segment_numbers = MagicMock(return_value=None)
 
         with patch_translator_dependencies() as (mock_redis, mock_pub):
 
@@ -1850,6 +2075,7 @@ class TestParallelTranslationProcessing:
         from uuid import uuid4
 
         request_id = uuid4()
+        mock_settings_parallel.subtitle_storage_path = str(tmp_path)
         monkeypatch.setattr("translator.worker.settings", mock_settings_parallel)
 
         call_count = 0
@@ -1859,15 +2085,14 @@ class TestParallelTranslationProcessing:
             call_count += 1
             if call_count == 2:  # Fail on second chunk
                 raise Exception("Simulated API error")
-            return [f"Translated {text}" for text in texts]
+            return TranslationResult([f"Translated {text}" for text in texts])
 
         mock_translator = MagicMock()
         mock_translator.translate_batch = AsyncMock(side_effect=mock_translate_batch)
-        mock_translator.get_last_parsed_segment_numbers = MagicMock(return_value=None)
 
         with patch_translator_dependencies() as (mock_redis, mock_pub), patch(
             "translator.translation_orchestrator.settings", mock_settings_parallel
-        ):
+        ), patch("translator.checkpoint_manager.settings", mock_settings_parallel):
 
             mock_message = MagicMock()
             mock_message.body = json.dumps(
@@ -1894,6 +2119,669 @@ class TestParallelTranslationProcessing:
                 len(job_failed_calls) > 0
             ), "Expected JOB_FAILED event to be published"
 
+    @pytest.mark.asyncio
+    async def test_resume_translates_only_chunks_missing_from_journal(
+        self, large_srt_file, mock_settings_parallel, tmp_path, monkeypatch
+    ):
+        """Test chunks are journaled as they finish and a retry skips exactly those."""
+        from uuid import uuid4
+
+        from translator.checkpoint_manager import CheckpointManager
+
+        request_id = uuid4()
+        mock_settings_parallel.subtitle_storage_path = str(tmp_path)
+        monkeypatch.setattr("translator.worker.settings", mock_settings_parallel)
+
+        translated_texts = []
+        failures = []
+
+        async def mock_translate_batch(texts, source_lang, target_lang):
+            if "Segment 3 text content" in texts and not failures:
+                failures.append(texts)
+                raise Exception("Simulated API error")
+            translated_texts.extend(texts)
+            return TranslationResult([f"Translated {text}" for text in texts])
+
+        mock_translator = MagicMock()
+        mock_translator.translate_batch = AsyncMock(side_effect=mock_translate_batch)
+
+        mock_message = MagicMock()
+        mock_message.body = json.dumps(
+            {
+                "request_id": str(request_id),
+                "subtitle_file_path": large_srt_file,
+                "source_language": "en",
+                "target_language": "es",
+            }
+        ).encode()
+
+        with patch_translator_dependencies() as (mock_redis, mock_pub), patch(
+            "translator.translation_orchestrator.settings", mock_settings_parallel
+        ), patch(
+            "translator.checkpoint_manager.settings", mock_settings_parallel
+        ), patch(
+            "translator.worker.finalize_translation", new_callable=AsyncMock
+        ) as mock_finalize:
+            # Chunk 2 of 5 fails; the other four are journaled anyway
+            await process_translation_message(mock_message, mock_translator)
+            mock_finalize.assert_not_awaited()
+
+            checkpoint = await CheckpointManager().load_checkpoint(request_id, "es")
+            assert checkpoint.translated_positions == [0, 1, 4, 5, 6, 7, 8, 9]
+
+            # The retried job translates only the missing chunk
+            translated_texts.clear()
+            await process_translation_message(mock_message, mock_translator)
+
+        assert translated_texts == ["Segment 3 text content", "Segment 4 text content"]
+        mock_finalize.assert_awaited_once()
+        output_path = mock_finalize.call_args[0][1]["es"]
+        output_segments = SRTParser.parse(output_path.read_text(encoding="utf-8"))
+        assert [segment.text for segment in output_segments] == [
+            f"Translated Segment {i} text content" for i in range(1, 11)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_streamed_segments_journaled_when_chunk_fails(
+        self, large_srt_file, mock_settings_parallel, tmp_path, monkeypatch
+    ):
+        """Test segments streamed before a chunk fails are kept for the retry."""
+        from uuid import uuid4
+
+        from translator.checkpoint_manager import CheckpointManager
+        from translator.translation_service import SubtitleTranslator
+
+        request_id = uuid4()
+        mock_settings_parallel.subtitle_storage_path = str(tmp_path)
+        monkeypatch.setattr("translator.worker.settings", mock_settings_parallel)
+
+        translated_texts = []
+        failures = []
+
+        async def mock_translate_batch(
+            texts, source_lang, target_lang, on_segment=None
+        ):
+            if "Segment 3 text content" in texts and not failures:
+                # The stream completes the first segment, then the request fails
+                failures.append(texts)
+                await on_segment(0, f"Translated {texts[0]}")
+                raise Exception("Simulated stream error")
+            translated_texts.extend(texts)
+            return TranslationResult([f"Translated {text}" for text in texts])
+
+        mock_translator = MagicMock()
+        mock_translator.translate_batch = AsyncMock(side_effect=mock_translate_batch)
+
+        mock_message = MagicMock()
+        mock_message.body = json.dumps(
+            {
+                "request_id": str(request_id),
+                "subtitle_file_path": large_srt_file,
+                "source_language": "en",
+                "target_language": "es",
+            }
+        ).encode()
+
+        with patch_translator_dependencies() as (mock_redis, mock_pub), patch(
+            "translator.translation_orchestrator.settings", mock_settings_parallel
+        ), patch(
+            "translator.checkpoint_manager.settings", mock_settings_parallel
+        ), patch.object(
+            SubtitleTranslator, "is_streaming_enabled", return_value=True
+        ), patch(
+            "translator.worker.finalize_translation", new_callable=AsyncMock
+        ) as mock_finalize:
+            await process_translation_message(mock_message, mock_translator)
+            mock_finalize.assert_not_awaited()
+
+            checkpoint = await CheckpointManager().load_checkpoint(request_id, "es")
+            assert checkpoint.translated_positions == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+
+            # The retried job translates only the segment that never streamed
+            translated_texts.clear()
+            await process_translation_message(mock_message, mock_translator)
+
+        assert translated_texts == ["Segment 4 text content"]
+        mock_finalize.assert_awaited_once()
+        output_path = mock_finalize.call_args[0][1]["es"]
+        output_segments = SRTParser.parse(output_path.read_text(encoding="utf-8"))
+        assert [segment.text for segment in output_segments] == [
+            f"Translated Segment {i} text content" for i in range(1, 11)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_progressive_output_tracks_translated_prefix(
+        self, large_srt_file, mock_settings_parallel, tmp_path, monkeypatch
+    ):
+        """Test the partial file grows with the translated start of the file."""
+        import asyncio
+        from uuid import uuid4
+
+        from common.schemas import EventType
+        from translator.progressive_output import ProgressiveSubtitleWriter
+
+        mock_settings_parallel.subtitle_storage_path = str(tmp_path)
+        monkeypatch.setattr("translator.worker.settings", mock_settings_parallel)
+        partial_path = tmp_path / "large_test.es.partial.srt"
+        partial_seen_by_slow_chunk = []
+
+        async def mock_translate_batch(texts, source_lang, target_lang):
+            if "Segment 5 text content" in texts:
+                # Chunks 4 and 5 finish while chunk 3 is still running
+                await asyncio.sleep(self.TEST_API_DELAY_SECONDS)
+                partial_seen_by_slow_chunk.extend(
+                    SRTParser.parse(partial_path.read_text(encoding="utf-8"))
+                )
+            else:
+                await asyncio.sleep(0.01)
+            return TranslationResult([f"Translated {text}" for text in texts])
+
+        mock_translator = MagicMock()
+        mock_translator.translate_batch = AsyncMock(side_effect=mock_translate_batch)
+
+        mock_message = MagicMock()
+        mock_message.body = json.dumps(
+            {
+                "request_id": str(uuid4()),
+                "subtitle_file_path": large_srt_file,
+                "source_language": "en",
+                "target_language": "es",
+            }
+        ).encode()
+
+        with patch_translator_dependencies() as (mock_redis, mock_pub), patch(
+            "translator.translation_orchestrator.settings", mock_settings_parallel
+        ), patch(
+            "translator.checkpoint_manager.settings", mock_settings_parallel
+        ), patch.object(
+            ProgressiveSubtitleWriter, "is_enabled", return_value=True
+        ):
+            await process_translation_message(mock_message, mock_translator)
+
+        # Segments 7-10 were translated but are not contiguous with the start
+        assert [segment.text for segment in partial_seen_by_slow_chunk] == [
+            f"Translated Segment {i} text content" for i in range(1, 5)
+        ]
+
+        progress = [
+            call.args[0].payload["segments_ready"]
+            for call in mock_pub.publish_event.call_args_list
+            if call.args[0].event_type == EventType.TRANSLATION_PROGRESS
+        ]
+        assert progress == sorted(progress)
+        assert set(progress) <= {2, 4, 10}
+        assert progress[-1] == 10
+
+        # The complete file replaces the partial one
+        assert (tmp_path / "large_test.es.srt").exists()
+        assert not partial_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_chunks_scheduled_earliest_timestamp_first(
+        self, mock_settings_parallel, tmp_path, monkeypatch
+    ):
+        """Test chunks start in playback order even if the file is not sorted."""
+        from uuid import uuid4
+
+        mock_settings_parallel.subtitle_storage_path = str(tmp_path)
+        monkeypatch.setattr("translator.worker.settings", mock_settings_parallel)
+
+        # Segments 5-6 play first but come last in the file
+        start_seconds = [10, 12, 20, 22, 1, 3]
+        srt_file = tmp_path / "unsorted.srt"
+        srt_file.write_text(
+            "\n".join(
+                f"{i}\n00:00:{start:02d},000 --> 00:00:{start + 1:02d},000\n"
+                f"Segment {i} text content\n"
+                for i, start in enumerate(start_seconds, 1)
+            ),
+            encoding="utf-8",
+        )
+
+        requests = []
+
+        async def mock_translate_batch(texts, source_lang, target_lang):
+            requests.append(texts[0])
+            return TranslationResult([f"Translated {text}" for text in texts])
+
+        mock_translator = MagicMock()
+        mock_translator.translate_batch = AsyncMock(side_effect=mock_translate_batch)
+
+        mock_message = MagicMock()
+        mock_message.body = json.dumps(
+            {
+                "request_id": str(uuid4()),
+                "subtitle_file_path": str(srt_file),
+                "source_language": "en",
+                "target_language": "es",
+            }
+        ).encode()
+
+        with patch_translator_dependencies(), patch(
+            "translator.translation_orchestrator.settings", mock_settings_parallel
+        ), patch("translator.checkpoint_manager.settings", mock_settings_parallel):
+            await process_translation_message(mock_message, mock_translator)
+
+        assert requests == [
+            "Segment 5 text content",
+            "Segment 1 text content",
+            "Segment 3 text content",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_resume_rechunks_untranslated_segments_after_chunking_change(
+        self, large_srt_file, mock_settings_parallel, tmp_path, monkeypatch
+    ):
+        """Test a chunk size change keeps checkpointed work and re-chunks the rest."""
+        from uuid import uuid4
+
+        request_id = uuid4()
+        mock_settings_parallel.subtitle_storage_path = str(tmp_path)
+        monkeypatch.setattr("translator.worker.settings", mock_settings_parallel)
+
+        requests = []
+
+        async def mock_translate_batch(texts, source_lang, target_lang):
+            requests.append(texts)
+            if len(requests) <= 5 and texts[0] in (
+                "Segment 3 text content",
+                "Segment 7 text content",
+            ):
+                raise Exception("Simulated API error")
+            return TranslationResult([f"Translated {text}" for text in texts])
+
+        mock_translator = MagicMock()
+        mock_translator.translate_batch = AsyncMock(side_effect=mock_translate_batch)
+
+        mock_message = MagicMock()
+        mock_message.body = json.dumps(
+            {
+                "request_id": str(request_id),
+                "subtitle_file_path": large_srt_file,
+                "source_language": "en",
+                "target_language": "es",
+            }
+        ).encode()
+
+        with patch_translator_dependencies() as (mock_redis, mock_pub), patch(
+            "translator.translation_orchestrator.settings", mock_settings_parallel
+        ), patch(
+            "translator.checkpoint_manager.settings", mock_settings_parallel
+        ), patch(
+            "translator.worker.finalize_translation", new_callable=AsyncMock
+        ) as mock_finalize:
+            # 5 chunks of 2 segments; chunks 2 and 4 fail
+            await process_translation_message(mock_message, mock_translator)
+            assert len(requests) == 5
+
+            # Larger chunks on resume: the 4 missing segments go in one request
+            mock_settings_parallel.translation_max_segments_per_chunk = 5
+            await process_translation_message(mock_message, mock_translator)
+
+        assert requests[5:] == [
+            [
+                "Segment 3 text content",
+                "Segment 4 text content",
+                "Segment 7 text content",
+                "Segment 8 text content",
+            ]
+        ]
+        output_path = mock_finalize.call_args[0][1]["es"]
+        output_segments = SRTParser.parse(output_path.read_text(encoding="utf-8"))
+        assert [segment.text for segment in output_segments] == [
+            f"Translated Segment {i} text content" for i in range(1, 11)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_ignored_when_source_changed(
+        self, large_srt_file, mock_settings_parallel, tmp_path, monkeypatch
+    ):
+        """Test a checkpoint for different subtitle content is not applied."""
+        from uuid import uuid4
+
+        from translator.checkpoint_manager import CheckpointManager
+
+        request_id = uuid4()
+        mock_settings_parallel.subtitle_storage_path = str(tmp_path)
+        monkeypatch.setattr("translator.worker.settings", mock_settings_parallel)
+        monkeypatch.setattr(
+            "translator.checkpoint_manager.settings", mock_settings_parallel
+        )
+
+        await CheckpointManager().start_journal(
+            request_id=request_id,
+            subtitle_file_path=large_srt_file,
+            source_language="en",
+            target_language="es",
+            total_chunks=5,
+            translated_segments={
+                0: SubtitleSegment(1, "00:00:01,000", "00:00:02,000", "Stale")
+            },
+            source_hash="hash-of-an-older-file",
+        )
+
+        mock_translator = MagicMock()
+        mock_translator.translate_batch = AsyncMock(
+            side_effect=lambda texts, sl, tl: TranslationResult(
+                [f"Translated {text}" for text in texts]
+            )
+        )
+        mock_message = MagicMock()
+        mock_message.body = json.dumps(
+            {
+                "request_id": str(request_id),
+                "subtitle_file_path": large_srt_file,
+                "source_language": "en",
+                "target_language": "es",
+            }
+        ).encode()
+
+        with patch_translator_dependencies() as (mock_redis, mock_pub), patch(
+            "translator.translation_orchestrator.settings", mock_settings_parallel
+        ), patch(
+            "translator.worker.finalize_translation", new_callable=AsyncMock
+        ) as mock_finalize:
+            await process_translation_message(mock_message, mock_translator)
+
+        assert mock_translator.translate_batch.await_count == 5
+        output_path = mock_finalize.call_args[0][1]["es"]
+        assert "Stale" not in output_path.read_text(encoding="utf-8")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_chunks_use_their_own_parsed_segment_numbers(
+        self, mock_settings_parallel
+    ):
+        """Test each chunk merges with the parsed numbers from its own call."""
+        from translator.schemas import CheckpointState, TranslationTaskData
+        from translator.translation_orchestrator import (
+            translate_segments_with_checkpoint,
+        )
+
+        mock_settings_parallel.checkpoint_enabled = False
+        mock_settings_parallel.translation_max_segments_per_chunk = 2
+        segments = [
+            SubtitleSegment(i, i * 1000, i * 1000 + 900, f"Line {i}")
+            for i in range(1, 9)
+        ]
+
+        async def translate_with_one_missing(texts, source_lang, target_lang):
+            """Drop a different segment per chunk and finish in reverse order."""
+            chunk_number = int(texts[0].split()[1]) // 2
+            await asyncio.sleep(0.01 * (4 - chunk_number))
+            if chunk_number % 2 == 0:
+                return TranslationResult([f"T {texts[1]}"], parsed_segment_numbers=[2])
+            return TranslationResult([f"T {texts[0]}"], parsed_segment_numbers=[1])
+
+        mock_translator = MagicMock()
+        mock_translator.translate_batch = AsyncMock(
+            side_effect=translate_with_one_missing
+        )
+        task_data = TranslationTaskData(uuid4(), "/tmp/test.en.srt", "en", "es")
+
+        with patch(
+            "translator.translation_orchestrator.settings", mock_settings_parallel
+        ):
+            translated = await translate_segments_with_checkpoint(
+                segments, task_data, mock_translator, CheckpointState(None, [])
+            )
+
+        assert [segment.text for segment in translated] == [
+            "Line 1",
+            "T Line 2",
+            "T Line 3",
+            "Line 4",
+            "Line 5",
+            "T Line 6",
+            "T Line 7",
+            "Line 8",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_prefilter_sends_only_unique_text_segments(
+        self, mock_settings_parallel, tmp_path, monkeypatch
+    ):
+        """Test wordless segments and repeated lines are filled in without a request."""
+        mock_settings_parallel.checkpoint_enabled = False
+        mock_settings_parallel.subtitle_storage_path = str(tmp_path)
+        mock_settings_parallel.download_base_url = None
+        mock_settings_parallel.translation_prefilter_enabled = True
+        monkeypatch.setattr("translator.worker.settings", mock_settings_parallel)
+
+        texts = ["♪♪", "Hello", "JOHN:", "Hello", "Goodbye", "www.example.com"]
+        srt_file = tmp_path / "movie.en.srt"
+        srt_file.write_text(
+            "\n".join(
+                f"{i}\n00:00:{i:02d},000 --> 00:00:{i:02d},900\n{text}\n"
+                for i, text in enumerate(texts, 1)
+            ),
+            encoding="utf-8",
+        )
+
+        sent = []
+
+        async def mock_translate_batch(texts, source_lang, target_lang):
+            sent.extend(texts)
+            return TranslationResult([f"es: {text}" for text in texts])
+
+        mock_translator = MagicMock()
+        mock_translator.translate_batch = AsyncMock(side_effect=mock_translate_batch)
+
+        mock_message = MagicMock()
+        mock_message.body = json.dumps(
+            {
+                "request_id": str(uuid4()),
+                "subtitle_file_path": str(srt_file),
+                "source_language": "en",
+                "target_language": "es",
+            }
+        ).encode()
+
+        with patch_translator_dependencies() as (mock_redis, mock_pub), patch(
+            "translator.translation_orchestrator.settings", mock_settings_parallel
+        ), patch("translator.event_helpers.settings", mock_settings_parallel):
+            await process_translation_message(mock_message, mock_translator)
+
+        assert sent == ["Hello", "Goodbye"]
+        output = SRTParser.parse(
+            (tmp_path / "movie.es.srt").read_text(encoding="utf-8")
+        )
+        assert [segment.text for segment in output] == [
+            "♪♪",
+            "es: Hello",
+            "JOHN:",
+            "es: Hello",
+            "es: Goodbye",
+            "www.example.com",
+        ]
+        assert output[3].start_time == "00:00:04,000"
+
+        completed = next(
+            call[0][0]
+            for call in mock_pub.publish_event.call_args_list
+            if call[0][0].event_type == EventType.TRANSLATION_COMPLETED
+        )
+        assert completed.payload["translation_stats"]["prefiltered_segments"] == 4
+        assert completed.payload["translation_stats"]["prefilter_tokens_saved"] > 0
+
+    @pytest.mark.asyncio
+    async def test_several_target_languages_share_one_parse_and_budget(
+        self, large_srt_file, mock_settings_parallel, tmp_path, monkeypatch
+    ):
+        """Test every language is translated from one parse under one request limit."""
+        mock_settings_parallel.checkpoint_enabled = False
+        mock_settings_parallel.subtitle_storage_path = str(tmp_path)
+        mock_settings_parallel.download_base_url = None
+        mock_settings_parallel.get_translation_parallel_requests = (
+            lambda: self.TEST_PARALLEL_LIMIT_LOW
+        )
+        monkeypatch.setattr("translator.worker.settings", mock_settings_parallel)
+
+        active = 0
+        max_active = 0
+        languages = []
+
+        async def mock_translate_batch(texts, source_lang, target_lang):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            languages.append(target_lang)
+            await asyncio.sleep(self.TEST_SEMAPHORE_DELAY_SECONDS)
+            active -= 1
+            return TranslationResult([f"{target_lang}: {text}" for text in texts])
+
+        mock_translator = MagicMock()
+        mock_translator.translate_batch = AsyncMock(side_effect=mock_translate_batch)
+
+        mock_message = MagicMock()
+        mock_message.body = json.dumps(
+            {
+                "request_id": str(uuid4()),
+                "subtitle_file_path": large_srt_file,
+                "source_language": "en",
+                "target_language": "es",
+                "target_languages": ["fr", "de"],
+            }
+        ).encode()
+
+        with patch_translator_dependencies() as (mock_redis, mock_pub), patch(
+            "translator.translation_orchestrator.settings", mock_settings_parallel
+        ), patch("translator.event_helpers.settings", mock_settings_parallel), patch(
+            "translator.worker.read_and_parse_subtitle_file",
+            wraps=read_and_parse_subtitle_file,
+        ) as mock_read:
+            await process_translation_message(mock_message, mock_translator)
+
+        mock_read.assert_awaited_once()
+        # Five two-segment chunks per language, never more than two in flight
+        assert sorted(languages) == ["de"] * 5 + ["es"] * 5 + ["fr"] * 5
+        assert max_active == self.TEST_PARALLEL_LIMIT_LOW
+
+        for language in ("es", "fr", "de"):
+            output = SRTParser.parse(
+                (tmp_path / f"large_test.{language}.srt").read_text(encoding="utf-8")
+            )
+            assert output[0].text == f"{language}: Segment 1 text content"
+            assert len(output) == 10
+
+        events = [call[0][0] for call in mock_pub.publish_event.call_args_list]
+        completed_languages = [
+            event.payload["target_language"]
+            for event in events
+            if event.event_type == EventType.TRANSLATION_COMPLETED
+        ]
+        assert sorted(completed_languages) == ["de", "es", "fr"]
+
+        # COMPLETED is set once, after every language is saved
+        statuses = [call[0][1] for call in mock_redis.update_phase.call_args_list]
+        assert statuses == [SubtitleStatus.TRANSLATE_IN_PROGRESS] * 4 + [
+            SubtitleStatus.COMPLETED
+        ]
+
+        # One SUBTITLE_TRANSLATED for the whole job, with every language
+        translated_events = [
+            event
+            for event in events
+            if event.event_type == EventType.SUBTITLE_TRANSLATED
+        ]
+        assert len(translated_events) == 1
+        assert translated_events[0].payload["translated_paths"] == {
+            language: str(tmp_path / f"large_test.{language}.srt")
+            for language in ("es", "fr", "de")
+        }
+
+    @pytest.mark.asyncio
+    async def test_language_file_saved_while_other_languages_translate(
+        self, large_srt_file, mock_settings_parallel, tmp_path, monkeypatch
+    ):
+        """Test a fast language's file is written before a slow language finishes."""
+        mock_settings_parallel.checkpoint_enabled = False
+        mock_settings_parallel.subtitle_storage_path = str(tmp_path)
+        mock_settings_parallel.download_base_url = None
+        monkeypatch.setattr("translator.worker.settings", mock_settings_parallel)
+
+        spanish_path = tmp_path / "large_test.es.srt"
+        spanish_saved = []
+
+        async def mock_translate_batch(texts, source_lang, target_lang):
+            if target_lang == "fr":
+                await asyncio.sleep(self.TEST_SEMAPHORE_DELAY_SECONDS)
+                spanish_saved.append(spanish_path.exists())
+            return TranslationResult([f"{target_lang}: {text}" for text in texts])
+
+        mock_translator = MagicMock()
+        mock_translator.translate_batch = AsyncMock(side_effect=mock_translate_batch)
+
+        mock_message = MagicMock()
+        mock_message.body = json.dumps(
+            {
+                "request_id": str(uuid4()),
+                "subtitle_file_path": large_srt_file,
+                "source_language": "en",
+                "target_language": "es",
+                "target_languages": ["fr"],
+            }
+        ).encode()
+
+        with patch_translator_dependencies(), patch(
+            "translator.translation_orchestrator.settings", mock_settings_parallel
+        ), patch("translator.event_helpers.settings", mock_settings_parallel):
+            await process_translation_message(mock_message, mock_translator)
+
+        assert spanish_saved[0] is False
+        assert spanish_saved[-1] is True
+        assert (tmp_path / "large_test.fr.srt").exists()
+
+    @pytest.mark.asyncio
+    async def test_job_not_completed_before_every_language_is_saved(
+        self, large_srt_file, mock_settings_parallel, tmp_path, monkeypatch
+    ):
+        """Test a finished language is published but a failing one fails the job."""
+        mock_settings_parallel.checkpoint_enabled = False
+        monkeypatch.setattr("translator.worker.settings", mock_settings_parallel)
+
+        async def mock_translate_batch(texts, source_lang, target_lang):
+            if target_lang == "fr":
+                await asyncio.sleep(self.TEST_SEMAPHORE_DELAY_SECONDS)
+                raise RuntimeError("French translation failed")
+            return TranslationResult([f"{target_lang}: {text}" for text in texts])
+
+        mock_translator = MagicMock()
+        mock_translator.translate_batch = AsyncMock(side_effect=mock_translate_batch)
+
+        mock_message = MagicMock()
+        mock_message.body = json.dumps(
+            {
+                "request_id": str(uuid4()),
+                "subtitle_file_path": large_srt_file,
+                "source_language": "en",
+                "target_language": "es",
+                "target_languages": ["fr"],
+            }
+        ).encode()
+
+        with patch_translator_dependencies() as (mock_redis, mock_pub), patch(
+            "translator.translation_orchestrator.settings", mock_settings_parallel
+        ), patch("translator.event_helpers.settings", mock_settings_parallel):
+            await process_translation_message(mock_message, mock_translator)
+
+        # The job is never COMPLETED; the finished language's file is
+        # recorded while the job is still in progress
+        statuses = [call[0][1] for call in mock_redis.update_phase.call_args_list]
+        assert statuses == [
+            SubtitleStatus.TRANSLATE_IN_PROGRESS,
+            SubtitleStatus.TRANSLATE_IN_PROGRESS,
+        ]
+        assert mock_redis.update_phase.call_args_list[1].kwargs["metadata"][
+            "translated_paths"
+        ] == {"es": str(tmp_path / "large_test.es.srt")}
+
+        events = [call[0][0] for call in mock_pub.publish_event.call_args_list]
+        assert [event.event_type for event in events] == [
+            EventType.TRANSLATION_COMPLETED,
+            EventType.JOB_FAILED,
+        ]
+        assert events[0].payload["target_language"] == "es"
+
 
 class TestTranslatorWorkerShutdown:
     """Tests for translator worker graceful shutdown."""